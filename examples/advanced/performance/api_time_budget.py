@@ -0,0 +1,38 @@
+import time
+from typing import Sequence
+
+from sklearn.datasets import make_classification
+
+from fedot.api.main import Fedot
+
+
+def run_time_budget_benchmark(timeouts: Sequence[float] = (0.5, 1.), seeds: Sequence[int] = (1, 2, 3),
+                              with_tuning: bool = True, samples_num: int = 3000):
+    """
+    Measures how precisely the AutoML run keeps within its timeout:
+    the elapsed time of the fit is compared with the timeout for each of the runs
+
+    :param timeouts: timeouts of the runs in minutes
+    :param seeds: seeds of the runs with each timeout
+    :param with_tuning: whether the composed pipelines are tuned
+    :param samples_num: number of samples in the train data
+    """
+    features, target = make_classification(samples_num, 20, random_state=1)
+    for timeout in timeouts:
+        elapsed_times = []
+        for seed in seeds:
+            model = Fedot(problem='classification', timeout=timeout, with_tuning=with_tuning,
+                          n_jobs=1, seed=seed, show_progress=False)
+            start = time.perf_counter()
+            model.fit(features, target)
+            elapsed_times.append(time.perf_counter() - start)
+        timeout_in_seconds = timeout * 60
+        overshoots = [max(0., elapsed - timeout_in_seconds) for elapsed in elapsed_times]
+        unused = [max(0., timeout_in_seconds - elapsed) for elapsed in elapsed_times]
+        print(f'Timeout {timeout_in_seconds:.0f} s: elapsed {", ".join(f"{t:.0f}" for t in elapsed_times)} s, '
+              f'{sum(overshoot > 0 for overshoot in overshoots)} of {len(seeds)} runs overshot '
+              f'by {sum(overshoots) / len(seeds):.1f} s on average, {sum(unused) / len(seeds):.1f} s unused')
+
+
+if __name__ == '__main__':
+    run_time_budget_benchmark()
@@ -0,0 +1,64 @@
+import timeit
+from copy import deepcopy
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.data.data_preprocessing import force_categorical_determination
+from fedot.core.operations.evaluation.operation_implementations.data_operations.categorical_encoders import \
+    LabelEncodingImplementation, OneHotEncodingImplementation
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.preprocessing.categorical import BinaryCategoricalPreprocessor
+from fedot.preprocessing.data_types import NAME_CLASS_FLOAT, NAME_CLASS_STR
+
+
+def get_categorical_data(n_rows: int, n_categorical: int = 30, n_numerical: int = 10,
+                         cardinality: int = 50) -> InputData:
+    """ Generates wide table with categorical (including binary ones) and numerical features """
+    rng = np.random.default_rng(1)
+    categories = np.array([f'category_{i}' for i in range(cardinality)], dtype=object)
+    categorical = categories[rng.integers(0, cardinality, size=(n_rows, n_categorical))]
+    # Every fifth categorical column is binary
+    categorical[:, ::5] = categories[rng.integers(0, 2, size=(n_rows, len(range(0, n_categorical, 5))))]
+    numerical = rng.random((n_rows, n_numerical)).astype(object)
+    data = InputData(idx=np.arange(n_rows), features=np.hstack((categorical, numerical)),
+                     target=rng.integers(0, 2, n_rows), task=Task(TaskTypesEnum.classification),
+                     data_type=DataTypesEnum.table)
+    data.supplementary_data.column_types = {'features': [NAME_CLASS_STR] * n_categorical +
+                                                        [NAME_CLASS_FLOAT] * n_numerical}
+    return data
+
+
+def run_categorical_encoding_benchmark(n_rows: int = 20000, repeats: int = 3):
+    """
+    Measures time of the categorical features detection and encoding for the wide table
+
+    :param n_rows: number of rows in the table
+    :param repeats: number of measurements for each stage
+    """
+    data = get_categorical_data(n_rows)
+
+    def fit_transform(encoder, input_data: InputData):
+        encoder.fit(input_data)
+        return encoder.transform(input_data)
+
+    stages = {
+        'categorical columns detection': lambda input_data: force_categorical_determination(input_data.features),
+        'binary encoding': lambda input_data: fit_transform(BinaryCategoricalPreprocessor(), input_data),
+        'one hot encoding': lambda input_data: fit_transform(OneHotEncodingImplementation(), input_data),
+        'label encoding': lambda input_data: fit_transform(LabelEncodingImplementation(), input_data),
+    }
+    for name, stage in stages.items():
+        durations = []
+        for _ in range(repeats):
+            # Encoders update column types of the data, so each run gets the source data
+            data_copy = deepcopy(data)
+            start_time = timeit.default_timer()
+            stage(data_copy)
+            durations.append(timeit.default_timer() - start_time)
+        print(f'{name}: {min(durations) * 1e3:.1f} ms')
+
+
+if __name__ == '__main__':
+    run_categorical_encoding_benchmark()
@@ -0,0 +1,91 @@
+import os
+import re
+import timeit
+from functools import partial
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+
+from fedot.core.data.columnar import import_pyarrow
+from fedot.core.data.data import InputData
+
+
+def save_table(directory: str, n_rows: int, n_features: int = 10):
+    """ Saves the same numerical table with binary target as CSV, Parquet, Arrow and .npy files """
+    rng = np.random.default_rng(1)
+    features = rng.random((n_rows, n_features))
+    target = rng.integers(0, 2, n_rows)
+    data_frame = pd.DataFrame(features, columns=[f'feature_{i}' for i in range(n_features)])
+    data_frame['target'] = target
+
+    data_frame.to_csv(os.path.join(directory, 'table.csv'))
+    # Row group is the unit of the decoding, so the smaller groups reduce the memory of chunked reads
+    data_frame.to_parquet(os.path.join(directory, 'table.parquet'), index=False, row_group_size=100_000)
+    data_frame.to_feather(os.path.join(directory, 'table.arrow'), compression='uncompressed')
+    np.save(os.path.join(directory, 'features.npy'), features)
+    np.save(os.path.join(directory, 'target.npy'), target)
+
+
+def _memory_usage(field_name: str) -> float:
+    """ Reads the memory usage of the process from Linux procfs in megabytes """
+    with open('/proc/self/status') as status:
+        return float(re.search(rf'{field_name}:\s+(\d+)', status.read()).group(1)) / 1024
+
+
+def _measure(load) -> tuple:
+    # Libraries are loaded before the measurement
+    import_pyarrow()
+    # Resets the peak resident set size of the process to its current value
+    with open('/proc/self/clear_refs', 'w') as clear_refs:
+        clear_refs.write('5')
+    rss_before = _memory_usage('VmRSS')
+    start_time = timeit.default_timer()
+    checksum = load()
+    duration = timeit.default_timer() - start_time
+    return duration, _memory_usage('VmHWM') - rss_before, checksum
+
+
+def _load_whole(loader, *args, **kwargs):
+    data = loader(*args, **kwargs)
+    # Touch all the values, the memory mapped table is read from disk here
+    return float(np.sum(data.features[:, 0].astype(float)))
+
+
+def _load_by_chunks(file_path: str, chunk_size: int, **kwargs):
+    return sum(float(np.sum(chunk.features[:, 0].astype(float)))
+               for chunk in InputData.iter_from_file(file_path, chunk_size=chunk_size, **kwargs))
+
+
+def run_columnar_loading_benchmark(n_rows: int = 5_000_000, chunk_size: int = 500_000):
+    """
+    Compares load time and peak memory of the table loaded from different formats.
+    Each loader runs in the separate process, so the peak memory is measured independently (Linux only).
+    Pages of the memory mapped files are included in the peak memory though the system can reclaim them
+
+    :param n_rows: number of rows in the table
+    :param chunk_size: number of rows in the chunk for chunked reads
+    """
+    with TemporaryDirectory() as directory:
+        save_table(directory, n_rows)
+
+        def path(name: str) -> str:
+            return os.path.join(directory, name)
+
+        loaders = {
+            'csv': (_load_whole, InputData.from_csv, path('table.csv')),
+            'parquet': (_load_whole, InputData.from_parquet, path('table.parquet')),
+            'arrow': (_load_whole, InputData.from_arrow, path('table.arrow')),
+            'npy memmap': (_load_whole, InputData.from_npy, path('features.npy'), path('target.npy')),
+            'csv by chunks': (_load_by_chunks, path('table.csv'), chunk_size),
+            'parquet by chunks': (_load_by_chunks, path('table.parquet'), chunk_size),
+        }
+        with get_context('spawn').Pool(1, maxtasksperchild=1) as pool:
+            for name, (load, *args) in loaders.items():
+                duration, peak_memory, _ = pool.apply(_measure, (partial(load, *args),))
+                print(f'{name}: {duration:.2f} s, peak memory {peak_memory:.0f} MB')
+
+
+if __name__ == '__main__':
+    run_columnar_loading_benchmark()
@@ -0,0 +1,65 @@
+import timeit
+
+from joblib import cpu_count
+from sklearn.datasets import make_classification
+
+from fedot.core.data.data import InputData
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.gp_comp.evaluation import MultiprocessingDispatcher
+from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.objective import DataSourceSplitter, Objective, PipelineObjectiveEvaluate
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.quality_metrics_repository import ClassificationMetricsEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utilities.cpu_budget import CPUBudget
+
+
+def get_data(samples_num: int = 20000, features_num: int = 30) -> InputData:
+    features, target = make_classification(samples_num, features_num, n_informative=10, random_state=1)
+    return InputData(idx=list(range(samples_num)), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def get_population(pop_size: int):
+    """ Builds population of the different multithreaded ensembles """
+    adapter = PipelineAdapter()
+    population = []
+    for ind_id in range(pop_size):
+        pipeline = PipelineBuilder() \
+            .add_node('scaling') \
+            .add_branch(('rf', {'n_estimators': 100 + ind_id}), ('xgboost', {'n_estimators': 50 + ind_id})) \
+            .join_branches('logit') \
+            .to_pipeline()
+        population.append(Individual(adapter.adapt(pipeline)))
+    return population
+
+
+def run_cpu_budget_benchmark(n_jobs: int = -1, pop_sizes=None):
+    """
+    Compares wall-clock time of the generation evaluation with one thread per evaluated pipeline
+    and with the shared CPU budget rebalanced between the workers and the threads of the models
+
+    :param n_jobs: number of cores available for the evaluation, -1 means all cores
+    :param pop_sizes: numbers of pipelines to evaluate in generation, by default
+        fewer pipelines than cores, as many as cores and one and a half times more
+    """
+    cores = CPUBudget(n_jobs).n_jobs
+    pop_sizes = pop_sizes or sorted({max(1, cores // 4), cores, cores + cores // 2})
+    data = get_data()
+    data_producer = DataSourceSplitter().build(data)
+    objective_eval = PipelineObjectiveEvaluate(Objective(ClassificationMetricsEnum.ROCAUC), data_producer,
+                                               eval_n_jobs=None)
+    print(f'{cores} of {cpu_count()} cores are used')
+    for pop_size in pop_sizes:
+        for name, budget in [('one thread per pipeline', CPUBudget(cores, nested=False)),
+                             ('shared CPU budget', CPUBudget(cores))]:
+            dispatcher = MultiprocessingDispatcher(PipelineAdapter(), n_jobs=cores, cpu_budget=budget)
+            evaluate = dispatcher.dispatch(objective_eval)
+            population = get_population(pop_size)
+            duration = timeit.timeit(lambda: evaluate(population), number=1)
+            print(f'{pop_size} pipelines, {name}: {duration:.1f} s per generation')
+
+
+if __name__ == '__main__':
+    run_cpu_budget_benchmark()
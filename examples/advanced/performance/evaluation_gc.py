@@ -0,0 +1,53 @@
+import timeit
+
+from sklearn.datasets import make_classification
+
+from fedot.core.data.data import InputData
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.gp_comp.evaluation import MultiprocessingDispatcher
+from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.objective import DataSourceSplitter, Objective, PipelineObjectiveEvaluate
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.quality_metrics_repository import ClassificationMetricsEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+SMALL_MODELS = ['logit', 'dt', 'knn', 'bernb', 'qda']
+
+
+def get_population(pop_size: int):
+    """ Builds population of the small pipelines which are fitted in milliseconds """
+    adapter = PipelineAdapter()
+    return [Individual(adapter.adapt(PipelineBuilder().add_node('scaling')
+                                     .add_node(SMALL_MODELS[ind_id % len(SMALL_MODELS)]).to_pipeline()))
+            for ind_id in range(pop_size)]
+
+
+def run_evaluation_gc_benchmark(pop_size: int = 200, samples_num: int = 300):
+    """
+    Compares time of the population evaluation with the garbage collection after each evaluation
+    and with the adaptive collection, then shows the most memory-hungry pipelines
+
+    :param pop_size: number of pipelines in the population
+    :param samples_num: number of samples in the train data
+    """
+    features, target = make_classification(samples_num, 10, random_state=1)
+    data = InputData(idx=list(range(samples_num)), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+    objective_eval = PipelineObjectiveEvaluate(Objective(ClassificationMetricsEnum.ROCAUC),
+                                               DataSourceSplitter().build(data))
+    population = []
+    for name, threshold in [('collection after each evaluation', 0), ('adaptive collection', 100)]:
+        dispatcher = MultiprocessingDispatcher(PipelineAdapter(), gc_threshold_in_mb=threshold)
+        evaluate = dispatcher.dispatch(objective_eval)
+        population = get_population(pop_size)
+        duration = timeit.timeit(lambda: evaluate(population), number=1)
+        print(f'{name}: {duration * 1e3 / pop_size:.1f} ms per pipeline')
+
+    print('Pipelines using the most memory:')
+    for ind in sorted(population, key=lambda ind: ind.metadata['peak_memory_in_mb'], reverse=True)[:3]:
+        print(f'{ind.graph.descriptive_id}: {ind.metadata["peak_memory_in_mb"]:.2f} MB')
+
+
+if __name__ == '__main__':
+    run_evaluation_gc_benchmark()
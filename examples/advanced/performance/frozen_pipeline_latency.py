@@ -0,0 +1,39 @@
+import timeit
+
+import numpy as np
+
+from examples.advanced.performance.predict_latency import get_classification_data
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+
+
+def get_pipeline() -> Pipeline:
+    scaling_node = PrimaryNode('scaling')
+    rf_node = SecondaryNode('rf', nodes_from=[scaling_node])
+    logit_node = SecondaryNode('logit', nodes_from=[scaling_node])
+    return Pipeline(SecondaryNode('logit', nodes_from=[rf_node, logit_node]))
+
+
+def run_frozen_pipeline_benchmark(batch_sizes=(1, 10000), repeats: int = 200):
+    """
+    Compares p50 / p99 latency of the prediction of the fitted pipeline and its frozen
+    inference-only representation for batches of different size
+
+    :param batch_sizes: numbers of rows in the batch to predict
+    :param repeats: number of predictions for each batch size
+    """
+    pipeline = get_pipeline()
+    pipeline.fit(get_classification_data(n_rows=2000))
+    frozen_pipeline = pipeline.freeze()
+
+    for batch_size in batch_sizes:
+        batch = get_classification_data(n_rows=batch_size)
+        for name, predict in [('pipeline', pipeline.predict), ('frozen pipeline', frozen_pipeline.predict)]:
+            latencies = np.array(timeit.repeat(lambda: predict(batch), number=1, repeat=repeats))
+            print(f'{name} predict for {batch_size} rows: '
+                  f'p50 {np.percentile(latencies, 50) * 1e3:.2f} ms, '
+                  f'p99 {np.percentile(latencies, 99) * 1e3:.2f} ms')
+
+
+if __name__ == '__main__':
+    run_frozen_pipeline_benchmark()
@@ -0,0 +1,49 @@
+import glob
+import os
+import timeit
+from tempfile import TemporaryDirectory
+
+import cv2
+import numpy as np
+
+from fedot.core.data.image_dataset import ImageDataset
+
+
+def save_images(directory: str, images_num: int, image_size: int = 512):
+    """ Saves random images of the slightly different sizes as jpeg files """
+    rng = np.random.default_rng(1)
+    for image_id in range(images_num):
+        image = rng.integers(0, 255, size=(image_size + image_id % 8, image_size, 3), dtype=np.uint8)
+        cv2.imwrite(os.path.join(directory, f'{image_id}.jpeg'), image)
+
+
+def load_serially(files, target_size) -> np.ndarray:
+    """ Decodes and resizes the images one by one as it was done before the lazy dataset """
+    return np.asarray([cv2.resize(cv2.imread(file_path), target_size) for file_path in files])
+
+
+def run_image_loading_benchmark(images_num: int = 1000, target_size=(128, 128), batch_size: int = 64):
+    """
+    Compares time of the images loading: serial decoding, parallel decoding and reading of the cache
+
+    :param images_num: number of the images
+    :param target_size: size of the resized images
+    :param batch_size: number of images in the batch for the batch iteration
+    """
+    with TemporaryDirectory() as directory:
+        save_images(directory, images_num)
+        files = glob.glob(os.path.join(directory, '*.jpeg'))
+        dataset = ImageDataset(files, target_size, cache_dir=os.path.join(directory, 'cache'))
+
+        stages = {
+            'serial decoding': lambda: load_serially(files, target_size),
+            f'parallel decoding ({dataset.n_jobs} threads) with caching': dataset.load,
+            'reading of the cache': dataset.load,
+            'batch iteration over the cache': lambda: sum(len(batch) for batch in dataset.iter_batches(batch_size)),
+        }
+        for name, stage in stages.items():
+            print(f'{name}: {timeit.timeit(stage, number=1):.2f} s')
+
+
+if __name__ == '__main__':
+    run_image_loading_benchmark()
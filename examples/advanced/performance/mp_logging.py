@@ -0,0 +1,75 @@
+import logging
+import timeit
+
+from joblib.externals.loky import get_reusable_executor
+from sklearn.datasets import make_classification
+
+from fedot.core.data.data import InputData
+from fedot.core.log import Log, default_log
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.gp_comp.evaluation import MultiprocessingDispatcher
+from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.objective import DataSourceSplitter, Objective, PipelineObjectiveEvaluate
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.quality_metrics_repository import ClassificationMetricsEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+SMALL_MODELS = ['logit', 'dt', 'knn', 'bernb', 'qda']
+
+
+def get_population(pop_size: int):
+    """ Builds population of the small pipelines, so the logging takes noticeable part of the evaluation """
+    adapter = PipelineAdapter()
+    return [Individual(adapter.adapt(PipelineBuilder().add_node('scaling')
+                                     .add_node(SMALL_MODELS[ind_id % len(SMALL_MODELS)]).to_pipeline()))
+            for ind_id in range(pop_size)]
+
+
+class LoggingObjective:
+    """ Objective writing ``records_num`` debug records per evaluation like the verbose operations do """
+
+    def __init__(self, objective_eval: PipelineObjectiveEvaluate, records_num: int):
+        self.objective_eval = objective_eval
+        self.records_num = records_num
+
+    def __call__(self, graph):
+        log = default_log(prefix='LoggingObjective')
+        for record_id in range(self.records_num):
+            log.debug(f'Record {record_id} of the evaluation of {graph.descriptive_id}')
+        return self.objective_eval(graph)
+
+
+def run_mp_logging_benchmark(pop_size: int = 100, n_jobs: int = 2, records_num: int = 50):
+    """
+    Measures overhead of the logging from the evaluating worker processes: time of the population evaluation
+    with the verbose logging compared to the evaluation with the logging disabled
+
+    :param pop_size: number of pipelines in the population
+    :param n_jobs: number of the evaluating worker processes
+    :param records_num: number of the log records written by each evaluation
+    """
+    samples_num = 300
+    features, target = make_classification(samples_num, 10, random_state=1)
+    data = InputData(idx=list(range(samples_num)), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+    objective_eval = PipelineObjectiveEvaluate(Objective(ClassificationMetricsEnum.ROCAUC),
+                                               DataSourceSplitter().build(data))
+    objective = LoggingObjective(objective_eval, records_num)
+    durations = {}
+    for name, level in [('logging disabled', logging.CRITICAL), ('debug logging', logging.DEBUG)]:
+        Log().reset_logging_level(level)
+        # The workers are restarted and warmed up, so both runs are measured in the same conditions
+        get_reusable_executor().shutdown(wait=True)
+        evaluate = MultiprocessingDispatcher(PipelineAdapter(), n_jobs=n_jobs).dispatch(objective)
+        evaluate(get_population(n_jobs))
+        population = get_population(pop_size)
+        durations[name] = timeit.timeit(lambda: evaluate(population), number=1) * 1e3 / pop_size
+    Log().reset_logging_level(logging.INFO)
+    print(f'{durations["logging disabled"]:.1f} ms per evaluation without logging, '
+          f'{durations["debug logging"]:.1f} ms with {records_num} records, overhead '
+          f'{(durations["debug logging"] - durations["logging disabled"]) * 1e3 / records_num:.0f} µs per record')
+
+
+if __name__ == '__main__':
+    run_mp_logging_benchmark()
@@ -0,0 +1,68 @@
+import timeit
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.pipelines.ts_wrappers import multi_series_forecast, out_of_sample_ts_forecast
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+
+
+def get_series(ts_len: int, series_num: int) -> np.ndarray:
+    """ Generates the related seasonal series with the different phases and amplitudes, the series are columns """
+    rng = np.random.default_rng(1)
+    time_steps = np.arange(ts_len)[:, None]
+    phases = rng.uniform(0, 2 * np.pi, series_num)
+    amplitudes = rng.uniform(1, 3, series_num)
+    return amplitudes * np.sin(time_steps / 10 + phases) + rng.normal(scale=0.1, size=(ts_len, series_num))
+
+
+def get_pipeline() -> Pipeline:
+    return PipelineBuilder().add_node('lagged', params={'window_size': 20}).add_node('ridge').to_pipeline()
+
+
+def run_multi_series_benchmark(ts_len: int = 200, series_num: int = 500, forecast_length: int = 10):
+    """
+    Compares the forecasting of many related series by the separate pipeline for each series
+    with the global pipeline fitted on all the series as multi_ts data and forecasting them by one predict call
+
+    :param ts_len: length of the series
+    :param series_num: number of the series
+    :param forecast_length: forecast horizon
+    """
+    series = get_series(ts_len + forecast_length, series_num)
+    history, actual = series[:-forecast_length], series[-forecast_length:].T
+    task = Task(TaskTypesEnum.ts_forecasting, TsForecastingParams(forecast_length=forecast_length))
+
+    def forecast_separately() -> np.ndarray:
+        forecasts = []
+        for ts in history.T:
+            data = InputData(idx=np.arange(ts_len), features=ts, target=ts, task=task, data_type=DataTypesEnum.ts)
+            pipeline = get_pipeline()
+            pipeline.fit(data)
+            forecasts.append(out_of_sample_ts_forecast(pipeline, data, horizon=forecast_length))
+        return np.array(forecasts)
+
+    multi_ts = InputData(idx=np.arange(ts_len), features=history, target=history, task=task,
+                         data_type=DataTypesEnum.multi_ts)
+    global_pipeline = get_pipeline()
+
+    separate_forecasts = []
+    separate_duration = timeit.timeit(lambda: separate_forecasts.append(forecast_separately()), number=1)
+    fit_duration = timeit.timeit(lambda: global_pipeline.fit(multi_ts), number=1)
+    global_forecasts = []
+    predict_duration = timeit.timeit(
+        lambda: global_forecasts.append(multi_series_forecast(global_pipeline, multi_ts)), number=1)
+
+    separate_error = np.mean(np.abs(separate_forecasts[0] - actual))
+    global_error = np.mean(np.abs(global_forecasts[0] - actual))
+    print(f'{series_num} series of length {ts_len}')
+    print(f'Separate pipelines: {separate_duration:.1f} s to fit and forecast, MAE {separate_error:.3f}')
+    print(f'Global pipeline: {fit_duration:.2f} s to fit, {predict_duration * 1e3:.1f} ms to forecast, '
+          f'MAE {global_error:.3f}')
+
+
+if __name__ == '__main__':
+    run_multi_series_benchmark()
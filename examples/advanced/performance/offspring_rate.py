@@ -0,0 +1,68 @@
+import random
+import timeit
+
+import numpy as np
+
+from fedot.core.composer.gp_composer.specific_operators import parameter_change_mutation
+from fedot.core.dag.verification_rules import DEFAULT_DAG_RULES
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.gp_comp.gp_params import GPGraphOptimizerParameters
+from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.operators.crossover import Crossover, CrossoverTypesEnum
+from fedot.core.optimisers.gp_comp.operators.mutation import Mutation, MutationTypesEnum
+from fedot.core.optimisers.gp_comp.pipeline_composer_requirements import PipelineComposerRequirements
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.pipelines.pipeline_graph_generation_params import get_pipeline_generation_params
+from fedot.core.repository.operation_types_repository import get_operations_for_task
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_population(pop_size: int):
+    """ Builds population of the pipelines with 10 nodes and tuned hyperparameters """
+    adapter = PipelineAdapter()
+    population = []
+    for _ in range(pop_size):
+        pipeline = PipelineBuilder() \
+            .add_sequence('scaling', 'pca') \
+            .add_branch(('rf', {'n_estimators': 50}), 'knn', ('logit', {'C': 2.})) \
+            .join_branches('logit') \
+            .add_branch('dt', 'rf') \
+            .join_branches('logit') \
+            .to_pipeline()
+        population.append(Individual(adapter.adapt(pipeline)))
+    return population
+
+
+def run_offspring_rate_benchmark(pop_size: int = 50, generations: int = 10):
+    """
+    Measures how many offspring per second mutation and crossover operators
+    produce for the population of the fixed size
+
+    :param pop_size: number of individuals in the population
+    :param generations: number of the repeated applications of the operators
+    """
+    random.seed(1)
+    np.random.seed(1)
+    task = Task(TaskTypesEnum.classification)
+    operations = get_operations_for_task(task)
+    requirements = PipelineComposerRequirements(primary=operations, secondary=operations, max_depth=10)
+    graph_params = get_pipeline_generation_params(requirements=requirements,
+                                                  rules_for_constraint=DEFAULT_DAG_RULES, task=task)
+    parameters = GPGraphOptimizerParameters(mutation_types=[MutationTypesEnum.single_change,
+                                                            MutationTypesEnum.single_add,
+                                                            MutationTypesEnum.single_edge,
+                                                            parameter_change_mutation],
+                                            crossover_types=[CrossoverTypesEnum.subtree,
+                                                             CrossoverTypesEnum.one_point],
+                                            mutation_prob=1., crossover_prob=1.)
+    operators = {'mutation': Mutation(parameters, requirements, graph_params),
+                 'crossover': Crossover(parameters, requirements, graph_params)}
+    population = get_population(pop_size)
+
+    for name, operator in operators.items():
+        seconds = timeit.timeit(lambda: operator(population), number=generations)
+        print(f'{name}: {pop_size * generations / seconds:.1f} offspring/sec')
+
+
+if __name__ == '__main__':
+    run_offspring_rate_benchmark()
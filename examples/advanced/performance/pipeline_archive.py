@@ -0,0 +1,85 @@
+import gc
+import os
+import tempfile
+import time
+from functools import partial
+
+from sklearn.datasets import make_classification
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utilities.isolated_process import run_in_subprocess
+from fedot.core.utilities.memory import MB, current_rss
+
+# Models keeping the train data or large weights after the fit
+BRANCH_MODELS = ['knn', 'rf', 'logit', 'pca']
+
+
+def get_pipeline(nodes_num: int = 30) -> Pipeline:
+    """ Builds pipeline of ``nodes_num`` nodes: scaling, parallel branches of the models and the final model """
+    branches = [BRANCH_MODELS[i % len(BRANCH_MODELS)] for i in range(nodes_num - 2)]
+    return PipelineBuilder().add_node('scaling').add_branch(*branches).join_branches('logit').to_pipeline()
+
+
+def measure_load(load):
+    """ Loads the pipeline in the current process and measures the time and the growth of the resident memory """
+    rss_before = current_rss()
+    start = time.perf_counter()
+    pipeline = load()
+    duration = time.perf_counter() - start
+    gc.collect()
+    memory = (current_rss() - rss_before) / MB
+    del pipeline
+    return duration, memory
+
+
+def load_directory(path: str):
+    return Pipeline.from_serialized(path)
+
+
+def load_archive(path: str, mmap_mode):
+    pipeline = Pipeline()
+    pipeline.load_archive(path, mmap_mode)
+    return pipeline
+
+
+def save_fitted_pipeline(folder: str, nodes_num: int, samples_num: int, features_num: int):
+    """ Fits the pipeline and saves it both to the directory and to the archive """
+    features, target = make_classification(samples_num, features_num, random_state=1)
+    data = InputData(idx=list(range(samples_num)), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+    pipeline = get_pipeline(nodes_num)
+    pipeline.fit(data)
+    pipeline.save(os.path.join(folder, 'directory'), datetime_in_path=False)
+    archive_path = pipeline.save_archive(os.path.join(folder, 'pipeline.fedot'))
+    return os.path.join(folder, 'directory', 'directory.json'), archive_path
+
+
+def run_pipeline_archive_benchmark(nodes_num: int = 30, samples_num: int = 20000, features_num: int = 30):
+    """
+    Compares loading time and resident memory of the pipeline saved to the directory
+    with JSON and pickles and to the single archive with memory-mapped arrays.
+    The pipeline is fitted and each load is measured in the separate process,
+    so the loads do not reuse the memory freed by the others
+
+    :param nodes_num: number of nodes in the pipeline
+    :param samples_num: number of samples in the train data
+    :param features_num: number of features in the train data
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        json_path, archive_path = run_in_subprocess(save_fitted_pipeline,
+                                                    (folder, nodes_num, samples_num, features_num))
+        print(f'{nodes_num} nodes, archive size {os.path.getsize(archive_path) / MB:.1f} MB')
+
+        for name, load, args in [('directory with pickles', load_directory, (json_path,)),
+                                 ('archive read to memory', load_archive, (archive_path, None)),
+                                 ('archive memory-mapped', load_archive, (archive_path, 'c'))]:
+            duration, memory = run_in_subprocess(measure_load, (partial(load, *args),))
+            print(f'{name}: {duration * 1e3:.0f} ms, {memory:.1f} MB of resident memory')
+
+
+if __name__ == '__main__':
+    run_pipeline_archive_benchmark()
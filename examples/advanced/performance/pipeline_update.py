@@ -0,0 +1,78 @@
+import timeit
+from typing import Optional, Sequence
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_table(rows_num: int, features_num: int, seed: int) -> InputData:
+    """ Generates the regression table with the non-linear dependency of the target on the features """
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(rows_num, features_num))
+    target = np.sin(features[:, 0]) * 3 + features[:, 1:] @ np.linspace(1, 0, features_num - 1) + \
+        rng.normal(scale=0.1, size=rows_num)
+    return InputData(idx=np.arange(rows_num), features=features, target=target,
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+
+
+def run_pipeline_update_benchmark(models: Sequence[str] = ('sgdr', 'lgbmreg', 'rfr'), history_rows: int = 200000,
+                                  new_rows: int = 10000, features_num: int = 20):
+    """
+    Compares the retraining of the fitted pipeline on the history with the appended rows from scratch
+    with the update of the pipeline by the appended rows, which refits only the drifted operations on the history.
+    The updated boosting models are also compared with the ones fitted from scratch with the same number of the trees
+
+    :param models: models of the pipelines, their features are scaled
+    :param history_rows: number of rows the pipeline is fitted on
+    :param new_rows: number of the appended rows
+    :param features_num: number of the features
+    """
+    history = get_table(history_rows, features_num, seed=1)
+    new_data = get_table(new_rows, features_num, seed=2)
+    full_data = InputData(idx=np.arange(history_rows + new_rows),
+                          features=np.vstack([history.features, new_data.features]),
+                          target=np.concatenate([history.target, new_data.target]),
+                          task=history.task, data_type=history.data_type)
+    test_data = get_table(new_rows, features_num, seed=3)
+
+    for model in models:
+        params = {'n_estimators': 20, 'max_depth': 8} if model == 'rfr' else {}
+        retrained = PipelineBuilder().add_node('scaling').add_node(model, params=params).to_pipeline()
+        updated = PipelineBuilder().add_node('scaling').add_node(model, params=params).to_pipeline()
+        updated.fit(history)
+
+        fit_duration = timeit.timeit(lambda: retrained.fit(full_data), number=1)
+        update_duration = timeit.timeit(lambda: updated.update(new_data, refit_data=full_data), number=1)
+
+        retrained_error = np.mean(np.abs(retrained.predict(test_data).predict - test_data.target))
+        updated_error = np.mean(np.abs(updated.predict(test_data).predict - test_data.target))
+        print(f'{model}: fit from scratch {fit_duration:.2f} s (MAE {retrained_error:.3f}), '
+              f'update {update_duration:.2f} s (MAE {updated_error:.3f})')
+
+        trees_num = getattr(updated.root_node.fitted_operation, 'n_estimators', None)
+        updated_trees_num = _trees_num(updated.root_node.fitted_operation)
+        if trees_num is not None and updated_trees_num is not None and updated_trees_num > trees_num:
+            # The boosting model grows by the update, so it is compared with the model of the same size
+            same_size = PipelineBuilder().add_node('scaling') \
+                .add_node(model, params={**params, 'n_estimators': updated_trees_num}).to_pipeline()
+            same_size_duration = timeit.timeit(lambda: same_size.fit(full_data), number=1)
+            same_size_error = np.mean(np.abs(same_size.predict(test_data).predict - test_data.target))
+            print(f'{model}: fit from scratch with {updated_trees_num} trees as the updated model '
+                  f'{same_size_duration:.2f} s (MAE {same_size_error:.3f})')
+
+
+def _trees_num(boosting_model) -> Optional[int]:
+    """ Gets the number of the trees of the XGBoost or LightGBM model """
+    if hasattr(boosting_model, 'booster_'):
+        return boosting_model.booster_.num_trees()
+    if hasattr(boosting_model, 'get_booster'):
+        return boosting_model.get_booster().num_boosted_rounds()
+    return None
+
+
+if __name__ == '__main__':
+    run_pipeline_update_benchmark()
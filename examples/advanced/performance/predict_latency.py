@@ -0,0 +1,44 @@
+import timeit
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.operations.model import Model
+from fedot.core.operations.operation_parameters import OperationParameters
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_classification_data(n_rows: int, n_features: int = 10) -> InputData:
+    features = np.random.rand(n_rows, n_features)
+    target = (features[:, 0] > 0.5).astype(int).reshape((-1, 1))
+    return InputData(idx=np.arange(n_rows), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def run_single_row_predict_benchmark(operation_type: str = 'logit', repeats: int = 1000):
+    """
+    Measures latency of the single-row prediction of the fitted operation.
+    The first prediction initializes the evaluation strategy (if it was not bound at fit stage),
+    subsequent predictions show the steady-state latency
+
+    :param operation_type: name of the model to measure
+    :param repeats: number of single-row predictions
+    """
+    train_data = get_classification_data(n_rows=1000)
+    single_row = get_classification_data(n_rows=1)
+
+    model = Model(operation_type=operation_type)
+    params = OperationParameters.from_operation_type(operation_type)
+    fitted_operation, _ = model.fit(params=params, data=train_data)
+
+    latencies = np.array(timeit.repeat(lambda: model.predict(fitted_operation, data=single_row, params=params),
+                                       number=1, repeat=repeats))
+    print(f'{operation_type} single-row predict latency: '
+          f'p50 {np.percentile(latencies, 50) * 1e6:.1f} us, '
+          f'p99 {np.percentile(latencies, 99) * 1e6:.1f} us')
+    return latencies
+
+
+if __name__ == '__main__':
+    run_single_row_predict_benchmark()
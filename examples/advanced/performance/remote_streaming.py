@@ -0,0 +1,44 @@
+import os
+import tempfile
+import timeit
+
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.utils import fedot_project_root
+from fedot.remote.infrastructure.clients.http_client import HttpClient
+from fedot.remote.infrastructure.local_server import LocalEvaluationServer
+from fedot.remote.remote_evaluator import RemoteEvaluator, RemoteTaskParams
+
+# Models with the different fitting time, so the tasks of the same batch are finished at different moments
+MODELS = ['logit', 'rf', 'dt', 'knn']
+
+
+def run_remote_streaming_benchmark(pipelines_num: int = 12, n_workers: int = 4):
+    """
+    Compares time of the remote evaluation with the local server when the pipelines
+    are submitted by batches and when they are streamed to the server
+
+    :param pipelines_num: number of pipelines to fit
+    :param n_workers: number of worker processes of the server (and maximal number of running tasks)
+    """
+    pipelines = [PipelineBuilder().add_node('scaling').add_node(MODELS[i % len(MODELS)]).to_pipeline()
+                 for i in range(pipelines_num)]
+    remote_task_params = RemoteTaskParams(mode='remote', dataset_name='advanced_classification',
+                                          task_type='Task(TaskTypesEnum.classification)',
+                                          max_parallel=n_workers, poll_interval=0.2)
+    with tempfile.TemporaryDirectory() as output_path, LocalEvaluationServer(n_workers=n_workers) as server:
+        exec_params = {'container_input_path': os.path.join(fedot_project_root(), 'test', 'data'),
+                       'container_output_path': output_path,
+                       'poll_interval': remote_task_params.poll_interval}
+        evaluator = RemoteEvaluator()
+        evaluator.init(HttpClient({'url': server.url}, exec_params, output_path), remote_task_params)
+        # Warm-up of the spawned workers importing the framework
+        evaluator.compute_graphs(pipelines[:n_workers])
+        for name, compute in [('batches', evaluator._compute_graphs_by_batches),
+                              ('streaming', evaluator.compute_graphs)]:
+            duration = timeit.timeit(lambda: compute(pipelines), number=1)
+            print(f'{name}: {duration:.1f} s for {pipelines_num} pipelines')
+        evaluator.init(None, RemoteTaskParams(mode='local'))
+
+
+if __name__ == '__main__':
+    run_remote_streaming_benchmark()
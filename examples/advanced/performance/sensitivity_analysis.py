@@ -0,0 +1,55 @@
+import timeit
+
+from sklearn.datasets import make_classification
+
+from fedot.core.data.data import InputData
+from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.sensitivity.operations_hp_sensitivity.one_operation_sensitivity import OneOperationHPAnalyze
+from fedot.sensitivity.operations_hp_sensitivity.problem import OneOperationProblem
+from fedot.sensitivity.sa_requirements import SensitivityAnalysisRequirements
+from fedot.sensitivity.sample_evaluation import unfit_downstream
+
+
+def get_pipeline() -> Pipeline:
+    """ Builds pipeline with the heavy models upstream of the cheap final model """
+    return PipelineBuilder().add_node('scaling').add_branch('rf', 'knn', 'logit').join_branches('logit') \
+        .to_pipeline()
+
+
+def run_sensitivity_benchmark(samples_num: int = 5000, sample_size: int = 8, n_jobs: int = 1):
+    """
+    Measures the evaluation time of the pipelines sampled by the hyperparameters sensitivity analysis
+    of the final node. Each sample changes only the final node, so it is compared how long the samples
+    are evaluated when the fitted upstream nodes are reused and when all the nodes are fitted again
+
+    :param samples_num: number of samples in the data
+    :param sample_size: base sample size of Saltelli method (the number of sampled pipelines is 4 times more)
+    :param n_jobs: number of processes evaluating the sampled pipelines
+    """
+    features, target = make_classification(samples_num, 20, random_state=1)
+    data = InputData(idx=list(range(samples_num)), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+    train_data, test_data = train_test_data_setup(data)
+    requirements = SensitivityAnalysisRequirements(hyperparams_analysis_samples_size=sample_size,
+                                                   is_visualize=False, n_jobs=n_jobs)
+
+    pipeline = get_pipeline()
+    pipeline.fit(train_data)
+    analyze = OneOperationHPAnalyze(pipeline, train_data, test_data, requirements=requirements)
+    analyze.problem = OneOperationProblem(operation_types=[pipeline.root_node.operation.operation_type])
+    samples = analyze.sample(sample_size, pipeline.root_node)
+    print(f'{len(samples)} sampled pipelines')
+
+    reused_duration = timeit.timeit(lambda: analyze._get_response_matrix(samples), number=1)
+    for sample in samples:
+        unfit_downstream(sample, sample.nodes)
+    full_duration = timeit.timeit(lambda: analyze._get_response_matrix(samples), number=1)
+    print(f'Upstream nodes reused: {reused_duration:.1f} s, all nodes fitted: {full_duration:.1f} s')
+
+
+if __name__ == '__main__':
+    run_sensitivity_benchmark()
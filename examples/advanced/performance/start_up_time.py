@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import timeit
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utils import fedot_project_root
+
+API_SCRIPT = 'from fedot.api.main import Fedot'
+
+# Dependencies imported by any pipeline, the start up of the process with them is the lower bound for FEDOT
+DEPENDENCIES_SCRIPT = 'import numpy, pandas, scipy.stats, sklearn.ensemble, sklearn.preprocessing'
+
+PREDICT_ONLY_SCRIPT = """
+import numpy as np
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+pipeline = Pipeline()
+pipeline.load(r'{path}')
+pipeline.predict(InputData(idx=np.arange(1), features=np.random.rand(1, 5), target=None,
+                           task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table))
+"""
+
+
+def save_fitted_pipeline(path: str) -> str:
+    """ Fits and saves a small classification pipeline, returns path to its json file """
+    features = np.random.rand(100, 5)
+    data = InputData(idx=np.arange(100), features=features, target=(features[:, 0] > 0.5).astype(int),
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+    pipeline = Pipeline(SecondaryNode('rf', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(data)
+    pipeline.save(path, datetime_in_path=False)
+    return os.path.join(path, f'{os.path.basename(path)}.json')
+
+
+def measure_process_time(script: str, repeats: int = 5) -> np.ndarray:
+    """
+    Measures wall time of the short-lived process running the script
+    (including interpreter start up and imports)
+
+    :param script: python code to run in the fresh interpreter
+    :param repeats: number of measurements
+    """
+    command = [sys.executable, '-c', script]
+    return np.array([timeit.timeit(lambda: subprocess.check_call(command, cwd=str(fedot_project_root())),
+                                   number=1)
+                     for _ in range(repeats)])
+
+
+def run_start_up_benchmark(repeats: int = 5):
+    with TemporaryDirectory() as temp_dir:
+        pipeline_path = save_fitted_pipeline(os.path.join(temp_dir, 'pipeline'))
+        scripts = {'dependencies import': DEPENDENCIES_SCRIPT,
+                   'predict-only process': PREDICT_ONLY_SCRIPT.format(path=pipeline_path),
+                   'api import': API_SCRIPT}
+        for name, script in scripts.items():
+            timings = measure_process_time(script, repeats)
+            print(f'{name}: median {np.median(timings):.3f} s, max {np.max(timings):.3f} s')
+
+
+if __name__ == '__main__':
+    run_start_up_benchmark()
@@ -0,0 +1,45 @@
+import timeit
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
+    GaussianFilterImplementation, NumericalDerivativeFilterImplementation, TsSmoothingImplementation
+from fedot.core.operations.operation_parameters import OperationParameters
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+
+
+def get_series_data(ts_len: int, series_num: int = 1) -> InputData:
+    """ Generates the random walk series, the table of series is used as multi_ts data """
+    rng = np.random.default_rng(1)
+    series = np.cumsum(rng.normal(size=(ts_len, series_num)), axis=0)
+    data_type = DataTypesEnum.multi_ts if series_num > 1 else DataTypesEnum.ts
+    features = series if series_num > 1 else np.ravel(series)
+    return InputData(idx=np.arange(ts_len), features=features, target=features,
+                     task=Task(TaskTypesEnum.ts_forecasting, TsForecastingParams(forecast_length=10)),
+                     data_type=data_type)
+
+
+def run_ts_filters_benchmark(ts_len: int = 5000, series_num: int = 20, repeats: int = 3):
+    """
+    Measures time of the time series filters for single series and for the table of series
+
+    :param ts_len: length of the series
+    :param series_num: number of series in the multi_ts data
+    :param repeats: number of measurements for each filter
+    """
+    filters = {
+        'smoothing': lambda: TsSmoothingImplementation(OperationParameters(window_size=10)),
+        'gaussian filter': lambda: GaussianFilterImplementation(OperationParameters(sigma=2)),
+        'numerical derivative': lambda: NumericalDerivativeFilterImplementation(
+            OperationParameters(window_size=10, poly_degree=3, order=1)),
+    }
+    for data in (get_series_data(ts_len), get_series_data(ts_len, series_num)):
+        for name, get_filter in filters.items():
+            duration = min(timeit.repeat(lambda: get_filter().transform(data), number=1, repeat=repeats))
+            print(f'{name} for {data.data_type.name} of shape {data.features.shape}: {duration * 1e3:.1f} ms')
+
+
+if __name__ == '__main__':
+    run_ts_filters_benchmark()
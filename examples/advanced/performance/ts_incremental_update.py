@@ -0,0 +1,60 @@
+import timeit
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+from fedot.core.validation.split import ts_cv_generator
+
+
+def get_series_data(ts_len: int, forecast_length: int) -> InputData:
+    """ Generates the seasonal series with the autoregressive noise """
+    rng = np.random.default_rng(1)
+    noise = np.zeros(ts_len)
+    for i in range(1, ts_len):
+        noise[i] = 0.7 * noise[i - 1] + rng.normal()
+    series = 10 * np.sin(np.arange(ts_len) * 2 * np.pi / 50) + noise + 50
+    return InputData(idx=np.arange(ts_len), features=series, target=series,
+                     task=Task(TaskTypesEnum.ts_forecasting, TsForecastingParams(forecast_length=forecast_length)),
+                     data_type=DataTypesEnum.ts)
+
+
+def fit_on_folds(pipeline: Pipeline, folds: list, keep_state: bool) -> list:
+    """ Fits the pipeline on the train part of each fold and forecasts its validation part """
+    forecasts = []
+    for train_data, _ in folds:
+        pipeline.unfit(keep_state=keep_state)
+        pipeline.fit(train_data)
+        forecasts.append(pipeline.predict(train_data).predict)
+    pipeline.unfit()
+    return forecasts
+
+
+def run_ts_update_benchmark(ts_len: int = 3000, folds_num: int = 20, forecast_length: int = 10):
+    """
+    Measures time of the fold-by-fold fit of the statistical time series models, when the model
+    of each fold is updated with the observations appended to the series of the previous fold
+    and when it is fitted from scratch
+
+    :param ts_len: length of the series
+    :param folds_num: number of folds of the time series cross validation
+    :param forecast_length: forecast horizon of each fold
+    """
+    data = get_series_data(ts_len, forecast_length)
+    folds = list(ts_cv_generator(data, folds_num))
+    for operation, params in (('arima', dict(p=2, d=0, q=2)),
+                              ('ets', dict(error='add', trend='add', seasonal='add', seasonal_periods=50))):
+        pipeline = PipelineBuilder().add_node(operation, params=params).to_pipeline()
+        updated, refitted = [], []
+        updated_duration = timeit.timeit(lambda: updated.extend(fit_on_folds(pipeline, folds, True)), number=1)
+        refitted_duration = timeit.timeit(lambda: refitted.extend(fit_on_folds(pipeline, folds, False)), number=1)
+        max_difference = max(np.max(np.abs(u - r)) for u, r in zip(updated, refitted))
+        print(f'{operation} on {folds_num} folds: updated {updated_duration:.1f} s, '
+              f'fitted from scratch {refitted_duration:.1f} s, max forecast difference {max_difference:.3f}')
+
+
+if __name__ == '__main__':
+    run_ts_update_benchmark()
@@ -13,11 +13,9 @@ from fedot.core.composer.advisor import PipelineChangeAdvisor
 from fedot.core.composer.composer_builder import ComposerBuilder
 from fedot.core.composer.gp_composer.gp_composer import GPComposer
 from fedot.core.composer.gp_composer.specific_operators import boosting_mutation, parameter_change_mutation
-from fedot.core.constants import DEFAULT_TUNING_ITERATIONS_NUMBER
 from fedot.core.data.data import InputData
 from fedot.core.log import default_log
 from fedot.core.optimisers.adapters import PipelineAdapter
-from fedot.core.optimisers.gp_comp.evaluation import determine_n_jobs
 from fedot.core.optimisers.gp_comp.gp_params import GPGraphOptimizerParameters
 from fedot.core.optimisers.gp_comp.operators.inheritance import GeneticSchemeTypesEnum
 from fedot.core.optimisers.gp_comp.operators.mutation import MutationTypesEnum
@@ -33,6 +31,7 @@ from fedot.core.repository.operation_types_repository import get_operations_for_
 from fedot.core.repository.pipeline_operation_repository import PipelineOperationRepository
 from fedot.core.repository.quality_metrics_repository import MetricsRepository, MetricType, MetricsEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utilities.cpu_budget import determine_n_jobs
 from fedot.utilities.define_metric_by_task import MetricByTask
 
 
@@ -117,13 +116,16 @@ class ApiComposer:
             early_stopping_generations=composer_params.get('early_stopping_generations', None),
 
             max_pipeline_fit_time=max_pipeline_fit_time,
+            isolated_fit=composer_params['isolated_fit'],
             n_jobs=api_params['n_jobs'],
             show_progress=api_params['show_progress'],
             collect_intermediate_metric=composer_params['collect_intermediate_metric'],
+            profile_nodes=composer_params['profile_nodes'],
             keep_n_best=composer_params['keep_n_best'],
 
             cv_folds=composer_params['cv_folds'],
             validation_blocks=composer_params['validation_blocks'],
+            progressive_sampling=composer_params['progressive_sampling'],
         )
         return composer_requirements
 
@@ -185,7 +187,8 @@ class ApiComposer:
         available_operations = composer_params['available_operations']
         preset = composer_params['preset']
 
-        self.timer = ApiTime(time_for_automl=timeout, with_tuning=with_tuning)
+        data_shape = getattr(train_data.features, 'shape', ()) if isinstance(train_data, InputData) else ()
+        self.timer = ApiTime(time_for_automl=timeout, with_tuning=with_tuning, data_shape=data_shape)
 
         # Work with initial assumptions
         assumption_handler = AssumptionsHandler(train_data)
@@ -260,6 +263,8 @@ class ApiComposer:
             .with_cache(self.pipelines_cache, self.preprocessing_cache) \
             .with_graph_generation_param(graph_generation_params=graph_generation_params) \
             .build()
+        # The evaluation time learned by the optimizer is used to determine the time for tuning
+        gp_composer.optimizer.set_time_estimator(self.timer.time_estimator)
 
         n_jobs = determine_n_jobs(composer_requirements.n_jobs)
         if self.timer.have_time_for_composing(composer_params['pop_size'], n_jobs):
@@ -289,20 +294,22 @@ class ApiComposer:
                             pipeline_gp_composed: Pipeline,
                             ) -> Pipeline:
         """ Launch tuning procedure for obtained pipeline by composer """
-        timeout_for_tuning = abs(self.timer.determine_resources_for_tuning()) / 60
+        timeout_for_tuning = abs(self.timer.determine_resources_for_tuning(pipeline_gp_composed)) / 60
+        iterations_for_tuning = self.timer.determine_iterations_for_tuning(pipeline_gp_composed)
         tuner = TunerBuilder(task) \
             .with_tuner(PipelineTuner) \
             .with_metric(metric_function) \
-            .with_iterations(DEFAULT_TUNING_ITERATIONS_NUMBER) \
+            .with_iterations(iterations_for_tuning) \
             .with_timeout(datetime.timedelta(minutes=timeout_for_tuning)) \
             .with_eval_time_constraint(composer_requirements.max_pipeline_fit_time) \
             .with_requirements(composer_requirements) \
             .build(train_data)
 
-        if self.timer.have_time_for_tuning():
+        if self.timer.have_time_for_tuning(pipeline_gp_composed):
             # Tune all nodes in the pipeline
             with self.timer.launch_tuning():
-                self.log.message(f'Hyperparameters tuning started with {round(timeout_for_tuning)} sec. timeout')
+                self.log.message(f'Hyperparameters tuning started with {round(timeout_for_tuning)} sec. timeout '
+                                 f'and {iterations_for_tuning} iterations')
                 self.was_tuned = False
                 tuned_pipeline = tuner.tune(pipeline_gp_composed)
                 self.was_tuned = True
@@ -328,8 +335,8 @@ def _divide_parameters(common_dict: dict) -> List[dict]:
                                 keep_n_best=None, available_operations=None, metric=None,
                                 validation_blocks=None, cv_folds=None, genetic_scheme=None, history_folder=None,
                                 early_stopping_generations=None, optimizer=None, optimizer_external_params=None,
-                                collect_intermediate_metric=False, max_pipeline_fit_time=None,
-                                initial_assumption=None, preset='auto',
+                                collect_intermediate_metric=False, profile_nodes=False, progressive_sampling=False,
+                                max_pipeline_fit_time=None, isolated_fit=False, initial_assumption=None, preset='auto',
                                 use_pipelines_cache=True, use_preprocessing_cache=True, cache_folder=None)
 
     tuner_params_dict = dict(with_tuning=False)
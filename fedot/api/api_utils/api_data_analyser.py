@@ -13,7 +13,8 @@ class DataAnalyser:
     Class to analyse data that comes to FEDOT API.
     All methods are inplace to prevent unnecessary copy of large datasets
     It functionality is:
-    1) Cut large datasets to prevent memory stackoverflow
+    1) Cut large datasets to prevent memory stackoverflow (the remaining objects are sampled
+       with stratification by classes or by quantiles of the target)
     2) Use label encoder with tree models instead OneHot when summary cardinality of categorical features is high
     """
 
@@ -5,6 +5,7 @@ from typing import Union
 import numpy as np
 import pandas as pd
 
+from fedot.core.data.columnar import ARROW_EXTENSIONS, PARQUET_EXTENSIONS, has_extension
 from fedot.core.data.data import InputData, array_to_input_data
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -113,7 +114,7 @@ class CsvStrategy(StrategyDefineData):
                     ml_task: Task,
                     target: str = None,
                     is_predict: bool = False) -> InputData:
-        # CSV files as input data, by default - table data
+        # CSV, Parquet or Arrow files as input data, by default - table data
 
         data_type = DataTypesEnum.table
         if ml_task.task_type == TaskTypesEnum.ts_forecasting:
@@ -122,6 +123,14 @@ class CsvStrategy(StrategyDefineData):
                                                   file_path=features,
                                                   target_column=target,
                                                   is_predict=is_predict)
+        elif has_extension(features, PARQUET_EXTENSIONS):
+            data = InputData.from_parquet(features, task=ml_task,
+                                          target_columns=target,
+                                          data_type=data_type)
+        elif has_extension(features, ARROW_EXTENSIONS):
+            data = InputData.from_arrow(features, task=ml_task,
+                                        target_columns=target,
+                                        data_type=data_type)
         else:
             # Make default features table
             # CSV files as input data
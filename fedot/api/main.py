@@ -14,14 +14,12 @@ from fedot.api.api_utils.predefined_model import PredefinedModel
 from fedot.core.constants import DEFAULT_API_TIMEOUT_MINUTES
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.multi_modal import MultiModalData
-from fedot.core.data.visualisation import plot_biplot, plot_forecast, plot_roc_auc
 from fedot.core.optimisers.opt_history import OptHistory
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.ts_wrappers import out_of_sample_ts_forecast, convert_forecast_to_output
 from fedot.core.repository.quality_metrics_repository import MetricsRepository
 from fedot.core.repository.tasks import TaskParams, TaskTypesEnum
 from fedot.core.utilities.data_structures import ensure_wrapped_in_sequence
-from fedot.core.visualisation.opt_viz_extra import visualise_pareto
 from fedot.explainability.explainer_template import Explainer
 from fedot.explainability.explainers import explain_pipeline
 from fedot.preprocessing.preprocessing import merge_preprocessors
@@ -76,11 +74,18 @@ class Fedot:
         cv_folds: number of folds for cross-validation
         validation_blocks: number of validation blocks for time series forecasting
         max_pipeline_fit_time: time constraint for operation fitting (in minutes)
+        isolated_fit: fit candidate pipelines in the separate processes which are killed
+            when ``max_pipeline_fit_time`` expires (even if an operation hangs in the native code)
         initial_assumption: initial assumption for composer
         genetic_scheme: name of the genetic scheme
         history_folder: name of the folder for composing history
         metric:  metric for quality calculation during composing, also is used for tuning if with_tuning=True
         collect_intermediate_metric: save metrics for intermediate (non-root) nodes in pipeline
+        profile_nodes: save time, memory and cache hits of each node of the candidate pipelines,
+            they are aggregated by :meth:`OptHistory.operations_profile` of the composing history
+        progressive_sampling: score candidate pipelines on the growing subsamples of the train data
+            and evaluate on the full data only the best of them.
+            Used only with ``n_jobs=1`` since the subsample scores are not shared between the evaluating processes
         preset: name of preset for model building (e.g. 'best_quality', 'fast_train', 'gpu'):
 
             .. details:: possible ``preset`` options:
@@ -298,6 +303,8 @@ class Fedot:
         self.data_processor.preprocessor = self.current_pipeline.preprocessor
 
     def plot_pareto(self):
+        from fedot.core.visualisation.opt_viz_extra import visualise_pareto
+
         metric_names = self.params.metric_to_compose
         # archive_history stores archives of the best models.
         # Each archive is sorted from the best to the worst model,
@@ -313,6 +320,8 @@ class Fedot:
         Args:
             target: user-specified name of target variable for :obj:`MultiModalData`
         """
+        from fedot.core.data.visualisation import plot_biplot, plot_forecast, plot_roc_auc
+
         if self.prediction is not None:
             if self.params.api_params['task'].task_type == TaskTypesEnum.ts_forecasting:
                 plot_forecast(self.test_data, self.prediction, target)
@@ -2,22 +2,31 @@ import datetime
 from contextlib import contextmanager
 from typing import Optional
 
-from fedot.core.constants import COMPOSING_TUNING_PROPORTION, MINIMAL_PIPELINE_NUMBER_FOR_EVALUATION, \
-    MINIMAL_SECONDS_FOR_TUNING
+from fedot.core.constants import COMPOSING_TUNING_PROPORTION, DEFAULT_TUNING_ITERATIONS_NUMBER, \
+    MINIMAL_PIPELINE_NUMBER_FOR_EVALUATION, MINIMAL_SECONDS_FOR_TUNING, TUNER_EVALUATIONS_OUT_OF_TIMEOUT
+from fedot.core.dag.graph import Graph
+from fedot.core.optimisers.time_estimator import EvaluationTimeEstimator
 
 
 class ApiTime:
     """
-    A class for performing operations on the AutoML algorithm runtime at the API level
+    A class for performing operations on the AutoML algorithm runtime at the API level.
+
+    The evaluation time of the candidates is learned during composing by the ``time_estimator``,
+    which is shared with the optimizer to size the populations and to stop the generations that would not finish
+    before the timeout. The timeout for tuning excludes the evaluations made by the tuner beyond its own timeout,
+    the number of the tuning iterations is reduced to the ones fitting into this timeout,
+    and the time of the final fit of the pipeline is reserved as the time of the initial assumption fit
 
     :param time_for_automl: time for AutoML algorithms in minutes
+    :param with_tuning: whether the time is reserved for tuning
+    :param data_shape: shape of the train data
     """
 
     def __init__(self, **time_params):
         self.time_for_automl = time_params.get('time_for_automl')
         self.with_tuning = time_params.get('with_tuning')
-
-        self.__define_timeouts_for_stages()
+        self.time_estimator = EvaluationTimeEstimator(data_shape=time_params.get('data_shape', ()))
 
         self.composing_spend_time = datetime.timedelta(minutes=0)
 
@@ -25,16 +34,30 @@ class ApiTime:
 
         self.assumption_fit_spend_time = datetime.timedelta(minutes=0)
 
-    def __define_timeouts_for_stages(self):
-        """ Determine timeouts for tuning and composing """
+    @property
+    def timeout_for_composing(self) -> Optional[float]:
+        """ Determine timeout for composing in minutes, the part of it is left for tuning """
         if self.time_for_automl in [None, -1]:
-            self.timeout_for_composing = None
-        else:
-            # Time for composing based on tuning parameters
-            if self.with_tuning:
-                self.timeout_for_composing = self.time_for_automl * COMPOSING_TUNING_PROPORTION
-            else:
-                self.timeout_for_composing = self.time_for_automl
+            return None
+        available_time = self.time_for_automl - self.final_fit_reserve.total_seconds() / 60
+        # Time for composing based on tuning parameters
+        if self.with_tuning:
+            return available_time * COMPOSING_TUNING_PROPORTION
+        return available_time
+
+    @property
+    def final_fit_reserve(self) -> datetime.timedelta:
+        """ Time reserved for the fit of the final pipeline on the whole train data after composing and tuning.
+        It is expected to be as long as the fit of the initial assumption """
+        return self.assumption_fit_spend_time
+
+    def expected_evaluation_time(self, pipeline: Graph) -> datetime.timedelta:
+        """ Expected evaluation time of the pipeline learned during composing,
+        the fit time of the initial assumption if composing has not evaluated any pipeline """
+        seconds = self.time_estimator.predict(pipeline)
+        if seconds is None:
+            return self.assumption_fit_spend_time
+        return datetime.timedelta(seconds=seconds)
 
     def have_time_for_composing(self, pop_size: int, n_jobs: int) -> bool:
         timeout_not_set = self.timedelta_composing is None
@@ -46,9 +69,12 @@ class ApiTime:
             return True
         return self.assumption_fit_spend_time <= self.timedelta_automl * n_jobs / MINIMAL_PIPELINE_NUMBER_FOR_EVALUATION
 
-    def have_time_for_tuning(self):
-        timeout_for_tuning = self.determine_resources_for_tuning()
-        return timeout_for_tuning >= MINIMAL_SECONDS_FOR_TUNING
+    def have_time_for_tuning(self, pipeline: Optional[Graph] = None):
+        timeout_for_tuning = self.determine_resources_for_tuning(pipeline)
+        if pipeline is None or not self.expected_evaluation_time(pipeline):
+            return timeout_for_tuning >= MINIMAL_SECONDS_FOR_TUNING
+        # The number of iterations is reduced to the remaining time, but the timeout of the tuner is in whole seconds
+        return timeout_for_tuning >= 1
 
     @contextmanager
     def launch_composing(self):
@@ -71,22 +97,43 @@ class ApiTime:
         yield
         self.assumption_fit_spend_time = datetime.datetime.now() - starting_time_for_assumption_fit
 
-    def determine_resources_for_tuning(self):
+    def determine_resources_for_tuning(self, pipeline: Optional[Graph] = None):
         """
         Based on time spend for composing and initial pipeline fit determine
         how much time and how many iterations are needed for tuning
 
+        :param pipeline: pipeline to tune, the time of its evaluations made by the tuner beyond its timeout
+        (the checks before and after the search and the last iteration of the search) is subtracted
         """
         all_spend_time = self.composing_spend_time + self.assumption_fit_spend_time
 
         if self.time_for_automl is not None:
             all_timeout = float(self.time_for_automl)
             timeout_in_sec = datetime.timedelta(minutes=all_timeout).total_seconds()
-            timeout_for_tuning = timeout_in_sec - all_spend_time.total_seconds()
+            reserved_time = self.final_fit_reserve
+            if pipeline is not None:
+                reserved_time += self.expected_evaluation_time(pipeline) * TUNER_EVALUATIONS_OUT_OF_TIMEOUT
+            timeout_for_tuning = timeout_in_sec - all_spend_time.total_seconds() - reserved_time.total_seconds()
         else:
             timeout_for_tuning = all_spend_time.total_seconds()
         return timeout_for_tuning
 
+    def determine_iterations_for_tuning(self, pipeline: Optional[Graph] = None) -> int:
+        """
+        Determine how many iterations of tuning fit into the timeout for tuning
+        according to the expected evaluation time of the pipeline
+
+        :param pipeline: pipeline to tune, the default number of iterations is used if it is not passed
+        """
+        if self.time_for_automl is None or pipeline is None:
+            return DEFAULT_TUNING_ITERATIONS_NUMBER
+        evaluation_seconds = self.expected_evaluation_time(pipeline).total_seconds()
+        if not evaluation_seconds:
+            return DEFAULT_TUNING_ITERATIONS_NUMBER
+        # The search is stopped after the first iteration which exceeds the timeout
+        iterations = int(self.determine_resources_for_tuning(pipeline) // evaluation_seconds) + 1
+        return max(0, min(iterations, DEFAULT_TUNING_ITERATIONS_NUMBER))
+
     @property
     def timedelta_composing(self) -> Optional[datetime.timedelta]:
         if self.timeout_for_composing is None:
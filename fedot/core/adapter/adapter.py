@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import TypeVar, Generic, Type, Optional, Dict, Any, Callable, Tuple, Sequence, Union
 
+from fedot.core.dag.graph_operator import GraphOperator
 from fedot.core.log import default_log
 from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.gp_comp.operators.operator import PopulationT
@@ -117,7 +118,7 @@ class DirectAdapter(BaseOptimizationAdapter[DomainStructureType]):
         self._base_node_class = base_node_class
 
     def _adapt(self, adaptee: DomainStructureType) -> OptGraph:
-        opt_graph = deepcopy(adaptee)
+        opt_graph = _copy_structure(adaptee)
         opt_graph.__class__ = OptGraph
 
         for node in opt_graph.nodes:
@@ -125,13 +126,25 @@ class DirectAdapter(BaseOptimizationAdapter[DomainStructureType]):
         return opt_graph
 
     def _restore(self, opt_graph: OptGraph, metadata: Optional[Dict[str, Any]] = None) -> DomainStructureType:
-        obj = deepcopy(opt_graph)
+        obj = _copy_structure(opt_graph)
         obj.__class__ = self.domain_graph_class
         for node in obj.nodes:
             node.__class__ = self._base_node_class
         return obj
 
 
+def _copy_structure(graph: Any) -> Any:
+    """Copies nodes and links of the graph sharing the content of the nodes with the source graph.
+    Falls back to the ``deepcopy`` for the structures which are not based on :class:`GraphOperator`.
+    """
+    operator = getattr(graph, 'operator', None)
+    if not isinstance(operator, GraphOperator):
+        return deepcopy(graph)
+    graph_copy = copy(graph)
+    graph_copy.operator = operator.copy_structure()
+    return graph_copy
+
+
 def _transform(fun: Callable, f_args: Callable, f_ret: Callable) -> Callable:
     """Transforms input function in the following way:
      ``f_args`` is called on each of the function arguments,
@@ -1,17 +1,21 @@
-from typing import Collection, Optional, Sequence, Tuple, Union
+from typing import Collection, List, Optional, Sequence, Tuple, Union
 
 from fedot.core.caching.pipelines_cache import OperationsCache
 from fedot.core.caching.preprocessing_cache import PreprocessingCache
 from fedot.core.composer.composer import Composer
+from fedot.core.constants import MINIMAL_PROGRESSIVE_SAMPLE_SIZE, PROGRESSIVE_SAMPLE_FRACTIONS
 from fedot.core.data.data import InputData
+from fedot.core.data.data_split import representative_subsample
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.optimisers.gp_comp.pipeline_composer_requirements import PipelineComposerRequirements
 from fedot.core.optimisers.graph import OptGraph
-from fedot.core.optimisers.objective import PipelineObjectiveEvaluate
+from fedot.core.optimisers.objective import PipelineObjectiveEvaluate, ProgressiveObjectiveEvaluate
 from fedot.core.optimisers.objective.data_source_splitter import DataSourceSplitter
 from fedot.core.optimisers.opt_history import OptHistory
 from fedot.core.optimisers.optimizer import GraphOptimizer
 from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import TaskTypesEnum
 
 
 class GPComposer(Composer):
@@ -38,18 +42,20 @@ class GPComposer(Composer):
         self.best_models: Collection[Pipeline] = ()
 
     def compose_pipeline(self, data: Union[InputData, MultiModalData]) -> Union[Pipeline, Sequence[Pipeline]]:
-        # Define data source
-        data_producer = DataSourceSplitter(self.composer_requirements.cv_folds,
-                                           self.composer_requirements.validation_blocks,
-                                           shuffle=True).build(data)
         # Define objective function
-        n_jobs_for_evaluation = 1
-        # TODO implement dispatcher selection
-        objective_evaluator = PipelineObjectiveEvaluate(self.optimizer.objective, data_producer,
-                                                        self.composer_requirements.max_pipeline_fit_time,
-                                                        self.composer_requirements.validation_blocks,
-                                                        self.pipelines_cache, self.preprocessing_cache,
-                                                        eval_n_jobs=n_jobs_for_evaluation)
+        objective_evaluator = self._build_objective_evaluator(data)
+        if self.composer_requirements.progressive_sampling and self.composer_requirements.n_jobs != 1:
+            # Scores on subsamples are not shared between the processes evaluating the population
+            self.log.warning('Progressive sampling is disabled since it requires sequential evaluation (n_jobs=1)')
+        elif self.composer_requirements.progressive_sampling:
+            subsamples = self._progressive_subsamples(data)
+            if subsamples:
+                self.log.info(f'Candidates are scored on subsamples of sizes {[len(s.idx) for s in subsamples]} '
+                              f'before the full data')
+                # Caches are not used for subsamples since their folds do not match the full data ones
+                evaluators = [self._build_objective_evaluator(subsample, use_caches=False)
+                              for subsample in subsamples]
+                objective_evaluator = ProgressiveObjectiveEvaluate([*evaluators, objective_evaluator])
         objective_function = objective_evaluator.evaluate
 
         # Define callback for computing intermediate metrics if needed
@@ -63,6 +69,32 @@ class GPComposer(Composer):
         self.log.info('GP composition finished')
         return best_model
 
+    def _build_objective_evaluator(self, data: Union[InputData, MultiModalData],
+                                   use_caches: bool = True) -> PipelineObjectiveEvaluate:
+        # Define data source
+        data_producer = DataSourceSplitter(self.composer_requirements.cv_folds,
+                                           self.composer_requirements.validation_blocks,
+                                           shuffle=True).build(data)
+        # Threads of the models are assigned to each evaluation by the CPU budget of the evaluation dispatcher
+        return PipelineObjectiveEvaluate(self.optimizer.objective, data_producer,
+                                         self.composer_requirements.max_pipeline_fit_time,
+                                         self.composer_requirements.validation_blocks,
+                                         self.pipelines_cache if use_caches else None,
+                                         self.preprocessing_cache if use_caches else None,
+                                         eval_n_jobs=None,
+                                         isolated_fit=self.composer_requirements.isolated_fit,
+                                         profile_nodes=self.composer_requirements.profile_nodes)
+
+    @staticmethod
+    def _progressive_subsamples(data: Union[InputData, MultiModalData]) -> List[InputData]:
+        """ Gets representative subsamples of growing size for the progressive sampling mode.
+        Only tabular data of classification and regression tasks is sampled """
+        if not isinstance(data, InputData) or data.data_type is not DataTypesEnum.table or \
+                data.task.task_type not in (TaskTypesEnum.classification, TaskTypesEnum.regression):
+            return []
+        sizes = [int(fraction * len(data.idx)) for fraction in PROGRESSIVE_SAMPLE_FRACTIONS]
+        return [representative_subsample(data, size) for size in sizes if size >= MINIMAL_PROGRESSIVE_SAMPLE_SIZE]
+
     def _convert_opt_results_to_pipeline(self, opt_result: Sequence[OptGraph]) -> Tuple[Pipeline, Sequence[Pipeline]]:
         adapter = self.optimizer.graph_generation_params.adapter
         multi_objective = self.optimizer.objective.is_multi_objective
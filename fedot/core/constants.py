@@ -7,6 +7,9 @@ EVALUATION_ATTEMPTS_NUMBER = 5
 DEFAULT_API_TIMEOUT_MINUTES = 5.0
 DEFAULT_FORECAST_LENGTH = 30
 COMPOSING_TUNING_PROPORTION = 0.6
+# Evaluations of the pipeline by the tuner which are not limited by its timeout:
+# the checks before and after the search and the last iteration of the search
+TUNER_EVALUATIONS_OUT_OF_TIMEOUT = 3
 
 BEST_QUALITY_PRESET_NAME = 'best_quality'
 FAST_TRAIN_PRESET_NAME = 'fast_train'
@@ -16,6 +19,13 @@ MINIMAL_PIPELINE_NUMBER_FOR_EVALUATION = 100
 
 FRACTION_OF_UNIQUE_VALUES = 0.95
 
+# Shares of the train data used to score candidates before the full data in the progressive sampling mode
+PROGRESSIVE_SAMPLE_FRACTIONS = (0.1, 0.3)
+MINIMAL_PROGRESSIVE_SAMPLE_SIZE = 500
+
+# Share of the trees of the boosting model added by each update of the fitted pipeline with the new data
+BOOSTING_UPDATE_TREES_FRACTION = 0.1
+
 default_data_split_ratio_by_task = {
     TaskTypesEnum.classification: 0.8,
     TaskTypesEnum.regression: 0.8,
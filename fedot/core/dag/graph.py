@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 from os import PathLike
-from typing import Tuple, Dict, List, Sequence, Union, TypeVar, Optional
+from typing import TYPE_CHECKING, Tuple, Dict, List, Sequence, Union, TypeVar, Optional
 
 from fedot.core.dag.graph_node import GraphNode
-from fedot.core.visualisation.graph_viz import GraphVisualiser, NodeColorType
+
+if TYPE_CHECKING:
+    from fedot.core.visualisation.graph_viz import NodeColorType
 
 NodeType = TypeVar('NodeType', bound=GraphNode, covariant=False, contravariant=False)
 
@@ -197,7 +199,7 @@ class Graph(ABC):
         return len(self.nodes)
 
     def show(self, save_path: Optional[Union[PathLike, str]] = None, engine: str = 'matplotlib',
-             node_color: Optional[NodeColorType] = None, dpi: int = 300,
+             node_color: Optional['NodeColorType'] = None, dpi: int = 300,
              node_size_scale: float = 1.0, font_size_scale: float = 1.0, edge_curvature_scale: float = 1.0):
         """Visualizes graph or saves its picture to the specified ``path``
 
@@ -210,6 +212,9 @@ class Graph(ABC):
             edge_curvature_scale: use to make edges more or less curved. Supported only for the engine 'matplotlib'.
             dpi: DPI of the output image. Not supported for the engine 'pyvis'.
         """
+        # Visualisation backends are heavy, so they are imported only when visualisation is requested
+        from fedot.core.visualisation.graph_viz import GraphVisualiser
+
         GraphVisualiser().visualise(self, save_path, engine, node_color, dpi, node_size_scale, font_size_scale,
                                     edge_curvature_scale)
 
@@ -1,5 +1,5 @@
 from copy import copy
-from typing import List, Optional, Union, Iterable
+from typing import Dict, List, Optional, Union, Iterable
 from uuid import uuid4
 
 from fedot.core.utilities.data_structures import UniqueList
@@ -148,3 +148,31 @@ def _descriptive_id_recursive(current_node: GraphNode, visited_nodes: Optional[L
     full_path_items.append(f'/{node_label}')
     full_path = ''.join(full_path_items)
     return full_path
+
+
+def copy_nodes_structure(nodes: Iterable[GraphNode]) -> List[GraphNode]:
+    """Copies the nodes together with the links between them.
+    Unlike the ``deepcopy``, only node objects and their ``content`` dictionaries are duplicated,
+    the values of the ``content`` (e.g. parameters and metadata) are shared with the source nodes.
+    So such values must be replaced instead of the inplace modification.
+    Parent nodes are copied as well even if they are not passed in ``nodes``
+
+    Args:
+        nodes: nodes to copy
+
+    Returns:
+        List[GraphNode]: copies of the ``nodes`` in the same order
+    """
+    copies: Dict[int, GraphNode] = {}
+
+    def copy_node(node: GraphNode) -> GraphNode:
+        node_copy = copies.get(id(node))
+        if node_copy is None:
+            node_copy = node.__class__.__new__(node.__class__)
+            node_copy.__dict__.update(node.__dict__)
+            node_copy.content = copy(node.content)
+            copies[id(node)] = node_copy
+            node_copy._nodes_from = UniqueList(copy_node(parent) for parent in node.nodes_from)
+        return node_copy
+
+    return [copy_node(node) for node in nodes]
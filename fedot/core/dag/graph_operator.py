@@ -1,10 +1,10 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Any, Dict, List, Optional, Tuple, Union, Callable, Sequence
 
 from networkx import graph_edit_distance, set_node_attributes
 
 from fedot.core.dag.graph import Graph
-from fedot.core.dag.graph_node import GraphNode
+from fedot.core.dag.graph_node import GraphNode, copy_nodes_structure
 from fedot.core.pipelines.convert import graph_structure_as_nx_graph
 from fedot.core.utilities.data_structures import ensure_wrapped_in_sequence, remove_items, Copyable
 from fedot.core.utils import copy_doc
@@ -200,6 +200,16 @@ class GraphOperator(Graph, Copyable):
     def nodes(self, new_nodes: List[GraphNode]):
         self._nodes = new_nodes
 
+    def copy_structure(self) -> 'GraphOperator':
+        """Returns the copy of the graph where nodes and links between them are copied,
+        but the content of the nodes is shared (see :func:`copy_nodes_structure`)
+        """
+        graph_copy = copy(self)
+        graph_copy._nodes = copy_nodes_structure(self._nodes)
+        if self._postprocess_nodes == self._empty_postprocess:
+            graph_copy._postprocess_nodes = graph_copy._empty_postprocess
+        return graph_copy
+
     @copy_doc(Graph)
     def __eq__(self, other_graph: Graph) -> bool:
         return \
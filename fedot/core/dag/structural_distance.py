@@ -0,0 +1,119 @@
+from collections import Counter
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, Sequence
+
+import numpy as np
+
+from fedot.core.dag.graph import Graph
+from fedot.core.dag.graph_node import GraphNode
+
+
+@dataclass(frozen=True)
+class StructuralEmbedding:
+    """Operation-multiset embedding of the graph used for the approximate structural distance
+
+    Args:
+        node_labels: numbers of nodes with the same operation and parameters
+        edges_num: number of edges in the graph
+    """
+
+    node_labels: Counter
+    edges_num: int
+
+    @property
+    def nodes_num(self) -> int:
+        return sum(self.node_labels.values())
+
+
+def node_label(node: GraphNode) -> str:
+    """Gets the label of the node which is equal for the nodes matched by :func:`get_distance_between`
+
+    :param node: node to describe
+
+    :return: operation name with the sorted parameters of the node
+    """
+    params = node.content.get('params') or {}
+    if isinstance(params, dict):
+        params = sorted(params.items(), key=lambda item: str(item[0]))
+    return f'{node}{params}'
+
+
+def structural_embedding(graph: Graph) -> StructuralEmbedding:
+    """Builds the operation-multiset embedding of the ``graph``
+
+    :param graph: graph to embed
+
+    :return: multiset of the node labels and the number of edges
+    """
+    return StructuralEmbedding(node_labels=Counter(node_label(node) for node in graph.nodes),
+                               edges_num=sum(len(node.nodes_from or ()) for node in graph.nodes))
+
+
+def get_approximate_distance_between(graph_1: Graph, graph_2: Graph) -> int:
+    """
+    Gets the cheap approximation of the edit distance from ``graph_1`` graph to the ``graph_2``.
+    The value is the lower bound of :func:`get_distance_between`: the nodes with the labels missing
+    in the other graph have to be substituted, inserted or deleted and the lacking edges have to be inserted.
+    The computation is linear in the size of the graphs
+
+    :param graph_1: left object to compare
+    :param graph_2: right object to compare
+
+    :return: approximate graph edit distance
+    """
+    return _embeddings_distance(structural_embedding(graph_1), structural_embedding(graph_2))
+
+
+def pairwise_approximate_distances(graphs: Sequence[Graph]) -> np.ndarray:
+    """
+    Computes approximate edit distances between all pairs of ``graphs`` at once
+
+    :param graphs: graphs to compare
+
+    :return: symmetric matrix of distances from :func:`get_approximate_distance_between`
+    """
+    embeddings = [structural_embedding(graph) for graph in graphs]
+    vocabulary: Dict[str, int] = {}
+    for embedding in embeddings:
+        for label in embedding.node_labels:
+            vocabulary.setdefault(label, len(vocabulary))
+
+    counts = np.zeros((len(embeddings), len(vocabulary)), dtype=int)
+    for row, embedding in enumerate(embeddings):
+        for label, count in embedding.node_labels.items():
+            counts[row, vocabulary[label]] = count
+    nodes_num = counts.sum(axis=1)
+    edges_num = np.array([embedding.edges_num for embedding in embeddings], dtype=int)
+
+    distances = np.zeros((len(embeddings), len(embeddings)), dtype=int)
+    for row in range(len(embeddings)):
+        common_nodes = np.minimum(counts[row], counts).sum(axis=1)
+        distances[row] = np.maximum(nodes_num[row], nodes_num) - common_nodes + np.abs(edges_num[row] - edges_num)
+    return distances
+
+
+def structural_diversity(graphs: Sequence[Graph]) -> float:
+    """
+    Estimates the structural diversity of the population of graphs
+
+    :param graphs: graphs of the population
+
+    :return: mean pairwise approximate distance normalized by the largest possible distance for each pair.
+        It is equal to 0 for the population of identical graphs and is not greater than 1
+    """
+    if len(graphs) < 2:
+        return 0.
+
+    distances = pairwise_approximate_distances(graphs)
+    sizes = np.array([[graph.length, sum(len(node.nodes_from or ()) for node in graph.nodes)] for graph in graphs])
+    upper_bounds = np.maximum(sizes[:, None, :], sizes[None, :, :]).sum(axis=-1)
+
+    pairs = tuple(np.array(list(combinations(range(len(graphs)), 2))).T)
+    return float(np.mean(distances[pairs] / np.maximum(upper_bounds[pairs], 1)))
+
+
+def _embeddings_distance(embedding_1: StructuralEmbedding, embedding_2: StructuralEmbedding) -> int:
+    common_nodes = sum((embedding_1.node_labels & embedding_2.node_labels).values())
+    return (max(embedding_1.nodes_num, embedding_2.nodes_num) - common_nodes +
+            abs(embedding_1.edges_num - embedding_2.edges_num))
@@ -0,0 +1,253 @@
+import os
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from fedot.core.data.array_utilities import atleast_2d
+from fedot.utilities.requirements_notificator import warn_requirement
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+NPY_EXTENSIONS = ('.npy',)
+CSV_EXTENSIONS = ('.csv',)
+
+# Number of rows in the chunks of files read piece by piece
+DEFAULT_CHUNK_SIZE = 1_000_000
+# Number of rows in the batches decoded at once while the whole Parquet file is read
+PARQUET_BATCH_SIZE = 65_536
+
+# Index, features and target of the table
+TableArrays = Tuple[Optional[np.ndarray], np.ndarray, Optional[np.ndarray]]
+
+
+def import_pyarrow():
+    """ Imports ``pyarrow`` which is needed only for Parquet and Arrow files """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ModuleNotFoundError:
+        warn_requirement('pyarrow', should_raise=True)
+    return pyarrow
+
+
+def columns_to_table(columns: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Stacks the columns into the C-contiguous table of their common dtype.
+    The table of numerical columns stays numerical and the object dtype is used
+    only if some of the columns are not numerical
+
+    :param columns: one-dimensional arrays of the same length
+
+    :return: two-dimensional table with the columns in the same order
+    """
+    columns = [np.asarray(column) for column in columns]
+    rows_num = len(columns[0]) if columns else 0
+    table = np.empty((rows_num, len(columns)), dtype=np.result_type(*columns) if columns else float)
+    for column_id, column in enumerate(columns):
+        table[:, column_id] = column
+    return table
+
+
+def arrow_to_arrays(arrow_table, target_columns: Union[str, List[str], None] = '',
+                    index_col: Optional[str] = None) -> TableArrays:
+    """
+    Converts pyarrow ``Table`` or ``RecordBatch`` to the arrays of index, features and target.
+    The columns are converted to numpy without the intermediate DataFrame,
+    numerical columns without gaps are not copied before stacking into the table
+
+    :param arrow_table: loaded pyarrow table or record batch
+    :param target_columns: name of target column (last column if empty and no target if ``None``)
+    :param index_col: name of the column with the index or ``None``
+
+    :return: index (``None`` if ``index_col`` is not set), features table and target
+    """
+    names = list(arrow_table.schema.names)
+    if index_col is not None:
+        names.remove(index_col)
+    target_columns = _resolve_target_columns(names, target_columns)
+    feature_columns = [name for name in names if name not in target_columns]
+
+    idx = _arrow_column_to_numpy(arrow_table, index_col) if index_col is not None else None
+    features = columns_to_table([_arrow_column_to_numpy(arrow_table, name) for name in feature_columns])
+    target = None
+    if target_columns:
+        target = atleast_2d(columns_to_table([_arrow_column_to_numpy(arrow_table, name)
+                                              for name in target_columns]))
+    return idx, features, target
+
+
+def dataframe_to_arrays(data_frame: pd.DataFrame, target_columns: Union[str, List[str], None] = '') -> TableArrays:
+    """
+    Converts the chunk of the table read by pandas to the arrays of index, features and target
+
+    :param data_frame: loaded chunk of the table
+    :param target_columns: name of target column (last column if empty and no target if ``None``)
+
+    :return: index, features table and target
+    """
+    target_columns = _resolve_target_columns(list(data_frame.columns), target_columns)
+    features = data_frame.drop(columns=target_columns).to_numpy()
+    target = atleast_2d(data_frame[target_columns].to_numpy()) if target_columns else None
+    return data_frame.index.to_numpy(), features, target
+
+
+def read_parquet(file_path: str, columns_to_drop: Optional[List[str]] = None,
+                 target_columns: Union[str, List[str], None] = '', index_col: Optional[str] = None,
+                 batch_size: int = PARQUET_BATCH_SIZE) -> TableArrays:
+    """
+    Reads Parquet file to the arrays of index, features and target.
+    The file is decoded by the record batches, so only one decoded batch
+    is kept in memory in addition to the resulting table
+
+    :param file_path: path to the file
+    :param columns_to_drop: names of columns that are not read at all
+    :param target_columns: name of target column (last column if empty and no target if ``None``)
+    :param index_col: name of the column with the index or ``None``
+    :param batch_size: number of rows in the decoded batch
+
+    :return: index (``None`` if ``index_col`` is not set), features table and target
+    """
+    pyarrow = import_pyarrow()
+    parquet_file = pyarrow.parquet.ParquetFile(file_path)
+    columns = _columns_to_read(parquet_file.schema_arrow.names, columns_to_drop)
+    batches = parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+    return batches_to_arrays(batches, parquet_file.metadata.num_rows,
+                             parquet_file.schema_arrow.empty_table().select(columns), target_columns, index_col)
+
+
+def read_arrow(file_path: str, columns_to_drop: Optional[List[str]] = None,
+               target_columns: Union[str, List[str], None] = '', index_col: Optional[str] = None) -> TableArrays:
+    """
+    Reads memory mapped Arrow IPC (Feather v2) file to the arrays of index, features and target.
+    Uncompressed buffers of the file are copied to the resulting table without intermediate copies
+
+    :param file_path: path to the file
+    :param columns_to_drop: names of columns that are excluded from the table
+    :param target_columns: name of target column (last column if empty and no target if ``None``)
+    :param index_col: name of the column with the index or ``None``
+
+    :return: index (``None`` if ``index_col`` is not set), features table and target
+    """
+    pyarrow = import_pyarrow()
+    reader = pyarrow.ipc.open_file(pyarrow.memory_map(file_path, 'r'))
+    columns = _columns_to_read(reader.schema.names, columns_to_drop)
+    batches = [reader.get_batch(batch_id).select(columns) for batch_id in range(reader.num_record_batches)]
+    return batches_to_arrays(batches, sum(batch.num_rows for batch in batches),
+                             reader.schema.empty_table().select(columns), target_columns, index_col)
+
+
+def batches_to_arrays(batches: Iterable, rows_num: int, empty_table,
+                      target_columns: Union[str, List[str], None] = '',
+                      index_col: Optional[str] = None) -> TableArrays:
+    """
+    Copies the record batches into the preallocated arrays of index, features and target
+
+    :param batches: pyarrow record batches of the table
+    :param rows_num: total number of rows in the batches
+    :param empty_table: pyarrow table with the same columns used if there are no batches
+    :param target_columns: name of target column (last column if empty and no target if ``None``)
+    :param index_col: name of the column with the index or ``None``
+
+    :return: index (``None`` if ``index_col`` is not set), features table and target
+    """
+    result = None
+    start = 0
+    for batch in batches:
+        arrays = arrow_to_arrays(batch, target_columns, index_col)
+        if result is None:
+            result = [np.empty((rows_num, *array.shape[1:]), dtype=array.dtype) if array is not None else None
+                      for array in arrays]
+        for array_id, (array, batch_array) in enumerate(zip(result, arrays)):
+            if array is None:
+                continue
+            if np.result_type(array, batch_array) != array.dtype:
+                # Column is wider in the batch (e.g. gaps in integer column)
+                array = result[array_id] = array.astype(np.result_type(array, batch_array))
+            array[start:start + len(batch_array)] = batch_array
+        start += batch.num_rows
+
+    if result is None:
+        return arrow_to_arrays(empty_table, target_columns, index_col)
+    return tuple(result)
+
+
+def iter_parquet_batches(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         columns_to_drop: Optional[List[str]] = None) -> Iterator:
+    """
+    Reads Parquet file by the record batches so only one batch is decoded in memory
+
+    :param file_path: path to the file
+    :param chunk_size: maximal number of rows in the batch
+    :param columns_to_drop: names of columns that are not read at all
+
+    :return: iterator over pyarrow record batches
+    """
+    pyarrow = import_pyarrow()
+    parquet_file = pyarrow.parquet.ParquetFile(file_path)
+    columns = _columns_to_read(parquet_file.schema_arrow.names, columns_to_drop)
+    yield from parquet_file.iter_batches(batch_size=chunk_size, columns=columns)
+
+
+def iter_arrow_batches(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       columns_to_drop: Optional[List[str]] = None) -> Iterator:
+    """
+    Iterates over memory mapped Arrow IPC file by the slices of its record batches
+
+    :param file_path: path to the file
+    :param chunk_size: maximal number of rows in the batch
+    :param columns_to_drop: names of columns that are excluded from the batches
+
+    :return: iterator over pyarrow record batches
+    """
+    pyarrow = import_pyarrow()
+    reader = pyarrow.ipc.open_file(pyarrow.memory_map(file_path, 'r'))
+    columns = _columns_to_read(reader.schema.names, columns_to_drop)
+    for batch_id in range(reader.num_record_batches):
+        batch = reader.get_batch(batch_id).select(columns)
+        for start in range(0, batch.num_rows, chunk_size):
+            yield batch.slice(start, chunk_size)
+
+
+def load_npy(file_path: Optional[str], mmap_mode: Optional[str] = 'c') -> Optional[np.ndarray]:
+    """
+    Loads ``.npy`` file as memory mapped array so the data is read from disk only on access
+
+    :param file_path: path to the file or ``None``
+    :param mmap_mode: mode of :func:`numpy.load`, the default copy-on-write mode
+        allows to modify the array in memory without changing the file
+
+    :return: memory mapped array or ``None`` if the path is not set
+    """
+    if file_path is None:
+        return None
+    return np.load(file_path, mmap_mode=mmap_mode, allow_pickle=False)
+
+
+def has_extension(file_path: str, extensions: Sequence[str]) -> bool:
+    return os.path.splitext(str(file_path))[1].lower() in extensions
+
+
+def _arrow_column_to_numpy(arrow_table, name: str) -> np.ndarray:
+    column = arrow_table.column(name)
+    # Columns of the table consist of chunks, columns of the record batch are contiguous arrays
+    if hasattr(column, 'num_chunks'):
+        if column.num_chunks != 1:
+            return column.to_numpy()
+        column = column.chunk(0)
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _columns_to_read(names: List[str], columns_to_drop: Optional[List[str]]) -> List[str]:
+    if not columns_to_drop:
+        return list(names)
+    return [name for name in names if name not in columns_to_drop]
+
+
+def _resolve_target_columns(names: List[str], target_columns: Union[str, List[str], None]) -> List[str]:
+    if target_columns == '':
+        # Take the last column in the table
+        return names[-1:]
+    if not target_columns:
+        return []
+    return [target_columns] if isinstance(target_columns, str) else list(target_columns)
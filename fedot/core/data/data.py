@@ -2,20 +2,16 @@ import glob
 import os
 from copy import copy, deepcopy
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
-from fedot.utilities.requirements_notificator import warn_requirement
-
-try:
-    import cv2
-except ModuleNotFoundError:
-    warn_requirement('opencv-python')
-    cv2 = None
-
 from fedot.core.data.array_utilities import atleast_2d
+from fedot.core.data.columnar import ARROW_EXTENSIONS, CSV_EXTENSIONS, DEFAULT_CHUNK_SIZE, NPY_EXTENSIONS, \
+    PARQUET_EXTENSIONS, arrow_to_arrays, dataframe_to_arrays, has_extension, iter_arrow_batches, \
+    iter_parquet_batches, load_npy, read_arrow, read_parquet
+from fedot.core.data.image_dataset import ImageDataset
 from fedot.core.data.load_data import JSONBatchLoader, TextBatchLoader
 from fedot.core.data.supplementary_data import SupplementaryData
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -70,6 +66,141 @@ class Data:
 
         return InputData(idx=idx, features=features, target=target, task=task, data_type=data_type)
 
+    @staticmethod
+    def from_parquet(file_path: str,
+                     task: Task = Task(TaskTypesEnum.classification),
+                     data_type: DataTypesEnum = DataTypesEnum.table,
+                     columns_to_drop: Optional[List] = None,
+                     target_columns: Union[str, List] = '',
+                     index_col: Optional[str] = None) -> 'InputData':
+        """Import data from ``Parquet`` file (requires ``pyarrow``).
+
+        Columns are decoded by batches directly to numpy table without the intermediate :obj:`DataFrame`,
+        so the table of numerical columns keeps their dtype instead of becoming the object array.
+
+        Args:
+            file_path: the path to the ``Parquet`` file
+            task: the :obj:`Task` that should be solved with data
+            data_type: the type of data interpretation
+            columns_to_drop: the names of columns that should not be read
+            target_columns: name of target column (last column if empty and no target if ``None``)
+            index_col: name of the column to use as the :obj:`Data.idx`;\n
+                if ``None`` then arrange new unique index
+
+        Returns:
+            data
+        """
+        return _input_data_from_arrays(*read_parquet(file_path, columns_to_drop, target_columns, index_col),
+                                       task=task, data_type=data_type)
+
+    @staticmethod
+    def from_arrow(file_path: str,
+                   task: Task = Task(TaskTypesEnum.classification),
+                   data_type: DataTypesEnum = DataTypesEnum.table,
+                   columns_to_drop: Optional[List] = None,
+                   target_columns: Union[str, List] = '',
+                   index_col: Optional[str] = None) -> 'InputData':
+        """Import data from ``Arrow IPC`` (``Feather`` v2) file (requires ``pyarrow``).
+
+        The file is memory mapped, so the uncompressed numerical columns are read without the copy.
+
+        Args:
+            file_path: the path to the ``Arrow`` file
+            task: the :obj:`Task` that should be solved with data
+            data_type: the type of data interpretation
+            columns_to_drop: the names of columns that should be dropped
+            target_columns: name of target column (last column if empty and no target if ``None``)
+            index_col: name of the column to use as the :obj:`Data.idx`;\n
+                if ``None`` then arrange new unique index
+
+        Returns:
+            data
+        """
+        return _input_data_from_arrays(*read_arrow(file_path, columns_to_drop, target_columns, index_col),
+                                       task=task, data_type=data_type)
+
+    @staticmethod
+    def from_npy(features_path: str,
+                 target_path: Optional[str] = None,
+                 task: Task = Task(TaskTypesEnum.classification),
+                 data_type: DataTypesEnum = DataTypesEnum.table,
+                 mmap_mode: Optional[str] = 'c') -> 'InputData':
+        """Import data from ``.npy`` files as memory mapped arrays.
+
+        Features are not loaded into memory: the pages of the file are read on access,
+        so the table may be larger than RAM.
+
+        Args:
+            features_path: the path to the ``.npy`` file with features table
+            target_path: the path to the ``.npy`` file with target or ``None`` if there is no target
+            task: the :obj:`Task` that should be solved with data
+            data_type: the type of data interpretation
+            mmap_mode: mode of :func:`numpy.load`; the default copy-on-write mode keeps the files unchanged
+                and ``None`` loads the arrays into memory
+
+        Returns:
+            data
+        """
+        features = load_npy(features_path, mmap_mode)
+        target = load_npy(target_path, mmap_mode)
+        return _input_data_from_arrays(None, features, atleast_2d(target) if target is not None else None,
+                                       task=task, data_type=data_type)
+
+    @staticmethod
+    def iter_from_file(file_path: str,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       task: Task = Task(TaskTypesEnum.classification),
+                       data_type: DataTypesEnum = DataTypesEnum.table,
+                       columns_to_drop: Optional[List] = None,
+                       target_columns: Union[str, List] = '',
+                       target_path: Optional[str] = None) -> Iterator['InputData']:
+        """Reads table from ``Parquet``, ``Arrow``, ``.npy`` or ``CSV`` file by chunks of rows
+        so the files larger than RAM can be processed piece by piece.
+
+        Args:
+            file_path: the path to the file, its format is defined by the extension
+            chunk_size: the maximal number of rows in the chunk
+            task: the :obj:`Task` that should be solved with data
+            data_type: the type of data interpretation
+            columns_to_drop: the names of columns that should be dropped (not used for ``.npy``)
+            target_columns: name of target column (last column if empty and no target if ``None``);\n
+                not used for ``.npy``
+            target_path: the path to the ``.npy`` file with target (used only for ``.npy`` features)
+
+        Returns:
+            iterator over the chunks with indices continuing through the whole file
+        """
+        if chunk_size <= 0:
+            raise ValueError('Chunk size must be positive')
+
+        if has_extension(file_path, NPY_EXTENSIONS):
+            features = load_npy(file_path)
+            target = load_npy(target_path)
+            for start in range(0, len(features), chunk_size):
+                chunk_target = atleast_2d(target[start:start + chunk_size]) if target is not None else None
+                yield InputData(idx=np.arange(start, min(start + chunk_size, len(features))),
+                                features=features[start:start + chunk_size], target=chunk_target,
+                                task=task, data_type=data_type)
+            return
+
+        if has_extension(file_path, PARQUET_EXTENSIONS + ARROW_EXTENSIONS):
+            iter_batches = iter_parquet_batches if has_extension(file_path, PARQUET_EXTENSIONS) \
+                else iter_arrow_batches
+            chunks = (arrow_to_arrays(batch, target_columns)
+                      for batch in iter_batches(file_path, chunk_size, columns_to_drop))
+        elif has_extension(file_path, CSV_EXTENSIONS):
+            chunks = (dataframe_to_arrays(data_frame.drop(columns=columns_to_drop or []), target_columns)
+                      for data_frame in pd.read_csv(file_path, chunksize=chunk_size, index_col=0))
+        else:
+            raise ValueError(f'Unsupported format of the file {file_path}')
+
+        start = 0
+        for idx, features, target in chunks:
+            if idx is None:
+                idx = np.arange(start, start + len(features))
+            start += len(features)
+            yield InputData(idx=idx, features=features, target=target, task=task, data_type=data_type)
+
     @staticmethod
     def from_csv_time_series(task: Task,
                              file_path=None,
@@ -165,16 +296,23 @@ class Data:
     def from_image(images: Union[str, np.ndarray] = None,
                    labels: Union[str, np.ndarray] = None,
                    task: Task = Task(TaskTypesEnum.classification),
-                   target_size: Optional[Tuple[int, int]] = None):
+                   target_size: Optional[Tuple[int, int]] = None,
+                   lazy: bool = False,
+                   cache_dir: Optional[str] = None,
+                   n_jobs: int = -1):
         """Input data from Image
 
         Args:
-            images: the path to the directory with image data in ``np.ndarray`` format
-                or array in ``np.ndarray`` format
+            images: the path to the directory with image data in ``np.ndarray`` format,
+                the pattern of ``*.jpeg`` image files or array in ``np.ndarray`` format
             labels: the path to the directory with image labels in ``np.ndarray`` format
                 or array in ``np.ndarray`` format
             task: the :obj:`Task` that should be solved with data
             target_size: size for the images resizing (if necessary)
+            lazy: if ``True``, the image files are not loaded into memory: the features are
+                :obj:`ImageDataset` decoding the images on access (by batches during the CNN training)
+            cache_dir: the directory for the cache of resized images (used only for image files)
+            n_jobs: the number of threads decoding and resizing image files, -1 means all cores
 
         Returns:
             data
@@ -187,15 +325,11 @@ class Data:
             # if upload from path
             if '*.jpeg' in images:
                 # upload from folder of images
-                path = images
-                images_list = []
-                for file_path in glob.glob(path):
-                    if target_size is not None:
-                        img = _resize_image(file_path, target_size)
-                        images_list.append(img)
-                    else:
-                        raise ValueError('Set target_size for images')
-                features = np.asarray(images_list)
+                if target_size is None:
+                    raise ValueError('Set target_size for images')
+                features = ImageDataset(glob.glob(images), target_size, cache_dir=cache_dir, n_jobs=n_jobs)
+                if not lazy:
+                    features = features.load()
                 target = labels
             else:
                 # upload from array
@@ -457,17 +591,6 @@ class OutputData(Data):
     target: Optional[np.ndarray] = None
 
 
-def _resize_image(file_path: str, target_size: Tuple[int, int]):
-    """Function resizes and rewrites the input image
-    """
-
-    img = cv2.imread(file_path)
-    if img.shape[:2] != target_size:
-        img = cv2.resize(img, (target_size[0], target_size[1]))
-        cv2.imwrite(file_path, img)
-    return img
-
-
 def process_target_and_features(data_frame: pd.DataFrame,
                                 target_column: Optional[Union[str, List[str]]]
                                 ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
@@ -495,6 +618,13 @@ def process_target_and_features(data_frame: pd.DataFrame,
     return features, target
 
 
+def _input_data_from_arrays(idx: Optional[np.ndarray], features: np.ndarray, target: Optional[np.ndarray],
+                            task: Task, data_type: DataTypesEnum) -> 'InputData':
+    if idx is None:
+        idx = np.arange(len(features))
+    return InputData(idx=idx, features=features, target=target, task=task, data_type=data_type)
+
+
 def data_type_is_table(data: Union[InputData, OutputData]) -> bool:
     return data.data_type is DataTypesEnum.table
 
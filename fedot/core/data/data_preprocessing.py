@@ -1,3 +1,5 @@
+from typing import Optional, Tuple
+
 import numpy as np
 import pandas as pd
 
@@ -91,36 +93,147 @@ def find_categorical_columns(table: np.array, column_types: dict = None):
 
 def force_categorical_determination(table):
     """ Find string columns using 'computationally expensive' approach """
-    source_shape = table.shape
-    columns_number = source_shape[1] if len(source_shape) > 1 else 1
+    table = np.asarray(table)
+    columns = table.reshape((-1, 1)) if table.ndim == 1 else table
+    columns_number = columns.shape[1]
+
+    if table.dtype.kind in 'US':
+        is_categorical = np.ones(columns_number, dtype=bool)
+    elif table.dtype != object:
+        is_categorical = np.zeros(columns_number, dtype=bool)
+    else:
+        # Types of the column values are inferred at once, only mixed columns are checked element-wise
+        is_categorical = np.zeros(columns_number, dtype=bool)
+        for column_id in range(columns_number):
+            column = columns[:, column_id]
+            inferred_type = pd.api.types.infer_dtype(column, skipna=True)
+            if inferred_type == 'string':
+                is_categorical[column_id] = True
+            elif inferred_type.startswith('mixed') or inferred_type == 'unknown-array':
+                is_categorical[column_id] = any(isinstance(value, str) for value in column)
+
+    categorical_ids = np.flatnonzero(is_categorical).tolist()
+    non_categorical_ids = np.flatnonzero(~is_categorical).tolist()
+    return categorical_ids, non_categorical_ids
 
-    categorical_ids = []
-    non_categorical_ids = []
-    # For every column in table make check for first element
-    for column_id in range(0, columns_number):
-        column = table[:, column_id] if columns_number > 1 else table
-        col_shape = column.shape
-        for i in column:
-            # Check if element is string object or not until the first appearance
-            if len(col_shape) == 2 and isinstance(i[0], str):
-                # Column looks like [[n], [n], [n]]
-                categorical_ids.append(column_id)
-                break
-            elif len(col_shape) == 1 and isinstance(i, str):
-                # Column [n, n, n]
-                categorical_ids.append(column_id)
-                break
-
-        if column_id not in categorical_ids:
-            non_categorical_ids.append(column_id)
 
-    return categorical_ids, non_categorical_ids
+def categorical_values_to_str(table: np.ndarray) -> np.ndarray:
+    """ Converts values of the categorical columns into strings with 'nan' for gaps (as ``astype(str)`` does).
+    Columns which already contain only strings and gaps are not converted element-wise
+
+    :param table: categorical columns
+    :return: object table with the string values
+    """
+    table = np.array(table, dtype=object)
+    for column in table.T:
+        if pd.api.types.infer_dtype(column, skipna=True) == 'string':
+            column[pd.isna(column)] = 'nan'
+        else:
+            column[:] = column.astype(str)
+    return table
+
+
+def categories_frame(table: np.ndarray) -> pd.DataFrame:
+    """ Flattens the categorical table into the pairs of the column number and the value (row by row)
+
+    :param table: values of the categorical features
+    :return: frame with the ``column`` number and the ``value`` of each cell of the table
+    """
+    rows_number, columns_number = table.shape
+    return pd.DataFrame({'column': np.tile(np.arange(columns_number), rows_number),
+                         'value': table.ravel()})
+
+
+class TableCategories:
+    """ Integer codes of the categories of all columns of the categorical table.
+    Values of the whole table are factorised at once into the positions in the vocabulary of the values
+    of all columns, and the category is identified by the integer key of the value position and the column number.
+    Codes follow the sorted order of the categories of the column, the categories unknown during the fit
+    are appended to the categories of their columns (in the sorted order) when they are encoded
+
+    :param table: values of the categorical features
+    :param gaps: mask of the gaps of the table which are not encoded, all values are encoded if it is not passed
+    """
+
+    def __init__(self, table: np.ndarray, gaps: Optional[np.ndarray] = None):
+        self._columns_number = table.shape[1]
+        self.categories_numbers = np.zeros(self._columns_number, dtype=int)
+        # Unique values of all columns
+        self._values = pd.Index([], dtype=object)
+        # Keys of the categories ((value position + 1) * columns number + column number) and codes of the categories
+        self._keys = np.array([], dtype=np.int64)
+        self._codes = np.array([], dtype=int)
+
+        values, columns = self._flatten(table)
+        self._append(values, columns, is_skipped=None if gaps is None else gaps.ravel())
+
+    def _flatten(self, table: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ Flattens the table into the values and the column numbers of the values (row by row) """
+        return table.ravel(), np.tile(np.arange(self._columns_number), len(table))
+
+    def _to_keys(self, value_ids: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """ Combines the positions of the values in the vocabulary (-1 for the missing ones) and the column numbers
+        into the non-negative integer keys """
+        return (value_ids.astype(np.int64) + 1) * self._columns_number + columns
+
+    @property
+    def _keys_number(self) -> int:
+        return (len(self._values) + 1) * self._columns_number
+
+    def _append(self, values: np.ndarray, columns: np.ndarray, is_skipped: Optional[np.ndarray] = None):
+        """ Appends the categories of the values (except the skipped ones) to the end of the categories
+        of their columns """
+        value_ids, unique_values = pd.factorize(values)
+        self._values = self._values.append(pd.Index(unique_values, dtype=object).difference(self._values))
+        keys = self._to_keys(self._values.get_indexer(unique_values)[value_ids], columns)
+        if is_skipped is not None:
+            keys = keys[~is_skipped]
+        if self._keys_number <= len(keys):
+            keys = np.flatnonzero(np.bincount(keys, minlength=self._keys_number))
+        else:
+            keys = pd.unique(keys)
+
+        # Only the unique categories are sorted by the column and the value
+        categories = pd.DataFrame({'column': keys % self._columns_number,
+                                   'value': self._values[keys // self._columns_number - 1]})
+        categories = categories.sort_values(['column', 'value'])
+        keys, columns = keys[categories.index], categories['column'].to_numpy()
+        # Position of the category among the appended categories of its column
+        codes = np.arange(len(columns)) - np.searchsorted(columns, columns) + self.categories_numbers[columns]
+        self.categories_numbers += np.bincount(columns, minlength=self._columns_number)
+        self._keys = np.concatenate([self._keys, keys])
+        self._codes = np.concatenate([self._codes, codes])
+
+    def encode(self, table: np.ndarray, gaps: Optional[np.ndarray] = None) -> np.ndarray:
+        """ Converts values of the categorical table into the codes of their categories
+
+        :param table: values of the categorical features, with the same columns as the fitted ones
+        :param gaps: mask of the gaps of the table which are not encoded
+        :return: integer codes of the values, -1 for the gaps
+        """
+        values, columns = self._flatten(table)
+        keys = self._to_keys(self._values.get_indexer(values), columns)
+        if self._keys_number <= len(keys):
+            # Codes are looked up in the table of all possible keys instead of the hashing of the keys
+            codes_table = np.full(self._keys_number, -1)
+            codes_table[self._keys] = self._codes
+            codes = codes_table[keys]
+        else:
+            codes = np.append(self._codes, -1)[pd.Index(self._keys).get_indexer(keys)]
+
+        unknown = codes < 0
+        if gaps is not None:
+            unknown &= ~gaps.ravel()
+        if np.any(unknown):
+            self._append(values[unknown], columns[unknown])
+            return self.encode(table, gaps)
+        return codes.reshape(table.shape)
 
 
 def data_has_missing_values(data: InputData) -> bool:
     """ Check data for missing values."""
     if data_type_is_suitable_preprocessing(data):
-        return pd.DataFrame(data.features).isna().sum().sum() > 0
+        return bool(pd.isna(data.features).any())
     return False
 
 
@@ -1,11 +1,13 @@
 from copy import deepcopy
 from typing import Tuple, Union
 
+import numpy as np
 from sklearn.model_selection import train_test_split
 
 from fedot.core.data.data import InputData
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import TaskTypesEnum
 
 
 def _split_time_series(data: InputData, task, *args, **kwargs):
@@ -226,3 +228,76 @@ def train_test_data_setup(data: Union[InputData, MultiModalData], split_ratio=0.
         raise ValueError(f'Dataset {type(data)} is not supported')
 
     return train_data, test_data
+
+
+def representative_sample_idx(data: InputData, size: int, random_state: int = 42) -> np.ndarray:
+    """ Selects rows of the data which keep the distribution of the target.
+    Classification data is sampled with stratification by classes (each class keeps at least one object
+    if the size allows), regression data - with one object from each of ``size`` equal-frequency
+    quantile bins of the target. Other data is sampled uniformly
+
+    :param data: InputData to sample from
+    :param size: number of objects in the sample
+    :param random_state: seed of the sampling
+
+    :return: sorted row numbers of the sample
+    """
+    rows_num = len(data.target) if data.target is not None else len(data.features)
+    if size >= rows_num:
+        return np.arange(rows_num)
+
+    rng = np.random.default_rng(random_state)
+    target = None
+    if data.target is not None:
+        target = np.asarray(data.target)
+        target = target.reshape(rows_num, -1)[:, 0] if target.ndim > 1 else target
+
+    if target is not None and data.task.task_type is TaskTypesEnum.classification:
+        sample_idx = _stratified_sample_idx(target, size, rng)
+    elif target is not None and data.task.task_type is TaskTypesEnum.regression:
+        # One random object from each equal-frequency bin of the sorted target
+        sorted_rows = np.argsort(target.astype(float), kind='stable')
+        positions = ((np.arange(size) + rng.random(size)) * rows_num / size).astype(int)
+        sample_idx = sorted_rows[positions]
+    else:
+        sample_idx = rng.choice(rows_num, size, replace=False)
+    return np.sort(sample_idx)
+
+
+def representative_subsample(data: InputData, size: int, random_state: int = 42) -> InputData:
+    """ Gets the subsample of the data with the rows from :func:`representative_sample_idx`
+
+    :param data: InputData to sample from
+    :param size: number of objects in the subsample
+    :param random_state: seed of the sampling
+
+    :return: new InputData with the subsample
+    """
+    sample_idx = representative_sample_idx(data, size, random_state)
+    return InputData(idx=np.asarray(data.idx)[sample_idx],
+                     features=data.features[sample_idx],
+                     target=data.target[sample_idx] if data.target is not None else None,
+                     task=data.task, data_type=data.data_type,
+                     supplementary_data=deepcopy(data.supplementary_data))
+
+
+def _stratified_sample_idx(labels: np.ndarray, size: int, rng: np.random.Generator) -> np.ndarray:
+    """ Samples rows with the numbers of objects of each class proportional to the class frequencies """
+    _, inverse, counts = np.unique(labels.astype(str), return_inverse=True, return_counts=True)
+    shares = size * counts / len(labels)
+    quotas = np.floor(shares).astype(int)
+    if size >= len(counts):
+        # Rare classes are kept in the sample
+        quotas = np.maximum(quotas, 1)
+    remainder = size - quotas.sum()
+    if remainder > 0:
+        quotas[np.argsort(quotas - shares, kind='stable')[:remainder]] += 1
+    while remainder < 0:
+        quotas[np.argmax(quotas)] -= 1
+        remainder += 1
+
+    # Rows grouped by classes in random order
+    rows = rng.permutation(len(labels))
+    rows = rows[np.argsort(inverse[rows], kind='stable')]
+    class_starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    return np.concatenate([rows[start:start + quota] for start, quota in zip(class_starts, quotas)])
@@ -0,0 +1,121 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fedot.utilities.requirements_notificator import warn_requirement
+
+try:
+    import cv2
+except ModuleNotFoundError:
+    warn_requirement('opencv-python')
+    cv2 = None
+
+
+class ImageDataset:
+    """
+    Lazy source of the images stored as files. The images are decoded and resized only on access
+    by the pool of threads (OpenCV releases GIL, so the threads use all the cores).
+    The resized images may be cached on disk as ``.npy`` files, so the next epochs and runs
+    read them without decoding.
+
+    Indexing by slice or by array of indices returns the lazy subset of the dataset,
+    so the data split does not load the images. Conversion with ``np.asarray`` loads all the images.
+
+    :param files: paths to the image files
+    :param target_size: size (width, height) of the resized images
+    :param cache_dir: directory for the cache of the resized images or ``None`` to disable the cache
+    :param n_jobs: number of decoding threads, -1 means all cores
+    """
+
+    dtype = np.dtype(np.uint8)
+    ndim = 4
+
+    def __init__(self, files: Sequence[str], target_size: Tuple[int, int],
+                 cache_dir: Optional[str] = None, n_jobs: int = -1):
+        self.files = np.array(files, dtype=object)
+        self.target_size = tuple(target_size)
+        self.cache_dir = cache_dir
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else max(1, n_jobs)
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def shape(self) -> Tuple[int, int, int, int]:
+        width, height = self.target_size
+        # Images are always decoded with three color channels
+        return len(self.files), height, width, 3
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __getitem__(self, key):
+        if np.ndim(key) == 0 and not isinstance(key, slice):
+            return self._read_image(self.files[key])
+        return ImageDataset(self.files[key], self.target_size, self.cache_dir, self.n_jobs)
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        images = self.load()
+        return images if dtype is None else images.astype(dtype)
+
+    def load(self) -> np.ndarray:
+        """
+        Decodes all the images of the dataset in parallel
+
+        :return: array of the images with shape (images, height, width, channels)
+        """
+        images = np.empty(self.shape, dtype=self.dtype)
+        with ThreadPoolExecutor(self.n_jobs) as executor:
+            for image_id, image in enumerate(executor.map(self._read_image, self.files)):
+                images[image_id] = image
+        return images
+
+    def iter_batches(self, batch_size: int, indices: Optional[Sequence[int]] = None) -> Iterator[np.ndarray]:
+        """
+        Iterates over the batches of images. The next batch is decoded while the current one is processed
+
+        :param batch_size: number of images in the batch
+        :param indices: order of the images to iterate over, all the images in the original order by default
+
+        :return: iterator over the arrays of images
+        """
+        indices = np.arange(len(self)) if indices is None else np.asarray(indices)
+        batches = [self[indices[start:start + batch_size]] for start in range(0, len(indices), batch_size)]
+        if not batches:
+            return
+        with ThreadPoolExecutor(1) as prefetcher:
+            next_batch = prefetcher.submit(batches[0].load)
+            for batch_id in range(len(batches)):
+                batch = next_batch.result()
+                if batch_id + 1 < len(batches):
+                    next_batch = prefetcher.submit(batches[batch_id + 1].load)
+                yield batch
+
+    def _read_image(self, file_path: str) -> np.ndarray:
+        cache_path = self._cache_path(file_path)
+        if cache_path is not None and os.path.exists(cache_path):
+            return np.load(cache_path)
+
+        image = cv2.imread(file_path)
+        if image is None:
+            raise ValueError(f'Image {file_path} can not be read')
+        width, height = self.target_size
+        if image.shape[:2] != (height, width):
+            image = cv2.resize(image, (width, height))
+
+        if cache_path is not None:
+            # Writing to the temporary file prevents reading of incomplete file by the concurrent process
+            temporary_path = f'{cache_path}.{os.getpid()}.tmp.npy'
+            np.save(temporary_path, image)
+            os.replace(temporary_path, cache_path)
+        return image
+
+    def _cache_path(self, file_path: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        # The cache is invalidated when the file is changed or the images are resized differently
+        stat = os.stat(file_path)
+        key = f'{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}:{self.target_size}'
+        return os.path.join(self.cache_dir, f'{sha1(key.encode()).hexdigest()}.npy')
@@ -21,7 +21,8 @@ class SupplementaryDataMerger:
             previous_operations=None,  # is set by Node after merge
             was_preprocessed=self.all_preprocessed(),
             non_int_idx=None,  # is set elsewhere (by preprocessor or during pipeline fit/predict)
-            column_types=self.merge_column_types()
+            column_types=self.merge_column_types(),
+            forecast_all_series=self.main_output.supplementary_data.forecast_all_series
         )
 
     def calculate_dataflow_len(self) -> int:
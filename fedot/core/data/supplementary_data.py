@@ -27,6 +27,8 @@ class SupplementaryData:
     non_int_idx: Optional[list] = None
     # Dictionary with features and target column types
     column_types: Optional[dict] = None
+    # Whether all the series of multi_ts data are forecasted, only the first one is forecasted otherwise
+    forecast_all_series: bool = False
 
     @property
     def compound_mask(self):
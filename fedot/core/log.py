@@ -1,16 +1,39 @@
 import json
 import logging
 import multiprocessing
+import os
 import pathlib
 import sys
+from contextlib import contextmanager
 from logging.config import dictConfig
-from logging.handlers import RotatingFileHandler
-from typing import Optional, Tuple, Union
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import Full
+from typing import Iterator, List, NamedTuple, Optional, Union
+from uuid import uuid4
 
 from fedot.core.utilities.singleton_meta import SingletonMeta
 from fedot.core.utils import default_fedot_data_dir
 
 DEFAULT_LOG_PATH = pathlib.Path(default_fedot_data_dir(), 'log.log')
+# Maximal number of the batches of records waiting in the queue from the worker processes
+DEFAULT_LOG_QUEUE_SIZE = 1000
+# Number of records sent by the worker process at once
+LOG_BATCH_SIZE = 100
+# Time to wait for the free place in the full queue before the records are dropped (in seconds)
+LOG_QUEUE_PUT_TIMEOUT = 1.
+
+
+class LogQueue(NamedTuple):
+    """Queue of the log records sent by the worker processes to the listener in the main process
+
+    Args:
+        queue: queue of the batches of records shared with the worker processes
+        listener_pid: id of the process handling the records
+        queue_id: unique id of the queue
+    """
+    queue: 'multiprocessing.Queue'
+    listener_pid: int
+    queue_id: str
 
 
 class Log(metaclass=SingletonMeta):
@@ -42,28 +65,74 @@ class Log(metaclass=SingletonMeta):
                  config_json_file: str = 'default',
                  output_logging_level: int = logging.INFO,
                  log_file: Optional[Union[str, pathlib.Path]] = None,
-                 use_console: bool = True):
+                 use_console: bool = True,
+                 log_queue: Optional[LogQueue] = None):
         self.log_file = log_file or DEFAULT_LOG_PATH
         self.logger = self._get_logger(config_file=config_json_file,
                                        logging_level=output_logging_level,
-                                       use_console=use_console)
+                                       use_console=use_console,
+                                       log_queue=log_queue)
 
     @staticmethod
-    def setup_in_mp(logging_level: int, logs_dir: pathlib.Path):
+    @contextmanager
+    def queue_listener(max_queue_size: int = DEFAULT_LOG_QUEUE_SIZE) -> Iterator[LogQueue]:
         """
-        Preserves logger level and its records in a separate file for each process only if it's a child one
+        Listens to the records sent by the worker processes set up with :meth:`setup_in_mp`
+        and passes them to the handlers of the current process, so all processes write to the same handlers
+        without contention and interleaving of the lines
+
+        Args:
+            max_queue_size: maximal number of the batches of records waiting in the queue,
+                the workers wait for the free place or drop the records if the queue is full
+
+        Returns:
+            queue to pass to the worker processes
+        """
+
+        # Queue of the manager can be passed to the workers of any pool as an argument of the task
+        manager = multiprocessing.Manager()
+        log_queue = LogQueue(manager.Queue(max_queue_size), os.getpid(), uuid4().hex)
+        listener = _BatchQueueListener(log_queue.queue, _CurrentProcessHandler())
+        listener.start()
+        try:
+            yield log_queue
+        finally:
+            listener.stop()
+            manager.shutdown()
+
+    @staticmethod
+    def setup_in_mp(logging_level: int, log_queue: LogQueue, **context):
+        """
+        Sends the records of the worker process to the queue listened by :meth:`queue_listener`
+        in the main process. Does nothing in the main process itself
 
         Args:
             logging_level: level of the logger from the main process
-            logs_dir: path to the logs directory
+            log_queue: queue of the records
+            context: fields added to each record of the worker process until the next setup
         """
 
-        cur_proc = multiprocessing.current_process().name
-        log_file_name = logs_dir.joinpath(f'log_{cur_proc}.log')
-        Log(output_logging_level=logging_level, log_file=log_file_name, use_console=False)
+        if os.getpid() == log_queue.listener_pid:
+            return
+        log = Log(output_logging_level=logging_level, log_queue=log_queue)
+        log.reset_logging_level(logging_level)
+        handler = next((handler for handler in log.handlers if isinstance(handler, _WorkerQueueHandler)), None)
+        if handler is None or handler.log_queue.queue_id != log_queue.queue_id:
+            # The worker is reused with the new queue (or it inherited the handlers of the main process)
+            for old_handler in list(log.handlers):
+                old_handler.close()
+                log.logger.removeHandler(old_handler)
+            handler = _WorkerQueueHandler(log_queue)
+            log.logger.addHandler(handler)
+        handler.context = context
 
-    def get_parameters(self) -> Tuple[int, pathlib.Path]:
-        return self.logger.level, pathlib.Path(self.log_file).parent
+    @staticmethod
+    def flush_in_mp():
+        """ Sends the records buffered in the worker process to the main process """
+
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, _WorkerQueueHandler):
+                handler.flush()
 
     def reset_logging_level(self, logging_level: int):
         """ Resets logging level for logger and its handlers """
@@ -72,6 +141,9 @@ class Log(metaclass=SingletonMeta):
         self.logger.setLevel(logging_level)
         for handler in self.handlers:
             handler.setLevel(logging_level)
+        # Adapters set their level to the logger on each record, so they have to keep the new one
+        for adapter in self.__log_adapters.values():
+            adapter.logging_level = logging_level
 
     def get_adapter(self, prefix: str) -> 'LoggerAdapter':
         """ Get adapter to pass contextual information to log messages
@@ -86,10 +158,14 @@ class Log(metaclass=SingletonMeta):
                                                         {'prefix': prefix})
         return self.__log_adapters[prefix]
 
-    def _get_logger(self, config_file: str, logging_level: int, use_console: bool = True) -> logging.Logger:
+    def _get_logger(self, config_file: str, logging_level: int, use_console: bool = True,
+                    log_queue: Optional[LogQueue] = None) -> logging.Logger:
         """ Get logger object """
         logger = logging.getLogger()
-        if config_file != 'default':
+        if log_queue is not None:
+            logger.addHandler(_WorkerQueueHandler(log_queue))
+            logger.setLevel(logging_level)
+        elif config_file != 'default':
             self._setup_logger_from_json_file(config_file)
         else:
             logger = self._setup_default_logger(logger=logger, logging_level=logging_level, use_console=use_console)
@@ -109,7 +185,7 @@ class Log(metaclass=SingletonMeta):
 
         file_handler = RotatingFileHandler(self.log_file, maxBytes=100000000, backupCount=1)
         file_handler.setLevel(logging_level)
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(processName)s - %(levelname)s - %(message)s'))
         logger.addHandler(file_handler)
 
         logger.setLevel(logging_level)
@@ -186,6 +262,71 @@ class LoggerAdapter(logging.LoggerAdapter):
         return self.__str__()
 
 
+class _WorkerQueueHandler(QueueHandler):
+    """ Handler of the worker process sending its records to the main process by batches.
+    The batch is sent when it is full, on the record of the warning level or higher and on :meth:`flush`.
+    If the queue stays full for :data:`LOG_QUEUE_PUT_TIMEOUT`, the batch is dropped
+    and the number of the dropped records is reported with the next batch """
+
+    def __init__(self, log_queue: LogQueue):
+        super().__init__(log_queue.queue)
+        self.log_queue = log_queue
+        self.context = {}
+        self.dropped_records = 0
+        self._batch: List[logging.LogRecord] = []
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.__dict__.update(self.context)
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        self._batch.append(record)
+        if len(self._batch) >= LOG_BATCH_SIZE or record.levelno >= logging.WARNING:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self._batch:
+                return
+            batch, self._batch = self._batch, []
+            records_num = len(batch)
+            if self.dropped_records:
+                batch.insert(0, self._dropped_records_warning())
+            try:
+                self.queue.put(batch, timeout=LOG_QUEUE_PUT_TIMEOUT)
+            except (Full, OSError, EOFError):
+                # The queue is full or the listener is already stopped
+                self.dropped_records += records_num
+            else:
+                self.dropped_records = 0
+
+    def _dropped_records_warning(self) -> logging.LogRecord:
+        return logging.makeLogRecord({'name': 'root', 'levelno': logging.WARNING, 'levelname': 'WARNING',
+                                      'msg': f'{self.dropped_records} log records were dropped '
+                                             f'because the log queue was full',
+                                      **self.context})
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class _BatchQueueListener(QueueListener):
+    """ Listener of the batches of records sent by :class:`_WorkerQueueHandler` """
+
+    def handle(self, records: List[logging.LogRecord]):
+        for record in records:
+            super().handle(record)
+
+
+class _CurrentProcessHandler(logging.Handler):
+    """ Passes the records received from the worker processes to the loggers of the current process """
+
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger(record.name).handle(record)
+
+
 def default_log(prefix: Optional[object] = 'default') -> 'LoggerAdapter':
     """ Default logger
 
@@ -37,6 +37,11 @@ class AtomizedModel(Operation):
 
         return fitted_atomized_operation, predicted_train
 
+    def partial_fit(self, fitted_operation, params: Optional[Union[OperationParameters, dict]],
+                    data: InputData) -> bool:
+        # The nested pipeline is refitted as a whole
+        return False
+
     def predict(self, fitted_operation, data: InputData,
                 params: Optional[Union[OperationParameters, dict]] = None, output_mode: str = 'default'):
 
@@ -67,6 +67,20 @@ class FedotPreprocessingStrategy(EvaluationStrategy):
             operation_implementation.fit(train_data)
         return operation_implementation
 
+    def partial_fit(self, trained_operation, train_data: InputData) -> bool:
+        """This method is used for training of the trained operation in place with the new data
+
+        Args:
+            trained_operation: model object
+            train_data: new data used for operation training
+
+        Returns:
+            bool: whether the operation was trained, ``False`` if it does not support the partial fit
+        """
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        with RandomStateHandler():
+            return trained_operation.partial_fit(train_data)
+
     def predict(self, trained_operation, predict_data: InputData) -> OutputData:
         """Transform method for preprocessing task
 
@@ -1,10 +1,9 @@
 import warnings
 from abc import abstractmethod
+from math import ceil
 from typing import Optional
 
 import numpy as np
-from catboost import CatBoostClassifier, CatBoostRegressor
-from lightgbm.sklearn import LGBMClassifier, LGBMRegressor
 from sklearn.cluster import KMeans as SklearnKmeans
 from sklearn.ensemble import (
     AdaBoostRegressor,
@@ -25,14 +24,15 @@ from sklearn.naive_bayes import BernoulliNB as SklearnBernoulliNB, MultinomialNB
 from sklearn.neural_network import MLPClassifier
 from sklearn.svm import LinearSVR as SklearnSVR
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
-from xgboost import XGBClassifier, XGBRegressor
 
+from fedot.core.constants import BOOSTING_UPDATE_TREES_FRACTION
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.log import default_log
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.operation_types_repository import OperationTypesRepository, get_operation_type_from_id
 from fedot.core.repository.tasks import TaskTypesEnum
+from fedot.core.utilities.lazy_import import import_by_name
 from fedot.core.utilities.random import RandomStateHandler
 
 warnings.filterwarnings("ignore", category=UserWarning)
@@ -71,6 +71,33 @@ class EvaluationStrategy:
         """
         raise NotImplementedError()
 
+    def update(self, trained_operation, train_data: InputData):
+        """Method to train the already trained operation with the data continuing the data it is trained on.
+        The operations reusing their state (e.g. statistical time series models) are updated,
+        the others are trained from scratch.
+
+        Args:
+            trained_operation: operation trained on the beginning of the data
+            train_data: data used for operation training
+
+        Returns:
+            trained operation
+        """
+        return self.fit(train_data)
+
+    def partial_fit(self, trained_operation, train_data: InputData) -> bool:
+        """Method to train the already trained operation in place with the data appended to the data
+        it is trained on (e.g. the new rows of the table)
+
+        Args:
+            trained_operation: trained operation object
+            train_data: new data used for operation training
+
+        Returns:
+            bool: whether the operation was trained, ``False`` if it does not support the partial fit
+        """
+        return False
+
     @abstractmethod
     def predict(self, trained_operation, predict_data: InputData) -> OutputData:
         """Method to predict the target data for predict stage.
@@ -171,7 +198,6 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
     """
 
     __operations_by_types = {
-        'xgbreg': XGBRegressor,
         'adareg': AdaBoostRegressor,
         'gbr': GradientBoostingRegressor,
         'dtreg': DecisionTreeRegressor,
@@ -182,22 +208,35 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
         'lasso': SklearnLassoReg,
         'svr': SklearnSVR,
         'sgdr': SklearnSGD,
-        'lgbmreg': LGBMRegressor,
-        'catboostreg': CatBoostRegressor,
 
-        'xgboost': XGBClassifier,
         'logit': SklearnLogReg,
         'bernb': SklearnBernoulliNB,
         'multinb': SklearnMultinomialNB,
         'dt': DecisionTreeClassifier,
         'rf': RandomForestClassifier,
         'mlp': MLPClassifier,
-        'lgbm': LGBMClassifier,
-        'catboost': CatBoostClassifier,
 
         'kmeans': SklearnKmeans,
     }
 
+    # Boosting frameworks are heavy to import, so they are loaded on the first use of the operation
+    __lazy_operations_by_types = {
+        'xgbreg': ('xgboost', 'XGBRegressor'),
+        'lgbmreg': ('lightgbm.sklearn', 'LGBMRegressor'),
+        'catboostreg': ('catboost', 'CatBoostRegressor'),
+
+        'xgboost': ('xgboost', 'XGBClassifier'),
+        'lgbm': ('lightgbm.sklearn', 'LGBMClassifier'),
+        'catboost': ('catboost', 'CatBoostClassifier'),
+    }
+
+    # Arguments of the fit methods of the boosting frameworks continuing the training of the passed model.
+    # CatBoost models can not change the number of the trees after the fit, so they are not continued
+    __boosting_continuation_arguments = {
+        'xgbreg': 'xgb_model', 'xgboost': 'xgb_model',
+        'lgbmreg': 'init_model', 'lgbm': 'init_model',
+    }
+
     def __init__(self, operation_type: str, params: Optional[OperationParameters] = None):
         self.operation_impl = self._convert_to_operation(operation_type)
         super().__init__(operation_type, params)
@@ -234,6 +273,54 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
                 operation_implementation.fit(train_data.features, train_data.target)
         return operation_implementation
 
+    def partial_fit(self, trained_operation, train_data: InputData) -> bool:
+        """This method is used for training of the trained operation in place with the new data:
+        the operations with ``partial_fit`` (e.g. SGD, naive Bayes, MLP) make the incremental step,
+        the boosting adds the trees fitted on the new data to the trees of the trained model,
+        their number is ``BOOSTING_UPDATE_TREES_FRACTION`` of ``n_estimators`` of the model
+
+        Args:
+            trained_operation: trained Sklearn operation
+            train_data: new data used for operation training
+
+        Returns:
+            bool: whether the operation was trained, ``False`` if it does not support the partial fit
+
+        Raises:
+            ValueError: if the operation can not be trained on the new data (e.g. the new classes appeared)
+        """
+
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+
+        continuation_argument = self.__boosting_continuation_arguments.get(self.operation_type)
+        is_multi_output_wrapper = isinstance(trained_operation, (MultiOutputClassifier, MultiOutputRegressor))
+        trained_classes = getattr(trained_operation, 'classes_', None)
+        if trained_classes is not None and not is_multi_output_wrapper:
+            # Some models ignore the new classes or fail with the errors of their own
+            target_classes = np.unique(train_data.target)
+            new_classes = np.setdiff1d(target_classes, trained_classes)
+            if new_classes.size:
+                raise ValueError(f'The classes {new_classes} are unknown to the trained operation')
+            # The boosting infers the number of the classes from the target, so it can not miss any of them
+            missing_classes = np.setdiff1d(trained_classes, target_classes)
+            if continuation_argument is not None and missing_classes.size:
+                raise ValueError(f'The classes {missing_classes} are missing to continue the boosting')
+
+        with RandomStateHandler():
+            if continuation_argument is not None and not is_multi_output_wrapper:
+                trees_num = trained_operation.get_params()['n_estimators']
+                trained_operation.set_params(n_estimators=ceil(BOOSTING_UPDATE_TREES_FRACTION * trees_num))
+                try:
+                    trained_operation.fit(train_data.features, train_data.target,
+                                          **{continuation_argument: trained_operation})
+                finally:
+                    trained_operation.set_params(n_estimators=trees_num)
+            elif hasattr(trained_operation, 'partial_fit'):
+                trained_operation.partial_fit(train_data.features, train_data.target)
+            else:
+                return False
+        return True
+
     def predict(self, trained_operation, predict_data: InputData) -> OutputData:
         """This method used for prediction of the target data
 
@@ -249,6 +336,8 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
             return self.__operations_by_types[operation_type]
+        elif operation_type in self.__lazy_operations_by_types.keys():
+            return import_by_name(*self.__lazy_operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain SKlearn strategy for {operation_type}')
 
@@ -256,6 +345,9 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
         for operation, operation_impl in self.__operations_by_types.items():
             if operation_impl == impl:
                 return operation
+        for operation, (module_name, impl_name) in self.__lazy_operations_by_types.items():
+            if impl.__module__.startswith(module_name.split('.')[0]) and impl.__name__ == impl_name:
+                return operation
 
     @property
     def implementation_info(self) -> str:
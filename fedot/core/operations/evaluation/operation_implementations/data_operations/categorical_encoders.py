@@ -1,27 +1,68 @@
-from copy import deepcopy
-from typing import Optional, Union
+from copy import copy, deepcopy
+from typing import List, Optional
 
 import numpy as np
-from sklearn.preprocessing import OneHotEncoder, LabelEncoder
+import pandas as pd
 
 from fedot.core.data.data import InputData, OutputData
-from fedot.core.data.data_preprocessing import find_categorical_columns
+from fedot.core.data.data_preprocessing import (
+    TableCategories,
+    categorical_values_to_str,
+    categories_frame,
+    find_categorical_columns
+)
 from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import \
     DataOperationImplementation
 from fedot.core.operations.operation_parameters import OperationParameters
 
 
+# Parameters of sklearn OneHotEncoder supported by the one hot encoding and their default values
+ONE_HOT_ENCODING_DEFAULT_PARAMS = {
+    'handle_unknown': 'ignore',
+    'drop': None,
+    'min_frequency': None,
+    'max_categories': None,
+    'dtype': np.float64,
+}
+
+
 class OneHotEncodingImplementation(DataOperationImplementation):
-    """ Class for automatic categorical data detection and one hot encoding """
+    """ Class for automatic categorical data detection and one hot encoding.
+    Values of all categorical columns are looked up in the fitted categories of all columns at once
+    and the binary columns are filled for the whole table at once.
+
+    The parameters follow sklearn ``OneHotEncoder``: ``handle_unknown`` ('ignore' encodes unknown categories
+    with zeros, 'error' raises), ``drop`` (None, 'first' or 'if_binary'), ``min_frequency`` and ``max_categories``
+    (the infrequent categories of the column are encoded by one column placed after the frequent ones)
+    and ``dtype`` of the encoded columns. Gaps are always encoded with zeros. The output is dense,
+    since the other operations expect dense features, so ``max_categories`` is the way to limit its width
+    """
 
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
-        default_params = {
-            'handle_unknown': 'ignore'
-        }
-        self.encoder = OneHotEncoder(**{**default_params, **self.params.to_dict()})
+        self.encoder_params = {**ONE_HOT_ENCODING_DEFAULT_PARAMS, **self.params.to_dict()}
+        self._check_encoder_params()
+        # Sorted categories of each categorical column
+        self.categories: List[np.ndarray] = []
         self.categorical_ids = None
         self.non_categorical_ids = None
+        # Pairs of the categorical column number and the category sorted by the column and the category
+        self._categories_index: Optional[pd.MultiIndex] = None
+        # Position of the binary column of each category of the index, -1 for the dropped categories
+        self._output_positions: Optional[np.ndarray] = None
+        self._encoded_columns_number = 0
+
+    def _check_encoder_params(self):
+        unsupported_params = set(self.encoder_params) - set(ONE_HOT_ENCODING_DEFAULT_PARAMS)
+        if unsupported_params:
+            raise ValueError(f'Unsupported parameters of one hot encoding: {sorted(unsupported_params)}')
+        if self.encoder_params['handle_unknown'] not in ('ignore', 'error'):
+            raise ValueError(f'Unsupported handle_unknown value: {self.encoder_params["handle_unknown"]}')
+        if self.encoder_params['drop'] not in (None, 'first', 'if_binary'):
+            raise ValueError(f'Unsupported drop value: {self.encoder_params["drop"]}')
+        max_categories = self.encoder_params['max_categories']
+        if max_categories is not None and max_categories < 1:
+            raise ValueError('max_categories has to be positive')
 
     def fit(self, input_data: InputData):
         """ Method for fit encoder with automatic determination of categorical features
@@ -40,10 +81,60 @@ class OneHotEncodingImplementation(DataOperationImplementation):
 
         # If there are categorical features - process it
         if self.categorical_ids:
-            updated_cat_features = np.array(features[:, self.categorical_ids], dtype=str)
-            self.encoder.fit(updated_cat_features)
-
-        return self.encoder
+            categorical_features = categorical_values_to_str(features[:, self.categorical_ids])
+            # Number of the values of each category in each column, sorted by the column and the category
+            counts = categories_frame(categorical_features).value_counts(sort=False).sort_index()
+            self._categories_index = counts.index
+            columns = self._categories_index.codes[0]
+            values = self._categories_index.get_level_values(1).to_numpy()
+            categories_numbers = np.bincount(columns, minlength=len(self.categorical_ids))
+            self.categories = np.split(values, np.cumsum(categories_numbers)[:-1])
+            infrequent = self._find_infrequent(columns, counts.to_numpy(), len(categorical_features))
+            self._output_positions = self._define_output_positions(columns, infrequent)
+
+        return self.categories
+
+    def _find_infrequent(self, columns: np.ndarray, counts: np.ndarray, rows_number: int) -> np.ndarray:
+        """ Marks the categories which are too rare by ``min_frequency`` or
+        not among the ``max_categories - 1`` most frequent categories of the column """
+        infrequent = np.zeros(len(columns), dtype=bool)
+        min_frequency = self.encoder_params['min_frequency']
+        if min_frequency is not None:
+            threshold = min_frequency if isinstance(min_frequency, int) else np.ceil(min_frequency * rows_number)
+            infrequent |= counts < threshold
+
+        max_categories = self.encoder_params['max_categories']
+        if max_categories is not None:
+            # Rank of the category in the column by the decreasing frequency, the ties keep the sorted order
+            order = np.lexsort((np.arange(len(columns)), -counts, columns))
+            column_starts = np.searchsorted(columns, columns)
+            ranks = np.empty(len(columns), dtype=int)
+            ranks[order] = np.arange(len(columns)) - column_starts[order]
+            categories_numbers = np.bincount(columns)[columns]
+            infrequent |= (categories_numbers > max_categories) & (ranks >= max_categories - 1)
+        return infrequent
+
+    def _define_output_positions(self, columns: np.ndarray, infrequent: np.ndarray) -> np.ndarray:
+        """ Places the binary columns of the frequent categories of each feature in the sorted order,
+        followed by the column of its infrequent categories, and drops the first column if it is required """
+        columns_number = len(self.categorical_ids)
+        frequent_numbers = np.bincount(columns[~infrequent], minlength=columns_number)
+        has_infrequent = np.bincount(columns[infrequent], minlength=columns_number) > 0
+        block_sizes = frequent_numbers + has_infrequent
+
+        drop = self.encoder_params['drop']
+        is_dropped = np.full(columns_number, drop == 'first') | ((block_sizes == 2) & (drop == 'if_binary'))
+
+        # Position of the category inside of the block of its feature
+        positions = frequent_numbers[columns]
+        frequent_columns = columns[~infrequent]
+        positions[~infrequent] = np.arange(len(frequent_columns)) - np.searchsorted(frequent_columns, frequent_columns)
+        positions = positions - is_dropped[columns]
+
+        kept_sizes = block_sizes - is_dropped
+        offsets = np.cumsum([0, *kept_sizes[:-1]])
+        self._encoded_columns_number = int(kept_sizes.sum())
+        return np.where(positions >= 0, offsets[columns] + positions, -1)
 
     def transform(self, input_data: InputData) -> OutputData:
         """
@@ -53,12 +144,13 @@ class OneHotEncodingImplementation(DataOperationImplementation):
         :param input_data: data with features, target and ids for transformation
         :return output_data: output data with transformed features table
         """
-        copied_data = deepcopy(input_data)
+        copied_data = copy(input_data)
+        copied_data.supplementary_data = deepcopy(input_data.supplementary_data)
 
         features = copied_data.features
         if not self.categorical_ids:
             # If there are no categorical features in the table
-            transformed_features = features
+            transformed_features = np.array(features)
         else:
             # If categorical features are exists
             transformed_features = self._apply_one_hot_encoding(features)
@@ -90,8 +182,24 @@ class OneHotEncodingImplementation(DataOperationImplementation):
         :return transformed_features: transformed features table
         """
 
-        categorical_features = np.array(features[:, self.categorical_ids])
-        transformed_categorical = self.encoder.transform(categorical_features).toarray()
+        categorical_features = features[:, self.categorical_ids]
+        values_frame = categories_frame(categorical_values_to_str(categorical_features))
+        category_ids = self._categories_index.get_indexer(pd.MultiIndex.from_frame(values_frame))
+        category_ids = category_ids.reshape(categorical_features.shape)
+        # Gaps are treated as unknown categories and encoded with zeros
+        gaps = pd.isna(categorical_features)
+
+        unknown = (category_ids < 0) & ~gaps
+        if self.encoder_params['handle_unknown'] == 'error' and np.any(unknown):
+            unknown_columns = [self.categorical_ids[column] for column in np.unique(np.nonzero(unknown)[1])]
+            raise ValueError(f'Found unknown categories in the columns {unknown_columns} during transform')
+
+        positions = np.where(category_ids >= 0, self._output_positions[category_ids], -1)
+        positions[gaps] = -1
+        rows, columns = np.nonzero(positions >= 0)
+        transformed_categorical = np.zeros((len(features), self._encoded_columns_number),
+                                           dtype=self.encoder_params['dtype'])
+        transformed_categorical[rows, positions[rows, columns]] = 1
 
         # If there are non-categorical features in the data
         if not self.non_categorical_ids:
@@ -99,6 +207,11 @@ class OneHotEncodingImplementation(DataOperationImplementation):
         else:
             # Stack transformed categorical and non-categorical data
             non_categorical_features = np.array(features[:, self.non_categorical_ids])
+            try:
+                # Numerical table avoids boxing of each encoded value into the python object
+                non_categorical_features = non_categorical_features.astype(float)
+            except (TypeError, ValueError):
+                pass
             frames = (non_categorical_features, transformed_categorical)
             transformed_features = np.hstack(frames)
 
@@ -106,12 +219,14 @@ class OneHotEncodingImplementation(DataOperationImplementation):
 
 
 class LabelEncodingImplementation(DataOperationImplementation):
-    """ Class for categorical features encoding based on LabelEncoding """
+    """ Class for categorical features encoding based on LabelEncoding.
+    Categories are sorted and each value is replaced by the position of its category,
+    all categorical columns are encoded at once """
 
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
         # LabelEncoder has no parameters
-        self.encoders = {}
+        self.categories: Optional[TableCategories] = None
         self.categorical_ids = None
         self.non_categorical_ids = None
 
@@ -122,29 +237,22 @@ class LabelEncodingImplementation(DataOperationImplementation):
 
         # If there are categorical features - process it
         if self.categorical_ids:
-            # For every categorical feature - perform encoding
-            self._fit_label_encoders(input_data)
-        return self.encoders
+            # Converting into string - so nans becomes marked as 'nan'
+            categorical_features = categorical_values_to_str(input_data.features[:, self.categorical_ids])
+            self.categories = TableCategories(categorical_features, gaps=categorical_features == 'nan')
+        return self.categories
 
     def transform(self, input_data: InputData) -> OutputData:
         """ Apply LabelEncoder on categorical features and doesn't process float or int ones
         Applicable during predict stage
         """
-        copied_data = deepcopy(input_data)
+        features = np.array(input_data.features)
         if self.categorical_ids:
-            # If categorical features are exists - transform them inplace in InputData
-            for categorical_id in self.categorical_ids:
-                categorical_column = input_data.features[:, categorical_id]
-
-                # Converting into string - so nans becomes marked as 'nan'
-                categorical_column = categorical_column.astype(str)
-                gap_ids = np.ravel(np.argwhere(categorical_column == 'nan'))
-
-                transformed = self._apply_label_encoder(categorical_column, categorical_id, gap_ids)
-                copied_data.features[:, categorical_id] = transformed
+            # If categorical features are exists - transform them
+            categorical_features = categorical_values_to_str(input_data.features[:, self.categorical_ids])
+            features[:, self.categorical_ids] = self._apply_label_encoder(categorical_features)
 
-        output_data = self._convert_to_output(input_data,
-                                              copied_data.features)
+        output_data = self._convert_to_output(input_data, features)
 
         self._update_column_types(output_data)
         return output_data
@@ -153,47 +261,26 @@ class LabelEncodingImplementation(DataOperationImplementation):
         """ Update column types after encoding. Categorical becomes integer """
         if self.categorical_ids:
             # Categorical features were in the dataset
-            col_types = output_data.supplementary_data.column_types['features']
-            for categorical_id in self.categorical_ids:
-                col_types[categorical_id] = str(int)
-
-            output_data.supplementary_data.column_types['features'] = col_types
-
-    def _fit_label_encoders(self, input_data: InputData):
-        """ Fit LabelEncoder for every categorical column in the dataset """
-        for categorical_id in self.categorical_ids:
-            categorical_column = input_data.features[:, categorical_id]
-            le = LabelEncoder()
-            le.fit(categorical_column)
+            col_types = np.array(output_data.supplementary_data.column_types['features'], dtype=object)
+            col_types[self.categorical_ids] = str(int)
 
-            self.encoders.update({categorical_id: le})
+            output_data.supplementary_data.column_types['features'] = col_types.tolist()
 
-    def _apply_label_encoder(self, categorical_column: np.array, categorical_id: int,
-                             gap_ids: Union[np.array, None]) -> np.array:
-        """ Apply fitted LabelEncoder for column transformation
+    def _apply_label_encoder(self, categorical_features: np.array) -> np.array:
+        """ Apply fitted categories for the transformation of the categorical columns,
+        the categories not previously encountered are added to the fitted ones
 
-        :param categorical_column: numpy array with categorical features
-        :param categorical_id: index of current categorical column
-        :param gap_ids: indices of gap elements in array
+        :param categorical_features: numpy array with categorical features converted into strings
         """
-        column_encoder = self.encoders[categorical_id]
-        encoder_classes = list(column_encoder.classes_)
+        gaps = categorical_features == 'nan'
+        transformed_features = self.categories.encode(categorical_features, gaps)
 
-        # If the column contains categories not previously encountered
-        for label in list(set(categorical_column)):
-            if label not in encoder_classes:
-                encoder_classes.append(label)
-
-        # Extent encoder classes
-        column_encoder.classes_ = encoder_classes
-
-        transformed_column = column_encoder.transform(categorical_column)
-        if len(gap_ids) > 0:
+        if np.any(gaps):
             # Store np.nan values
-            transformed_column = transformed_column.astype(object)
-            transformed_column[gap_ids] = np.nan
+            transformed_features = transformed_features.astype(object)
+            transformed_features[gaps] = np.nan
 
-        return transformed_column
+        return transformed_features
 
     def get_params(self) -> OperationParameters:
         """ Due to LabelEncoder has no parameters - return empty set """
@@ -3,7 +3,7 @@ from typing import Optional, Dict, Any
 
 import numpy as np
 import sklearn
-from pkg_resources import parse_version
+from packaging.version import parse as parse_version
 from sklearn.ensemble import IsolationForest
 from sklearn.linear_model import LinearRegression, RANSACRegressor
 from sklearn.pipeline import make_pipeline
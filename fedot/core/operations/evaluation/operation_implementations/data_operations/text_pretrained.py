@@ -1,7 +1,9 @@
 import os
-from typing import Optional
+from itertools import chain
+from typing import Optional, Sequence
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.log import default_log
@@ -43,7 +45,7 @@ class PretrainedEmbeddingsImplementation(DataOperationImplementation):
         :return output_data: output data with transformed features table
         """
 
-        embed_data = np.stack([self.vectorize_avg(text, self.model) for text in input_data.features])
+        embed_data = self.vectorize_avg_batch(np.ravel(input_data.features), self.model)
         output_data = self._convert_to_output(input_data,
                                               embed_data,
                                               data_type=DataTypesEnum.table)
@@ -70,6 +72,36 @@ class PretrainedEmbeddingsImplementation(DataOperationImplementation):
             return features / num_words
         return features
 
+    @staticmethod
+    def vectorize_avg_batch(texts: Sequence[str], embeddings) -> np.ndarray:
+        """ Method converts the whole corpus to averages of token vectors at once.
+        Corpus is tokenized once, tokens are mapped to vocabulary indices in bulk
+        and averages are obtained with one sparse matrix product
+
+        :param texts: sequence of str with text data
+        :param embeddings: gensim pretrained embeddings
+        :return features: two-dimensional np.array with shape (len(texts), embedding_dim)
+        """
+        tokenized = [str(text).split() for text in texts]
+        tokens_amount = np.fromiter(map(len, tokenized), dtype=int, count=len(tokenized))
+
+        key_to_index = embeddings.key_to_index
+        vocab_indices = np.fromiter((key_to_index.get(token, -1) for token in chain.from_iterable(tokenized)),
+                                    dtype=int, count=tokens_amount.sum())
+        text_indices = np.repeat(np.arange(len(tokenized)), tokens_amount)
+
+        # Words out of vocabulary are skipped as in the per-text averaging
+        is_known = vocab_indices >= 0
+        vocab_indices = vocab_indices[is_known]
+        text_indices = text_indices[is_known]
+
+        vectors = embeddings.vectors
+        occurrences = csr_matrix((np.ones(len(vocab_indices), dtype=vectors.dtype), (text_indices, vocab_indices)),
+                                 shape=(len(tokenized), vectors.shape[0]))
+        features = np.asarray(occurrences @ vectors)
+        known_amount = np.bincount(text_indices, minlength=len(tokenized))
+        return features / np.maximum(known_amount, 1)[:, np.newaxis].astype(features.dtype)
+
     def _download_model_resources(self):
         """ Method for downloading text embeddings. Embeddings are loaded into external folder"""
         self.logger.info('Trying to download embeddings...')
@@ -78,4 +110,16 @@ class PretrainedEmbeddingsImplementation(DataOperationImplementation):
 
         if os.path.exists(model_path):
             self.logger.info('Embeddings are already downloaded. Loading model...')
-            self.model = KeyedVectors.load_word2vec_format(model_path, binary=False)
+            self.model = self._load_shared_model(model_path)
+
+    def _load_shared_model(self, model_path: str):
+        """ Method loads embeddings as read-only memory-mapped arrays, so forked evaluation workers
+        share one copy of vectors. Text word2vec format is converted to the gensim native format once
+
+        :param model_path: path to the downloaded embeddings in word2vec format
+        """
+        native_model_path = f'{model_path}.kv'
+        if not os.path.exists(native_model_path):
+            self.logger.info('Converting embeddings to the memory-mappable format...')
+            KeyedVectors.load_word2vec_format(model_path, binary=False).save(native_model_path)
+        return KeyedVectors.load(native_model_path, mmap='r')
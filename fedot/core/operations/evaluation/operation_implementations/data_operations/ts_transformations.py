@@ -1,7 +1,9 @@
 from copy import copy
+from functools import lru_cache
 from typing import Optional, Union
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
 from scipy.ndimage import gaussian_filter
 from sklearn.decomposition import TruncatedSVD
@@ -148,6 +150,9 @@ class LaggedImplementation(DataOperationImplementation):
         """Apply lagged transformation on each time series in the current dataset
         """
 
+        if input_data.data_type == DataTypesEnum.multi_ts and len(features.shape) > 1 and not self.sparse_transform:
+            return self._apply_transformation_for_multi_ts_fit(input_data, features, target, forecast_length, old_idx)
+
         # Shape of the time series
         if len(features.shape) > 1:
             # Multivariate time series
@@ -196,6 +201,34 @@ class LaggedImplementation(DataOperationImplementation):
         self.features_columns = all_transformed_features
         return all_transformed_target, all_transformed_idx
 
+    def _apply_transformation_for_multi_ts_fit(self, input_data: InputData, features: np.array, target: np.array,
+                                               forecast_length: int, old_idx: np.array):
+        """Apply lagged transformation on all the time series of multi_ts data at once.
+        The lagged tables of the series are stacked vertically in the order of the series,
+        so the single model is trained on all of them
+        """
+
+        n_elements, n_time_series = features.shape
+        rows_num = n_elements - self.window_size - forecast_length + 1
+        # Windows of the series have the shape (rows, series, window)
+        windows = sliding_window_view(features.astype(float), self.window_size, axis=0)[:rows_num]
+        all_transformed_features = windows.transpose(1, 0, 2).reshape(-1, self.window_size)
+
+        # Target of each series is its column or the single column shared by all the series
+        target = target.reshape(n_elements, -1)
+        series_target = target[:, np.arange(n_time_series) % target.shape[1]]
+        target_windows = sliding_window_view(series_target[self.window_size:], forecast_length, axis=0)[:rows_num]
+        all_transformed_target = target_windows.transpose(1, 0, 2).reshape(-1, forecast_length)
+        if forecast_length == 1:
+            all_transformed_target = np.ravel(all_transformed_target)
+
+        all_transformed_idx = np.tile(np.asarray(old_idx)[self.window_size: self.window_size + rows_num],
+                                      n_time_series)
+
+        input_data.features = all_transformed_features
+        self.features_columns = all_transformed_features
+        return all_transformed_target, all_transformed_idx
+
     def stack_by_type_fit(self, input_data, all_features, all_target, all_idx, features, target, idx):
         """Apply stack function for multi_ts and multivariable ts types on fit step
         """
@@ -280,6 +313,15 @@ class LaggedImplementation(DataOperationImplementation):
             self.features_columns = transformed_cols[-1].reshape(1, -1)
             return self.features_columns
 
+        forecast_all_series = input_data.supplementary_data.forecast_all_series
+        if input_data.data_type == DataTypesEnum.multi_ts and len(input_data.features.shape) > 1:
+            # Last window_size elements of each series in the row
+            all_transformed_features = np.array(input_data.features[-self.window_size:], dtype=float).T
+            if not forecast_all_series:
+                all_transformed_features = all_transformed_features[:1]
+            self.features_columns = all_transformed_features
+            return all_transformed_features
+
         if len(input_data.features.shape) > 1:
             # Multivariate time series
             n_elements, n_time_series = input_data.features.shape
@@ -303,8 +345,6 @@ class LaggedImplementation(DataOperationImplementation):
                                                                       all_transformed_features,
                                                                       last_part_of_ts)
 
-        if input_data.data_type == DataTypesEnum.multi_ts:
-            all_transformed_features = np.expand_dims(all_transformed_features[0], axis=0)
         self.features_columns = all_transformed_features
         return all_transformed_features
 
@@ -384,26 +424,19 @@ class TsSmoothingImplementation(DataOperationImplementation):
             output data with smoothed time series
         """
 
-        source_ts = input_data.features
+        source_ts = np.array(input_data.features)
         if input_data.data_type == DataTypesEnum.multi_ts:
-            full_smoothed_ts = []
-            for ts_n in range(source_ts.shape[1]):
-                ts = pd.Series(source_ts[:, ts_n])
-                smoothed_ts = self._apply_smoothing_to_series(ts)
-                full_smoothed_ts.append(smoothed_ts)
-            output_data = self._convert_to_output(input_data,
-                                                  np.array(full_smoothed_ts).T,
-                                                  data_type=input_data.data_type)
+            # All the series are smoothed at once
+            smoothed_ts = self._apply_smoothing_to_series(pd.DataFrame(source_ts))
         else:
-            source_ts = pd.Series(input_data.features)
-            smoothed_ts = np.ravel(self._apply_smoothing_to_series(source_ts))
-            output_data = self._convert_to_output(input_data,
-                                                  smoothed_ts,
-                                                  data_type=input_data.data_type)
+            smoothed_ts = np.ravel(self._apply_smoothing_to_series(pd.Series(source_ts)))
+        output_data = self._convert_to_output(input_data,
+                                              smoothed_ts,
+                                              data_type=input_data.data_type)
 
         return output_data
 
-    def _apply_smoothing_to_series(self, ts):
+    def _apply_smoothing_to_series(self, ts: Union[pd.Series, pd.DataFrame]) -> np.ndarray:
         smoothed_ts = ts.rolling(window=self.window_size).mean()
         smoothed_ts = np.array(smoothed_ts)
 
@@ -568,60 +601,47 @@ class NumericalDerivativeFilterImplementation(DataOperationImplementation):
         """
 
         source_ts = np.array(input_data.features)
-        # Apply differential operation
-        if input_data.data_type == DataTypesEnum.multi_ts:
-            full_differential_ts = []
-            for ts_n in range(source_ts.shape[1]):
-                ts = source_ts[:, ts_n]
-                differential_ts = self._differential_filter(ts)
-                full_differential_ts.append(differential_ts)
-            output_data = self._convert_to_output(input_data,
-                                                  np.array(full_differential_ts).T,
-                                                  data_type=input_data.data_type)
-        else:
-            differential_ts = np.ravel(self._differential_filter(source_ts))
-            output_data = self._convert_to_output(input_data,
-                                                  differential_ts,
-                                                  data_type=input_data.data_type)
+        # Apply differential operation to all the series at once
+        differential_ts = self._differential_filter(source_ts)
+        if input_data.data_type != DataTypesEnum.multi_ts:
+            differential_ts = np.ravel(differential_ts)
+        output_data = self._convert_to_output(input_data,
+                                              differential_ts,
+                                              data_type=input_data.data_type)
 
         return output_data
 
-    def _differential_filter(self, ts):
-        """:obj:`NumericalDerivative` filter
+    def _differential_filter(self, ts: np.ndarray) -> np.ndarray:
+        """:obj:`NumericalDerivative` filter for the series or for the table of series in columns
         """
 
         if self.window_size > ts.shape[0]:
             self.log.info(f'NumericalDerivativeFilter: invalid parameter window_size ({self.window_size}) changed to '
                           f'{self.poly_degree + 1}')
             self.params.update(window_size=self.poly_degree + 1)
-        x = np.arange(ts.shape[0])
-
-        ts_len = x.shape[0]
-        der_f = np.zeros(ts_len)
-
-        # Take the differentials in the center of the domain
-        for center_window in range(self.window_size, ts_len - self.window_size):
-            points = np.arange(center_window - self.window_size, center_window + self.window_size)
-            # Fit to a Chebyshev polynomial
-            # this is the same as any polynomial since we're on a fixed grid but it's better conditioned :)
-            poly = np.polynomial.chebyshev.Chebyshev.fit(x[points], ts[points], self.poly_degree,
-                                                         window=[np.min(points), np.max(points)])
-            der_f[center_window] = poly.deriv(m=self.order)(x[center_window])
-
-        supp_1 = ts[0:self.window_size]
-        coordsupp_1 = x[0:self.window_size]
-        supp_2 = ts[-self.window_size:]
-        coordsupp_2 = x[-self.window_size:]
-        poly = np.polynomial.chebyshev.Chebyshev.fit(coordsupp_1, supp_1, self.window_size - 1)
-        der_f[0:self.window_size] = poly.deriv(m=self.order)(coordsupp_1)
-        poly = np.polynomial.chebyshev.Chebyshev.fit(coordsupp_2, supp_2, self.window_size - 1)
-        der_f[-self.window_size:] = poly.deriv(m=self.order)(coordsupp_2)
+        window_size = self.window_size
+        series = ts.reshape((ts.shape[0], -1)).astype(float)
+        ts_len = series.shape[0]
+        x = np.arange(ts_len)
+        der_f = np.zeros_like(series)
+
+        # Take the differentials in the center of the domain. The derivative of the polynomial
+        # fitted to the window is the linear combination of the window values, so it is the convolution
+        if ts_len > 2 * window_size:
+            windows = sliding_window_view(series[:ts_len - 1], 2 * window_size, axis=0)
+            kernel = _derivative_kernel(window_size, self.poly_degree, self.order)
+            der_f[window_size:ts_len - window_size] = windows @ kernel
+
+        supp_1 = series[0:window_size]
+        coordsupp_1 = x[0:window_size]
+        supp_2 = series[-window_size:]
+        coordsupp_2 = x[-window_size:]
         for _ in range(self.order):
-            supp_1 = np.gradient(supp_1, coordsupp_1, edge_order=2)
-            supp_2 = np.gradient(supp_2, coordsupp_2, edge_order=2)
-        der_f[0:self.window_size] = supp_1
-        der_f[-self.window_size:] = supp_2
-        return np.transpose(der_f)
+            supp_1 = np.gradient(supp_1, coordsupp_1, axis=0, edge_order=2)
+            supp_2 = np.gradient(supp_2, coordsupp_2, axis=0, edge_order=2)
+        der_f[0:window_size] = supp_1
+        der_f[-window_size:] = supp_2
+        return der_f.reshape(ts.shape)
 
     def _correct_params(self):
         if self.poly_degree > 5:
@@ -642,6 +662,22 @@ class NumericalDerivativeFilterImplementation(DataOperationImplementation):
             self.params.update(window_size=self.poly_degree + 1)
 
 
+@lru_cache(maxsize=None)
+def _derivative_kernel(window_size: int, poly_degree: int, order: int) -> np.ndarray:
+    """ Weights of the window values which give the derivative of the ``order`` at the window center
+    of the Chebyshev polynomial of the ``poly_degree`` fitted to the window of ``2 * window_size`` points
+
+    :return: read-only array of the weights
+    """
+    points = np.arange(2 * window_size)
+    # Fit is linear in values, so the fits to the unit vectors give the weights of each point
+    kernel = np.array([np.polynomial.chebyshev.Chebyshev.fit(points, unit_vector, poly_degree)
+                       .deriv(m=order)(window_size)
+                       for unit_vector in np.eye(len(points))])
+    kernel.flags.writeable = False
+    return kernel
+
+
 class CutImplementation(DataOperationImplementation):
     def __init__(self, params: Optional[OperationParameters]):
         super().__init__(params)
@@ -759,6 +795,24 @@ def ts_to_table(idx, time_series: np.array, window_size: int, is_lag: bool = Fal
     return updated_idx, features_columns
 
 
+def ts_continuation(fitted_ts: Optional[np.ndarray], time_series: np.ndarray) -> Optional[np.ndarray]:
+    """Returns the observations of the time series following the time series the model is fitted on.
+
+    Args:
+        fitted_ts: time series the model is fitted on
+        time_series: time series to fit the model on
+
+    Returns:
+        new observations (empty if the time series are the same) or ``None``
+        if ``time_series`` does not start with ``fitted_ts``
+    """
+    if fitted_ts is None or len(time_series) < len(fitted_ts):
+        return None
+    if not np.array_equal(time_series[:len(fitted_ts)], fitted_ts):
+        return None
+    return time_series[len(fitted_ts):]
+
+
 def _sparse_matrix(logger, features_columns: np.array, n_components_perc=0.5, use_svd=False):
     """Method converts the matrix to sparse form
 
@@ -840,7 +894,10 @@ def prepare_target(all_idx, idx, features_columns: np.array, target, forecast_le
     idx = idx[: -1]
 
     # Update target (clip first "window size" values)
-    row_nums = [list(all_idx).index(i) for i in idx]
+    row_nums_by_idx = {}
+    for row_num, i in enumerate(all_idx):
+        row_nums_by_idx.setdefault(i, row_num)
+    row_nums = [row_nums_by_idx[i] for i in idx]
     ts_target = target[row_nums]
 
     # Multi-target transformation
@@ -44,6 +44,15 @@ class DataOperationImplementation(ABC):
         """
         return self.transform(input_data)
 
+    def partial_fit(self, input_data: InputData) -> bool:
+        """ Method updates the fitted operation in place with the data appended to the data
+        it is fitted on. The operations which can not be updated return False
+
+        :param input_data: new data with features, target and ids to process
+        :return: whether the operation was updated
+        """
+        return False
+
     def get_params(self) -> OperationParameters:
         """ Method return parameters, which can be optimized for particular
         operation
@@ -95,6 +104,21 @@ class EncodedInvariantImplementation(DataOperationImplementation):
 
         return self.operation
 
+    def partial_fit(self, input_data: InputData) -> bool:
+        """ Method updates the transformer in place with the new data if it supports
+        the incremental fit (e.g. the scalers), the boolean features are determined at the fit stage
+
+        :param input_data: new data with features, target and ids to process
+        :return: whether the transformer was updated
+        """
+        if len(self.ids_to_process) == 0:
+            return True
+        if not hasattr(self.operation, 'partial_fit'):
+            return False
+        features_to_process = np.array(input_data.features[:, self.ids_to_process])
+        self.operation.partial_fit(features_to_process)
+        return True
+
     def transform(self, input_data: InputData) -> OutputData:
         """
         The method that transforms the source features using "operation" for predict stage
@@ -178,6 +202,8 @@ class ModelImplementation(ABC):
     Contains abstract methods, which should be implemented for applying EA
     optimizer on it
     """
+    # Whether the fitted model reuses its state when it is updated with the continued data (see :meth:`update`)
+    supports_update = False
 
     def __init__(self, params: OperationParameters = None):
         self.log = default_log(self)
@@ -208,6 +234,15 @@ class ModelImplementation(ABC):
         """
         return self.predict(input_data)
 
+    def update(self, input_data: InputData):
+        """ Method fit already fitted model on a dataset continuing the one it is fitted on
+        (e.g. time series with the new observations). Allows to reuse the fitted state of the model
+        instead of fitting it from scratch, which is done by default.
+
+        :param input_data: data with features, target and ids to process
+        """
+        return self.fit(input_data)
+
     def get_params(self) -> OperationParameters:
         """ Method return parameters, which can be optimized for particular
         operation
@@ -1,6 +1,7 @@
 import logging
 import os
-from typing import Optional
+from math import ceil
+from typing import Iterator, Optional, Sequence
 
 import numpy as np
 
@@ -14,6 +15,7 @@ except ModuleNotFoundError:
     tf = None
 
 from fedot.core.data.data import InputData, OutputData
+from fedot.core.data.image_dataset import ImageDataset
 from fedot.core.log import LoggerAdapter, default_log
 from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import ModelImplementation
 from sklearn import preprocessing
@@ -32,6 +34,28 @@ def check_input_array(x_train):
     return transformed_x_train, transform_flag
 
 
+def image_batches(images: ImageDataset, target: Optional[np.ndarray] = None, batch_size: int = 32,
+                  indices: Optional[Sequence[int]] = None, shuffle: bool = False, repeat: bool = False) -> Iterator:
+    """ Yields batches of the images scaled to [0, 1] (with the target if it is set)
+    to train and apply CNN on the datasets which do not fit in memory
+
+    :param images: lazy source of the images
+    :param target: target of all the images or None
+    :param batch_size: number of the images in the batch
+    :param indices: indices of the images to use, all the images by default
+    :param shuffle: if True, the images are shuffled before each pass over the dataset
+    :param repeat: if True, passes over the dataset are repeated infinitely (as required by keras for training)
+    """
+    indices = np.arange(len(images)) if indices is None else np.asarray(indices)
+    while True:
+        order = np.random.permutation(indices) if shuffle else indices
+        for start, batch in zip(range(0, len(order), batch_size), images.iter_batches(batch_size, order)):
+            scaled_batch = batch.astype('float32') / 255
+            yield scaled_batch if target is None else (scaled_batch, target[order[start:start + batch_size]])
+        if not repeat:
+            return
+
+
 def create_deep_cnn(input_shape: tuple,
                     num_classes: int):
     model = tf.keras.Sequential(
@@ -84,7 +108,11 @@ def fit_cnn(train_data: InputData,
             optimizer_params: dict = None,
             logger: Optional[LoggerAdapter] = None):
     x_train, y_train = train_data.features, train_data.target
-    transformed_x_train, transform_flag = check_input_array(x_train)
+    if isinstance(x_train, ImageDataset):
+        # Images are loaded and scaled by batches during the training
+        transformed_x_train, transform_flag = x_train, True
+    else:
+        transformed_x_train, transform_flag = check_input_array(x_train)
 
     if logger is None:
         logger = default_log(prefix=__name__)
@@ -117,29 +145,50 @@ def fit_cnn(train_data: InputData,
     if epochs is None:
         logger.warning('The number of training epochs was not set. The selected number of epochs is 10.')
 
-    model.fit(transformed_x_train, y_train, batch_size=batch_size, epochs=epochs,
-              validation_split=0.1, verbose=verbose)
+    if isinstance(transformed_x_train, ImageDataset):
+        # The last images are used for validation as keras does with validation_split
+        train_size = len(transformed_x_train) - int(0.1 * len(transformed_x_train))
+        train_ids, validation_ids = np.arange(train_size), np.arange(train_size, len(transformed_x_train))
+        validation_data = {}
+        if len(validation_ids):
+            validation_data = dict(validation_data=image_batches(transformed_x_train, y_train, batch_size,
+                                                                 validation_ids, repeat=True),
+                                   validation_steps=ceil(len(validation_ids) / batch_size))
+        model.fit(image_batches(transformed_x_train, y_train, batch_size, train_ids, shuffle=True, repeat=True),
+                  steps_per_epoch=ceil(len(train_ids) / batch_size), epochs=epochs, verbose=verbose,
+                  **validation_data)
+    else:
+        model.fit(transformed_x_train, y_train, batch_size=batch_size, epochs=epochs,
+                  validation_split=0.1, verbose=verbose)
 
     return model
 
 
 def predict_cnn(trained_model, predict_data: InputData, output_mode: str = 'labels', logger=None) -> OutputData:
     x_test = predict_data.features
-    transformed_x_test, transform_flag = check_input_array(x_test)
 
     if logger is None:
         logger = default_log(prefix=__name__)
 
-    if np.max(transformed_x_test) > 1:
-        logger.warning('Test data set was not scaled. The data was divided by 255.')
+    if isinstance(x_test, ImageDataset):
+        # Images are loaded and scaled by batches
+        batch_size = 32
+        transformed_x_test = image_batches(x_test, batch_size=batch_size)
+        predict_params = dict(steps=ceil(len(x_test) / batch_size))
+    else:
+        transformed_x_test, transform_flag = check_input_array(x_test)
+        predict_params = {}
+
+        if np.max(transformed_x_test) > 1:
+            logger.warning('Test data set was not scaled. The data was divided by 255.')
 
-    if len(x_test.shape) == 3:
-        transformed_x_test = np.expand_dims(x_test, -1)
+        if len(x_test.shape) == 3:
+            transformed_x_test = np.expand_dims(x_test, -1)
 
     if output_mode == 'labels':
-        prediction = np.round(trained_model.predict(transformed_x_test))
+        prediction = np.round(trained_model.predict(transformed_x_test, **predict_params))
     elif output_mode in ['probs', 'full_probs', 'default']:
-        prediction = trained_model.predict(transformed_x_test)
+        prediction = trained_model.predict(transformed_x_test, **predict_params)
         if trained_model.num_classes < 2:
             logger.error('Data set contain only 1 target class. Please reformat your data.')
             raise NotImplementedError()
@@ -8,7 +8,8 @@ from statsmodels.tsa.api import STLForecast
 from statsmodels.tsa.arima.model import ARIMA
 
 from fedot.core.data.data import InputData, OutputData
-from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import ts_to_table
+from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
+    ts_continuation, ts_to_table
 from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import ModelImplementation
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -16,6 +17,7 @@ from fedot.utilities.ts_gapfilling import SimpleGapFiller
 
 
 class ARIMAImplementation(ModelImplementation):
+    supports_update = True
 
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
@@ -23,6 +25,7 @@ class ARIMAImplementation(ModelImplementation):
         self.lambda_value = None
         self.scope = None
         self.actual_ts_len = None
+        self.fitted_ts = None
 
     def fit(self, input_data):
         """ Class fit arima model on data
@@ -32,6 +35,7 @@ class ARIMAImplementation(ModelImplementation):
         source_ts = np.array(input_data.features)
         # Save actual time series length
         self.actual_ts_len = len(source_ts)
+        self.fitted_ts = source_ts
 
         # Apply box-cox transformation for positive values
         transformed_ts = self._apply_boxcox(source_ts)
@@ -46,6 +50,30 @@ class ARIMAImplementation(ModelImplementation):
 
         return self.arima
 
+    def update(self, input_data: InputData):
+        """ Appends the observations following the fitted time series to the model
+        and refits its parameters starting from the fitted ones. The Box-Cox transformation
+        of the fitted time series is kept. The model is fitted from scratch if the time series
+        does not continue the fitted one or the transformation is not applicable to the new observations
+
+        :param input_data: data with the fitted time series followed by the new observations
+        """
+        source_ts = np.array(input_data.features)
+        new_ts = ts_continuation(self.fitted_ts, source_ts)
+        if new_ts is None:
+            return self.fit(input_data)
+        if len(new_ts) == 0:
+            return self.arima
+
+        shifted_ts = new_ts if self.scope is None else new_ts + self.scope
+        if np.min(shifted_ts) <= 0:
+            return self.fit(input_data)
+        self.arima = self.arima.append(boxcox(shifted_ts, self.lambda_value), refit=True)
+        self.actual_ts_len = len(source_ts)
+        self.fitted_ts = source_ts
+
+        return self.arima
+
     def predict(self, input_data: InputData):
         """ Method for time series prediction on forecast length
 
@@ -121,7 +149,8 @@ class ARIMAImplementation(ModelImplementation):
     def _apply_boxcox(self, source_ts):
         min_value = np.min(source_ts)
         if min_value > 0:
-            pass
+            # The shift of the previous fit is not needed for the positive values
+            self.scope = None
         else:
             # Making a shift to positive values
             self.scope = abs(min_value) + 1
@@ -9,7 +9,8 @@ from statsmodels.tsa.ar_model import AutoReg
 from statsmodels.tsa.exponential_smoothing.ets import ETSModel
 
 from fedot.core.data.data import InputData, OutputData
-from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import ts_to_table
+from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
+    ts_continuation, ts_to_table
 from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import ModelImplementation
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -245,26 +246,47 @@ class AutoRegImplementation(ModelImplementation):
 
 class ExpSmoothingImplementation(ModelImplementation):
     """ Exponential smoothing implementation from statsmodels """
+    supports_update = True
 
     def __init__(self, params: OperationParameters):
         super().__init__(params)
         self.model = None
+        self.fitted_ts = None
         if self.params.get("seasonal"):
             self.seasonal_periods = int(self.params.get("seasonal_periods"))
         else:
             self.seasonal_periods = None
 
     def fit(self, input_data):
-        self.model = ETSModel(
-            input_data.features.astype("float64"),
+        self.fitted_ts = input_data.features.astype("float64")
+        self.model = self._build_model(self.fitted_ts).fit(disp=False)
+        return self.model
+
+    def update(self, input_data):
+        """ Fits the model on the time series continuing the fitted one
+        starting the optimization from the fitted parameters, the model is fitted
+        from scratch if the time series does not continue the fitted one
+
+        :param input_data: data with the fitted time series followed by the new observations
+        """
+        source_ts = input_data.features.astype("float64")
+        new_ts = ts_continuation(self.fitted_ts, source_ts)
+        if new_ts is None:
+            return self.fit(input_data)
+        if len(new_ts) > 0:
+            self.model = self._build_model(source_ts).fit(start_params=self.model.params, disp=False)
+            self.fitted_ts = source_ts
+        return self.model
+
+    def _build_model(self, time_series: np.ndarray) -> ETSModel:
+        return ETSModel(
+            time_series,
             error=self.params.get("error"),
             trend=self.params.get("trend"),
             seasonal=self.params.get("seasonal"),
             damped_trend=self.params.get("damped_trend"),
             seasonal_periods=self.seasonal_periods
         )
-        self.model = self.model.fit(disp=False)
-        return self.model
 
     def predict(self, input_data):
         input_data = copy(input_data)
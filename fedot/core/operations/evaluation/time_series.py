@@ -60,6 +60,21 @@ class FedotTsForecastingStrategy(EvaluationStrategy):
         model.fit(train_data)
         return model
 
+    def update(self, trained_operation, train_data: InputData):
+        """
+        This method is used for training of the operation already trained on the beginning
+        of the time series, the operation is trained from scratch if its hyperparameters are changed
+        :param trained_operation: operation trained on the beginning of the time series
+        :param InputData train_data: data used for operation training
+        :return: trained model
+        """
+        if not trained_operation.supports_update or \
+                trained_operation.params.to_dict() != self.params_for_fit.to_dict():
+            return self.fit(train_data)
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        trained_operation.update(train_data)
+        return trained_operation
+
     def predict(self, trained_operation, predict_data: InputData) -> OutputData:
         """
         This method used for prediction of the target data during predict stage.
@@ -21,6 +21,7 @@ class Operation:
         self.operation_type = operation_type
 
         self._eval_strategy = None
+        self._eval_strategy_key = None
         self.operations_repo = None
         self.fitted_operation = None
 
@@ -49,6 +50,20 @@ class Operation:
         if 'output_mode' in kwargs:
             self._eval_strategy.output_mode = kwargs['output_mode']
 
+        self._eval_strategy_key = _eval_strategy_key(task, params)
+
+    def _init_for_predict(self, task: Task, **kwargs):
+        """Reuses the evaluation strategy bound at fit stage if the task and the parameters were not changed,
+        otherwise initializes the new one. Hyperparameters corrections are used only during training,
+        so there is no need to repeat them for every prediction
+        """
+        bound_key = getattr(self, '_eval_strategy_key', None)
+        is_bound = self._eval_strategy is not None and bound_key is not None
+        if not is_bound or bound_key != _eval_strategy_key(task, kwargs.get('params')):
+            self._init(task, **kwargs)
+        elif 'output_mode' in kwargs:
+            self._eval_strategy.output_mode = kwargs['output_mode']
+
     def description(self, operation_params: dict) -> str:
         operation_type = self.operation_type
         return f'n_{operation_type}_{operation_params}'
@@ -85,6 +100,47 @@ class Operation:
 
         return self.fitted_operation, predict_train
 
+    def update(self, fitted_operation, params: Optional[Union[OperationParameters, dict]], data: InputData):
+        """This method is used for defining and running of the evaluation strategy
+        to train the operation already trained on the beginning of the data provided (e.g. of the time series),
+        the operations not supporting the update are trained from scratch
+
+        Args:
+            fitted_operation: operation trained on the beginning of the data
+            params: hyperparameters for operation
+            data: data used for operation training
+
+        Returns:
+            tuple: trained operation and prediction on train data
+        """
+        self._init(data.task, params=params, n_samples_data=data.features.shape[0])
+
+        self.fitted_operation = self._eval_strategy.update(fitted_operation, train_data=data)
+
+        predict_train = self.predict_for_fit(self.fitted_operation, data, params)
+
+        return self.fitted_operation, predict_train
+
+    def partial_fit(self, fitted_operation, params: Optional[Union[OperationParameters, dict]],
+                    data: InputData) -> bool:
+        """This method is used for defining and running of the evaluation strategy
+        to train the trained operation in place with the data appended to the data it is trained on
+
+        Args:
+            fitted_operation: trained operation object
+            params: hyperparameters for operation
+            data: new data used for operation training
+
+        Returns:
+            bool: whether the operation was trained, ``False`` if it does not support the partial fit
+
+        Raises:
+            ValueError: if the operation can not be trained on the new data (e.g. the new classes appeared)
+        """
+        self._init(data.task, params=params, n_samples_data=data.features.shape[0])
+
+        return self._eval_strategy.partial_fit(fitted_operation, train_data=data)
+
     def predict(self, fitted_operation, data: InputData, params: Optional[Union[OperationParameters, dict]] = None,
                 output_mode: str = 'default'):
         """This method is used for defining and running of the evaluation strategy
@@ -118,7 +174,8 @@ class Operation:
 
         is_main_target = data.supplementary_data.is_main_target
         data_flow_length = data.supplementary_data.data_flow_length
-        self._init(data.task, output_mode=output_mode, params=params, n_samples_data=data.features.shape[0])
+        self._init_for_predict(data.task, output_mode=output_mode, params=params,
+                               n_samples_data=data.features.shape[0])
 
         if is_fit_stage:
             prediction = self._eval_strategy.predict_for_fit(
@@ -151,6 +208,25 @@ class Operation:
         return f'{self.operation_type}'
 
 
+def _eval_strategy_key(task: Task, params: Optional[Union[OperationParameters, dict]]) -> tuple:
+    """The function returns the key which defines the evaluation strategy of the operation
+
+    Args:
+        task: task to solve
+        params: hyperparameters for operation
+
+    Returns:
+        tuple: task type and snapshot of the parameters
+    """
+    if not params:
+        params_snapshot = None
+    elif isinstance(params, OperationParameters):
+        params_snapshot = params.to_dict()
+    else:
+        params_snapshot = dict(params)
+    return task.task_type, params_snapshot
+
+
 def _eval_strategy_for_task(operation_type: str, current_task_type: TaskTypesEnum,
                             operations_repo):
     """The function returns the strategy for the selected operation and task type.
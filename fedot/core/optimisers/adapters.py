@@ -1,8 +1,7 @@
-from copy import deepcopy
 from typing import Any, Optional, Dict
 
 from fedot.core.adapter import BaseOptimizationAdapter
-from fedot.core.dag.graph_node import GraphNode
+from fedot.core.dag.graph_node import GraphNode, copy_nodes_structure
 from fedot.core.optimisers.graph import OptGraph, OptNode
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
@@ -48,25 +47,25 @@ class PipelineAdapter(BaseOptimizationAdapter[Pipeline]):
 
     def _adapt(self, adaptee: Pipeline) -> OptGraph:
         """ Convert Pipeline class into OptGraph class """
-        source_pipeline = deepcopy(adaptee)
+        source_nodes = copy_nodes_structure(adaptee.nodes)
 
         # Apply recursive transformation since root
-        for node in source_pipeline.nodes:
+        for node in source_nodes:
             _transform_node(node=node, primary_class=OptNode,
                             transform_func=self._transform_to_opt_node)
-        graph = OptGraph(source_pipeline.nodes)
+        graph = OptGraph(source_nodes)
         return graph
 
     def _restore(self, opt_graph: OptGraph, metadata: Optional[Dict[str, Any]] = None) -> Pipeline:
         """ Convert OptGraph class into Pipeline class """
         metadata = metadata or {}
-        source_graph = deepcopy(opt_graph)
+        source_nodes = copy_nodes_structure(opt_graph.nodes)
 
         # Inverse transformation since root node
-        for node in source_graph.nodes:
+        for node in source_nodes:
             _transform_node(node=node, primary_class=PrimaryNode, secondary_class=SecondaryNode,
                             transform_func=self._transform_to_pipeline_node)
-        pipeline = Pipeline(source_graph.nodes)
+        pipeline = Pipeline(source_nodes)
         pipeline.computation_time = metadata.get('computation_time_in_seconds')
         return pipeline
 
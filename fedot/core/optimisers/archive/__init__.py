@@ -1,2 +1,5 @@
 from .generation_keeper import GenerationKeeper
 from .individuals_containers import HallOfFame, ParetoFront
+from .fitness_index import FitnessIndex
+
+__all__ = ['GenerationKeeper', 'HallOfFame', 'ParetoFront', 'FitnessIndex']
@@ -0,0 +1,62 @@
+from hashlib import sha1
+from typing import Dict, Optional
+
+from fedot.core.dag.graph import Graph
+from fedot.core.optimisers.fitness import Fitness
+
+
+class FitnessIndex:
+    """
+    Index of the fitness values of all graphs evaluated during the optimisation run.
+    Graphs are identified by the canonical hash of their structure, so the repeated structure
+    produced by the evolutionary operators can get the known fitness without the evaluation.
+    Only the valid fitness values are stored.
+
+    The index counts the lookups to report the share of evaluations saved during the run.
+    """
+
+    def __init__(self):
+        self._fitness_by_hash: Dict[str, Fitness] = {}
+        self.requests_num = 0
+        self.hits_num = 0
+
+    @staticmethod
+    def graph_hash(graph: Graph) -> str:
+        """
+        Gets the canonical hash of the graph structure
+
+        :param graph: graph to describe
+
+        :return: hash which is equal for the graphs with the same nodes, parameters and edges
+        """
+        root_ids = sorted(root_node.descriptive_id for root_node in graph.root_nodes())
+        return sha1('|'.join(root_ids).encode()).hexdigest()
+
+    def get(self, graph_hash: str) -> Optional[Fitness]:
+        """
+        Gets the fitness of the previously evaluated graph and counts the lookup
+
+        :param graph_hash: canonical hash of the graph from :meth:`graph_hash`
+
+        :return: known fitness or None if the graph was not evaluated yet
+        """
+        self.requests_num += 1
+        fitness = self._fitness_by_hash.get(graph_hash)
+        if fitness is not None:
+            self.hits_num += 1
+        return fitness
+
+    def add(self, graph_hash: str, fitness: Fitness):
+        if fitness.valid:
+            self._fitness_by_hash[graph_hash] = fitness
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits_num / self.requests_num if self.requests_num else 0.
+
+    def __len__(self) -> int:
+        return len(self._fitness_by_hash)
+
+    def __str__(self) -> str:
+        return (f'fitness of {self.hits_num} of {self.requests_num} graphs reused '
+                f'from the evaluation history (hit rate {self.hit_rate:.1%})')
@@ -103,7 +103,9 @@ class GenerationKeeper(ImprovementWatcher):
 
     def append(self, population: PopulationT):
         previous_archive_fitness = self._archive_fitness()
-        self.archive.update(population)
+        # Individuals scored only on the subsample of data can not compete with the ones scored on the full data
+        fully_evaluated = [ind for ind in population if 'subsample_stage' not in ind.metadata]
+        self.archive.update(fully_evaluated)
         self._update_improvements(previous_archive_fitness)
 
     def _archive_fitness(self) -> Dict[MetricsEnum, Sequence[float]]:
@@ -17,13 +17,18 @@ class ComposerRequirements:
     Infrastructure options (logging, performance)
     :param keep_n_best: number of the best individuals of previous generation to keep in next generation
     :param max_pipeline_fit_time: time constraint for operation fitting (minutes)
+    :param isolated_fit: fit candidates in the separate processes killed when max_pipeline_fit_time expires
     :param n_jobs: num of n_jobs
     :param show_progress: bool indicating whether to show progress using tqdm or not
     :param collect_intermediate_metric: save metrics for intermediate (non-root) nodes in pipeline
+    :param profile_nodes: save time, memory and cache hits of each node of the evaluated pipelines
+    to the ``node_profile`` metadata of the individuals
 
     Model validation options:
     :param cv_folds: number of cross-validation folds
     :param validation_blocks: number of validation blocks for time series validation
+    :param progressive_sampling: score candidates on the growing subsamples of the train data
+    and evaluate on the full data only the best of them, works only with the sequential evaluation (n_jobs=1)
     """
 
     num_of_generations: int = 20
@@ -32,12 +37,15 @@ class ComposerRequirements:
 
     keep_n_best: int = 1
     max_pipeline_fit_time: Optional[datetime.timedelta] = None
+    isolated_fit: bool = False
     n_jobs: int = 1
     show_progress: bool = True
     collect_intermediate_metric: bool = False
+    profile_nodes: bool = False
 
     cv_folds: Optional[int] = None
     validation_blocks: Optional[int] = None
+    progressive_sampling: bool = False
 
     def __post_init__(self):
         if self.cv_folds is not None and self.cv_folds <= 1:
@@ -1,22 +1,27 @@
-import gc
-import pathlib
+import heapq
 import timeit
 from abc import ABC, abstractmethod
+from contextlib import ExitStack, nullcontext
 from datetime import datetime
 from random import choice
-from typing import Dict, Optional, Tuple
+from typing import ContextManager, Dict, Optional, Set, Tuple
 
-from joblib import Parallel, delayed, cpu_count
+from joblib import Parallel, delayed
 
 from fedot.core.adapter import BaseOptimizationAdapter
 from fedot.core.dag.graph import Graph
-from fedot.core.log import default_log, Log
+from fedot.core.log import default_log, Log, LogQueue
+from fedot.core.optimisers.archive.fitness_index import FitnessIndex
 from fedot.core.optimisers.fitness import Fitness
 from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.gp_comp.operators.operator import EvaluationOperator, PopulationT
 from fedot.core.optimisers.objective import GraphFunction, ObjectiveFunction
+from fedot.core.optimisers.time_estimator import EvaluationTimeEstimator
 from fedot.core.optimisers.timer import Timer, get_forever_timer
+from fedot.core.pipelines.profiling import PipelineProfile
 from fedot.core.pipelines.verification import verifier_for_task
+from fedot.core.utilities.cpu_budget import CPUBudget, CoresShare
+from fedot.core.utilities.memory import AdaptiveGarbageCollector, DEFAULT_GC_THRESHOLD_IN_MB, MemoryUsageTracker
 from fedot.remote.remote_evaluator import RemoteEvaluator
 
 
@@ -37,22 +42,44 @@ class ObjectiveEvaluationDispatcher(ABC):
         that's called on each graph after its evaluation."""
         pass
 
+    def __enter__(self):
+        """Starts the optimisation run, the resources shared by the evaluations of the run live until its end"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
 
 class MultiprocessingDispatcher(ObjectiveEvaluationDispatcher):
     """Evaluates objective function on population using multiprocessing pool
     and optionally model evaluation cache with RemoteEvaluator.
+    The graphs evaluated earlier with the same objective get their known fitness
+    from the :class:`FitnessIndex` instead of the evaluation.
 
     Usage: call `dispatch(objective_function)` to get evaluation function.
+    The optimisation run is wrapped by ``with dispatcher:``, so the listener of the logs of the workers
+    is started once for the whole run.
 
     :param n_jobs: number of jobs for multiprocessing or 1 for no multiprocessing.
     :param graph_cleanup_fn: function to call after graph evaluation, primarily for memory cleanup.
+    :param cpu_budget: split of the cores between the evaluating workers and the threads of the models,
+    by default all ``n_jobs`` cores are shared and rebalanced when there are fewer graphs than cores.
+    :param gc_threshold_in_mb: growth of the memory of the evaluating process that triggers the full garbage collection
+    after the evaluation, 0 means the collection after each evaluation.
+    The peak memory used by the evaluation is saved to the ``peak_memory_in_mb`` metadata of the individual.
+    The measurements of the nodes recorded to the ``profile`` of the evaluated graph (if any)
+    are saved to the ``node_profile`` metadata.
+    :param time_estimator: estimator of the evaluation time trained on the times of the evaluated graphs
     """
 
     def __init__(self,
                  adapter: BaseOptimizationAdapter,
                  timer: Timer = None,
                  n_jobs: int = 1,
-                 graph_cleanup_fn: Optional[GraphFunction] = None):
+                 graph_cleanup_fn: Optional[GraphFunction] = None,
+                 cpu_budget: Optional[CPUBudget] = None,
+                 gc_threshold_in_mb: float = DEFAULT_GC_THRESHOLD_IN_MB,
+                 time_estimator: Optional[EvaluationTimeEstimator] = None):
         self._adapter = adapter
         self._objective_eval = None
         self._cleanup = graph_cleanup_fn
@@ -61,12 +88,34 @@ class MultiprocessingDispatcher(ObjectiveEvaluationDispatcher):
         self.timer = timer or get_forever_timer()
         self.logger = default_log(self)
         self._n_jobs = n_jobs
+        self._cpu_budget = cpu_budget or CPUBudget(n_jobs)
+        self._garbage_collector = AdaptiveGarbageCollector(gc_threshold_in_mb)
+        self.time_estimator = time_estimator
         self._reset_eval_cache()
+        self.fitness_index = FitnessIndex()
+        self._run_stack: Optional[ExitStack] = None
+        self._log_queue: Optional[LogQueue] = None
+
+    def __enter__(self):
+        self._run_stack = ExitStack()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        run_stack, self._run_stack, self._log_queue = self._run_stack, None, None
+        if run_stack is not None:
+            run_stack.close()
+
+    def __getstate__(self):
+        # The listener of the logs lives in the main process only
+        state = self.__dict__.copy()
+        state['_run_stack'] = None
+        return state
 
     def dispatch(self, objective: ObjectiveFunction) -> EvaluationOperator:
         """Return handler to this object that hides all details
         and allows only to evaluate population with provided objective."""
         self._objective_eval = objective
+        self.fitness_index = FitnessIndex()
         return self.evaluate_with_cache
 
     def set_evaluation_callback(self, callback: Optional[GraphFunction]):
@@ -74,62 +123,172 @@ class MultiprocessingDispatcher(ObjectiveEvaluationDispatcher):
 
     def evaluate_with_cache(self, population: PopulationT) -> Optional[PopulationT]:
         reversed_population = list(reversed(population))
-        self._remote_compute_cache(reversed_population)
-        evaluated_population = self.evaluate_population(reversed_population)
+        known_population, unknown_population, graph_hashes = self._apply_fitness_index(reversed_population)
+        if not unknown_population:
+            return known_population
+
+        self._remote_compute_cache(unknown_population)
+        evaluated_population = self.evaluate_population(unknown_population)
         self._reset_eval_cache()
-        return evaluated_population
+
+        if evaluated_population is None:
+            return known_population or None
+        for ind in evaluated_population:
+            # The low-fidelity fitness obtained on the subsample is not reused
+            if ind.uid in graph_hashes and 'subsample_stage' not in ind.metadata:
+                self.fitness_index.add(graph_hashes[ind.uid], ind.fitness)
+        return known_population + evaluated_population
+
+    def _apply_fitness_index(self, population: PopulationT) -> Tuple[PopulationT, PopulationT, Dict[str, str]]:
+        """Sets the fitness of the graphs evaluated before.
+        Returns the individuals with known fitness, the ones to evaluate and hashes of the graphs to evaluate """
+        known_population, unknown_population = [], []
+        graph_hashes = {}
+        for ind in population:
+            if ind.fitness.valid:
+                known_population.append(ind)
+                continue
+            graph_hash = self.fitness_index.graph_hash(ind.graph)
+            fitness = self.fitness_index.get(graph_hash)
+            if fitness is None:
+                graph_hashes[ind.uid] = graph_hash
+                unknown_population.append(ind)
+            else:
+                ind.set_evaluation_result(fitness)
+                ind.metadata['computation_time_in_seconds'] = 0.
+                ind.metadata['evaluation_time_iso'] = datetime.now().isoformat()
+                known_population.append(ind)
+        return known_population, unknown_population, graph_hashes
 
     def evaluate_population(self, individuals: PopulationT) -> Optional[PopulationT]:
-        n_jobs = determine_n_jobs(self._n_jobs, self.logger)
+        all_individuals = individuals
+        # The individuals with the known fitness are returned as is, so their times are not observed again
+        evaluated_uids = {ind.uid for ind in individuals if not ind.fitness.valid}
+        individuals = self._expected_in_time(individuals)
+        n_jobs = self._cpu_budget.workers_num(len(individuals))
+        self.logger.info(f"Number of used CPU's: {self._cpu_budget.n_jobs} ({n_jobs} workers)")
+        # Only the individuals with the unknown fitness take the cores
+        tasks_num = sum(not ind.fitness.valid for ind in individuals)
 
         parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch="2*n_jobs")
-        eval_inds = parallel(delayed(self.evaluate_single)(ind=ind, logs_initializer=Log().get_parameters())
-                             for ind in individuals)
+        # The records of the workers are written by the main process, the sequential evaluation writes them itself
+        with self._logs_listener(n_jobs) as log_queue, self._cpu_budget.share(tasks_num) as cores:
+            logs_initializer = (Log().logger.level, log_queue) if log_queue is not None else None
+            eval_inds = parallel(delayed(self.evaluate_single)(ind=ind, logs_initializer=logs_initializer,
+                                                               cores=cores)
+                                 for ind in individuals)
         # If there were no successful evals then try once again getting at least one,
         # even if time limit was reached
         successful_evals = list(filter(None, eval_inds))
+        self._observe_evaluation_times(successful_evals, evaluated_uids)
         if not successful_evals:
-            single = self.evaluate_single(choice(individuals), with_time_limit=False)
+            single = self.evaluate_single(choice(all_individuals), with_time_limit=False)
             if single:
                 successful_evals = [single]
+                self._observe_evaluation_times(successful_evals, evaluated_uids)
             else:
                 successful_evals = None
 
         return successful_evals
 
+    def _logs_listener(self, n_jobs: int) -> ContextManager[Optional[LogQueue]]:
+        """Gets the queue of the records of the workers listened during the optimisation run.
+        Out of the run the listener is started for the single evaluation of the population"""
+        if n_jobs == 1:
+            return nullcontext()
+        if self._run_stack is None:
+            return Log.queue_listener()
+        if self._log_queue is None:
+            self._log_queue = self._run_stack.enter_context(Log.queue_listener())
+        return nullcontext(self._log_queue)
+
+    def _expected_in_time(self, individuals: PopulationT) -> PopulationT:
+        """Leaves the individuals which are expected to be evaluated before the timeout
+        by the predicted evaluation times, taking into account that they are dispatched in order to the workers"""
+        if self.time_estimator is None or self.timer.timeout is None or not individuals:
+            return individuals
+        remaining_seconds = (self.timer.timeout - self.timer.spent_time).total_seconds()
+        workers_release_times = [0.] * self._cpu_budget.workers_num(len(individuals))
+        individuals_in_time = []
+        for ind in individuals:
+            evaluation_time = self.time_estimator.predict(ind.graph)
+            if evaluation_time is None:
+                return individuals
+            release_time = heapq.heappop(workers_release_times) + evaluation_time
+            if release_time <= remaining_seconds:
+                individuals_in_time.append(ind)
+                heapq.heappush(workers_release_times, release_time)
+            else:
+                # The worker is left free for the next individuals, which may be evaluated faster
+                heapq.heappush(workers_release_times, release_time - evaluation_time)
+        skipped_num = len(individuals) - len(individuals_in_time)
+        if skipped_num:
+            self.logger.info(f'{skipped_num} individuals are not evaluated since they are not expected '
+                             f'to be evaluated before the timeout')
+        return individuals_in_time
+
+    def _observe_evaluation_times(self, individuals: PopulationT, evaluated_uids: Set[str]):
+        if self.time_estimator is None:
+            return
+        for ind in individuals:
+            computation_time = ind.metadata.get('computation_time_in_seconds')
+            # The time of the evaluation on the subsample of data underestimates the one on the full data
+            is_fully_evaluated = 'subsample_stage' not in ind.metadata
+            if ind.uid in evaluated_uids and is_fully_evaluated and computation_time is not None:
+                self.time_estimator.observe(ind.graph, computation_time)
+
     def evaluate_single(self, ind: Individual, with_time_limit: bool = True,
-                        logs_initializer: Optional[Tuple[int, pathlib.Path]] = None) -> Optional[Individual]:
+                        logs_initializer: Optional[Tuple[int, LogQueue]] = None,
+                        cores: Optional[CoresShare] = None) -> Optional[Individual]:
         if ind.fitness.valid:
             return ind
         if with_time_limit and self.timer.is_time_limit_reached():
             return None
-        if logs_initializer is not None:
-            # in case of multiprocessing run
-            Log.setup_in_mp(*logs_initializer)
+        if logs_initializer is None:
+            return self._evaluate_single(ind, cores)
+        # in case of multiprocessing run
+        Log.setup_in_mp(*logs_initializer, individual_uid=ind.uid)
+        try:
+            return self._evaluate_single(ind, cores)
+        finally:
+            Log.flush_in_mp()
+
+    def _evaluate_single(self, ind: Individual, cores: Optional[CoresShare] = None) -> Optional[Individual]:
         start_time = timeit.default_timer()
 
         graph = self.evaluation_cache.get(ind.uid, ind.graph)
 
         adapted_evaluate = self._adapter.adapt_func(self._evaluate_graph)
-        ind_fitness, ind_domain_graph = adapted_evaluate(graph)
+        # The single graph evaluated out of the population gets all the cores
+        assigned_threads = cores.acquire() if cores is not None else CPUBudget.assign(self._cpu_budget.n_jobs)
+        with assigned_threads, MemoryUsageTracker() as memory:
+            ind_fitness, ind_domain_graph, profile, subsample_stage = adapted_evaluate(graph)
         ind.set_evaluation_result(ind_fitness, ind_domain_graph)
 
         end_time = timeit.default_timer()
 
         ind.metadata['computation_time_in_seconds'] = end_time - start_time
+        ind.metadata['peak_memory_in_mb'] = memory.peak_in_mb
+        if profile is not None:
+            ind.metadata['node_profile'] = profile.to_records()
+        if subsample_stage is not None:
+            ind.metadata['subsample_stage'] = subsample_stage
         ind.metadata['evaluation_time_iso'] = datetime.now().isoformat()
         return ind if ind.fitness.valid else None
 
-    def _evaluate_graph(self, domain_graph: Graph) -> Tuple[Fitness, Graph]:
+    def _evaluate_graph(self, domain_graph: Graph) -> Tuple[Fitness, Graph, Optional[PipelineProfile], Optional[int]]:
         fitness = self._objective_eval(domain_graph)
+        # The profile is taken before the cleanup, which can drop the state of the graph
+        profile = getattr(domain_graph, 'profile', None)
+        subsample_stage = getattr(domain_graph, 'subsample_stage', None)
 
         if self._post_eval_callback:
             self._post_eval_callback(domain_graph)
         if self._cleanup:
             self._cleanup(domain_graph)
-        gc.collect()
+        self._garbage_collector.collect_if_needed()
 
-        return fitness, domain_graph
+        return fitness, domain_graph, profile, subsample_stage
 
     def _reset_eval_cache(self):
         self.evaluation_cache: Dict[str, Graph] = {}
@@ -192,11 +351,3 @@ class SimpleDispatcher(ObjectiveEvaluationDispatcher):
     def _evaluate_graph(self, graph: Graph) -> Tuple[Fitness, Graph]:
         fitness = self._objective_eval(graph)
         return fitness, graph
-
-
-def determine_n_jobs(n_jobs=-1, logger=None):
-    if n_jobs > cpu_count() or n_jobs == -1:
-        n_jobs = cpu_count()
-    if logger:
-        logger.info(f"Number of used CPU's: {n_jobs}")
-    return n_jobs
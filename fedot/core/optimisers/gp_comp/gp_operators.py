@@ -3,6 +3,7 @@ from random import randint
 from typing import Any, List, Optional, Tuple
 
 from fedot.core.constants import MAXIMAL_ATTEMPTS_NUMBER
+from fedot.core.dag.graph_node import copy_nodes_structure
 from fedot.core.optimisers.gp_comp.pipeline_composer_requirements import PipelineComposerRequirements
 from fedot.core.optimisers.graph import OptGraph, OptNode
 from fedot.core.optimisers.opt_node_factory import OptNodeFactory
@@ -97,7 +98,7 @@ def equivalent_subtree(graph_first: Any, graph_second: Any) -> List[Tuple[Any, A
 
 def replace_subtrees(graph_first: Any, graph_second: Any, node_from_first: Any, node_from_second: Any,
                      layer_in_first: int, layer_in_second: int, max_depth: int):
-    node_from_graph_first_copy = deepcopy(node_from_first)
+    node_from_graph_first_copy = copy_nodes_structure([node_from_first])[0]
 
     summary_depth = layer_in_first + node_from_second.distance_to_primary_level
     if summary_depth <= max_depth and summary_depth != 0:
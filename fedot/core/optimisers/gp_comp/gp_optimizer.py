@@ -64,6 +64,8 @@ class EvoGraphOptimizer(PopulationalOptimizer):
         # Adding of initial assumptions to history as zero generation
         self._update_population(evaluator(self.initial_individuals))
 
+        # The evaluation time of the initial assumptions is known at this point
+        self.graph_optimizer_params.pop_size = self._affordable_pop_size(self.graph_optimizer_params.pop_size)
         if len(self.initial_individuals) < self.graph_optimizer_params.pop_size:
             self.initial_individuals = self._extend_population(self.initial_individuals)
             # Adding of extended population to history
@@ -108,7 +110,7 @@ class EvoGraphOptimizer(PopulationalOptimizer):
         if not self.generations.is_any_improved:
             self.graph_optimizer_params.mutation_prob, self.graph_optimizer_params.crossover_prob = \
                 self._operators_prob.next(self.population)
-        self.graph_optimizer_params.pop_size = self._pop_size.next(self.population)
+        self.graph_optimizer_params.pop_size = self._affordable_pop_size(self._pop_size.next(self.population))
         self.requirements.max_depth = self._graph_depth.next()
         self.log.info(
             f'Next population size: {self.graph_optimizer_params.pop_size}; '
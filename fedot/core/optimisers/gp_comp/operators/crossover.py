@@ -1,4 +1,3 @@
-from copy import deepcopy
 from random import choice, random
 from typing import Callable, Union, Iterable, Tuple, TYPE_CHECKING
 
@@ -51,8 +50,8 @@ class Crossover(Operator):
         if self._will_crossover_be_applied(ind_first.graph, ind_second.graph, crossover_type):
             crossover_func = self._get_crossover_function(crossover_type)
             for _ in range(self.parameters.max_num_of_operator_attempts):
-                first_object = deepcopy(ind_first.graph)
-                second_object = deepcopy(ind_second.graph)
+                first_object = ind_first.graph.copy_structure()
+                second_object = ind_second.graph.copy_structure()
                 new_graphs = crossover_func(first_object, second_object, max_depth=self.requirements.max_depth)
                 are_correct = all(self.graph_generation_params.verifier(new_graph) for new_graph in new_graphs)
                 if are_correct:
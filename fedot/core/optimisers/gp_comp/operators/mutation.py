@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import partial
 from random import choice, randint, random, sample
 from typing import Callable, List, Union, Tuple, TYPE_CHECKING
@@ -73,7 +72,7 @@ class Mutation(Operator):
         """ Function applies mutation operator to graph """
 
         for _ in range(self.parameters.max_num_of_operator_attempts):
-            new_graph = deepcopy(individual.graph)
+            new_graph = individual.graph.copy_structure()
             num_mut = max(int(round(np.random.lognormal(0, sigma=0.5))), 1)
 
             new_graph, mutation_names = self._adapt_and_apply_mutations(new_graph, num_mut)
@@ -157,7 +156,7 @@ class Mutation(Operator):
 
         :param graph: graph to mutate
         """
-        old_graph = deepcopy(graph)
+        old_graph = graph.copy_structure()
 
         for _ in range(self.parameters.max_num_of_operator_attempts):
             if len(graph.nodes) < 2 or graph.depth > self.requirements.max_depth:
@@ -1,3 +1,4 @@
+from copy import copy
 from typing import List, Union
 
 from fedot.core.dag.graph_delegate import GraphDelegate
@@ -17,3 +18,12 @@ class OptGraph(GraphDelegate):
     def __init__(self, nodes: Union[OptNode, List[OptNode]] = ()):
         super().__init__(nodes)
         self.log = default_log(self)
+
+    def copy_structure(self) -> 'OptGraph':
+        """Returns the cheap copy of the graph for the modification by evolutionary operators.
+        Nodes and links between them are copied, but the content of the nodes is shared with this graph,
+        so node parameters and metadata must be replaced instead of the inplace modification
+        """
+        graph_copy = copy(self)
+        graph_copy.operator = self.operator.copy_structure()
+        return graph_copy
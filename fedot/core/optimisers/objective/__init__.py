@@ -2,3 +2,7 @@ from .objective import Objective, GraphFunction, ObjectiveFunction
 from .objective_eval import ObjectiveEvaluate
 from .data_objective_eval import PipelineObjectiveEvaluate, DataSource
 from .data_source_splitter import DataSourceSplitter
+from .progressive_objective_eval import ProgressiveObjectiveEvaluate
+
+__all__ = ['Objective', 'GraphFunction', 'ObjectiveFunction', 'ObjectiveEvaluate', 'PipelineObjectiveEvaluate',
+           'DataSource', 'DataSourceSplitter', 'ProgressiveObjectiveEvaluate']
@@ -1,4 +1,5 @@
 import traceback
+from dataclasses import replace
 from datetime import timedelta
 from typing import Callable, Iterable, Optional, Tuple
 
@@ -11,6 +12,7 @@ from fedot.core.log import default_log
 from fedot.core.operations.model import Model
 from fedot.core.optimisers.fitness import Fitness
 from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.utilities.cpu_budget import CPUBudget
 from fedot.utilities.debug import is_test_session, is_recording_mode
 from fedot.utilities.debug import save_debug_info_for_pipeline
 from .objective import Objective, to_fitness
@@ -31,7 +33,10 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
     :param validation_blocks: Number of validation blocks, optional, used only for time series validation.
     :param pipelines_cache: Cache manager for fitted models, optional.
     :param preprocessing_cache: Cache manager for optional preprocessing encoders and imputers, optional.
-    :param eval_n_jobs: number of jobs used to evaluate the objective.
+    :param eval_n_jobs: number of jobs used to evaluate the objective,
+    ``None`` means the number of threads assigned to the evaluation by the :class:`CPUBudget`.
+    :param isolated_fit: fit pipelines in the separate processes that are killed when the time constraint expires.
+    :param profile_nodes: record the measurements of the nodes to the ``profile`` of the evaluated pipeline.
     """
 
     def __init__(self,
@@ -41,8 +46,10 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
                  validation_blocks: Optional[int] = None,
                  pipelines_cache: Optional[OperationsCache] = None,
                  preprocessing_cache: Optional[PreprocessingCache] = None,
-                 eval_n_jobs: int = 1,
-                 do_unfit: bool = True):
+                 eval_n_jobs: Optional[int] = 1,
+                 do_unfit: bool = True,
+                 isolated_fit: bool = False,
+                 profile_nodes: bool = False):
         super().__init__(objective, eval_n_jobs=eval_n_jobs)
         self._data_producer = data_producer
         self._time_constraint = time_constraint
@@ -51,11 +58,15 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
         self._preprocessing_cache = preprocessing_cache
         self._log = default_log(self)
         self._do_unfit = do_unfit
+        self._isolated_fit = isolated_fit
+        self._profile_nodes = profile_nodes
 
     def evaluate(self, graph: Pipeline) -> Fitness:
         # Seems like a workaround for situation when logger is lost
         #  when adapting and restoring it to/from OptGraph.
         graph.log = self._log
+        if self._profile_nodes:
+            graph.enable_profiling()
 
         graph_id = graph.root_node.descriptive_id
         self._log.debug(f'Pipeline {graph_id} fit started')
@@ -63,7 +74,7 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
         folds_metrics = []
         for fold_id, (train_data, test_data) in enumerate(self._data_producer()):
             try:
-                prepared_pipeline = self.prepare_graph(graph, train_data, fold_id, self._eval_n_jobs)
+                prepared_pipeline = self.prepare_graph(graph, train_data, fold_id, self._n_jobs)
             except Exception as ex:
                 self._log.warning(f'Continuing after pipeline fit error <{ex}> for graph: {graph_id}')
                 if is_test_session() and not isinstance(ex, TimeoutError):
@@ -84,7 +95,10 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
                 else:
                     continue
             if self._do_unfit:
-                graph.unfit()
+                # The models supporting the update are not fitted from scratch on the next fold continuing this one
+                graph.unfit(keep_state=True)
+        if self._do_unfit:
+            graph.unfit()
         if folds_metrics:
             folds_metrics = tuple(np.mean(folds_metrics, axis=0))  # averages for each metric over folds
             self._log.debug(f'Pipeline {graph_id} with evaluated metrics: {folds_metrics}')
@@ -92,6 +106,12 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
             folds_metrics = None
         return to_fitness(folds_metrics, self._objective.is_multi_objective)
 
+    @property
+    def _n_jobs(self) -> int:
+        if self._eval_n_jobs is None:
+            return CPUBudget.assigned_threads()
+        return self._eval_n_jobs
+
     def prepare_graph(self, graph: Pipeline, train_data: InputData,
                       fold_id: Optional[int] = None, n_jobs: int = -1) -> Pipeline:
         """
@@ -101,13 +121,14 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
         :param fold_id: id of the fold in cross-validation, used for cache requests.
         :param n_jobs: number of parallel jobs for preparation
         """
-        graph.unfit()
+        graph.unfit(keep_state=True)
         # load preprocessing
         graph.try_load_from_cache(self._pipelines_cache, self._preprocessing_cache, fold_id)
         graph.fit(
             train_data,
             n_jobs=n_jobs,
-            time_constraint=self._time_constraint
+            time_constraint=self._time_constraint,
+            isolated=self._isolated_fit
         )
 
         if self._pipelines_cache is not None:
@@ -134,10 +155,11 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
             intermediate_graph.fit(
                 train_data,
                 time_constraint=self._time_constraint,
-                n_jobs=self._eval_n_jobs,
+                n_jobs=self._n_jobs,
+                isolated=self._isolated_fit
             )
             intermediate_fitness = self._objective(intermediate_graph,
                                                    reference_data=test_data,
                                                    validation_blocks=self._validation_blocks)
             # saving only the most important first metric
-            node.metadata.metric = intermediate_fitness.values[0]
+            node.metadata = replace(node.metadata, metric=intermediate_fitness.values[0])
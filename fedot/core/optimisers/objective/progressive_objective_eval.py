@@ -0,0 +1,57 @@
+from math import ceil
+from typing import List, Sequence
+
+from fedot.core.log import default_log
+from fedot.core.optimisers.fitness import Fitness
+from fedot.core.pipelines.pipeline import Pipeline
+from .data_objective_eval import PipelineObjectiveEvaluate
+from .objective_eval import ObjectiveEvaluate
+
+
+class ProgressiveObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
+    """
+    Evaluator of Objective on the growing subsamples of data (successive halving of candidates).
+    The pipeline is scored on each subsample in turn and proceeds to the larger one only if its fitness
+    is among the best ``promotion_ratio`` share of the fitness values obtained on this subsample before.
+    Only the promoted pipelines are evaluated on the full data, the others keep the fitness obtained
+    on the last subsample and are marked by the index of this subsample in ``subsample_stage`` of the pipeline,
+    so they are distinguishable from the failed evaluations and are not kept among the best individuals.
+    The scores on the subsamples are kept by the evaluator, so it works only with the sequential evaluation.
+
+    :param evaluators: evaluators for the subsamples of the growing size, the last one uses the full data.
+    :param promotion_ratio: share of the best pipelines promoted to the next subsample.
+    """
+
+    def __init__(self, evaluators: Sequence[PipelineObjectiveEvaluate], promotion_ratio: float = 0.5):
+        if not evaluators:
+            raise ValueError('At least one evaluator is required')
+        if not 0. < promotion_ratio <= 1.:
+            raise ValueError('Promotion ratio must belong to the interval (0; 1]')
+        full_evaluator = evaluators[-1]
+        super().__init__(full_evaluator._objective, eval_n_jobs=full_evaluator._eval_n_jobs)
+        self._evaluators = evaluators
+        self._promotion_ratio = promotion_ratio
+        self._subsample_fitness: List[List[Fitness]] = [[] for _ in evaluators[:-1]]
+        self._log = default_log(self)
+
+    def evaluate(self, graph: Pipeline) -> Fitness:
+        graph.subsample_stage = None
+        for stage, evaluator in enumerate(self._evaluators[:-1]):
+            fitness = evaluator.evaluate(graph)
+            if not fitness.valid:
+                return fitness
+            if not self._is_promoted(fitness, stage):
+                self._log.debug(f'Pipeline {graph.root_node.descriptive_id} is not promoted '
+                                f'after the subsample {stage} with fitness {fitness}')
+                graph.subsample_stage = stage
+                return fitness
+        return self._evaluators[-1].evaluate(graph)
+
+    def evaluate_intermediate_metrics(self, graph: Pipeline):
+        self._evaluators[-1].evaluate_intermediate_metrics(graph)
+
+    def _is_promoted(self, fitness: Fitness, stage: int) -> bool:
+        stage_fitness = self._subsample_fitness[stage]
+        stage_fitness.append(fitness)
+        better_num = sum(other.dominates(fitness) for other in stage_fitness)
+        return better_num < ceil(self._promotion_ratio * len(stage_fitness))
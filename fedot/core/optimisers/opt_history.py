@@ -7,6 +7,8 @@ import shutil
 from pathlib import Path
 from typing import List, Optional, Sequence, Union
 
+import pandas as pd
+
 from fedot.core.log import default_log
 from fedot.core.optimisers.adapters import PipelineAdapter
 from fedot.core.optimisers.archive import GenerationKeeper
@@ -16,11 +18,11 @@ from fedot.core.optimisers.gp_comp.individual import Individual, ParentOperator
 from fedot.core.optimisers.gp_comp.operators.operator import PopulationT
 from fedot.core.optimisers.objective import Objective
 from fedot.core.optimisers.utils.population_utils import get_metric_position
+from fedot.core.pipelines.profiling import PROFILE_COLUMNS, summarize_profile
 from fedot.core.pipelines.template import PipelineTemplate
 from fedot.core.repository.quality_metrics_repository import QualityMetricsEnum
 from fedot.core.serializers import Serializer
 from fedot.core.utils import default_fedot_data_dir
-from fedot.core.visualisation.opt_viz import OptHistoryVisualizer
 
 
 class OptHistory:
@@ -162,8 +164,35 @@ class OptHistory:
             for ind in list(itertools.chain(*self.individuals))
         ]
 
+    def node_profile_table(self) -> pd.DataFrame:
+        """
+        Returns the measurements of the nodes recorded during the evaluation of the individuals
+        (see ``profile_nodes`` option of the composer requirements), one row per call of the node.
+        The individuals kept in several generations are counted once, in the generation of their first appearance
+        """
+        rows = []
+        seen_uids = set()
+        for gen_num, gen in enumerate(self.individuals):
+            for ind in gen:
+                if ind.uid in seen_uids:
+                    continue
+                seen_uids.add(ind.uid)
+                rows.extend({'generation': gen_num, 'individual_uid': ind.uid, **record}
+                            for record in ind.metadata.get('node_profile', []))
+        return pd.DataFrame(rows, columns=['generation', 'individual_uid', *PROFILE_COLUMNS])
+
+    def operations_profile(self) -> pd.DataFrame:
+        """
+        Returns the measurements of the nodes aggregated by the operations over the whole optimisation,
+        the operations dominating the evaluation time go first
+        """
+        return summarize_profile(self.node_profile_table())
+
     @property
     def show(self):
+        # Visualisation backends are heavy, so they are imported only when visualisation is requested
+        from fedot.core.visualisation.opt_viz import OptHistoryVisualizer
+
         return OptHistoryVisualizer(self)
 
     def get_leaderboard(self, top_n: int = 10) -> str:
@@ -13,6 +13,7 @@ from fedot.core.optimisers.gp_comp.operators.operator import PopulationT
 from fedot.core.optimisers.graph import OptGraph
 from fedot.core.optimisers.objective import GraphFunction, Objective, ObjectiveFunction
 from fedot.core.optimisers.opt_node_factory import DefaultOptNodeFactory, OptNodeFactory
+from fedot.core.optimisers.time_estimator import EvaluationTimeEstimator
 
 OptimisationCallback = Callable[[PopulationT, GenerationKeeper], Any]
 
@@ -116,3 +117,8 @@ class GraphOptimizer:
         """Set or reset (with None) post-evaluation callback
         that's called on each graph after its evaluation."""
         pass
+
+    def set_time_estimator(self, estimator: EvaluationTimeEstimator):
+        """Set the estimator of the evaluation time to be trained and used by the optimizer
+        (e.g. the one which has already observed the initial assumptions)"""
+        pass
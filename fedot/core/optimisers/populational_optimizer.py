@@ -1,9 +1,12 @@
+import datetime
+import math
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 from tqdm import tqdm
 
 from fedot.core.dag.graph import Graph
+from fedot.core.dag.structural_distance import structural_diversity
 from fedot.core.optimisers.archive import GenerationKeeper
 from fedot.core.optimisers.gp_comp.evaluation import MultiprocessingDispatcher
 from fedot.core.optimisers.gp_comp.operators.operator import PopulationT
@@ -12,8 +15,10 @@ from fedot.core.optimisers.graph import OptGraph
 from fedot.core.optimisers.objective import GraphFunction, ObjectiveFunction
 from fedot.core.optimisers.objective.objective import Objective
 from fedot.core.optimisers.optimizer import GraphGenerationParams, GraphOptimizer, GraphOptimizerParameters
+from fedot.core.optimisers.time_estimator import EvaluationTimeEstimator
 from fedot.core.optimisers.timer import OptimisationTimer
 from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.utilities.cpu_budget import determine_n_jobs
 from fedot.core.utilities.grouped_condition import GroupedCondition
 
 if TYPE_CHECKING:
@@ -28,6 +33,8 @@ class PopulationalOptimizer(GraphOptimizer):
     It allows to find the optimal solution using specified metric (one or several).
     To implement the specific evolution strategy,
     the abstract method '_evolution_process' should be re-defined in the ancestor class
+    The evaluation time of the candidates is learned during the run by the ``time_estimator``,
+    so the optimisation stops when the next generation is not expected to be evaluated before the timeout
 
     :param objective: objective for optimization
     :param initial_graphs: graphs which were initialized outside the optimizer
@@ -46,16 +53,19 @@ class PopulationalOptimizer(GraphOptimizer):
         self.population = None
         self.generations = GenerationKeeper(self.objective, keep_n_best=requirements.keep_n_best)
         self.timer = OptimisationTimer(timeout=self.requirements.timeout)
+        self.time_estimator = EvaluationTimeEstimator()
         self.eval_dispatcher = MultiprocessingDispatcher(adapter=graph_generation_params.adapter,
                                                          timer=self.timer,
                                                          n_jobs=requirements.n_jobs,
-                                                         graph_cleanup_fn=_unfit_pipeline)
+                                                         graph_cleanup_fn=_unfit_pipeline,
+                                                         time_estimator=self.time_estimator)
 
         # early_stopping_generations may be None, so use some obvious max number
         max_stagnation_length = requirements.early_stopping_generations or requirements.num_of_generations
         self.stop_optimization = \
             GroupedCondition().add_condition(
-                lambda: self.timer.is_time_limit_reached(self.current_generation_num),
+                lambda: self.timer.is_time_limit_reached(self.current_generation_num,
+                                                         self._predict_generation_time()),
                 'Optimisation stopped: Time limit is reached'
             ).add_condition(
                 lambda: self.current_generation_num >= requirements.num_of_generations + 1,
@@ -73,12 +83,17 @@ class PopulationalOptimizer(GraphOptimizer):
         # Redirect callback to evaluation dispatcher
         self.eval_dispatcher.set_evaluation_callback(callback)
 
+    def set_time_estimator(self, estimator: EvaluationTimeEstimator):
+        # The estimator is trained by the evaluation dispatcher
+        self.time_estimator = estimator
+        self.eval_dispatcher.time_estimator = estimator
+
     def optimise(self, objective: ObjectiveFunction) -> Sequence[OptGraph]:
 
         # eval_dispatcher defines how to evaluate objective on the whole population
         evaluator = self.eval_dispatcher.dispatch(objective)
 
-        with self.timer, self._progressbar:
+        with self.timer, self._progressbar, self.eval_dispatcher:
 
             self._initial_population(evaluator=evaluator)
 
@@ -87,10 +102,11 @@ class PopulationalOptimizer(GraphOptimizer):
                     new_population = self._evolve_population(evaluator=evaluator)
                 except EvaluationAttemptsError as ex:
                     self.log.warning(f'Composition process was stopped due to: {ex}')
-                    return self.best_graphs
+                    break
                 # Adding of new population to history
                 self._update_population(new_population)
 
+        self.log.info(f'Evaluation history: {self.eval_dispatcher.fitness_index}')
         return self.best_graphs
 
     @property
@@ -117,8 +133,36 @@ class PopulationalOptimizer(GraphOptimizer):
         self.log.info(f'Generation num: {self.current_generation_num}')
         self.log.info(f'Best individuals: {str(self.generations)}')
         self.log.info(f'no improvements for {self.generations.stagnation_duration} iterations')
+        self.log.info(f'structural diversity: {structural_diversity([ind.graph for ind in next_population]):.3f}')
         self.log.info(f'spent time: {round(self.timer.minutes_from_start, 1)} min')
 
+    def _predict_evaluation_time(self) -> Optional[float]:
+        """Predicts the mean evaluation time of the next candidates in seconds
+        by the graphs of the current population, ``None`` if it is unknown yet"""
+        if not self.population:
+            return None
+        return self.time_estimator.predict_mean([ind.graph for ind in self.population])
+
+    def _predict_generation_time(self) -> Optional[datetime.timedelta]:
+        """Predicts the time of the evaluation of the next generation, ``None`` if it is unknown yet"""
+        evaluation_time = self._predict_evaluation_time()
+        if evaluation_time is None:
+            return None
+        n_jobs = determine_n_jobs(self.requirements.n_jobs)
+        waves_num = math.ceil(self.graph_optimizer_params.pop_size / n_jobs)
+        return datetime.timedelta(seconds=waves_num * evaluation_time)
+
+    def _affordable_pop_size(self, pop_size: int) -> int:
+        """Reduces the population size so that the next generation is evaluated before the timeout.
+        The population is not reduced below the number of the evaluating processes"""
+        evaluation_time = self._predict_evaluation_time()
+        if self.timer.timeout is None or evaluation_time is None:
+            return pop_size
+        n_jobs = determine_n_jobs(self.requirements.n_jobs)
+        remaining_seconds = (self.timer.timeout - self.timer.spent_time).total_seconds()
+        affordable_size = int(remaining_seconds // evaluation_time) * n_jobs
+        return min(pop_size, max(affordable_size, n_jobs))
+
     def _update_native_generation_numbers(self, population: PopulationT):
         for individual in population:
             individual.set_native_generation(self.current_generation_num)
@@ -0,0 +1,110 @@
+import math
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fedot.core.dag.graph import Graph
+
+# The times are learned in the logarithmic scale, so the instant evaluations are clipped to keep them finite
+MIN_EVALUATION_SECONDS = 1e-3
+# Intercept, number of nodes, depth of the graph, logarithms of the numbers of rows and features
+_COMMON_FEATURES_NUM = 5
+
+
+class EvaluationTimeEstimator:
+    """Predicts the evaluation time of the candidate graphs from the number of their nodes, their depth,
+    the operations in their nodes and the shape of the data. The estimator is trained online on the measured times
+    of the evaluated graphs: the logarithm of the time is fitted by the ridge regression, in which each operation
+    adds its own cost, so the graphs with the operations seen in the other graphs are predicted as well.
+    The graphs with the operations not observed yet are expected to be at least as long as the longest observed one.
+
+    :param data_shape: shape of the data the graphs are evaluated on, used when the shape is not passed explicitly
+    :param regularization: ridge penalty of the coefficients (except the intercept)
+    :param max_observations: number of the latest observations kept for the training
+    """
+
+    def __init__(self, data_shape: Sequence[int] = (), regularization: float = 1.0,
+                 max_observations: int = 1000):
+        self.data_shape = tuple(data_shape)
+        self.regularization = regularization
+        self._observations: Deque[Tuple[Counter, Tuple[float, ...], float]] = deque(maxlen=max_observations)
+        self._operations: Dict[str, int] = {}
+        self._coefficients: Optional[np.ndarray] = None
+        self._residual_variance = 0.
+        self._max_log_time = -math.inf
+
+    @property
+    def observations_num(self) -> int:
+        return len(self._observations)
+
+    def observe(self, graph: Graph, seconds: float, data_shape: Optional[Sequence[int]] = None):
+        """Adds the measured evaluation time of the graph to the training data
+
+        :param graph: evaluated graph (optimisation or domain one)
+        :param seconds: time of the evaluation
+        :param data_shape: shape of the data the graph was evaluated on, :attr:`data_shape` by default
+        """
+        operations, common_features = self._graph_features(graph, data_shape)
+        for operation in operations:
+            self._operations.setdefault(operation, len(self._operations))
+        self._observations.append((operations, common_features, math.log(max(seconds, MIN_EVALUATION_SECONDS))))
+        self._coefficients = None
+
+    def predict(self, graph: Graph, data_shape: Optional[Sequence[int]] = None) -> Optional[float]:
+        """Predicts the evaluation time of the graph in seconds
+
+        :param graph: graph to evaluate (optimisation or domain one)
+        :param data_shape: shape of the data the graph is evaluated on, :attr:`data_shape` by default
+
+        :return: expected time of the evaluation or ``None`` if nothing is observed yet
+        """
+        if not self._observations:
+            return None
+        if self._coefficients is None:
+            self._fit()
+        operations, common_features = self._graph_features(graph, data_shape)
+        log_time = self._features(operations, common_features) @ self._coefficients
+        if any(operation not in self._operations for operation in operations):
+            log_time = max(log_time, self._max_log_time)
+        # Mean of the log-normal distribution, since the median underestimates the total time of many graphs
+        return math.exp(log_time + self._residual_variance / 2)
+
+    def predict_mean(self, graphs: Sequence[Graph], data_shape: Optional[Sequence[int]] = None) -> Optional[float]:
+        """Predicts the mean evaluation time of the graphs in seconds, ``None`` if nothing is observed yet"""
+        predictions = [self.predict(graph, data_shape) for graph in graphs]
+        if not predictions or predictions[0] is None:
+            return None
+        return float(np.mean(predictions))
+
+    def _fit(self):
+        features = np.array([self._features(operations, common_features)
+                             for operations, common_features, _ in self._observations])
+        log_times = np.array([log_time for *_, log_time in self._observations])
+        penalty = np.full(features.shape[1], self.regularization)
+        penalty[0] = 0.
+        self._coefficients = np.linalg.solve(features.T @ features + np.diag(penalty), features.T @ log_times)
+        residuals = log_times - features @ self._coefficients
+        self._residual_variance = float(np.mean(residuals ** 2))
+        self._max_log_time = float(np.max(log_times))
+
+    def _features(self, operations: Counter, common_features: Tuple[float, ...]) -> np.ndarray:
+        features = np.zeros(_COMMON_FEATURES_NUM + len(self._operations))
+        features[:_COMMON_FEATURES_NUM] = common_features
+        for operation, count in operations.items():
+            if operation in self._operations:
+                features[_COMMON_FEATURES_NUM + self._operations[operation]] = count
+        return features
+
+    def _graph_features(self, graph: Graph,
+                        data_shape: Optional[Sequence[int]]) -> Tuple[Counter, Tuple[float, ...]]:
+        operations = Counter(str(node.content['name']) for node in graph.nodes)
+        rows, features = _rows_and_features(data_shape if data_shape is not None else self.data_shape)
+        return operations, (1., len(graph.nodes), graph.depth, math.log1p(rows), math.log1p(features))
+
+
+def _rows_and_features(data_shape: Sequence[int]) -> List[int]:
+    """Number of rows and the product of the other dimensions of the data, zeros if the shape is unknown"""
+    if not data_shape:
+        return [0, 0]
+    return [data_shape[0], int(np.prod(data_shape[1:]))]
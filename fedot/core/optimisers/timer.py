@@ -1,5 +1,6 @@
 import datetime
 from abc import ABC
+from typing import Optional
 
 from fedot.core.log import default_log
 
@@ -46,9 +47,12 @@ class OptimisationTimer(Timer):
         super().__init__(timeout=timeout)
         self.init_time = 0
 
-    def _is_next_iteration_possible(self, time_constraint: float, iteration_num: int = None) -> bool:
+    def _is_next_iteration_possible(self, time_constraint: float, iteration_num: int = None,
+                                    iteration_time: Optional[datetime.timedelta] = None) -> bool:
         minutes = self.minutes_from_start
-        if iteration_num is not None:
+        if iteration_time is not None:
+            possible = time_constraint > (minutes + iteration_time.total_seconds() / 60.)
+        elif iteration_num is not None:
             evo_proc_minutes = minutes - self.init_time
             possible = time_constraint > (minutes + (evo_proc_minutes / (iteration_num + 1)))
         else:
@@ -57,12 +61,19 @@ class OptimisationTimer(Timer):
             self.process_terminated = True
         return possible
 
-    def is_time_limit_reached(self, iteration_num: int = None) -> bool:
+    def is_time_limit_reached(self, iteration_num: int = None,
+                              iteration_time: Optional[datetime.timedelta] = None) -> bool:
+        """Checks whether the next iteration can be finished before the timeout
+
+        :param iteration_num: number of the finished iterations, the next one is expected to last as the mean of them
+        :param iteration_time: expected time of the next iteration, used instead of the mean one if known
+        """
         if self.timeout:
             timeout = 0 if self.timeout.total_seconds() < 0 else self.timeout.total_seconds() / 60.
             if timeout:
                 reached = not self._is_next_iteration_possible(iteration_num=iteration_num,
-                                                               time_constraint=timeout)
+                                                               time_constraint=timeout,
+                                                               iteration_time=iteration_time)
             else:
                 self.process_terminated = True
                 reached = True
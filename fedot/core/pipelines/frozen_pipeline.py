@@ -0,0 +1,208 @@
+from copy import copy, deepcopy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.data.merge.data_merger import DataMerger
+from fedot.core.data.multi_modal import MultiModalData
+from fedot.core.operations.operation import Operation
+from fedot.core.operations.operation_parameters import OperationParameters
+from fedot.core.utilities.mmap_archive import load_archive, save_archive
+from fedot.preprocessing.preprocessing import DataPreprocessor, update_indices_for_time_series
+from fedot.preprocessing.structure import DEFAULT_SOURCE_NAME, PipelineStructureExplorer
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.node import Node
+    from fedot.core.pipelines.pipeline import Pipeline
+
+# Attributes which are stored in the pipeline at fit stage for time series with non-int indices
+TS_INDEX_ATTRIBUTES = ('last_idx_int', 'last_idx_dt', 'period')
+# Name of the frozen pipeline in the archive
+_ARCHIVE_OBJECT_NAME = 'frozen_pipeline'
+
+
+@dataclass(frozen=True)
+class FrozenStep:
+    """Fitted operation of the pipeline node prepared for the inference
+
+    Args:
+        operation_type: type of the operation in the node
+        operation: operation of the node
+        fitted_operation: trained implementation of the operation
+        params: hyperparameters of the operation
+        parents: positions of the parent steps in the execution plan (in the order of data merging)
+    """
+
+    operation_type: str
+    operation: Operation
+    fitted_operation: Any
+    params: Optional[OperationParameters]
+    parents: Tuple[int, ...]
+
+    @property
+    def is_primary(self) -> bool:
+        return not self.parents
+
+
+class FrozenPipeline:
+    """Inference-only representation of the fitted :class:`Pipeline`.
+
+    The pipeline structure is flattened into the topologically ordered list of fitted operations,
+    so the prediction does not traverse the graph, sort the parent nodes and
+    analyse the pipeline structure for the optional preprocessing on each call.
+    The nodes shared by several children are evaluated once per prediction.
+    The frozen pipeline is persisted on its own by :meth:`save` and :meth:`load`.
+
+    Args:
+        pipeline: fitted pipeline to freeze
+    """
+
+    def __init__(self, pipeline: 'Pipeline'):
+        if not pipeline.is_fitted:
+            raise ValueError('Pipeline is not fitted yet')
+
+        self.steps = _build_plan(pipeline.root_node)
+        self.preprocessor: DataPreprocessor = deepcopy(pipeline.preprocessor)
+
+        for attribute in TS_INDEX_ATTRIBUTES:
+            if hasattr(pipeline, attribute):
+                setattr(self, attribute, getattr(pipeline, attribute))
+
+        # Result of the structure analysis which defines the optional preprocessing for data sources
+        source_names = {DEFAULT_SOURCE_NAME, *(step.operation_type for step in self.steps if step.is_primary)}
+        self._structure_tags: Dict[Tuple[str, str], bool] = {
+            (source_name, tag): PipelineStructureExplorer.check_structure_by_tag(pipeline, tag_to_check=tag,
+                                                                                 source_name=source_name)
+            for source_name in source_names
+            for tag in ('imputation', 'encoding')
+        }
+
+    @property
+    def root_step(self) -> FrozenStep:
+        return self.steps[-1]
+
+    def predict(self, input_data: Union[InputData, MultiModalData], output_mode: str = 'default') -> OutputData:
+        """Runs the fitted operations of the pipeline in topological order
+
+        Args:
+            input_data: data for prediction
+            output_mode: desired form of output for operations (the same as for :meth:`Pipeline.predict`)
+
+        Returns:
+            OutputData: values predicted on the provided ``input_data``
+        """
+
+        data = _copy_for_predict(input_data)
+        data = self.preprocessor.obligatory_prepare_for_predict(data)
+        if isinstance(data, InputData):
+            self._prepare_optional(data, DEFAULT_SOURCE_NAME)
+        else:
+            for source_name, source_data in data.items():
+                self._prepare_optional(source_data, source_name)
+        data = self.preprocessor.convert_indexes_for_predict(pipeline=self, data=data)
+        data = update_indices_for_time_series(data)
+
+        outputs: List[OutputData] = []
+        for step in self.steps:
+            step_output_mode = output_mode if step is self.root_step else 'default'
+            step_input = self._step_input(step, data, outputs)
+            outputs.append(step.operation.predict(fitted_operation=step.fitted_operation, data=step_input,
+                                                  params=step.params, output_mode=step_output_mode))
+
+        result = self.preprocessor.restore_index(data, outputs[-1])
+        if output_mode == 'labels':
+            result.predict = self.preprocessor.apply_inverse_target_encoding(result.predict)
+        return result
+
+    def save(self, path: str) -> str:
+        """Saves the frozen pipeline to the single archive file, the large arrays of the fitted operations
+        are stored to be memory-mapped by :meth:`load`
+
+        Args:
+            path: path to the archive file
+
+        Returns:
+            str: absolute path to the archive
+        """
+
+        manifest = {_ARCHIVE_OBJECT_NAME: {'operations': [step.operation_type for step in self.steps]}}
+        return save_archive(path, manifest, {_ARCHIVE_OBJECT_NAME: self})
+
+    @staticmethod
+    def load(path: str, mmap_mode: Optional[str] = 'c') -> 'FrozenPipeline':
+        """Loads the frozen pipeline from the archive created by :meth:`save`
+
+        Args:
+            path: path to the archive file
+            mmap_mode: mode of the memory mapping of the large arrays (the same as for :meth:`Pipeline.load_archive`)
+
+        Returns:
+            FrozenPipeline: loaded frozen pipeline
+        """
+
+        _, objects = load_archive(path, mmap_mode)
+        if _ARCHIVE_OBJECT_NAME not in objects:
+            raise ValueError(f'Archive {path} does not contain the frozen pipeline')
+        return objects[_ARCHIVE_OBJECT_NAME]
+
+    def _step_input(self, step: FrozenStep, data: Union[InputData, MultiModalData],
+                    outputs: Sequence[OutputData]) -> InputData:
+        if step.is_primary:
+            if isinstance(data, MultiModalData):
+                if step.operation_type not in data:
+                    raise ValueError(f'No data for primary node {step.operation_type}')
+                return data[step.operation_type]
+            return data
+
+        step_input = DataMerger.get([outputs[parent] for parent in step.parents]).merge()
+        step_input.supplementary_data.previous_operations = [self.steps[parent].operation_type
+                                                             for parent in step.parents]
+        return step_input
+
+    def _prepare_optional(self, data: InputData, source_name: str):
+        """ Applies fitted imputer and encoder of the preprocessor if pipeline does not contain them """
+        self.preprocessor.apply_optional_preprocessing(data, source_name,
+                                                       has_imputer=self._structure_tags[(source_name, 'imputation')],
+                                                       has_encoder=self._structure_tags[(source_name, 'encoding')])
+
+
+def _build_plan(root_node: 'Node') -> List[FrozenStep]:
+    """Flattens the pipeline graph into the list of steps where each step follows its parents.
+    Parents are visited in the same order as during recursive prediction of the :class:`Pipeline`
+    """
+
+    steps: List[FrozenStep] = []
+    positions: Dict[int, int] = {}
+
+    def visit(node: 'Node') -> int:
+        if id(node) not in positions:
+            parent_nodes = sorted(node.nodes_from, key=lambda parent: parent.descriptive_id) if node.nodes_from else []
+            parents = tuple(visit(parent) for parent in parent_nodes)
+            steps.append(FrozenStep(operation_type=node.operation.operation_type,
+                                    operation=node.operation,
+                                    fitted_operation=node.fitted_operation,
+                                    params=node._parameters,
+                                    parents=parents))
+            positions[id(node)] = len(steps) - 1
+        return positions[id(node)]
+
+    visit(root_node)
+    return steps
+
+
+def _copy_for_predict(input_data: Union[InputData, MultiModalData]) -> Union[InputData, MultiModalData]:
+    """ Copies the data containers to avoid inplace modifications of the source data.
+    Unlike the deepcopy, arrays are copied without per-element traversal """
+    if isinstance(input_data, MultiModalData):
+        return MultiModalData({source_name: _copy_for_predict(source_data)
+                               for source_name, source_data in input_data.items()})
+
+    copied_data = copy(input_data)
+    copied_data.idx = np.array(input_data.idx)
+    copied_data.features = np.array(input_data.features)
+    if input_data.target is not None:
+        copied_data.target = np.array(input_data.target)
+    copied_data.supplementary_data = deepcopy(input_data.supplementary_data)
+    return copied_data
@@ -0,0 +1,73 @@
+import warnings
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+# Maximal drift of the inputs at which the node not supporting the partial fit keeps its fitted operation
+DEFAULT_DRIFT_THRESHOLD = 0.25
+# Lower bound of the standard deviation, so the drift of the constant columns stays finite
+_MIN_STD = 1e-8
+
+
+@dataclass(frozen=True)
+class InputStatistics:
+    """Column-wise statistics of the numeric features the operation of the node is fitted on.
+    They are compared with the statistics of the new data to decide whether the operation has to be refitted
+
+    Args:
+        rows_num: number of the rows the statistics are computed on
+        mean: means of the columns
+        std: standard deviations of the columns
+    """
+
+    rows_num: int
+    mean: np.ndarray
+    std: np.ndarray
+
+    @staticmethod
+    def of(features: Any) -> Optional['InputStatistics']:
+        """Computes the statistics of the features table (or of the series)
+
+        Args:
+            features: features passed to the operation
+
+        Returns:
+            Optional[InputStatistics]: statistics or ``None`` if the features are not numeric table or series
+        """
+        if not isinstance(features, np.ndarray) or features.ndim not in (1, 2) or len(features) == 0:
+            return None
+        if not (np.issubdtype(features.dtype, np.number) or features.dtype == bool):
+            return None
+        table = features.reshape((len(features), -1)).astype(float, copy=False)
+        with warnings.catch_warnings():
+            # Columns full of nans get nan statistics, which are ignored by the drift
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            return InputStatistics(len(table), np.nanmean(table, axis=0), np.nanstd(table, axis=0))
+
+    def drift(self, other: 'InputStatistics') -> float:
+        """Measures the drift of the ``other`` statistics from these ones: the maximum over the columns
+        of the mean shift in the standard deviations and of the absolute logarithm of the standard deviations ratio
+
+        Args:
+            other: statistics of the new data
+
+        Returns:
+            float: drift, ``inf`` if the number of the columns is changed
+        """
+        if self.mean.shape != other.mean.shape:
+            return np.inf
+        std = np.maximum(self.std, _MIN_STD)
+        mean_shift = np.abs(other.mean - self.mean) / std
+        std_ratio = np.abs(np.log(np.maximum(other.std, _MIN_STD) / std))
+        drifts = np.concatenate([mean_shift, std_ratio])
+        drifts = drifts[~np.isnan(drifts)]
+        return float(np.max(drifts)) if drifts.size else 0.
+
+    def merged(self, other: 'InputStatistics') -> 'InputStatistics':
+        """Combines the statistics of two parts of the data into the statistics of the whole data"""
+        rows_num = self.rows_num + other.rows_num
+        mean = (self.rows_num * self.mean + other.rows_num * other.mean) / rows_num
+        variance = (self.rows_num * (self.std ** 2 + (self.mean - mean) ** 2) +
+                    other.rows_num * (other.std ** 2 + (other.mean - mean) ** 2)) / rows_num
+        return InputStatistics(rows_num, mean, np.sqrt(variance))
@@ -11,6 +11,8 @@ from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.operations.factory import OperationFactory
 from fedot.core.operations.operation import Operation
 from fedot.core.optimisers.timer import Timer
+from fedot.core.pipelines.input_statistics import DEFAULT_DRIFT_THRESHOLD, InputStatistics
+from fedot.core.pipelines.profiling import NodeProfiler
 from fedot.core.repository.operation_types_repository import OperationTypesRepository
 from fedot.core.utils import DEFAULT_PARAMS_STUB
 
@@ -63,6 +65,13 @@ class Node(GraphNode):
                                   'params': self._parameters.to_dict()}, nodes_from=nodes_from)
         self.log = default_log(self)
         self._fitted_operation = None
+        self._operation_to_update = None
+        # Statistics of the features the operation is fitted on, used to detect the drift at the update
+        self.input_statistics: Optional[InputStatistics] = None
+        # Whether the operation has to be refitted since the last update because of the drift of its inputs
+        self.is_drifted = False
+        # Whether the operation is already updated by the current update of the pipeline
+        self.is_updated = False
         self.rating = None
 
     def _process_content_init(self, passed_content: dict) -> Operation:
@@ -153,14 +162,25 @@ class Node(GraphNode):
         else:
             self._fitted_operation = value
 
-    def unfit(self):
+    def unfit(self, keep_state: bool = False):
         """Sets :obj:`fitted_operation` to ``None``
 
+        Args:
+            keep_state: keep the fitted operation supporting the update (e.g. statistical time series model)
+                to update it by the next fit instead of fitting from scratch
+
         Todo:
             check how it would be rendered
         """
 
+        if not keep_state:
+            self._operation_to_update = None
+        elif self.fitted_operation is not None:
+            is_updatable = getattr(self.fitted_operation, 'supports_update', False)
+            self._operation_to_update = self.fitted_operation if is_updatable else None
         self.fitted_operation = None
+        self.input_statistics = None
+        self.is_drifted = False
 
     def fit(self, input_data: InputData) -> OutputData:
         """Runs training process in the node
@@ -172,15 +192,27 @@ class Node(GraphNode):
             OutputData: values predicted on the provided ``input_data``
         """
 
-        if self.fitted_operation is None:
-            with Timer() as t:
-                self.fitted_operation, operation_predict = self.operation.fit(params=self._parameters,
-                                                                              data=input_data)
-                self.fit_time_in_seconds = round(t.seconds_from_start, 3)
-        else:
-            operation_predict = self.operation.predict_for_fit(fitted_operation=self.fitted_operation,
-                                                               data=input_data,
-                                                               params=self._parameters)
+        is_fitted = self.fitted_operation is not None
+        with NodeProfiler(self, 'fit', input_data, cache_hit=is_fitted) as profiler:
+            if not is_fitted:
+                operation_to_update = getattr(self, '_operation_to_update', None)
+                with Timer() as t:
+                    if operation_to_update is None:
+                        self.fitted_operation, operation_predict = self.operation.fit(params=self._parameters,
+                                                                                      data=input_data)
+                    else:
+                        self.fitted_operation, operation_predict = self.operation.update(operation_to_update,
+                                                                                         params=self._parameters,
+                                                                                         data=input_data)
+                    self.fit_time_in_seconds = round(t.seconds_from_start, 3)
+                self._operation_to_update = None
+                self.input_statistics = InputStatistics.of(input_data.features)
+                self.is_drifted = False
+            else:
+                operation_predict = self.operation.predict_for_fit(fitted_operation=self.fitted_operation,
+                                                                   data=input_data,
+                                                                   params=self._parameters)
+            profiler.output = operation_predict
 
         # Update parameters after operation fitting (they can be corrected)
         not_atomized_operation = 'atomized' not in self.operation.operation_type
@@ -189,6 +221,59 @@ class Node(GraphNode):
             self.update_params()
         return operation_predict
 
+    def update(self, input_data: InputData, drift_threshold: float = DEFAULT_DRIFT_THRESHOLD) -> OutputData:
+        """Updates the fitted operation with the data appended to the data it is fitted on.
+        The operation supporting the partial fit (e.g. scaler, SGD or boosting model) is trained in place.
+        The operation is marked as :attr:`is_drifted` and kept as is if it can not be trained on the new data
+        (e.g. the new classes appeared), if it does not support the partial fit and its inputs drifted
+        by more than ``drift_threshold`` (see :meth:`InputStatistics.drift`) or if any of its parents is drifted.
+        The drifted operations are refitted by :meth:`Pipeline.update` on the history with the new data.
+        Not fitted operation is fitted
+
+        Args:
+            input_data: new data used for operation training
+            drift_threshold: maximal drift of the inputs at which the operation is not marked as drifted
+
+        Returns:
+            OutputData: values predicted on the provided ``input_data``
+        """
+
+        if self.fitted_operation is None:
+            # The parent nodes are already updated, so only the operation of this node is fitted
+            return Node.fit(self, input_data)
+        if getattr(self, 'is_updated', False):
+            # The node shared by several children is updated by the first of them
+            return self.operation.predict_for_fit(fitted_operation=self.fitted_operation, data=input_data,
+                                                  params=self._parameters)
+
+        reference_statistics = getattr(self, 'input_statistics', None)
+        new_statistics = InputStatistics.of(input_data.features)
+        # The operation trained on the outputs of the drifted parents is refitted after them
+        self.is_drifted = any(getattr(parent, 'is_drifted', False) for parent in self.nodes_from or [])
+        with NodeProfiler(self, 'update', input_data) as profiler:
+            try:
+                is_partially_fitted = not self.is_drifted and self.operation.partial_fit(
+                    self.fitted_operation, params=self._parameters, data=input_data)
+            except ValueError as ex:
+                self.log.debug(f'Operation {self.operation} can not be partially fitted because of {ex}')
+                is_partially_fitted, self.is_drifted = False, True
+            if is_partially_fitted:
+                is_mergeable = (reference_statistics is not None and new_statistics is not None and
+                                reference_statistics.mean.shape == new_statistics.mean.shape)
+                self.input_statistics = reference_statistics.merged(new_statistics) if is_mergeable else new_statistics
+                self.log.debug(f'Operation {self.operation} is partially fitted')
+            elif (reference_statistics is None or new_statistics is None or
+                  reference_statistics.drift(new_statistics) > drift_threshold):
+                self.is_drifted = True
+            if self.is_drifted:
+                self.log.debug(f'Operation {self.operation} has to be refitted because of the drift of its inputs')
+            operation_predict = self.operation.predict_for_fit(fitted_operation=self.fitted_operation,
+                                                               data=input_data,
+                                                               params=self._parameters)
+            profiler.output = operation_predict
+        self.is_updated = True
+        return operation_predict
+
     def predict(self, input_data: InputData, output_mode: str = 'default') -> OutputData:
         """Runs prediction process in the node
 
@@ -200,12 +285,13 @@ class Node(GraphNode):
             OutputData: values predicted on the provided ``input_data``
         """
 
-        with Timer() as t:
+        with Timer() as t, NodeProfiler(self, 'predict', input_data) as profiler:
             operation_predict = self.operation.predict(fitted_operation=self.fitted_operation,
                                                        params=self._parameters,
                                                        data=input_data,
                                                        output_mode=output_mode)
             self.inference_time_in_seconds = round(t.seconds_from_start, 3)
+            profiler.output = operation_predict
         return operation_predict
 
     @property
@@ -302,14 +388,36 @@ class PrimaryNode(Node):
             self.node_data = input_data
         return super().fit(input_data)
 
-    def unfit(self):
+    def unfit(self, keep_state: bool = False):
         """Sets ``node_data`` (if exists) and ``fitted_operation`` to ``None``
+
+        Args:
+            keep_state: keep the fitted operation supporting the update to update it by the next fit
         """
 
-        self.fitted_operation = None
+        super().unfit(keep_state)
         if hasattr(self, 'node_data'):
             self.node_data = None
 
+    def update(self, input_data: InputData, drift_threshold: float = DEFAULT_DRIFT_THRESHOLD) -> OutputData:
+        """Updates the operation located in the primary node with the new data
+
+        Args:
+            input_data: new data used for operation training
+            drift_threshold: maximal drift of the inputs at which the operation is not marked as drifted
+
+        Returns:
+            OutputData: values predicted on the provided ``input_data``
+        """
+
+        self.log.debug(f'Trying to update primary node with operation: {self.operation}')
+
+        if self.direct_set:
+            input_data = self.node_data
+        else:
+            self.node_data = input_data
+        return super().update(input_data, drift_threshold)
+
     def predict(self, input_data: InputData, output_mode: str = 'default') -> OutputData:
         """Predicts using the operation located in the primary node
 
@@ -392,6 +500,24 @@ class SecondaryNode(Node):
 
         return super().fit(input_data=secondary_input)
 
+    def update(self, input_data: InputData, drift_threshold: float = DEFAULT_DRIFT_THRESHOLD) -> OutputData:
+        """Updates the operation located in the secondary node and its parent nodes with the new data
+
+        Args:
+            input_data: new data used for operation training
+            drift_threshold: maximal drift of the inputs at which the operations are not marked as drifted
+
+        Returns:
+            OutputData: values predicted on the provided ``input_data``
+        """
+
+        self.log.debug(f'Trying to update secondary node with operation: {self.operation}')
+
+        secondary_input = self._input_from_parents(input_data=input_data, parent_operation='update',
+                                                   drift_threshold=drift_threshold)
+
+        return super().update(secondary_input, drift_threshold)
+
     def predict(self, input_data: InputData, output_mode: str = 'default') -> OutputData:
         """Predicts using the operation located in the secondary node
 
@@ -410,12 +536,15 @@ class SecondaryNode(Node):
 
         return super().predict(input_data=secondary_input, output_mode=output_mode)
 
-    def _input_from_parents(self, input_data: InputData, parent_operation: str) -> InputData:
+    def _input_from_parents(self, input_data: InputData, parent_operation: str,
+                            drift_threshold: float = DEFAULT_DRIFT_THRESHOLD) -> InputData:
         """Processes all the parent nodes via the current operation using ``input_data``
 
         Args:
             input_data: input data from pipeline abstraction (source input data)
-            parent_operation: name of parent operation (``'fit'`` or ``'predict'``)
+            parent_operation: name of parent operation (``'fit'``, ``'update'`` or ``'predict'``)
+            drift_threshold: maximal drift of the inputs at which the parent operations are not marked as drifted
+                at the ``'update'``
 
         Returns:
             InputData: predictions from the secondary nodes
@@ -429,7 +558,7 @@ class SecondaryNode(Node):
         parent_nodes = self._nodes_from_with_fixed_order()
 
         parent_results, _ = _combine_parents(parent_nodes, input_data,
-                                             parent_operation)
+                                             parent_operation, drift_threshold)
 
         secondary_input = DataMerger.get(parent_results).merge()
 
@@ -448,13 +577,16 @@ class SecondaryNode(Node):
 
 
 def _combine_parents(parent_nodes: List[Node],
-                     input_data: Optional[InputData], parent_operation: str) -> Tuple[List[OutputData], np.array]:
+                     input_data: Optional[InputData], parent_operation: str,
+                     drift_threshold: float = DEFAULT_DRIFT_THRESHOLD) -> Tuple[List[OutputData], np.array]:
     """Сombines predictions from the ``parent_nodes``
 
     Args:
         parent_nodes: list of parent nodes, from which predictions will be combined
         input_data: input data from pipeline abstraction (source input data)
-        parent_operation: name of parent operation (``'fit'`` or ``'predict'``)
+        parent_operation: name of parent operation (``'fit'``, ``'update'`` or ``'predict'``)
+        drift_threshold: maximal drift of the inputs at which the parent operations are not marked as drifted
+            at the ``'update'``
 
     Returns:
         Tuple[List[OutputData], np.array]: :obj:`output data list from parent nodes`,
@@ -472,6 +604,9 @@ def _combine_parents(parent_nodes: List[Node],
         elif parent_operation == 'fit':
             prediction = parent.fit(input_data=input_data)
             parent_results.append(prediction)
+        elif parent_operation == 'update':
+            prediction = parent.update(input_data=input_data, drift_threshold=drift_threshold)
+            parent_results.append(prediction)
         else:
             raise NotImplementedError()
 
@@ -1,8 +1,9 @@
 from copy import deepcopy
 from datetime import timedelta
-from typing import List, Optional, Tuple, Union, Sequence
+from typing import Dict, List, Optional, Tuple, Union, Sequence
 
 import func_timeout
+import numpy as np
 
 from fedot.core.caching.pipelines_cache import OperationsCache
 from fedot.core.caching.preprocessing_cache import PreprocessingCache
@@ -13,16 +14,33 @@ from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.log import default_log
 from fedot.core.operations.data_operation import DataOperation
+from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
+    ts_continuation
 from fedot.core.operations.model import Model
 from fedot.core.optimisers.timer import Timer
+from fedot.core.pipelines.frozen_pipeline import FrozenPipeline
+from fedot.core.pipelines.input_statistics import DEFAULT_DRIFT_THRESHOLD
 from fedot.core.pipelines.node import Node, PrimaryNode, SecondaryNode
+from fedot.core.pipelines.profiling import PipelineProfile
 from fedot.core.pipelines.template import PipelineTemplate
+from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import TaskTypesEnum
+from fedot.core.utilities.isolated_process import run_in_subprocess
+from fedot.core.utilities.mmap_archive import is_archive
 from fedot.core.utilities.serializable import Serializable
 from fedot.preprocessing.preprocessing import DataPreprocessor, update_indices_for_time_series
+from fedot.preprocessing.structure import DEFAULT_SOURCE_NAME
 
 ERROR_PREFIX = 'Invalid pipeline configuration:'
 
+# Names of the parameters defining the number of threads used by the operations
+N_JOBS_PARAMS = ('n_jobs', 'num_threads', 'nthread', 'thread_count')
+N_JOBS_PARAMS_BY_OPERATION = {
+    'lgbm': ('n_jobs',), 'lgbmreg': ('n_jobs',),
+    'catboost': ('thread_count',), 'catboostreg': ('thread_count',),
+    'xgboost': ('nthread',), 'xgbreg': ('nthread',),
+}
+
 
 class Pipeline(GraphDelegate, Serializable):
     """Base class used for composite model structure definition
@@ -35,6 +53,12 @@ class Pipeline(GraphDelegate, Serializable):
         super().__init__(nodes, _graph_nodes_to_pipeline_nodes)
 
         self.computation_time = None
+        # Measurements of the nodes, recorded only if the profiling is enabled
+        self.profile: Optional[PipelineProfile] = None
+        # Time series the pipeline is fitted on by the names of the sources, used to check the update
+        self._fitted_ts: Optional[Dict[str, np.ndarray]] = None
+        # Index of the subsample the fitness is obtained on if the pipeline is not evaluated on the full data
+        self.subsample_stage: Optional[int] = None
         self.log = default_log(self)
 
         # Define data preprocessor
@@ -52,7 +76,7 @@ class Pipeline(GraphDelegate, Serializable):
         self.fit(input_data)
 
     def _fit_with_time_limit(self, input_data: Optional[InputData],
-                             time: timedelta) -> OutputData:
+                             time: timedelta, isolated: bool = False) -> OutputData:
         """Runs training process in all of the pipeline nodes starting with root with time limit.
 
         Todo:
@@ -62,11 +86,16 @@ class Pipeline(GraphDelegate, Serializable):
             input_data: data used for operations training
             use_fitted_operations: flag defining whether to use saved information about previous executions or not
             time: time constraint for operations fitting process (in minutes)
+            isolated: if ``True``, the pipeline is fitted in the separate process which is killed on timeout,
+                otherwise the fitting thread is stopped only when the running operation returns to Python code
 
         Returns:
             OutputData: values predicted on the provided ``input_data``
         """
 
+        if isolated:
+            return self._fit_in_isolated_process(input_data, time)
+
         time = int(time.total_seconds())
         process_state_dict = {}
         fitted_operations = []
@@ -76,13 +105,53 @@ class Pipeline(GraphDelegate, Serializable):
                 args=(input_data, process_state_dict, fitted_operations)
             )
         except func_timeout.FunctionTimedOut:
-            raise TimeoutError(f'Pipeline fitness evaluation time limit is expired (more then {time} seconds)')
+            raise TimeoutError(f'Pipeline fitness evaluation time limit is expired (more than {time} seconds)')
 
         self.computation_time = process_state_dict['computation_time_in_seconds']
         for node_num, _ in enumerate(self.nodes):
             self.nodes[node_num].fitted_operation = fitted_operations[node_num]
         return process_state_dict['train_predicted']
 
+    def _fit_in_isolated_process(self, input_data: Optional[InputData], time: timedelta) -> OutputData:
+        """Runs training process in the separate process and copies the fitted state of the nodes back
+
+        Args:
+            input_data: data used for operations training
+            time: time constraint for operations fitting process
+
+        Returns:
+            OutputData: values predicted on the provided ``input_data``
+        """
+        seconds = time.total_seconds()
+        try:
+            process_state_dict = run_in_subprocess(self._fit_and_get_state, args=(input_data,), timeout=seconds)
+        except TimeoutError:
+            raise TimeoutError(f'Pipeline fitness evaluation time limit is expired (more than {seconds} seconds)')
+
+        self.computation_time = process_state_dict['computation_time_in_seconds']
+        self.profile = process_state_dict['profile']
+        for node, node_state in zip(self.nodes, process_state_dict['nodes_states']):
+            fitted_operation, fit_time, parameters, input_statistics, is_drifted, operation_to_update = node_state
+            node.fitted_operation = fitted_operation
+            node.fit_time_in_seconds = fit_time
+            # Parameters of some operations are corrected during the fit
+            node.parameters = parameters
+            # The state used by the update of the fitted pipeline
+            node.input_statistics = input_statistics
+            node.is_drifted = is_drifted
+            node._operation_to_update = operation_to_update
+        return process_state_dict['train_predicted']
+
+    def _fit_and_get_state(self, input_data: Optional[InputData]) -> dict:
+        """Fits the pipeline and collects the state changed during the fit (used inside of the isolated process)"""
+        train_predicted = self._fit(input_data)
+        return {'train_predicted': train_predicted,
+                'computation_time_in_seconds': self.computation_time,
+                'profile': self.profile,
+                'nodes_states': [(node.fitted_operation, node.fit_time_in_seconds, node.parameters,
+                                  node.input_statistics, node.is_drifted, node._operation_to_update)
+                                 for node in self.nodes]}
+
     def _fit(self, input_data: Optional[InputData] = None,
              process_state_dict: dict = None, fitted_operations: list = None) -> Optional[OutputData]:
         """Runs training process in all of the pipeline nodes starting with root
@@ -99,7 +168,7 @@ class Pipeline(GraphDelegate, Serializable):
             in case of the time controlled call
         """
 
-        with Timer() as t:
+        with Timer() as t, PipelineProfile.activate(self.profile):
             computation_time_update = not self.root_node.fitted_operation or self.computation_time is None
             train_predicted = self.root_node.fit(input_data=input_data)
             if computation_time_update:
@@ -114,7 +183,8 @@ class Pipeline(GraphDelegate, Serializable):
                 fitted_operations.append(node.fitted_operation)
 
     def fit(self, input_data: Union[InputData, MultiModalData],
-            time_constraint: Optional[timedelta] = None, n_jobs: int = 1) -> OutputData:
+            time_constraint: Optional[timedelta] = None, n_jobs: int = 1,
+            isolated: bool = False) -> OutputData:
         """
         Runs training process in all the pipeline nodes starting with root
 
@@ -122,11 +192,15 @@ class Pipeline(GraphDelegate, Serializable):
             input_data: data used for operations training
             time_constraint: time constraint for operations fitting (in seconds)
             n_jobs: number of threads for nodes fitting
+            isolated: fit the pipeline with ``time_constraint`` in the separate process which is killed on timeout.
+                It stops the operations hanging in the native code, but the fitted operations have to be picklable
 
         Returns:
             OutputData: values predicted on the provided ``input_data``
         """
         self.replace_n_jobs_in_nodes(n_jobs)
+        if input_data is not None and input_data.task.task_type is TaskTypesEnum.ts_forecasting:
+            self._fitted_ts = _time_series_of(input_data)
 
         copied_input_data = deepcopy(input_data)
         copied_input_data = self.preprocessor.obligatory_prepare_for_fit(copied_input_data)
@@ -140,9 +214,83 @@ class Pipeline(GraphDelegate, Serializable):
         if time_constraint is None:
             train_predicted = self._fit(input_data=copied_input_data)
         else:
-            train_predicted = self._fit_with_time_limit(input_data=copied_input_data, time=time_constraint)
+            train_predicted = self._fit_with_time_limit(input_data=copied_input_data, time=time_constraint,
+                                                        isolated=isolated)
         return train_predicted
 
+    def update(self, new_data: Union[InputData, MultiModalData],
+               refit_data: Optional[Union[InputData, MultiModalData]] = None,
+               drift_threshold: float = DEFAULT_DRIFT_THRESHOLD) -> OutputData:
+        """Updates the fitted pipeline with the new data instead of fitting it from scratch.
+        The operations supporting the partial fit (e.g. scalers, SGD, naive Bayes and boosting models)
+        are trained in place on the new rows. The other ones are kept as is unless their inputs drifted
+        by more than ``drift_threshold``, the operations which can not be trained on the new rows
+        (e.g. the classifiers getting the new classes) are drifted too (see :meth:`Node.update`).
+        The drifted operations and the operations after them are fitted from scratch on ``refit_data``,
+        if it is not set they are kept and the warning is logged. The fitted preprocessor is reused.
+        Each update adds ``BOOSTING_UPDATE_TREES_FRACTION`` of ``n_estimators`` trees to the boosting models
+        (XGBoost and LightGBM), so they grow linearly with the number of the updates until they are fitted again.
+
+        For the time series forecasting ``new_data`` is the whole series continuing the fitted one
+        (not only the new observations as for the tables): the statistical models are updated
+        with the new observations, the other operations are fitted on the whole series
+
+        Args:
+            new_data: rows appended to the table the pipeline is fitted (or updated) on or, for the time series
+                forecasting, the time series the pipeline is fitted on followed by the new observations
+            refit_data: data to fit the drifted operations on, usually the history with ``new_data`` appended
+                or its latest window
+            drift_threshold: maximal drift of the node inputs at which the operation is not refitted
+
+        Returns:
+            OutputData: values predicted on the provided ``new_data`` or on ``refit_data``
+            if any operation is refitted
+        """
+
+        if not self.is_fitted:
+            ex = 'Pipeline is not fitted yet'
+            self.log.error(ex)
+            raise ValueError(ex)
+
+        if new_data.task.task_type is TaskTypesEnum.ts_forecasting:
+            fitted_ts = getattr(self, '_fitted_ts', None)
+            new_ts = _time_series_of(new_data)
+            if fitted_ts is not None and any(ts_continuation(fitted_ts.get(source_name), time_series) is None
+                                             for source_name, time_series in new_ts.items()):
+                ex = 'Time series to update the pipeline must start with the time series the pipeline is fitted on'
+                self.log.error(ex)
+                raise ValueError(ex)
+            self.unfit(unfit_preprocessor=False, keep_state=True)
+            return self.fit(new_data)
+
+        copied_input_data = self._prepare_data_for_update(new_data)
+        for node in self.nodes:
+            node.is_updated = False
+        with PipelineProfile.activate(self.profile):
+            updated_predict = self.root_node.update(input_data=copied_input_data, drift_threshold=drift_threshold)
+
+        drifted_nodes = [node for node in self.nodes if node.is_drifted]
+        if not drifted_nodes:
+            return updated_predict
+        if refit_data is None:
+            self.log.warning(f'Inputs of the operations {", ".join(map(str, drifted_nodes))} drifted, '
+                             f'they are kept fitted on the previous data. Pass the history with the new data '
+                             f'as refit_data to refit them')
+            return updated_predict
+
+        for node in drifted_nodes:
+            node.unfit()
+        copied_refit_data = self._prepare_data_for_update(refit_data)
+        with PipelineProfile.activate(self.profile):
+            return self.root_node.fit(input_data=copied_refit_data)
+
+    def _prepare_data_for_update(self, data: Union[InputData, MultiModalData]) -> Optional[InputData]:
+        """Preprocesses the data for the update by the fitted preprocessor and assigns it to the nodes"""
+        copied_data = deepcopy(data)
+        copied_data = self.preprocessor.obligatory_prepare_for_update(copied_data)
+        copied_data = self.preprocessor.optional_prepare_for_predict(pipeline=self, data=copied_data)
+        return self._assign_data_to_nodes(copied_data)
+
     @property
     def is_fitted(self) -> bool:
         """Property showing whether pipeline is fitted
@@ -153,7 +301,7 @@ class Pipeline(GraphDelegate, Serializable):
 
         return all(node.fitted_operation is not None for node in self.nodes)
 
-    def unfit(self, mode='all', unfit_preprocessor: bool = True):
+    def unfit(self, mode='all', unfit_preprocessor: bool = True, keep_state: bool = False):
         """Removes fitted operations for chosen type of nodes.
 
         Args:
@@ -165,15 +313,33 @@ class Pipeline(GraphDelegate, Serializable):
                         - ``data_operations`` -> All data operations will be unfitted
 
             unfit_preprocessor: should we unfit preprocessor
+            keep_state: keep the fitted operations supporting the update (e.g. statistical time series models)
+                to update them by the next fit on the continued data instead of fitting from scratch
         """
 
         for node in self.nodes:
             if mode == 'all' or (mode == 'data_operations' and isinstance(node.content['name'], DataOperation)):
-                node.unfit()
+                node.unfit(keep_state)
+        if not keep_state:
+            self._fitted_ts = None
 
         if unfit_preprocessor:
             self.unfit_preprocessor()
 
+    def enable_profiling(self, enabled: bool = True) -> Optional[PipelineProfile]:
+        """Starts recording of the wall and CPU time, peak memory, shapes of the data and cache hits
+        of each node in the subsequent fit and predict calls or stops it
+
+        Args:
+            enabled: ``True`` to start the recording from scratch, ``False`` to stop it and discard the profile
+
+        Returns:
+            Optional[PipelineProfile]: profile available as :attr:`profile`, ``None`` if the profiling is disabled
+        """
+
+        self.profile = PipelineProfile() if enabled else None
+        return self.profile
+
     def unfit_preprocessor(self):
         self.preprocessor = DataPreprocessor()
 
@@ -229,7 +395,8 @@ class Pipeline(GraphDelegate, Serializable):
 
         copied_input_data = self._assign_data_to_nodes(copied_input_data)
 
-        result = self.root_node.predict(input_data=copied_input_data, output_mode=output_mode)
+        with PipelineProfile.activate(self.profile):
+            result = self.root_node.predict(input_data=copied_input_data, output_mode=output_mode)
 
         result = self.preprocessor.restore_index(copied_input_data, result)
         # Prediction should be converted into source labels (if it is needed)
@@ -237,6 +404,15 @@ class Pipeline(GraphDelegate, Serializable):
             result.predict = self.preprocessor.apply_inverse_target_encoding(result.predict)
         return result
 
+    def freeze(self) -> FrozenPipeline:
+        """Converts the fitted pipeline into the lightweight inference-only representation
+
+        Returns:
+            FrozenPipeline: flat plan of the fitted operations with the copy of the pipeline preprocessor
+        """
+
+        return FrozenPipeline(self)
+
     def save(self, path: str = None, datetime_in_path: bool = True) -> Tuple[str, dict]:
         """
         Saves the pipeline to JSON representation with pickled fitted operations
@@ -255,14 +431,45 @@ class Pipeline(GraphDelegate, Serializable):
                                                                        datetime_in_path=datetime_in_path)
         return json_object, dict_fitted_operations
 
+    def save_archive(self, path: str) -> str:
+        """Saves the pipeline with the fitted operations to the single archive file.
+        Unlike :meth:`save`, large numpy arrays of the fitted operations are stored uncompressed
+        to be memory-mapped by :meth:`load_archive` instead of being read and unpickled
+
+        Args:
+            path: path to the archive file
+
+        Returns:
+            str: absolute path to the archive
+        """
+
+        template = PipelineTemplate(self)
+        return template.export_archive(path, root_node=self.root_node)
+
+    def load_archive(self, path: str, mmap_mode: Optional[str] = 'c'):
+        """Loads the pipeline from the archive created by :meth:`save_archive`
+
+        Args:
+            path: path to the archive file
+            mmap_mode: mode of the memory mapping of the large arrays: ``'c'`` maps them copy-on-write,
+                ``'r'`` maps them read-only and ``None`` reads them into the memory
+        """
+
+        self.nodes = []
+        template = PipelineTemplate(self)
+        template.import_archive(path, mmap_mode)
+
     def load(self, source: Union[str, dict], dict_fitted_operations: Optional[dict] = None):
-        """Loads the pipeline ``JSON`` representation with pickled fitted operations.
+        """Loads the pipeline ``JSON`` representation with pickled fitted operations
+        or the pipeline archive created by :meth:`save_archive`.
 
         Args:
             source: where to load the pipeline from
             dict_fitted_operations: dictionary of the fitted operations
         """
 
+        if isinstance(source, str) and is_archive(source):
+            return self.load_archive(source)
         self.nodes = []
         template = PipelineTemplate(self)
         template.import_pipeline(source, dict_fitted_operations)
@@ -358,13 +565,13 @@ class Pipeline(GraphDelegate, Serializable):
         :param n_jobs: required number of the jobs to assign to the nodes
         """
         for node in self.nodes:
-            for param in ['n_jobs', 'num_threads']:
-                if param in node.content['params']:
-                    node.content['params'][param] = n_jobs
-                    # workaround for lgbm paramaters
-                    if node.content['name'] == 'lgbm':
-                        node.content['params']['num_threads'] = n_jobs
-                        node.content['params']['n_jobs'] = n_jobs
+            params = node.parameters
+            thread_params = {param for param in N_JOBS_PARAMS if param in params}
+            # Some models use all the cores if the number of threads is not set explicitly
+            thread_params.update(N_JOBS_PARAMS_BY_OPERATION.get(node.operation.operation_type, ()))
+            if thread_params:
+                # Parameters can be shared with the copies of the pipeline, so they are replaced instead of update
+                node.parameters = {**params, **dict.fromkeys(thread_params, n_jobs)}
 
 
 def nodes_with_operation(pipeline: Pipeline, operation_name: str) -> List[Node]:
@@ -384,6 +591,13 @@ def nodes_with_operation(pipeline: Pipeline, operation_name: str) -> List[Node]:
     return list(appropriate_nodes)
 
 
+def _time_series_of(data: Union[InputData, MultiModalData]) -> Dict[str, np.ndarray]:
+    """Gets the time series of the data by the names of the sources"""
+    sources = data.items() if isinstance(data, MultiModalData) else [(DEFAULT_SOURCE_NAME, data)]
+    return {source_name: np.asarray(source.features) for source_name, source in sources
+            if source.data_type is DataTypesEnum.ts}
+
+
 def _graph_nodes_to_pipeline_nodes(operator: GraphOperator, nodes: Sequence[Node]):
     """
     Method to update nodes type after performing some action on the pipeline
@@ -0,0 +1,170 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, fields
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fedot.core.utilities.memory import MemoryUsageTracker
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.node import Node
+
+# Profile of the pipeline which is fitted or predicted in the current thread
+_active_profile: ContextVar[Optional['PipelineProfile']] = ContextVar('active_profile', default=None)
+
+
+@dataclass
+class NodeProfile:
+    """Measurements of the single fit or predict call of the pipeline node.
+    The time and the memory are measured for the operation of the node only, without its parent nodes
+
+    Args:
+        node_uid: unique id of the node
+        operation: type of the operation in the node
+        stage: ``'fit'``, ``'update'`` or ``'predict'``
+        wall_time_in_seconds: elapsed time of the call
+        cpu_time_in_seconds: CPU time of the process during the call (including the threads of the operation)
+        peak_memory_in_mb: growth of the peak memory of the process during the call
+        input_shape: shape of the features passed to the operation
+        output_shape: shape of the prediction of the operation
+        cache_hit: whether the fitted operation was reused (loaded from the cache or fitted for the other
+            child node) instead of the fit, ``None`` for the predict stage
+    """
+
+    node_uid: str
+    operation: str
+    stage: str
+    wall_time_in_seconds: float
+    cpu_time_in_seconds: float
+    peak_memory_in_mb: float
+    input_shape: Optional[Tuple[int, ...]] = None
+    output_shape: Optional[Tuple[int, ...]] = None
+    cache_hit: Optional[bool] = None
+
+
+PROFILE_COLUMNS = [field.name for field in fields(NodeProfile)]
+
+
+class PipelineProfile:
+    """Measurements of the nodes recorded during the fit and predict calls of the pipeline with the active profile
+
+    Args:
+        records: measurements recorded earlier
+    """
+
+    def __init__(self, records: Sequence[NodeProfile] = ()):
+        self.records: List[NodeProfile] = list(records)
+
+    def add(self, record: NodeProfile):
+        self.records.append(record)
+
+    def to_table(self) -> pd.DataFrame:
+        """Returns the measurements as the table with one row per call of the node"""
+        return pd.DataFrame([asdict(record) for record in self.records], columns=PROFILE_COLUMNS)
+
+    def summary(self) -> pd.DataFrame:
+        """Returns the measurements aggregated by the operations, see :func:`summarize_profile`"""
+        return summarize_profile(self.to_table())
+
+    def to_records(self) -> List[dict]:
+        """Returns the measurements as the JSON-serializable list (e.g. to keep them in the metadata)"""
+        records = []
+        for record in self.records:
+            record = asdict(record)
+            for shape in ('input_shape', 'output_shape'):
+                if record[shape] is not None:
+                    record[shape] = list(record[shape])
+            records.append(record)
+        return records
+
+    @staticmethod
+    def from_records(records: Sequence[dict]) -> 'PipelineProfile':
+        return PipelineProfile([NodeProfile(**record) for record in records])
+
+    @staticmethod
+    @contextmanager
+    def activate(profile: Optional['PipelineProfile']) -> Iterator[None]:
+        """Records the calls of the nodes made inside of the block to the ``profile``.
+        ``None`` stops the recording, so the nodes of the nested pipelines are not recorded"""
+        token = _active_profile.set(profile)
+        try:
+            yield
+        finally:
+            _active_profile.reset(token)
+
+
+def summarize_profile(table: pd.DataFrame) -> pd.DataFrame:
+    """Aggregates the table of the measurements by the operations and the stages
+
+    Args:
+        table: table of the measurements with the columns of :class:`NodeProfile`
+
+    Returns:
+        number of the calls, total wall and CPU time, maximal peak memory and number of the cache hits
+        of each operation at each stage, the most time-consuming operations go first
+    """
+    table = table.assign(cache_hit=table['cache_hit'].eq(True))
+    summary = table.groupby(['operation', 'stage']).agg(calls=('node_uid', 'size'),
+                                                        wall_time_in_seconds=('wall_time_in_seconds', 'sum'),
+                                                        cpu_time_in_seconds=('cpu_time_in_seconds', 'sum'),
+                                                        peak_memory_in_mb=('peak_memory_in_mb', 'max'),
+                                                        cache_hits=('cache_hit', 'sum'))
+    return summary.sort_values('wall_time_in_seconds', ascending=False)
+
+
+class NodeProfiler:
+    """Measures the call of the node if the profile is active in the current thread, does nothing otherwise.
+    The output of the call has to be set to :attr:`output` inside of the block
+
+    Args:
+        node: node to measure
+        stage: ``'fit'``, ``'update'`` or ``'predict'``
+        input_data: data passed to the operation of the node
+        cache_hit: whether the fitted operation is reused at the fit stage
+    """
+
+    def __init__(self, node: 'Node', stage: str, input_data: Any, cache_hit: Optional[bool] = None):
+        self.output = None
+        self._node = node
+        self._stage = stage
+        self._input_data = input_data
+        self._cache_hit = cache_hit
+        self._profile = _active_profile.get()
+        self._memory = MemoryUsageTracker()
+        self._start_time = 0.
+        self._start_cpu_time = 0.
+
+    def __enter__(self) -> 'NodeProfiler':
+        if self._profile is not None:
+            self._memory.__enter__()
+            self._start_cpu_time = time.process_time()
+            self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if self._profile is None:
+            return
+        wall_time = time.perf_counter() - self._start_time
+        cpu_time = time.process_time() - self._start_cpu_time
+        self._memory.__exit__(exc_type, exc_value, exc_traceback)
+        if exc_type is not None:
+            return
+        self._profile.add(NodeProfile(node_uid=self._node.uid,
+                                      operation=self._node.operation.operation_type,
+                                      stage=self._stage,
+                                      wall_time_in_seconds=wall_time,
+                                      cpu_time_in_seconds=cpu_time,
+                                      peak_memory_in_mb=self._memory.peak_in_mb,
+                                      input_shape=_features_shape(self._input_data),
+                                      output_shape=_features_shape(self.output, 'predict'),
+                                      cache_hit=self._cache_hit))
+
+
+def _features_shape(data: Any, attribute: str = 'features') -> Optional[Tuple[int, ...]]:
+    values = getattr(data, attribute, None)
+    if values is None:
+        return None
+    return tuple(int(size) for size in np.shape(values))
@@ -13,6 +13,7 @@ from fedot.core.log import default_log
 from fedot.core.operations.atomized_template import AtomizedModelTemplate
 from fedot.core.operations.operation_template import OperationTemplate, check_existing_path
 from fedot.core.pipelines.node import Node, PrimaryNode, SecondaryNode
+from fedot.core.utilities.mmap_archive import DEFAULT_MIN_MMAP_SIZE, load_archive, save_archive
 
 if TYPE_CHECKING:
     from fedot.core.pipelines.pipeline import Pipeline
@@ -138,6 +139,50 @@ class PipelineTemplate:
 
         return json_data, dict_fitted_operations
 
+    def export_archive(self, path: str, root_node: Optional[Node] = None,
+                       min_mmap_size: int = DEFAULT_MIN_MMAP_SIZE) -> str:
+        """
+        Save the pipeline with the fitted operations and the preprocessor to the single archive file.
+        Large numpy arrays of the fitted operations are stored uncompressed to be memory-mapped at import
+
+        :param path: path to the archive file
+        :param root_node: root node of the exported pipeline
+        :param min_mmap_size: minimal size of the array (in bytes) to store it for the memory mapping
+
+        :return: absolute path to the archive
+        """
+        fitted_operations = {}
+        for operation in self.operation_templates:
+            if isinstance(operation, AtomizedModelTemplate) or 'h2o' in operation.operation_type:
+                message = f'Exporting {operation.operation_type} operation to the archive is not supported'
+                self.log.error(message)
+                raise TypeError(message)
+            if operation.fitted_operation is not None:
+                fitted_operations[f'operation_{operation.operation_id}'] = operation.fitted_operation
+        if self.data_preprocessor is not None:
+            fitted_operations['preprocessing'] = self.data_preprocessor
+
+        pipeline_template_dict = self.convert_to_dict(root_node)
+        path = save_archive(path, {'pipeline': pipeline_template_dict}, fitted_operations, min_mmap_size)
+        self.log.debug(f'The pipeline saved to the archive: {path}.')
+        return path
+
+    def import_archive(self, path: str, mmap_mode: Optional[str] = 'c'):
+        """
+        Imports pipeline from the archive created by :meth:`export_archive` into the :attr:`link_to_empty_pipeline`
+
+        :param path: path to the archive file
+        :param mmap_mode: mode of the memory mapping of the large arrays (see :class:`numpy.memmap`),
+            None means reading them into the memory
+        """
+        self._check_path_correct(path)
+        manifest, fitted_operations = load_archive(path, mmap_mode)
+        self.log.debug(f'The pipeline was imported from the archive: {path}.')
+
+        self._extract_operations(manifest['pipeline'], path)
+        self.convert_to_pipeline(self.link_to_empty_pipeline, dict_fitted_operations=fitted_operations)
+        self.depth = self.link_to_empty_pipeline.depth
+
     def convert_to_dict(self, root_node: Node = None) -> dict:
         """ Generate pipeline description in a form of dictionary """
 
@@ -265,8 +310,7 @@ class PipelineTemplate:
             preprocessor_file = os.path.join(path, 'preprocessing', 'data_preprocessor.pkl')
             pipeline.preprocessor = joblib.load(preprocessor_file)
         elif dict_fitted_operations and 'preprocessing' in dict_fitted_operations:
-            preprocessor_file = dict_fitted_operations['preprocessing']
-            pipeline.preprocessor = joblib.load(preprocessor_file)
+            pipeline.preprocessor = _load_fitted_object(dict_fitted_operations['preprocessing'])
 
     def roll_pipeline_structure(self, operation_object: Union['OperationTemplate', 'AtomizedModelTemplate'],
                                 visited_nodes: dict, path: str = None, dict_fitted_operations: dict = None):
@@ -317,7 +361,8 @@ class PipelineTemplate:
                 self.log.error(message)
                 raise TypeError(message)
             else:
-                fitted_operation = joblib.load(dict_fitted_operations[f'operation_{operation_object.operation_id}'])
+                fitted_operation = _load_fitted_object(
+                    dict_fitted_operations.get(f'operation_{operation_object.operation_id}'))
 
         operation_object.fitted_operation = fitted_operation
         node.fitted_operation = fitted_operation
@@ -349,6 +394,13 @@ class PipelineTemplate:
                 return bytes_container
 
 
+def _load_fitted_object(source: Union[str, BytesIO, Any, None]) -> Any:
+    """ Unpickles the object from the path or bytes, the already loaded objects are returned as is """
+    if isinstance(source, (str, BytesIO)):
+        return joblib.load(source)
+    return source
+
+
 def _is_nested_path(path):
     return path.find('nested') == -1
 
@@ -1,11 +1,12 @@
 import math
 from copy import copy
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.multi_modal import MultiModalData
+from fedot.core.data.supplementary_data import SupplementaryData
 from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import ts_to_table
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -66,6 +67,43 @@ def out_of_sample_ts_forecast(pipeline: Pipeline, input_data: Union[InputData, M
     return final_forecast
 
 
+def multi_series_forecast(pipeline: Pipeline, input_data: InputData, horizon: Optional[int] = None) -> np.array:
+    """
+    Method allows to forecast each series of multi_ts data by the single predict call of the pipeline
+    fitted on multi_ts data (the global model trained on all the series). The windows of all the series
+    are forecasted at once. For the horizon longer than the forecast length the previously predicted parts
+    of the series are used for forecasting next parts as in :func:`out_of_sample_ts_forecast`.
+
+    :param pipeline: Pipeline fitted on multi_ts data
+    :param input_data: multi_ts data with the series as columns of the features
+    :param horizon: forecasting horizon, forecast length of the task by default
+    :return final_forecast: array with forecast of each series in the row
+    """
+    task = input_data.task
+    exception_if_not_ts_task(task)
+    if input_data.data_type is not DataTypesEnum.multi_ts:
+        raise ValueError(f'Forecast of multiple series requires multi_ts data, got {input_data.data_type}')
+
+    forecast_length = task.task_params.forecast_length
+    horizon = horizon or forecast_length
+    pre_history_ts = np.array(input_data.features).reshape(len(input_data.features), -1)
+    series_num = pre_history_ts.shape[1]
+
+    final_forecast = []
+    for _ in range(math.ceil(horizon / forecast_length)):
+        start_forecast = len(pre_history_ts)
+        data = InputData(idx=np.arange(start_forecast, start_forecast + forecast_length),
+                         features=pre_history_ts, target=None, task=task, data_type=DataTypesEnum.multi_ts,
+                         supplementary_data=SupplementaryData(forecast_all_series=True))
+        iter_predict = np.array(pipeline.predict(data).predict).reshape(series_num, -1)
+        final_forecast.append(iter_predict)
+        # Add prediction to the historical data of each series
+        pre_history_ts = np.vstack((pre_history_ts, iter_predict.T))
+
+    # Clip the forecast if it is necessary
+    return np.hstack(final_forecast)[:, :horizon]
+
+
 def in_sample_ts_forecast(pipeline, input_data: Union[InputData, MultiModalData],
                           horizon: int = None) -> np.array:
     """
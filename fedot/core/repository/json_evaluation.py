@@ -1,5 +1,6 @@
 from typing import Union
 
+from fedot.core.utilities.lazy_import import import_by_name
 # imports are required for the eval
 from fedot.core.repository.dataset_types import *
 from fedot.core.repository.tasks import *
@@ -32,6 +33,5 @@ def eval_field_str(field_value) -> Union[List[DataTypesEnum],
 
 def eval_strategy_str(field_value):
     # TODO add docstring
-    namespace = field_value[0]
-    exec(f'from {namespace} import {field_value[1]}')
-    return eval(field_value[1])
+    namespace, strategy_name = field_value
+    return import_by_name(namespace, strategy_name)
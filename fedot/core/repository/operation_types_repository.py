@@ -2,7 +2,7 @@ import json
 import os
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, List, Optional, Dict, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from fedot.core.constants import BEST_QUALITY_PRESET_NAME, AUTO_PRESET_NAME
 from fedot.core.log import default_log
@@ -10,6 +10,7 @@ from fedot.core.optimisers.graph import OptNode
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.json_evaluation import eval_field_str, eval_strategy_str, read_field
 from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utilities.lazy_import import is_lazy_reference
 
 AVAILABLE_REPO_NAMES = ['all', 'model', 'data_operation', 'automl']
 
@@ -37,8 +38,61 @@ class OperationMetaInfo:
         """
 
         if isinstance(self.supported_strategies, dict):
-            return self.supported_strategies.get(task, None)
-        return self.supported_strategies
+            strategy = self.supported_strategies.get(task, None)
+        else:
+            strategy = self.supported_strategies
+        if is_lazy_reference(strategy):
+            # Strategy module (and its backend) is imported only when the strategy is requested
+            strategy = eval_strategy_str(strategy)
+        return strategy
+
+
+class OperationsIndex:
+    """Precomputed lookups over the operations of repository: operation metadata by id
+    and inverted indexes of operations positions by tag, task type, input data type and preset.
+    Positions are used to keep the order of operations from the repository
+
+    Args:
+        operations: list with :obj:`OperationMetaInfo` for every operation in repository
+    """
+
+    def __init__(self, operations: List[OperationMetaInfo]):
+        self.operations = operations
+        self.all_positions = frozenset(range(len(operations)))
+
+        self.by_id: Dict[str, OperationMetaInfo] = {}
+        self.duplicated_ids: Set[str] = set()
+        self.positions_by_tag: Dict[str, Set[int]] = defaultdict(set)
+        self.positions_by_task_type: Dict[TaskTypesEnum, Set[int]] = defaultdict(set)
+        self.positions_by_data_type: Dict[DataTypesEnum, Set[int]] = defaultdict(set)
+        self.positions_by_preset: Dict[str, Set[int]] = defaultdict(set)
+
+        for position, operation in enumerate(operations):
+            if operation.id in self.by_id:
+                self.duplicated_ids.add(operation.id)
+            else:
+                self.by_id[operation.id] = operation
+            for tag in operation.tags or []:
+                self.positions_by_tag[tag].add(position)
+            for task_type in operation.task_type:
+                self.positions_by_task_type[task_type].add(position)
+            for data_type in operation.input_types:
+                self.positions_by_data_type[data_type].add(position)
+            for preset in operation.presets or []:
+                self.positions_by_preset[preset].add(position)
+
+    def positions_with_tags(self, tags: List[str], is_full_match: bool) -> Set[int]:
+        """Returns positions of operations which contain all (``is_full_match``) or any of the tags"""
+        tags_positions = [self.positions_by_tag.get(tag, set()) for tag in tags]
+        if not tags_positions:
+            return set(self.all_positions) if is_full_match else set()
+        if is_full_match:
+            return set.intersection(*tags_positions)
+        return set.union(*tags_positions)
+
+    def ids(self, positions: Iterable[int]) -> List[str]:
+        """Returns names of operations in the repository order"""
+        return [self.operations[position].id for position in sorted(positions)]
 
 
 def run_once(function):
@@ -57,6 +111,7 @@ class OperationTypesRepository:
     """
 
     __initialized_repositories__ = {}
+    __initialized_indexes__ = {}
     # The later the tag, the higher its priority in case of intersection
     DEFAULT_MODEL_TAGS = ['linear', 'non_linear', 'custom_model', 'tree', 'boosting', 'ts_model', 'deep']
     DEFAULT_DATA_OPERATION_TAGS = [
@@ -80,23 +135,38 @@ class OperationTypesRepository:
         OperationTypesRepository.init_default_repositories()
 
         self.repository_name = []
-        self._repo = []
         self.default_tags = []
         if operation_type == 'all':
             for op_type in OperationTypesRepository.__repository_dict__.keys():
                 self.repository_name.append(OperationTypesRepository.__repository_dict__[op_type]['file'])
-                operations = OperationTypesRepository.__repository_dict__[op_type]['initialized_repo']
                 self.default_tags += OperationTypesRepository.__repository_dict__[op_type]['default_tags']
-
-                if operations is not None:
-                    for operation in operations:
-                        if operation not in self._repo:
-                            self._repo.append(operation)
+            self._index = OperationTypesRepository._get_index(list(OperationTypesRepository.__repository_dict__))
 
         else:
             self.repository_name = OperationTypesRepository.__repository_dict__[operation_type]['file']
-            self._repo = OperationTypesRepository.__repository_dict__[operation_type]['initialized_repo']
             self.default_tags = OperationTypesRepository.__repository_dict__[operation_type]['default_tags']
+            self._index = OperationTypesRepository._get_index([operation_type])
+        self._repo = self._index.operations
+
+    @classmethod
+    def _get_index(cls, operation_types: List[str]) -> OperationsIndex:
+        """Returns the index of operations from the initialized repositories of the given types.
+        Index is built once for every combination of repositories files and reused then
+
+        Args:
+            operation_types: types of repositories to unite, for example ``['model', 'data_operation']``
+        """
+        repositories = [cls.__repository_dict__[op_type] for op_type in operation_types]
+        index_key: Tuple[str, ...] = tuple(repository['file'] for repository in repositories
+                                           if repository['initialized_repo'] is not None)
+        if index_key not in cls.__initialized_indexes__:
+            operations = []
+            for repository in repositories:
+                for operation in repository['initialized_repo'] or []:
+                    if operation not in operations:
+                        operations.append(operation)
+            cls.__initialized_indexes__[index_key] = OperationsIndex(operations)
+        return cls.__initialized_indexes__[index_key]
 
     @classmethod
     def get_available_repositories(cls):
@@ -213,7 +283,8 @@ class OperationTypesRepository:
 
     @staticmethod
     def get_strategies_by_metadata(metadata: dict):
-        """Method allow obtain strategy instance by the metadata
+        """Method allow obtain references to strategies by the metadata.
+        Strategies are imported lazily by :meth:`OperationMetaInfo.current_strategy`
 
         Args:
             metadata: information about meta of the operation
@@ -221,15 +292,15 @@ class OperationTypesRepository:
         """
         strategies_json = metadata['strategies']
         if isinstance(strategies_json, list):
-            supported_strategies = eval_strategy_str(strategies_json)
+            supported_strategies = tuple(strategies_json)
         else:
             supported_strategies = {}
             for strategy_dict_key in strategies_json.keys():
                 # Convert string into class path for import
                 import_path = eval_field_str(strategy_dict_key)
-                strategy_class = eval_strategy_str(strategies_json[strategy_dict_key])
+                strategy_reference = tuple(strategies_json[strategy_dict_key])
 
-                supported_strategies.update({import_path: strategy_class})
+                supported_strategies.update({import_path: strategy_reference})
         return supported_strategies
 
     def operation_info_by_id(self, operation_id: str) -> Optional[OperationMetaInfo]:
@@ -237,13 +308,12 @@ class OperationTypesRepository:
 
         operation_id = get_operation_type_from_id(operation_id)
 
-        operations_with_id = [m for m in self._repo if m.id == operation_id]
-        if len(operations_with_id) > 1:
+        if operation_id in self._index.duplicated_ids:
             raise ValueError('Several operations with same id in repository')
-        if len(operations_with_id) == 0:
+        operation_info = self._index.by_id.get(operation_id)
+        if operation_info is None:
             self.log.warning(f'Operation {operation_id} not found in the repository')
-            return None
-        return operations_with_id[0]
+        return operation_info
 
     def operations_with_tag(self, tags: List[str], is_full_match: bool = False):
         """ Method returns operations from repository with specific tags
@@ -253,9 +323,7 @@ class OperationTypesRepository:
 
                 :return list of suitable operations names
         """
-        operations_info = [m for m in self._repo if
-                           _is_operation_contains_tag(tags, m.tags, is_full_match)]
-        return [m.id for m in operations_info]
+        return self._index.ids(self._index.positions_with_tags(tags, is_full_match))
 
     def suitable_operation(self, task_type: TaskTypesEnum = None,
                            data_type: DataTypesEnum = None,
@@ -274,29 +342,28 @@ class OperationTypesRepository:
             preset: return operations from desired preset
         """
 
-        if not forbidden_tags:
-            forbidden_tags = []
-
+        forbidden_tags = list(forbidden_tags or [])
         if not tags:
-            for excluded_default_tag in self._tags_excluded_by_default:
-                # Forbidden tags by default
-                forbidden_tags.append(excluded_default_tag)
-
-        no_task = task_type is None
-        operations_info = []
-        for o in self._repo:
-            is_desired_task = task_type in o.task_type or no_task
-            tags_good = not tags or _is_operation_contains_tag(tags, o.tags, is_full_match)
-            tags_bad = not forbidden_tags or not _is_operation_contains_tag(forbidden_tags, o.tags, False)
-            is_desired_preset = _is_operation_contains_preset(o.presets, preset)
-            if is_desired_task and tags_good and tags_bad and is_desired_preset:
-                operations_info.append(o)
+            # Forbidden tags by default
+            forbidden_tags.extend(self._tags_excluded_by_default)
+
+        index = self._index
+        if task_type is None:
+            positions = set(index.all_positions)
+        else:
+            positions = set(index.positions_by_task_type.get(task_type, set()))
+        if tags:
+            positions &= index.positions_with_tags(tags, is_full_match)
+        if forbidden_tags:
+            positions -= index.positions_with_tags(forbidden_tags, is_full_match=False)
+        if preset is not None:
+            positions &= index.positions_by_preset.get(preset, set())
 
         # TODO: too many operations are filtered out, because only a small number of operations defines `input_types`
         if data_type:
-            operations_info = [o for o in operations_info if data_type in o.input_types]
+            positions &= index.positions_by_data_type.get(data_type, set())
 
-        return [m.id for m in operations_info]
+        return index.ids(positions)
 
     @property
     def operations(self):
@@ -359,40 +426,6 @@ def get_opt_node_tag(opt_node: Union[OptNode, str], tags_model: Optional[List[st
     return None
 
 
-def _is_operation_contains_tag(candidate_tags: List[str],
-                               operation_tags: List[str],
-                               is_full_match: bool) -> bool:
-    """The function checks which operations are suitable for the selected tags
-
-    Args:
-        candidate_tags: ``list`` with tags that the operation must have in order
-            to fit the selected task
-        operation_tags: ``list`` with tags with names as in repository json file
-            which correspond to the considering operation
-        is_full_match: requires all tags to match, or at least one
-
-    Returns:
-        bool: is there a match on the tags
-    """
-
-    matches = (tag in operation_tags for tag in candidate_tags)
-    if is_full_match:
-        return all(matches)
-    else:
-        return any(matches)
-
-
-def _is_operation_contains_preset(operation_presets: List[str], preset: str) -> bool:
-    """Checking whether the operation is suitable for current preset
-    """
-
-    if preset is None:
-        # None means that best_quality preset are using so return all operations
-        return True
-
-    return preset in operation_presets
-
-
 def atomized_model_type():
     return 'atomized_operation'
 
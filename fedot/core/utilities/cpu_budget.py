@@ -0,0 +1,108 @@
+import threading
+from contextlib import contextmanager
+from multiprocessing import Manager
+from typing import Iterator, List, Optional
+
+from joblib import cpu_count
+from threadpoolctl import threadpool_limits
+
+_assigned = threading.local()
+
+
+def determine_n_jobs(n_jobs=-1, logger=None):
+    if n_jobs > cpu_count() or n_jobs == -1:
+        n_jobs = cpu_count()
+    if logger:
+        logger.info(f"Number of used CPU's: {n_jobs}")
+    return n_jobs
+
+
+class CPUBudget:
+    """Single budget of CPU cores shared between the workers evaluating the population
+    and the threads used by the models inside of each worker (``n_jobs`` of the nodes, BLAS and OpenMP pools).
+
+    The threads of a task are assigned when the task starts (see :class:`CoresShare`): the cores free from
+    the running tasks are shared between the tasks waiting to start. So while there are more tasks than cores
+    each task gets one thread, and a few candidates left to evaluate use the whole machine instead of one core each,
+    without oversubscription of the cores still used by the running tasks.
+
+    :param n_jobs: number of cores available for the run, -1 means all cores
+    :param nested: if ``False``, each task gets one thread regardless of the number of tasks
+    """
+
+    def __init__(self, n_jobs: int = -1, nested: bool = True):
+        self.n_jobs = determine_n_jobs(n_jobs)
+        self.nested = nested
+
+    def workers_num(self, tasks_num: int) -> int:
+        """Returns the number of workers for evaluation of ``tasks_num`` tasks"""
+        return max(1, min(self.n_jobs, tasks_num))
+
+    @contextmanager
+    def share(self, tasks_num: int) -> Iterator['CoresShare']:
+        """Shares the cores between the tasks evaluated by :meth:`workers_num` workers
+
+        :param tasks_num: number of the tasks to evaluate
+
+        :return: share of the cores passed to the tasks, the state of the share is kept by the process of the manager
+        if the tasks are evaluated by several processes
+        """
+        max_threads = self.n_jobs if self.nested else 1
+        if self.workers_num(tasks_num) == 1:
+            yield CoresShare(threading.Lock(), [self.n_jobs, tasks_num], max_threads)
+            return
+        with Manager() as manager:
+            yield CoresShare(manager.Lock(), manager.list([self.n_jobs, tasks_num]), max_threads)
+
+    @staticmethod
+    @contextmanager
+    def assign(threads: int) -> Iterator[int]:
+        """Limits the threads of the current task: the number is available to the code evaluating the task
+        through :meth:`assigned_threads` and the thread pools of native libraries are limited to it
+
+        :param threads: number of threads for the task
+        """
+        previous = getattr(_assigned, 'threads', None)
+        _assigned.threads = threads
+        try:
+            with threadpool_limits(limits=threads):
+                yield threads
+        finally:
+            _assigned.threads = previous
+
+    @staticmethod
+    def assigned_threads(default: int = 1) -> int:
+        """Returns the number of threads assigned to the current task or ``default`` outside of any task"""
+        threads: Optional[int] = getattr(_assigned, 'threads', None)
+        return default if threads is None else threads
+
+
+class CoresShare:
+    """Cores of the :class:`CPUBudget` shared between the tasks at their start.
+    A starting task takes its part of the free cores divided by the number of the tasks waiting to start
+    and returns them when it is finished, so the waiting tasks always have at least one free core each.
+
+    :param lock: lock of the state of the share
+    :param state: numbers of the free cores and of the tasks waiting to start
+    :param max_threads: maximal number of threads of a task
+    """
+
+    def __init__(self, lock, state: List[int], max_threads: int):
+        self._lock = lock
+        self._state = state
+        self._max_threads = max_threads
+
+    @contextmanager
+    def acquire(self) -> Iterator[int]:
+        """Assigns the threads to the current task (see :meth:`CPUBudget.assign`) until it is finished"""
+        with self._lock:
+            free_cores, waiting_num = self._state[0], self._state[1]
+            threads = max(1, min(self._max_threads, free_cores // max(1, waiting_num)))
+            self._state[0] = free_cores - threads
+            self._state[1] = waiting_num - 1
+        try:
+            with CPUBudget.assign(threads):
+                yield threads
+        finally:
+            with self._lock:
+                self._state[0] += threads
@@ -0,0 +1,71 @@
+import multiprocessing
+import os
+import signal
+from typing import Any, Callable, Optional, Sequence
+
+
+def run_in_subprocess(function: Callable, args: Sequence = (), timeout: Optional[float] = None) -> Any:
+    """Calls the function in the separate process which is killed when the ``timeout`` expires.
+    Unlike the threads, the process is stopped even if it hangs in the native code (e.g. inside of the models
+    from sklearn, xgboost or statsmodels). The result of the call is returned through the pipe,
+    so it must be picklable
+
+    Args:
+        function: function to call
+        args: positional arguments of the function
+        timeout: time limit in seconds, ``None`` means no limit
+
+    Returns:
+        the result of the function call
+
+    Raises:
+        TimeoutError: if the function is not finished in time
+        RuntimeError: if the process is terminated without the result
+    """
+    # Forked process does not need the function and its arguments to be pickled
+    start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+    context = multiprocessing.get_context(start_method)
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_call_and_send, args=(sender, function, args))
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            raise TimeoutError(f'Isolated process is not finished in {timeout} seconds')
+        status, result = receiver.recv()
+    except EOFError:
+        process.join()
+        raise RuntimeError(f'Isolated process is terminated with exit code {process.exitcode}')
+    finally:
+        _kill(process)
+        receiver.close()
+
+    if status == 'error':
+        raise result
+    return result
+
+
+def _call_and_send(sender, function: Callable, args: Sequence):
+    if hasattr(os, 'setpgid'):
+        # Own process group allows to kill the child processes of the models (e.g. joblib workers) as well
+        os.setpgid(0, 0)
+    try:
+        message = ('result', function(*args))
+    except Exception as ex:
+        message = ('error', ex)
+    try:
+        sender.send(message)
+    except Exception as ex:
+        # The result or the exception can not be pickled
+        sender.send(('error', RuntimeError(f'Result of the isolated process can not be returned: {ex}')))
+    finally:
+        sender.close()
+
+
+def _kill(process):
+    if process.is_alive():
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            process.kill()
+    process.join()
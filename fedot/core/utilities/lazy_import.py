@@ -0,0 +1,29 @@
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Sequence
+
+
+@lru_cache(maxsize=None)
+def import_by_name(module_name: str, object_name: str) -> Any:
+    """Imports the object from the module on the first request and caches it.
+    Allows to load heavy and optional backends only when the operation that needs them is used
+
+    Args:
+        module_name: full name of the module, for example ``'xgboost'``
+        object_name: name of the object in the module, for example ``'XGBRegressor'``
+
+    Returns:
+        imported object
+    """
+    return getattr(import_module(module_name), object_name)
+
+
+def is_lazy_reference(reference: Any) -> bool:
+    """Checks whether the ``reference`` is a pair of module name and object name
+    which can be imported with :func:`import_by_name`
+
+    Args:
+        reference: object to check
+    """
+    return (isinstance(reference, Sequence) and not isinstance(reference, str) and len(reference) == 2
+            and all(isinstance(name, str) for name in reference))
@@ -0,0 +1,115 @@
+import gc
+import re
+from typing import List, Optional
+
+import psutil
+
+MB = 1024 ** 2
+# Growth of the memory of the process triggering the full garbage collection
+DEFAULT_GC_THRESHOLD_IN_MB = 100
+
+# Resident set size of the process after the last collection made by the adaptive garbage collector
+_rss_after_collection: Optional[int] = None
+# Trackers of the code blocks running in the current process, the outer ones go first
+_active_trackers: List['MemoryUsageTracker'] = []
+
+
+def current_rss() -> int:
+    """Returns the resident set size of the current process in bytes"""
+    return psutil.Process().memory_info().rss
+
+
+class MemoryUsageTracker:
+    """Context manager measuring the peak memory used by the code block in the current process.
+    On Linux the peak resident set size of the process is reset at the start of the block,
+    so the allocations freed inside of the block are counted as well.
+    On the other systems only the memory remaining at the end of the block is counted.
+    The trackers can be nested: the peak reached before the reset made by the inner tracker
+    is kept by the outer ones.
+
+    Attributes:
+        peak_in_mb: growth of the peak resident set size over its value at the start of the block
+        growth_in_mb: growth of the resident set size at the end of the block
+    """
+
+    def __init__(self):
+        self.peak_in_mb = 0.
+        self.growth_in_mb = 0.
+        self._start_rss = 0
+        self._observed_peak_rss = 0
+        self._is_peak_reset = False
+
+    def __enter__(self) -> 'MemoryUsageTracker':
+        if _active_trackers:
+            peak_rss = _peak_rss()
+            for tracker in _active_trackers:
+                tracker._observed_peak_rss = max(tracker._observed_peak_rss, peak_rss or 0)
+        self._is_peak_reset = _reset_peak_rss()
+        self._start_rss = current_rss()
+        self._observed_peak_rss = self._start_rss
+        _active_trackers.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if self in _active_trackers:
+            _active_trackers.remove(self)
+        end_rss = current_rss()
+        peak_rss = _peak_rss() if self._is_peak_reset else None
+        peak_rss = max(peak_rss or 0, end_rss, self._observed_peak_rss)
+        self.growth_in_mb = (end_rss - self._start_rss) / MB
+        self.peak_in_mb = max(0, peak_rss - self._start_rss) / MB
+
+
+class AdaptiveGarbageCollector:
+    """Runs full garbage collection only if the resident set size of the process has grown
+    by more than ``threshold_in_mb`` since the last collection. Full collection after each
+    evaluation of small models takes more time than the evaluation itself,
+    while the growth of the memory shows that there is garbage worth to collect.
+
+    The memory after the last collection is stored per process, so the collectors
+    copied to the workers of the process pool share it.
+
+    Args:
+        threshold_in_mb: growth of the memory triggering the collection, 0 means collection on each call
+    """
+
+    def __init__(self, threshold_in_mb: float = DEFAULT_GC_THRESHOLD_IN_MB):
+        self.threshold_in_mb = threshold_in_mb
+
+    def collect_if_needed(self) -> bool:
+        """Collects garbage if the memory has grown enough
+
+        Returns:
+            ``True`` if the collection was made
+        """
+        global _rss_after_collection
+        if self.threshold_in_mb > 0:
+            rss = current_rss()
+            if _rss_after_collection is None:
+                _rss_after_collection = rss
+            if rss - _rss_after_collection <= self.threshold_in_mb * MB:
+                # Memory freed outside of the collector moves the reference point down
+                _rss_after_collection = min(_rss_after_collection, rss)
+                return False
+        gc.collect()
+        _rss_after_collection = current_rss()
+        return True
+
+
+def _reset_peak_rss() -> bool:
+    """Resets the peak resident set size of the process to its current value (supported only on Linux)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss() -> Optional[int]:
+    try:
+        with open('/proc/self/status') as status:
+            peak = re.search(r'VmHWM:\s+(\d+) kB', status.read())
+    except OSError:
+        return None
+    return int(peak.group(1)) * 1024 if peak else None
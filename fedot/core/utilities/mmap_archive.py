@@ -0,0 +1,171 @@
+import json
+import os
+import pickle
+import struct
+import zipfile
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+from weakref import WeakValueDictionary
+
+import numpy as np
+
+ARCHIVE_FORMAT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+# Arrays smaller than this are kept inside of the pickles, the larger ones are stored separately to be memory-mapped
+DEFAULT_MIN_MMAP_SIZE = 64 * 1024
+# Alignment of the array data in the archive file, enough for any numpy dtype and the cache lines
+ARRAY_ALIGNMENT = 64
+
+_LOCAL_HEADER_SIZE = struct.calcsize(zipfile.structFileHeader)
+_PADDING_HEADER_ID = 0xFE00
+
+
+def save_archive(path: str, manifest: dict, objects: Dict[str, Any],
+                 min_mmap_size: int = DEFAULT_MIN_MMAP_SIZE) -> str:
+    """Saves the objects to the single uncompressed zip archive with the JSON manifest.
+    The objects are pickled, while the numpy arrays of at least ``min_mmap_size`` bytes
+    are stored aside of the pickles as raw aligned data, so they can be memory-mapped at load.
+    The arrays shared by several objects are stored once.
+
+    Args:
+        path: path to the archive file
+        manifest: JSON-serializable description of the archive content
+        objects: objects to pickle by their names
+        min_mmap_size: minimal size of the array in bytes to store it separately
+
+    Returns:
+        absolute path to the archive
+    """
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED) as archive:
+        writer = _ArrayWriter(archive, min_mmap_size)
+        objects_info = {}
+        for name, obj in objects.items():
+            # The large arrays are written to their own members while pickling, so the pickle is buffered
+            pickled = BytesIO()
+            pickler = pickle.Pickler(pickled, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.persistent_id = writer.persistent_id
+            pickler.dump(obj)
+            member = f'objects/{name}.pkl'
+            archive.writestr(member, pickled.getbuffer())
+            objects_info[name] = member
+        full_manifest = {'format_version': ARCHIVE_FORMAT_VERSION,
+                         'objects': objects_info,
+                         'arrays': writer.arrays_info,
+                         **manifest}
+        archive.writestr(MANIFEST_NAME, json.dumps(full_manifest, indent=4))
+    return path
+
+
+def load_archive(path: str, mmap_mode: Optional[str] = 'c') -> Tuple[dict, Dict[str, Any]]:
+    """Loads the manifest and the objects from the archive created by :func:`save_archive`
+
+    Args:
+        path: path to the archive file
+        mmap_mode: mode of :class:`numpy.memmap` for the large arrays: ``'c'`` maps them copy-on-write,
+            ``'r'`` maps them read-only and ``None`` reads them into the memory
+
+    Returns:
+        manifest of the archive and the unpickled objects by their names
+    """
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+        if manifest.get('format_version', 0) > ARCHIVE_FORMAT_VERSION:
+            raise ValueError(f'Archive format version {manifest["format_version"]} is not supported')
+        # The arrays are loaded on demand and kept only while they are referenced, so the arrays
+        # copied by the unpickled objects (e.g. by the trees of scikit-learn) are freed right away
+        arrays = WeakValueDictionary()
+
+        def persistent_load(array_id: str) -> np.ndarray:
+            array = arrays.get(array_id)
+            if array is None:
+                array = _load_array(path, archive, manifest['arrays'][array_id], mmap_mode)
+                arrays[array_id] = array
+            return array
+
+        objects = {}
+        for name, member in manifest['objects'].items():
+            unpickler = pickle.Unpickler(BytesIO(archive.read(member)))
+            unpickler.persistent_load = persistent_load
+            objects[name] = unpickler.load()
+    return manifest, objects
+
+
+def is_archive(path: str) -> bool:
+    """Checks whether the path points to the archive created by :func:`save_archive`"""
+    if not os.path.isfile(path) or not zipfile.is_zipfile(path):
+        return False
+    with zipfile.ZipFile(path) as archive:
+        return MANIFEST_NAME in archive.namelist()
+
+
+class _ArrayWriter:
+    """Writes the large arrays met by the pickler to the separate archive members"""
+
+    def __init__(self, archive: zipfile.ZipFile, min_mmap_size: int):
+        self.archive = archive
+        self.min_mmap_size = min_mmap_size
+        self.arrays_info: Dict[str, dict] = {}
+        # Written arrays by their ids. The arrays are referenced here, because the arrays created by ``__reduce__``
+        # of the pickled objects are freed right after pickling and their ids could be reused by the other arrays
+        self._written: Dict[int, Tuple[str, np.ndarray]] = {}
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if not (isinstance(obj, np.ndarray) and type(obj) in (np.ndarray, np.memmap)):
+            return None
+        if obj.dtype.hasobject or obj.nbytes < max(self.min_mmap_size, 1):
+            return None
+        if id(obj) not in self._written:
+            self._written[id(obj)] = (self._write(obj), obj)
+        return self._written[id(obj)][0]
+
+    def _write(self, array: np.ndarray) -> str:
+        array_id = str(len(self.arrays_info))
+        member = f'arrays/{array_id}.bin'
+        order = 'F' if array.flags.f_contiguous and not array.flags.c_contiguous else 'C'
+        # Fortran-ordered array is written as its transposition, which is C-contiguous
+        data = array.T if order == 'F' else np.ascontiguousarray(array)
+
+        info = zipfile.ZipInfo(member)
+        info.compress_type = zipfile.ZIP_STORED
+        info.file_size = array.nbytes
+        zip64 = array.nbytes * 1.05 > zipfile.ZIP64_LIMIT
+        info.extra = self._padding(member, zip64)
+        with self.archive.open(info, 'w', force_zip64=zip64) as member_file:
+            member_file.write(data.reshape(-1).view(np.uint8))
+
+        self.arrays_info[array_id] = {'member': member, 'dtype': np.lib.format.dtype_to_descr(array.dtype),
+                                      'shape': list(array.shape), 'order': order}
+        return array_id
+
+    def _padding(self, member: str, zip64: bool) -> bytes:
+        """Extra field of the local file header aligning the start of the member data"""
+        header_end = (self.archive.fp.tell() + _LOCAL_HEADER_SIZE + len(member.encode('utf-8'))
+                      + (20 if zip64 else 0) + 4)
+        padding_size = -header_end % ARRAY_ALIGNMENT
+        return struct.pack('<HH', _PADDING_HEADER_ID, padding_size) + b'\0' * padding_size
+
+
+def _load_array(path: str, archive: zipfile.ZipFile, info: dict, mmap_mode: Optional[str]) -> np.ndarray:
+    zip_info = archive.getinfo(info['member'])
+    if zip_info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f'Array {info["member"]} is compressed and cannot be loaded')
+    offset = _data_offset(archive, zip_info)
+    dtype = np.lib.format.descr_to_dtype(info['dtype'])
+    shape = tuple(info['shape'])
+    # Data of the Fortran-ordered array was written as its transposition, that is in Fortran order
+    order = info['order']
+    if mmap_mode is None:
+        array = np.fromfile(path, dtype=dtype, count=int(np.prod(shape)), offset=offset)
+        return array.reshape(shape, order=order)
+    return np.memmap(path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape, order=order)
+
+
+def _data_offset(archive: zipfile.ZipFile, zip_info: zipfile.ZipInfo) -> int:
+    """Offset of the member data in the archive file, taken from the local file header of the member"""
+    archive.fp.seek(zip_info.header_offset)
+    header = archive.fp.read(_LOCAL_HEADER_SIZE)
+    # The lengths of the name and of the extra field close the local file header
+    name_length, extra_length = struct.unpack('<2H', header[-4:])
+    return zip_info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
@@ -3,7 +3,6 @@ from copy import deepcopy
 from inspect import signature
 from typing import Optional
 
-from matplotlib import pyplot as plt
 from sklearn import tree
 from sklearn.tree._tree import TREE_LEAF
 
@@ -68,6 +67,8 @@ class SurrogateExplainer(Explainer):
         :param figsize: the figure size in format `(width, height)`, defaults to `(48, 12)`.
         :param save_path: path to save the plot.
         """
+        from matplotlib import pyplot as plt
+
         plt.figure(dpi=dpi, figsize=figsize)
         if self.surrogate_str in ['dt', 'dtreg']:
 
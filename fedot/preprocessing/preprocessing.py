@@ -13,6 +13,7 @@ from fedot.core.data.data_preprocessing import (
     replace_inf_with_nans,
     replace_nans_with_empty_strings
 )
+from fedot.core.data.data_split import representative_sample_idx
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.log import default_log
 from fedot.core.operations.evaluation.operation_implementations.data_operations.categorical_encoders import (
@@ -25,7 +26,7 @@ from fedot.core.operations.evaluation.operation_implementations.data_operations.
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import TaskTypesEnum
 from fedot.preprocessing.categorical import BinaryCategoricalPreprocessor
-from fedot.preprocessing.data_types import NAME_CLASS_INT, TableTypesCorrector
+from fedot.preprocessing.data_types import NAME_CLASS_INT, NAME_CLASS_STR, TableTypesCorrector
 from fedot.preprocessing.data_type_check import exclude_ts, exclude_multi_ts, exclude_image
 from fedot.preprocessing.structure import DEFAULT_SOURCE_NAME, PipelineStructureExplorer
 # The allowed percent of empty samples in features.
@@ -142,6 +143,22 @@ class DataPreprocessor:
         self.mark_as_preprocessed(data)
         return data
 
+    def obligatory_prepare_for_update(self, data: Union[InputData, MultiModalData]):
+        """
+        Perform obligatory preprocessing for pipeline update method by the fitted preprocessor.
+        The features are processed as for predict, the target is processed as for fit
+        """
+        if isinstance(data, InputData):
+            data = self._prepare_obligatory_unimodal_for_update(data, source_name=DEFAULT_SOURCE_NAME)
+
+        elif isinstance(data, MultiModalData):
+            for data_source_name, values in data.items():
+                data[data_source_name] = self._prepare_obligatory_unimodal_for_update(values,
+                                                                                      source_name=data_source_name)
+
+        self.mark_as_preprocessed(data)
+        return data
+
     def optional_prepare_for_fit(self, pipeline, data: Union[InputData, MultiModalData]):
         """ Launch preprocessing operations if it is necessary for pipeline fitting
 
@@ -252,6 +269,20 @@ class DataPreprocessor:
 
         return data
 
+    @exclude_ts
+    @exclude_multi_ts
+    @exclude_image
+    def _prepare_obligatory_unimodal_for_update(self, data: InputData, source_name: str) -> InputData:
+        """ Method process InputData for pipeline update method """
+        if data.supplementary_data.was_preprocessed:
+            # Preprocessing was already done - return data
+            return data
+
+        data = self._prepare_obligatory_unimodal_for_predict(data, source_name)
+        data = self._drop_rows_with_nan_in_target(data)
+        data.target = self._apply_target_encoding(data, source_name)
+        return data
+
     def _prepare_optional(self, pipeline, data: InputData, source_name: str):
         """ Perform optional fitting/preprocessing for unimodal data """
         if not data_type_is_table(data):
@@ -271,6 +302,26 @@ class DataPreprocessor:
             if not has_encoder:
                 data = self._apply_categorical_encoding(data, source_name)
 
+    def apply_optional_preprocessing(self, data: InputData, source_name: str,
+                                     has_imputer: bool, has_encoder: bool) -> InputData:
+        """ Apply the imputation and the categorical encoding inplace if the pipeline
+        does not contain its own imputer and encoder. Unlike :meth:`optional_prepare_for_predict`,
+        the structure of the pipeline is analysed by the caller in advance
+
+        :param data: data to preprocess
+        :param source_name: name of data source node
+        :param has_imputer: whether the pipeline contains the imputation for the source
+        :param has_encoder: whether the pipeline contains the encoding for the source
+        """
+        if not data_type_is_table(data):
+            return data
+
+        if not has_imputer and data_has_missing_values(data):
+            data = self._apply_imputation_unidata(data, source_name)
+        if not has_encoder and data_has_categorical_features(data):
+            data = self._apply_categorical_encoding(data, source_name)
+        return data
+
     def _find_features_full_of_nans(self, data: InputData, source_name: str):
         """ Find features with more than ALLOWED_NAN_PERCENT nan's
 
@@ -317,10 +368,26 @@ class DataPreprocessor:
         """ Remove extra spaces from data.
             Transform cells in columns from ' x ' to 'x'
         """
-        features = pd.DataFrame(data.features)
-        features = features.applymap(lambda x: x.strip() if isinstance(x, str) else x)
+        if data.features.dtype != object:
+            # Numerical table can not contain strings
+            return data
+
+        features = np.array(data.features)
+        column_types = (data.supplementary_data.column_types or {}).get('features')
+        if features.ndim == 2 and column_types is not None and len(column_types) == features.shape[1]:
+            # Column types are already known so only string columns are processed
+            columns_to_clean = [column_id for column_id, column_type in enumerate(column_types)
+                                if column_type == NAME_CLASS_STR]
+        else:
+            features = features.reshape((len(features), -1))
+            columns_to_clean = range(features.shape[1])
+
+        for column_id in columns_to_clean:
+            features[:, column_id] = [x.strip() if isinstance(x, str) else x for x in features[:, column_id]]
 
-        data.features = np.array(features)
+        # Restore numerical dtype of the columns stored as objects
+        features = pd.DataFrame(features).infer_objects().to_numpy()
+        data.features = features.reshape(data.features.shape)
         return data
 
     def label_encoding_for_fit(self, data: InputData, source_name: str = DEFAULT_SOURCE_NAME):
@@ -344,13 +411,13 @@ class DataPreprocessor:
             data.supplementary_data = encoder_output.supplementary_data
 
     def cut_dataset(self, data: InputData, border: int):
-        """ Cutting large dataset based on border (number of objects to remain) """
+        """ Cutting large dataset based on border (number of objects to remain).
+        The remaining objects keep the distribution of the target (see :func:`representative_sample_idx`) """
         self.log.info("Cut dataset due to it size is large")
-        # TODO: don't shuffle the data here, because it is done in GPComposer
-        data.shuffle()
-        data.idx = data.idx[:border]
-        data.features = data.features[:border]
-        data.target = data.target[:border]
+        sample_idx = representative_sample_idx(data, border)
+        data.idx = np.asarray(data.idx)[sample_idx]
+        data.features = data.features[sample_idx]
+        data.target = data.target[sample_idx]
 
     def _apply_imputation_unidata(self, data: InputData, source_name: str):
         """ Fill in the gaps in the data inplace.
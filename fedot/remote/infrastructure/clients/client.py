@@ -9,6 +9,12 @@ from fedot.core.utils import default_fedot_data_dir
 
 G = TypeVar('G', bound=Serializable)
 
+SUCCEEDED_STATUS = 'Succeeded'
+FAILED_STATUS = 'Failed'
+RUNNING_STATUS = 'Running'
+# Statuses of the remote tasks that will not change anymore
+FINISHED_STATUSES = (SUCCEEDED_STATUS, FAILED_STATUS, 'Timeout', 'Interrupted')
+
 
 class Client:
     """
@@ -35,6 +41,22 @@ class Client:
         """
         raise NotImplementedError()
 
+    def get_task_status(self, task_id) -> str:
+        """
+        Checks the status of the remote task without waiting
+        :param task_id: id of remote task
+        :return: status of the task, one of ``FINISHED_STATUSES`` if the task is finished
+        """
+        raise NotImplementedError()
+
+    @property
+    def supports_streaming(self) -> bool:
+        """
+        The client that checks the status of each task separately allows to stream the tasks
+        instead of waiting for the whole batch
+        """
+        return type(self).get_task_status is not Client.get_task_status
+
     def wait_until_ready(self) -> timedelta:
         """
         Delay execution until all remote tasks are ready
@@ -64,6 +64,9 @@ class DataMallClient(Client):
                                             config=config)
         return created_ex['id']
 
+    def get_task_status(self, task_id) -> str:
+        return self._get_execution(task_id)['status']
+
     def wait_until_ready(self) -> timedelta:
         statuses = ['']
         all_executions = self._get_executions()
@@ -0,0 +1,70 @@
+import io
+import os
+import shutil
+import time
+import zipfile
+from datetime import datetime, timedelta
+from typing import Optional
+
+import requests
+
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.remote.infrastructure.clients.client import Client, FINISHED_STATUSES
+
+DEFAULT_REQUEST_TIMEOUT = 30
+
+
+class HttpClient(Client):
+    """
+    Client of the evaluation server with plain HTTP interface (e.g. the bundled
+    :class:`~fedot.remote.infrastructure.local_server.LocalEvaluationServer`):
+
+    - ``POST /tasks`` with the task config as body creates the task and returns its ``id``;
+    - ``GET /tasks/<id>`` returns ``status`` of the task;
+    - ``GET /tasks/<id>/result`` returns zip archive with the fitted pipeline.
+
+    Connection params: ``url`` of the server and optional ``request_timeout`` in seconds.
+    """
+
+    def __init__(self, connect_params: dict, exec_params: dict, output_path: Optional[str] = None):
+        super().__init__(connect_params, exec_params, output_path)
+        self.url = connect_params['url'].rstrip('/')
+        self.request_timeout = connect_params.get('request_timeout', DEFAULT_REQUEST_TIMEOUT)
+        self._session = requests.Session()
+        self._task_ids = []
+
+    def create_task(self, config) -> str:
+        response = self._request('post', '/tasks', data=config)
+        task_id = response.json()['id']
+        self._task_ids.append(task_id)
+        return task_id
+
+    def get_task_status(self, task_id) -> str:
+        return self._request('get', f'/tasks/{task_id}').json()['status']
+
+    def wait_until_ready(self) -> timedelta:
+        start = datetime.now()
+        unfinished_ids = list(self._task_ids)
+        while unfinished_ids:
+            unfinished_ids = [task_id for task_id in unfinished_ids
+                              if self.get_task_status(task_id) not in FINISHED_STATUSES]
+            if unfinished_ids:
+                time.sleep(self.exec_params.get('poll_interval', 1))
+        self._task_ids = []
+        return datetime.now() - start
+
+    def download_result(self, execution_id: str, result_cls=Pipeline) -> Pipeline:
+        response = self._request('get', f'/tasks/{execution_id}/result')
+        results_path_out = os.path.join(self.output_path, f'execution-{execution_id}')
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            archive.extractall(results_path_out)
+        try:
+            return result_cls.from_serialized(os.path.join(results_path_out, 'fitted_pipeline', 'fitted_pipeline.json'))
+        finally:
+            shutil.rmtree(results_path_out, ignore_errors=True)
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        response = self._session.request(method, f'{self.url}{path}', timeout=self.request_timeout, **kwargs)
+        if response.status_code != 200:
+            raise ValueError(f'Request {method.upper()} {path} failed. Reason: {response.text}')
+        return response
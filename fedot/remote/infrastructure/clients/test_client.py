@@ -5,7 +5,7 @@ from uuid import uuid4
 
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.utils import default_fedot_data_dir
-from fedot.remote.infrastructure.clients.client import Client
+from fedot.remote.infrastructure.clients.client import Client, FAILED_STATUS, SUCCEEDED_STATUS
 from fedot.remote.run_pipeline import fit_pipeline
 
 
@@ -15,11 +15,16 @@ class TestClient(Client):
         self.exec_params = exec_params
         self.output_path = output_path if output_path else \
             os.path.join(default_fedot_data_dir(), 'remote_fit_results')
+        self._statuses = {}
         super().__init__(connect_params, exec_params, output_path)
 
     def create_task(self, config) -> str:
-        fit_pipeline(config)
-        return str(uuid4())
+        task_id = str(uuid4())
+        self._statuses[task_id] = SUCCEEDED_STATUS if fit_pipeline(config) else FAILED_STATUS
+        return task_id
+
+    def get_task_status(self, task_id) -> str:
+        return self._statuses[task_id]
 
     def wait_until_ready(self) -> timedelta:
         return timedelta()
@@ -0,0 +1,168 @@
+import argparse
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+from typing import Dict, Optional
+from uuid import uuid4
+
+from fedot.core.log import default_log
+from fedot.remote.infrastructure.clients.client import FAILED_STATUS, RUNNING_STATUS, SUCCEEDED_STATUS
+from fedot.remote.run_pipeline import fit_pipeline
+
+
+class LocalEvaluationServer:
+    """
+    Local stand-in of the remote evaluation server. It accepts the same task configs
+    as the remote one and fits the pipelines in the pool of worker processes,
+    so the remote evaluation can be used and tested without external infrastructure.
+    The interface is described in :class:`~fedot.remote.infrastructure.clients.http_client.HttpClient`.
+
+    :param host: host to listen
+    :param port: port to listen, 0 means any free port
+    :param n_workers: number of worker processes fitting the pipelines
+    :param work_dir: folder for the results of the tasks, temporary folder by default
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, n_workers: int = 1, work_dir: Optional[str] = None):
+        self.n_workers = n_workers
+        self._own_work_dir = work_dir is None
+        self.work_dir = tempfile.mkdtemp(prefix='fedot_server_') if work_dir is None else work_dir
+        self._tasks: Dict[str, Future] = {}
+        self._executor = None
+        self._thread = None
+        self.log = default_log(prefix='LocalEvaluationServer')
+        self._http_server = ThreadingHTTPServer((host, port), _make_handler(self))
+
+    @property
+    def url(self) -> str:
+        host, port = self._http_server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'LocalEvaluationServer':
+        """ Starts the workers and the request handling in the background thread """
+        # Spawned workers do not inherit the threads of the server
+        self._executor = ProcessPoolExecutor(self.n_workers, mp_context=get_context('spawn'))
+        self._thread = threading.Thread(target=self._http_server.serve_forever, daemon=True)
+        self._thread.start()
+        self.log.info(f'Evaluation server is started at {self.url} with {self.n_workers} workers')
+        return self
+
+    def serve_forever(self):
+        """ Starts the workers and handles the requests in the current thread until the interruption """
+        self._executor = ProcessPoolExecutor(self.n_workers, mp_context=get_context('spawn'))
+        self.log.info(f'Evaluation server is started at {self.url} with {self.n_workers} workers')
+        try:
+            self._http_server.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self):
+        """ Stops the request handling, cancels the waiting tasks and removes the temporary results """
+        if self._thread is not None:
+            self._http_server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._http_server.server_close()
+        if self._executor is not None:
+            for future in self._tasks.values():
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._own_work_dir:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def __enter__(self) -> 'LocalEvaluationServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.stop()
+
+    def create_task(self, config: bytes) -> str:
+        task_id = uuid4().hex
+        self._tasks[task_id] = self._executor.submit(fit_pipeline, config, self._output_path(task_id))
+        return task_id
+
+    def has_task(self, task_id: str) -> bool:
+        return task_id in self._tasks
+
+    def task_status(self, task_id: str) -> str:
+        future = self._tasks[task_id]
+        if not future.done():
+            return RUNNING_STATUS
+        if future.cancelled() or future.exception() is not None or not future.result():
+            return FAILED_STATUS
+        return SUCCEEDED_STATUS
+
+    def task_result(self, task_id: str) -> bytes:
+        """ Packs the fitted pipeline of the succeeded task to zip archive """
+        if self.task_status(task_id) != SUCCEEDED_STATUS:
+            raise ValueError(f'Task {task_id} is not succeeded')
+        output_path = self._output_path(task_id)
+        archive_bytes = io.BytesIO()
+        with zipfile.ZipFile(archive_bytes, 'w') as archive:
+            for root, _, files in os.walk(output_path):
+                for file_name in files:
+                    file_path = os.path.join(root, file_name)
+                    archive.write(file_path, os.path.relpath(file_path, output_path))
+        return archive_bytes.getvalue()
+
+    def _output_path(self, task_id: str) -> str:
+        return os.path.join(self.work_dir, task_id)
+
+
+def _make_handler(server: LocalEvaluationServer):
+    class EvaluationRequestHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip('/') != '/tasks':
+                return self._send_error(404, f'Unknown path {self.path}')
+            config = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            self._send_json({'id': server.create_task(config)})
+
+        def do_GET(self):
+            parts = self.path.strip('/').split('/')
+            if len(parts) not in (2, 3) or parts[0] != 'tasks' or not server.has_task(parts[1]):
+                return self._send_error(404, f'Unknown task or path {self.path}')
+            if len(parts) == 2:
+                return self._send_json({'id': parts[1], 'status': server.task_status(parts[1])})
+            if parts[2] != 'result':
+                return self._send_error(404, f'Unknown path {self.path}')
+            try:
+                result = server.task_result(parts[1])
+            except ValueError as ex:
+                return self._send_error(409, str(ex))
+            self._send(200, result, 'application/zip')
+
+        def log_message(self, format, *args):
+            server.log.debug(format % args)
+
+        def _send_json(self, content: dict):
+            self._send(200, json.dumps(content).encode('utf-8'), 'application/json')
+
+        def _send_error(self, code: int, message: str):
+            self._send(code, message.encode('utf-8'), 'text/plain')
+
+        def _send(self, code: int, body: bytes, content_type: str):
+            self.send_response(code)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return EvaluationRequestHandler
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local server fitting FEDOT pipelines for the remote evaluation')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--work-dir', default=None)
+    arguments = parser.parse_args()
+    LocalEvaluationServer(arguments.host, arguments.port, arguments.workers, arguments.work_dir).serve_forever()
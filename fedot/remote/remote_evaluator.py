@@ -1,6 +1,9 @@
 import os
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Any, TypeVar, Callable, Hashable
+from datetime import datetime
+from typing import List, Optional, Sequence, Any, TypeVar, Callable, Hashable, Iterator, Tuple
 
 import numpy as np
 
@@ -10,7 +13,7 @@ from fedot.core.data.data import InputData
 from fedot.core.log import default_log
 from fedot.core.pipelines.verification import verifier_for_task
 from fedot.core.utilities.serializable import Serializable
-from fedot.remote.infrastructure.clients.client import Client
+from fedot.remote.infrastructure.clients.client import Client, FINISHED_STATUSES, SUCCEEDED_STATUS
 from fedot.utilities.pattern_wrappers import singleton
 
 
@@ -31,6 +34,8 @@ class RemoteTaskParams:
     :param is_multi_modal: is train data multi-modal?
     :param var_names: variable names for fitting?
     :param max_parallel maximal number of parallel remote task
+    :param max_retries: number of repeated attempts to submit, fit and download the pipeline
+    :param poll_interval: delay between the checks of the running tasks status (in seconds)
     """
     mode: str = 'local'
     dataset_name: Optional[str] = None
@@ -40,6 +45,8 @@ class RemoteTaskParams:
     var_names: Optional[List] = None
     target: Optional[str] = None
     max_parallel: int = 7
+    max_retries: int = 2
+    poll_interval: float = 5.
 
 
 G = TypeVar('G', bound=Serializable)
@@ -74,9 +81,90 @@ class RemoteEvaluator:
         return self.remote_task_params is not None and self.remote_task_params.mode == 'remote'
 
     def compute_graphs(self, graphs: Sequence[G], verifier: Optional[GraphVerifier] = None) -> Sequence[G]:
+        """
+        Fits the graphs remotely. The graphs which are not fitted are returned as is.
+        If the client checks the tasks one by one, they are streamed by :meth:`iter_computed_graphs`,
+        otherwise the graphs are submitted by batches and each batch is waited for entirely
+        """
+        if self.client.supports_streaming:
+            final_graphs = list(graphs)
+            start = datetime.now()
+            for graph_id, graph in self.iter_computed_graphs(graphs, verifier):
+                final_graphs[graph_id] = graph
+            self._logger.info(f'REMOTE EXECUTION TIME {datetime.now() - start}')
+            return final_graphs
+        return self._compute_graphs_by_batches(graphs, verifier)
+
+    def iter_computed_graphs(self, graphs: Sequence[G],
+                             verifier: Optional[GraphVerifier] = None) -> Iterator[Tuple[int, G]]:
+        """
+        Streams the graphs to the client and yields the fitted graphs as soon as their tasks are finished.
+        No more than ``max_parallel`` tasks are running at once, the next graph is submitted
+        when any of the running tasks is finished. Failed submissions, tasks and downloads
+        are repeated up to ``max_retries`` times, then the graph is skipped.
+
+        :param graphs: graphs to fit
+        :param verifier: verifier of the graphs, invalid graphs are not submitted
+
+        :return: iterator over pairs of index of the graph in ``graphs`` and the fitted graph
+        """
+        params = self.remote_task_params
+        verifier = verifier or verifier_for_task()
+        pending = deque((graph_id, 0) for graph_id in range(len(graphs)))
+        running = {}
+
+        while pending or running:
+            # Back-pressure: the new tasks are submitted only for the free slots
+            while pending and len(running) < params.max_parallel:
+                graph_id, attempt = pending.popleft()
+                try:
+                    task_id = self._create_graph_task(graphs[graph_id], verifier)
+                except Exception as ex:
+                    self._retry_or_skip(pending, graph_id, attempt, f'submission error <{ex}>')
+                    # The server may be overloaded, so the next submission is delayed
+                    time.sleep(params.poll_interval * 2 ** attempt)
+                    continue
+                if task_id is not None:
+                    running[task_id] = (graph_id, attempt)
+
+            finished = self._finished_tasks(running)
+            for task_id, status in finished.items():
+                graph_id, attempt = running.pop(task_id)
+                if status == SUCCEEDED_STATUS:
+                    try:
+                        graph = self.client.download_result(task_id)
+                    except Exception as ex:
+                        status = f'download error <{ex}>'
+                    else:
+                        yield graph_id, graph
+                        continue
+                self._retry_or_skip(pending, graph_id, attempt, status)
+            if running and not finished:
+                time.sleep(params.poll_interval)
+
+    def _finished_tasks(self, running: dict) -> dict:
+        finished = {}
+        for task_id in running:
+            try:
+                status = self.client.get_task_status(task_id)
+            except Exception as ex:
+                # The status will be requested again with the next check
+                self._logger.warning(f'Status of the remote task {task_id} is unknown: {ex}')
+                continue
+            if status in FINISHED_STATUSES:
+                finished[task_id] = status
+        return finished
+
+    def _retry_or_skip(self, pending: deque, graph_id: int, attempt: int, reason: str):
+        if attempt < self.remote_task_params.max_retries:
+            self._logger.info(f'Remote evaluation of graph {graph_id} is repeated after {reason}')
+            pending.append((graph_id, attempt + 1))
+        else:
+            self._logger.warning(f'Remote evaluation of graph {graph_id} is skipped after {reason}')
+
+    def _compute_graphs_by_batches(self, graphs: Sequence[G], verifier: Optional[GraphVerifier] = None) -> Sequence[G]:
         params = self.remote_task_params
         verifier = verifier or verifier_for_task()
-
         client = self.client
         execution_ids = {}
         graph_batches = _prepare_batches(graphs, params.max_parallel)
@@ -139,7 +227,7 @@ def _get_config(graph_json: dict, params: RemoteTaskParams, client_params: dict,
         if params.train_data_idx is not None else []
 
     data_name = params.dataset_name
-    if conn_params is not None and conn_params:
+    if conn_params and 'DATA_ID' in conn_params:
         train_data = f"{client_params['container_input_path']}/data/{conn_params['DATA_ID']}/{data_name}.csv"
     else:
         train_data = f"{client_params['container_input_path']}/{data_name}.csv"
@@ -1,7 +1,7 @@
 import json
 import os
 import sys
-from typing import Union
+from typing import Optional, Union
 
 from fedot.core.data.data import InputData
 from fedot.core.data.multi_modal import MultiModalData
@@ -43,11 +43,14 @@ def _load_data(config):
     return train_data
 
 
-def fit_pipeline(config_file: Union[str, bytes]) -> bool:
+def fit_pipeline(config_file: Union[str, bytes], output_path: Optional[str] = None) -> bool:
     logger = default_log(prefix='pipeline_fitting_logger')
 
     config = \
         PipelineRunConfig().load_from_file(config_file)
+    if output_path is not None:
+        # The server running several tasks at once saves them to the separate folders
+        config.output_path = output_path
 
     verifier = verifier_for_task(config.task.task_type)
 
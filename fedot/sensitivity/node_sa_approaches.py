@@ -16,6 +16,7 @@ from fedot.core.pipelines.verification import verify_pipeline
 from fedot.core.repository.operation_types_repository import OperationTypesRepository
 from fedot.core.utils import default_fedot_data_dir
 from fedot.sensitivity.sa_requirements import ReplacementAnalysisMetaParams, SensitivityAnalysisRequirements
+from fedot.sensitivity.sample_evaluation import SampleEvaluator, unfit_downstream
 from fedot.utilities.define_metric_by_task import MetricByTask
 
 
@@ -25,11 +26,13 @@ class NodeAnalysis:
         approaches: methods applied to nodes to modify the pipeline or analyze certain operations.
             Default: [``NodeDeletionAnalyze``, ``NodeTuneAnalyze``, ``NodeReplaceOperationAnalyze``]
         path_to_save: path to save results to. Default: ``~home/Fedot/sensitivity``
+        evaluator: evaluator of the sampled pipelines sharing the time budget with the other analyses.
+            Default: new evaluator defined by the ``approaches_requirements``
     """
 
     def __init__(self, approaches: Optional[List[Type['NodeAnalyzeApproach']]] = None,
                  approaches_requirements: SensitivityAnalysisRequirements = None,
-                 path_to_save=None):
+                 path_to_save=None, evaluator: Optional[SampleEvaluator] = None):
 
         self.approaches = [NodeDeletionAnalyze, NodeReplaceOperationAnalyze] if approaches is None else approaches
 
@@ -39,6 +42,8 @@ class NodeAnalysis:
 
         self.approaches_requirements = \
             SensitivityAnalysisRequirements() if approaches_requirements is None else approaches_requirements
+        self.evaluator = evaluator or SampleEvaluator(self.approaches_requirements.n_jobs,
+                                                      self.approaches_requirements.timeout)
 
     def analyze(self, pipeline: Pipeline, node: Node,
                 train_data: InputData, test_data: InputData,
@@ -64,7 +69,8 @@ class NodeAnalysis:
                          train_data=train_data,
                          test_data=test_data,
                          requirements=self.approaches_requirements,
-                         path_to_save=self.path_to_save).analyze(node=node)
+                         path_to_save=self.path_to_save,
+                         evaluator=self.evaluator).analyze(node=node)
 
         # TODO remove conflict with requirements.is_save
         if is_save:
@@ -79,9 +85,10 @@ class NodeAnalysis:
     @staticmethod
     def _get_node_index(train_data: InputData, results: dict):
         total_index = None
-        if NodeReplaceOperationAnalyze.__name__ in results.keys() and NodeDeletionAnalyze.__name__ in results.keys():
+        # The results can be empty if the samples were not evaluated within the time budget
+        if results.get(NodeReplaceOperationAnalyze.__name__) and results.get(NodeDeletionAnalyze.__name__):
             task = train_data.task.task_type
-            app_models, _ = OperationTypesRepository().suitable_operation(task_type=task)
+            app_models = OperationTypesRepository().suitable_operation(task_type=task)
             total_operations_number = len(app_models)
 
             replacement_candidates = results[NodeReplaceOperationAnalyze.__name__]
@@ -128,17 +135,19 @@ class NodeAnalyzeApproach(ABC):
         train_data: data used for :obj:`Pipeline` training
         test_data: data used for :obj:`Pipeline` validation
         path_to_save: path to save results to. Default: ``~home/Fedot/sensitivity``
+        evaluator: evaluator of the sampled pipelines. Default: new evaluator defined by the ``requirements``
     """
 
     def __init__(self, pipeline: Pipeline, train_data, test_data: InputData,
                  requirements: SensitivityAnalysisRequirements = None,
-                 path_to_save=None):
+                 path_to_save=None, evaluator: Optional[SampleEvaluator] = None):
         self._pipeline = pipeline
         self._train_data = train_data
         self._test_data = test_data
         self._origin_metric = None
         self._requirements = \
             SensitivityAnalysisRequirements() if requirements is None else requirements
+        self._evaluator = evaluator or SampleEvaluator(self._requirements.n_jobs, self._requirements.timeout)
 
         self._path_to_save = \
             join(default_fedot_data_dir(), 'sensitivity', 'nodes_sensitivity') if path_to_save is None else path_to_save
@@ -162,15 +171,25 @@ class NodeAnalyzeApproach(ABC):
         """Changes the pipeline according to the approach"""
         pass
 
-    def _compare_with_origin_by_metric(self, changed_pipeline: Pipeline) -> float:
+    def _compare_with_origin_by_metric(self, changed_pipelines: List[Pipeline]) -> List[Optional[float]]:
+        """Returns the ratio of the metric of each changed pipeline to the metric of the origin one
+        or ``None`` for the pipelines not evaluated within the time budget"""
         metric = MetricByTask(self._train_data.task.task_type)
 
         if not self._origin_metric:
             self._origin_metric = self._get_metric_value(pipeline=self._pipeline, metric=metric)
 
-        changed_pipeline_metric = self._get_metric_value(pipeline=changed_pipeline, metric=metric)
+        changed_pipelines_metrics = self._evaluator.evaluate(changed_pipelines, self._train_data, self._test_data,
+                                                             metric.get_value)
 
-        return changed_pipeline_metric / self._origin_metric
+        return [None if changed_metric is None else changed_metric / self._origin_metric
+                for changed_metric in changed_pipelines_metrics]
+
+    def _sample_pipeline(self) -> Pipeline:
+        """Copies the origin pipeline fitting it before, so its fitted operations are reused by the samples"""
+        if not self._pipeline.is_fitted:
+            self._pipeline.fit(self._train_data)
+        return deepcopy(self._pipeline)
 
     def _get_metric_value(self, pipeline: Pipeline, metric: MetricByTask) -> float:
         pipeline.fit(self._train_data)
@@ -183,9 +202,10 @@ class NodeAnalyzeApproach(ABC):
 
 class NodeDeletionAnalyze(NodeAnalyzeApproach):
     def __init__(self, pipeline: Pipeline, train_data: InputData, test_data: InputData,
-                 requirements: SensitivityAnalysisRequirements = None, path_to_save=None):
+                 requirements: SensitivityAnalysisRequirements = None, path_to_save=None,
+                 evaluator: Optional[SampleEvaluator] = None):
         super().__init__(pipeline, train_data, test_data, requirements,
-                         path_to_save)
+                         path_to_save, evaluator)
 
     def analyze(self, node: Node, **kwargs) -> Union[List[dict], List[float]]:
         """
@@ -193,7 +213,8 @@ class NodeDeletionAnalyze(NodeAnalyzeApproach):
             node: :obj:`Node` object to analyze
 
         Returns:
-            the ratio of modified pipeline score to origin score
+            the ratio of modified pipeline score to origin score,
+            empty if the modified pipeline was not evaluated within the time budget
         """
 
         if node is self._pipeline.root_node:
@@ -202,12 +223,12 @@ class NodeDeletionAnalyze(NodeAnalyzeApproach):
         else:
             shortened_pipeline = self.sample(node)
             if shortened_pipeline:
-                loss = self._compare_with_origin_by_metric(shortened_pipeline)
+                loss, = self._compare_with_origin_by_metric([shortened_pipeline])
                 del shortened_pipeline
             else:
                 loss = 1
 
-            return [loss]
+            return [] if loss is None else [loss]
 
     def sample(self, node: Node):
         """
@@ -217,15 +238,18 @@ class NodeDeletionAnalyze(NodeAnalyzeApproach):
             :obj:`Pipeline`: pipeline without node
         """
 
-        pipeline_sample = deepcopy(self._pipeline)
+        pipeline_sample = self._sample_pipeline()
         node_index_to_delete = self._pipeline.nodes.index(node)
         node_to_delete = pipeline_sample.nodes[node_index_to_delete]
+        children = pipeline_sample.node_children(node_to_delete)
         pipeline_sample.delete_node(node_to_delete)
         try:
             verify_pipeline(pipeline_sample)
         except ValueError as ex:
             self.log.info(f'Can not delete node. Deletion of this node leads to {ex}')
             return None
+        # The children get the other inputs, the nodes upstream of the deleted one are reused
+        unfit_downstream(pipeline_sample, children)
 
         return pipeline_sample
 
@@ -238,9 +262,10 @@ class NodeReplaceOperationAnalyze(NodeAnalyzeApproach):
     """
 
     def __init__(self, pipeline: Pipeline, train_data: InputData, test_data: InputData,
-                 requirements: SensitivityAnalysisRequirements = None, path_to_save=None):
+                 requirements: SensitivityAnalysisRequirements = None, path_to_save=None,
+                 evaluator: Optional[SampleEvaluator] = None):
         super().__init__(pipeline, train_data, test_data, requirements,
-                         path_to_save)
+                         path_to_save, evaluator)
 
     def analyze(self, node: Node, **kwargs) -> Union[List[dict], List[float]]:
         """
@@ -248,7 +273,8 @@ class NodeReplaceOperationAnalyze(NodeAnalyzeApproach):
             node: :obj:`Node` object to analyze
 
         Returns:
-            the ratio of modified pipeline score to origin score
+            the ratio of modified pipeline score to origin score for each replacement
+            evaluated within the time budget
         """
 
         requirements: ReplacementAnalysisMetaParams = self._requirements.replacement_meta
@@ -259,8 +285,9 @@ class NodeReplaceOperationAnalyze(NodeAnalyzeApproach):
 
         loss_values = []
         new_nodes_types = []
-        for sample_pipeline in samples:
-            loss_per_sample = self._compare_with_origin_by_metric(sample_pipeline)
+        for sample_pipeline, loss_per_sample in zip(samples, self._compare_with_origin_by_metric(samples)):
+            if loss_per_sample is None:
+                continue
             loss_values.append(loss_per_sample)
 
             new_node = sample_pipeline.nodes[node_id]
@@ -293,11 +320,14 @@ class NodeReplaceOperationAnalyze(NodeAnalyzeApproach):
 
         samples = list()
         for replacing_node in nodes_to_replace_to:
-            sample_pipeline = deepcopy(self._pipeline)
+            sample_pipeline = self._sample_pipeline()
             replaced_node_index = self._pipeline.nodes.index(node)
             replaced_node = sample_pipeline.nodes[replaced_node_index]
+            # The replacing nodes can be shared by the analyses of several nodes, so their copies are inserted
+            new_node = deepcopy(replacing_node)
             sample_pipeline.update_node(old_node=replaced_node,
-                                        new_node=replacing_node)
+                                        new_node=new_node)
+            unfit_downstream(sample_pipeline, [new_node])
             samples.append(sample_pipeline)
 
         return samples
@@ -306,7 +336,7 @@ class NodeReplaceOperationAnalyze(NodeAnalyzeApproach):
                          number_of_operations=None) -> List[Node]:
         task = self._train_data.task.task_type
         # Get models
-        app_models, _ = OperationTypesRepository().suitable_operation(task_type=task)
+        app_models = OperationTypesRepository().suitable_operation(task_type=task)
         # Get data operations for such task
         app_data_operations = OperationTypesRepository('data_operation').suitable_operation(
             task_type=task)
@@ -13,6 +13,7 @@ from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.utils import default_fedot_data_dir
 from fedot.sensitivity.node_sa_approaches import NodeAnalysis, NodeAnalyzeApproach
 from fedot.sensitivity.sa_requirements import SensitivityAnalysisRequirements
+from fedot.sensitivity.sample_evaluation import SampleEvaluator
 
 
 class NodesAnalysis:
@@ -29,12 +30,15 @@ class NodesAnalysis:
             Default: [:obj:`NodeDeletionAnalyze`, :obj:`NodeReplaceOperationAnalyze`]
         nodes_to_analyze: nodes to analyze. Default: all nodes
         path_to_save: path to save results to. Default: ``~home/Fedot/sensitivity``
+        evaluator: evaluator of the sampled pipelines sharing the time budget with the other analyses.
+            Default: new evaluator defined by the ``requirements``
     """
 
     def __init__(self, pipeline: Pipeline, train_data: InputData, test_data: InputData,
                  approaches: Optional[List[Type[NodeAnalyzeApproach]]] = None,
                  requirements: SensitivityAnalysisRequirements = None,
-                 path_to_save=None, nodes_to_analyze: List[Node] = None):
+                 path_to_save=None, nodes_to_analyze: List[Node] = None,
+                 evaluator: Optional[SampleEvaluator] = None):
 
         self.pipeline = pipeline
         self.train_data = train_data
@@ -43,6 +47,7 @@ class NodesAnalysis:
         self.requirements = \
             SensitivityAnalysisRequirements() if requirements is None else requirements
         self.metric = self.requirements.metric
+        self.evaluator = evaluator or SampleEvaluator(self.requirements.n_jobs, self.requirements.timeout)
         self.log = default_log(self)
         self.path_to_save = \
             join(default_fedot_data_dir(), 'sensitivity', 'nodes_sensitivity') if path_to_save is None else path_to_save
@@ -62,10 +67,16 @@ class NodesAnalysis:
 
         nodes_results = dict()
         operation_types = []
+        self.evaluator.start()
         for node in self.nodes_to_analyze:
+            if self.evaluator.is_time_over:
+                self.log.warning(f'Time budget is over, {len(self.nodes_to_analyze) - len(nodes_results)} '
+                                 f'nodes were not analyzed')
+                break
             node_result = NodeAnalysis(approaches=self.approaches,
                                        approaches_requirements=self.requirements,
-                                       path_to_save=self.path_to_save). \
+                                       path_to_save=self.path_to_save,
+                                       evaluator=self.evaluator). \
                 analyze(pipeline=self.pipeline, node=node,
                         train_data=self.train_data,
                         test_data=self.test_data)
@@ -77,7 +88,7 @@ class NodesAnalysis:
         if self.requirements.is_visualize:
             self._visualize_result_per_approach(nodes_results, operation_types)
 
-        if len(self.nodes_to_analyze) == len(self.pipeline.nodes):
+        if len(nodes_results) == len(self.pipeline.nodes):
             self._visualize_degree_correlation(nodes_results)
 
         if self.requirements.is_save:
@@ -15,6 +15,7 @@ from fedot.sensitivity.operations_hp_sensitivity.sa_and_sample_methods import (
     sample_method_by_name
 )
 from fedot.sensitivity.sa_requirements import HyperparamsAnalysisMetaParams, SensitivityAnalysisRequirements
+from fedot.sensitivity.sample_evaluation import SampleEvaluator, unfit_downstream
 
 
 class MultiOperationsHPAnalyze:
@@ -28,16 +29,18 @@ class MultiOperationsHPAnalyze:
         requirements: extra requirements to define specific details for different approaches.
             See :class:`SensitivityAnalysisRequirements` class documentation.
         path_to_save: path to save results to. Default: ``~home/Fedot/sensitivity/``
+        evaluator: evaluator of the sampled pipelines. Default: new evaluator defined by the ``requirements``
     """
 
     def __init__(self, pipeline: Pipeline, train_data: InputData, test_data: InputData,
                  requirements: SensitivityAnalysisRequirements = None,
-                 path_to_save=None):
+                 path_to_save=None, evaluator: Optional[SampleEvaluator] = None):
         self._pipeline = pipeline
         self._train_data = train_data
         self._test_data = test_data
         self.problem: Optional[Problem] = None
         requirements = SensitivityAnalysisRequirements() if requirements is None else requirements
+        self._evaluator = evaluator or SampleEvaluator(requirements.n_jobs, requirements.timeout)
         self.requirements: HyperparamsAnalysisMetaParams = requirements.hp_analysis_meta
         self.analyze_method = analyze_method_by_name.get(self.requirements.analyze_method)
         self.sample_method = sample_method_by_name.get(self.requirements.sample_method)
@@ -53,7 +56,8 @@ class MultiOperationsHPAnalyze:
         Default: Sobol method with Saltelli sample algorithm
 
         Returns:
-            dict: ``Main`` and total ``Sobol`` indices for every parameter per node
+            dict: ``Main`` and total ``Sobol`` indices for every parameter per node,
+            empty if not all the samples were evaluated within the time budget
         """
 
         if not self._pipeline.is_fitted:
@@ -67,6 +71,10 @@ class MultiOperationsHPAnalyze:
         self.log.info('Making hyperparameters samples')
         samples = self.sample(self.requirements.sample_size)
         response_matrix = self._get_response_matrix(samples)
+        if response_matrix is None:
+            self.log.warning('Hyperparameters sensitivity analysis is skipped: '
+                             'not all the samples were evaluated within the time budget')
+            return {}
 
         self.log.info('Start hyperparameters sensitivity analysis')
         indices = self.analyze_method(self.problem.dictionary, samples, response_matrix)
@@ -97,20 +105,21 @@ class MultiOperationsHPAnalyze:
         sampled_pipelines: List[Pipeline] = list()
         for sample in params:
             copied_pipeline = deepcopy(self._pipeline)
+            changed_nodes = []
             for node_id, params_per_node in enumerate(sample):
-                copied_pipeline.nodes[node_id].parameters = params_per_node
-                sampled_pipelines.append(copied_pipeline)
+                if params_per_node is not None:
+                    copied_pipeline.nodes[node_id].parameters = params_per_node
+                    changed_nodes.append(copied_pipeline.nodes[node_id])
+            # The nodes without the analyzed parameters and upstream of the changed ones keep their fitted operations
+            unfit_downstream(copied_pipeline, changed_nodes)
+            sampled_pipelines.append(copied_pipeline)
 
         return sampled_pipelines
 
-    def _get_response_matrix(self, samples: List[Pipeline]):
-        operation_response_matrix = []
-        for sampled_pipeline in samples:
-            sampled_pipeline.fit(self._train_data)
-            prediction = sampled_pipeline.predict(self._test_data)
-            mse_metric = MSE().metric(reference=self._test_data,
-                                      predicted=prediction)
-            operation_response_matrix.append(mse_metric)
+    def _get_response_matrix(self, samples: List[Pipeline]) -> Optional[np.ndarray]:
+        operation_response_matrix = self._evaluator.evaluate(samples, self._train_data, self._test_data, MSE.metric)
+        if any(response is None for response in operation_response_matrix):
+            return None
 
         return np.array(operation_response_matrix)
 
@@ -1,13 +1,11 @@
-from copy import deepcopy
 from os.path import join
-from threading import Lock, Thread
 from typing import List, Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 from sklearn.metrics import mean_squared_error
 
-from fedot.core.data.data import InputData
+from fedot.core.data.data import InputData, OutputData
 from fedot.core.log import default_log
 from fedot.core.operations.operation_template import extract_operation_params
 from fedot.core.pipelines.node import Node
@@ -20,14 +18,15 @@ from fedot.sensitivity.operations_hp_sensitivity.sa_and_sample_methods import (
     sample_method_by_name
 )
 from fedot.sensitivity.sa_requirements import HyperparamsAnalysisMetaParams, SensitivityAnalysisRequirements
+from fedot.sensitivity.sample_evaluation import SampleEvaluator, unfit_downstream
 
 
 class OneOperationHPAnalyze(NodeAnalyzeApproach):
-    lock = Lock()
 
     def __init__(self, pipeline: Pipeline, train_data, test_data: InputData,
-                 requirements: SensitivityAnalysisRequirements = None, path_to_save=None):
-        super().__init__(pipeline, train_data, test_data, path_to_save)
+                 requirements: SensitivityAnalysisRequirements = None, path_to_save=None,
+                 evaluator: Optional[SampleEvaluator] = None):
+        super().__init__(pipeline, train_data, test_data, requirements, path_to_save, evaluator)
 
         requirements = SensitivityAnalysisRequirements() if requirements is None else requirements
         self.requirements: HyperparamsAnalysisMetaParams = requirements.hp_analysis_meta
@@ -57,6 +56,10 @@ class OneOperationHPAnalyze(NodeAnalyzeApproach):
         samples = self.sample(self.requirements.sample_size, node)
 
         response_matrix = self._get_response_matrix(samples)
+        if response_matrix is None:
+            self.log.warning(f'Hyperparameters sensitivity analysis of {self.operation_type} is skipped: '
+                             f'not all the samples were evaluated within the time budget')
+            return {}
         indices = self.analyze_method(self.problem.dictionary, samples, response_matrix)
         converted_to_json_indices = self._convert_indices_to_json(problem=self.problem,
                                                                   si=indices)
@@ -84,21 +87,20 @@ class OneOperationHPAnalyze(NodeAnalyzeApproach):
     def _apply_params_to_node(self, params: List[dict], node: Node) -> List[Pipeline]:
         sampled_pipelines: List[Pipeline] = list()
         for sample in params:
-            copied_pipeline = deepcopy(self._pipeline)
+            copied_pipeline = self._sample_pipeline()
             node_id = self._pipeline.nodes.index(node)
             copied_pipeline.nodes[node_id].parameters = sample
+            # Only the analyzed node and the nodes downstream of it are fitted again
+            unfit_downstream(copied_pipeline, [copied_pipeline.nodes[node_id]])
             sampled_pipelines.append(copied_pipeline)
 
         return sampled_pipelines
 
-    def _get_response_matrix(self, samples: List[Pipeline]):
-        operation_response_matrix = []
-        for sampled_pipeline in samples:
-            sampled_pipeline.fit(self._train_data)
-            prediction = sampled_pipeline.predict(self._test_data)
-            mse_metric = mean_squared_error(y_true=self._test_data.target,
-                                            y_pred=prediction.predict)
-            operation_response_matrix.append(mse_metric)
+    def _get_response_matrix(self, samples: List[Pipeline]) -> Optional[np.ndarray]:
+        operation_response_matrix = self._evaluator.evaluate(samples, self._train_data, self._test_data,
+                                                             _mean_squared_error)
+        if any(response is None for response in operation_response_matrix):
+            return None
 
         return np.array(operation_response_matrix)
 
@@ -107,15 +109,9 @@ class OneOperationHPAnalyze(NodeAnalyzeApproach):
         transposed_samples = samples.T
         converted_samples = self.problem.convert_for_dispersion_analysis(transposed_samples)
 
-        jobs = [Thread(target=self._evaluate_variance,
-                       args=(params, transposed_samples[index], node))
-                for index, params in enumerate(converted_samples)]
-
-        for job in jobs:
-            job.start()
-
-        for job in jobs:
-            job.join()
+        # The samples of each parameter are evaluated by the parallel processes
+        for index, params in enumerate(converted_samples):
+            self._evaluate_variance(params, transposed_samples[index], node)
 
         self._visualize_variance()
 
@@ -128,12 +124,13 @@ class OneOperationHPAnalyze(NodeAnalyzeApproach):
         # percentage ratio
         samples = (samples - default_param_value) / default_param_value
         response_matrix = self._get_response_matrix(pipelines_with_applied_params)
+        if response_matrix is None:
+            self.log.warning(f'Dispersion of {param_name} is not analyzed within the time budget')
+            return
         response_matrix = (response_matrix - np.mean(response_matrix)) / \
                           (max(response_matrix) - min(response_matrix))
 
-        OneOperationHPAnalyze.lock.acquire()
         self.data_under_lock[f'{param_name}'] = [samples.reshape(1, -1)[0], response_matrix]
-        OneOperationHPAnalyze.lock.release()
 
     def _visualize_variance(self):
         x_ticks_param = list()
@@ -177,3 +174,7 @@ class OneOperationHPAnalyze(NodeAnalyzeApproach):
         }
 
         return data
+
+
+def _mean_squared_error(reference: InputData, predicted: OutputData) -> float:
+    return mean_squared_error(y_true=reference.target, y_pred=predicted.predict)
@@ -8,6 +8,7 @@ from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.utils import default_fedot_data_dir
 from fedot.sensitivity.operations_hp_sensitivity.multi_operations_sensitivity import MultiOperationsHPAnalyze
 from fedot.sensitivity.sa_requirements import SensitivityAnalysisRequirements
+from fedot.sensitivity.sample_evaluation import SampleEvaluator
 
 
 class PipelineAnalysis:
@@ -22,18 +23,21 @@ class PipelineAnalysis:
         requirements: extra requirements to define specific details for different approaches
             See :class:`SensitivityAnalysisRequirements` class documentation
         path_to_save: path to save results to. Default: ``~home/Fedot/sensitivity/pipeline_sa``
+        evaluator: evaluator of the sampled pipelines sharing the time budget with the other analyses.
+            Default: new evaluator defined by the ``requirements``
     """
 
     def __init__(self, pipeline: Pipeline, train_data: InputData, test_data: InputData,
                  approaches: Optional[List[Type[MultiOperationsHPAnalyze]]] = None,
                  requirements: SensitivityAnalysisRequirements = None,
-                 path_to_save=None):
+                 path_to_save=None, evaluator: Optional[SampleEvaluator] = None):
         self.pipeline = pipeline
         self.train_data = train_data
         self.test_data = test_data
         self.requirements = \
             SensitivityAnalysisRequirements() if requirements is None else requirements
         self.approaches = [MultiOperationsHPAnalyze] if approaches is None else approaches
+        self.evaluator = evaluator or SampleEvaluator(self.requirements.n_jobs, self.requirements.timeout)
         self.path_to_save = \
             join(default_fedot_data_dir(), 'sensitivity', 'pipeline_sa') if path_to_save is None else path_to_save
 
@@ -44,11 +48,16 @@ class PipelineAnalysis:
         """
 
         all_approaches_results = dict()
+        self.evaluator.start()
         for approach in self.approaches:
+            if self.evaluator.is_time_over:
+                self.log.warning(f'Time budget is over, {approach.__name__} was not applied')
+                break
             analyze_result = approach(pipeline=self.pipeline,
                                       train_data=self.train_data,
                                       test_data=self.test_data,
-                                      requirements=self.requirements).analyze()
+                                      requirements=self.requirements,
+                                      evaluator=self.evaluator).analyze()
             all_approaches_results[f'{approach.__name__}'] = analyze_result
 
         if self.requirements.is_save:
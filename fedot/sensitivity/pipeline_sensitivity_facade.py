@@ -9,6 +9,7 @@ from fedot.sensitivity.nodes_sensitivity import NodesAnalysis
 from fedot.sensitivity.operations_hp_sensitivity.multi_operations_sensitivity import MultiOperationsHPAnalyze
 from fedot.sensitivity.pipeline_sensitivity import PipelineAnalysis
 from fedot.sensitivity.sa_requirements import SensitivityAnalysisRequirements
+from fedot.sensitivity.sample_evaluation import SampleEvaluator
 
 
 class PipelineSensitivityAnalysis:
@@ -22,7 +23,8 @@ class PipelineSensitivityAnalysis:
         approaches: methods applied to pipeline. Default: ``None``
         nodes_to_analyze: nodes to analyze. Default: all nodes
         requirements: extra requirements to define specific details for different approaches.
-            See :class:`SensitivityAnalysisRequirements` class documentation
+            See :class:`SensitivityAnalysisRequirements` class documentation,
+            its ``timeout`` limits the nodes and the pipeline analyses together
         path_to_save: path to save results to. Default: ``~home/Fedot/sensitivity/``
     """
 
@@ -45,13 +47,18 @@ class PipelineSensitivityAnalysis:
             nodes_analyze_approaches = None
             pipeline_analyze_approaches = None
 
+        requirements = SensitivityAnalysisRequirements() if requirements is None else requirements
+        # Both analyses evaluate their samples with the same evaluator, so they share its time budget
+        evaluator = SampleEvaluator(requirements.n_jobs, requirements.timeout)
+
         self._nodes_analyze = NodesAnalysis(pipeline=pipeline,
                                             train_data=train_data,
                                             test_data=test_data,
                                             approaches=nodes_analyze_approaches,
                                             requirements=requirements,
                                             nodes_to_analyze=nodes_to_analyze,
-                                            path_to_save=path_to_save, log=log)
+                                            path_to_save=path_to_save,
+                                            evaluator=evaluator)
 
         self._pipeline_analyze = PipelineAnalysis(pipeline=pipeline,
                                                   train_data=train_data,
@@ -59,7 +66,7 @@ class PipelineSensitivityAnalysis:
                                                   approaches=pipeline_analyze_approaches,
                                                   requirements=requirements,
                                                   path_to_save=path_to_save,
-                                                  log=log)
+                                                  evaluator=evaluator)
 
     def analyze(self):
         """Applies defined sensitivity analysis approaches
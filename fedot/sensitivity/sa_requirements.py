@@ -1,3 +1,4 @@
+import datetime
 from typing import List, Optional
 
 from fedot.core.pipelines.node import Node
@@ -24,6 +25,9 @@ class SensitivityAnalysisRequirements:
         is_visualize: defines whether the SA visualization needs to be saved to ``.png`` files.
         is_save_results_to_json: defines whether the SA indices needs to be saved to ``.json`` file.
         metric: metric used for validation. Default: see :obj:`MetricByTask`
+        n_jobs: number of processes evaluating the sampled pipelines, ``-1`` means all cores
+        timeout: time budget shared by all the analyses, the samples left after it are not evaluated.
+            ``None`` means no limit
     """
 
     def __init__(self,
@@ -34,7 +38,9 @@ class SensitivityAnalysisRequirements:
                  replacement_nodes_to_replace_to: Optional[List[Node]] = None,
                  replacement_number_of_random_operations: Optional[int] = None,
                  is_visualize: bool = True,
-                 is_save_results_to_json: bool = True):
+                 is_save_results_to_json: bool = True,
+                 n_jobs: int = 1,
+                 timeout: Optional[datetime.timedelta] = None):
         self.metric = metric
         self.hp_analysis_meta = HyperparamsAnalysisMetaParams(hyperparams_analyze_method,
                                                               hyperparams_sample_method,
@@ -46,3 +52,5 @@ class SensitivityAnalysisRequirements:
 
         self.is_visualize = is_visualize
         self.is_save = is_save_results_to_json
+        self.n_jobs = n_jobs
+        self.timeout = timeout
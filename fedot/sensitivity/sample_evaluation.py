@@ -0,0 +1,111 @@
+import datetime
+import time
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from joblib import Parallel, delayed
+
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.log import default_log
+from fedot.core.pipelines.node import Node
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.utilities.cpu_budget import CPUBudget, CoresShare
+
+SampleMetric = Callable[[InputData, OutputData], float]
+
+
+class SampleEvaluator:
+    """Evaluates the metric of the pipelines sampled by the sensitivity analysis approaches
+    in the parallel processes. The time budget starts with the first evaluation and is shared
+    by all the analyses using the same evaluator: when it expires, the remaining samples are not evaluated.
+
+    The fitted operations of the sampled pipeline are reused, so only the changed nodes
+    and the nodes downstream of them are fitted (see :func:`unfit_downstream`).
+
+    Args:
+        n_jobs: number of processes evaluating the samples, -1 means all cores
+        timeout: time budget of all the evaluations, ``None`` means no limit
+    """
+
+    def __init__(self, n_jobs: int = 1, timeout: Optional[datetime.timedelta] = None):
+        self.cpu_budget = CPUBudget(n_jobs)
+        self.timeout = timeout
+        self._deadline: Optional[float] = None
+        self.log = default_log(self)
+
+    def start(self):
+        """Starts the time budget if it is not started yet"""
+        if self._deadline is None and self.timeout is not None:
+            self._deadline = time.time() + self.timeout.total_seconds()
+
+    @property
+    def is_time_over(self) -> bool:
+        return self._deadline is not None and time.time() >= self._deadline
+
+    def evaluate(self, pipelines: Sequence[Pipeline], train_data: InputData, test_data: InputData,
+                 metric: SampleMetric) -> List[Optional[float]]:
+        """Fits the pipelines on the train data and computes the metric of their prediction of the test data
+
+        Args:
+            pipelines: sampled pipelines
+            train_data: data used for the fit
+            test_data: data used for the metric
+            metric: function computing the metric from the test data and the prediction
+
+        Returns:
+            List[Optional[float]]: metric of each pipeline, ``None`` for the pipelines not evaluated in time
+        """
+        self.start()
+        if not pipelines:
+            return []
+        n_jobs = self.cpu_budget.workers_num(len(pipelines))
+        # The tasks are dispatched lazily, so the samples are not sent to the workers after the deadline
+        with self.cpu_budget.share(len(pipelines)) as cores:
+            tasks = self._tasks(pipelines, cores, train_data, test_data, metric)
+            results = Parallel(n_jobs=n_jobs, pre_dispatch='2*n_jobs')(tasks)
+
+        values: List[Optional[float]] = [None] * len(pipelines)
+        for index, value in results:
+            values[index] = value
+        skipped_num = values.count(None)
+        if skipped_num:
+            self.log.warning(f'{skipped_num} of {len(pipelines)} samples were not evaluated within the time budget')
+        return values
+
+    def _tasks(self, pipelines: Sequence[Pipeline], cores: CoresShare, train_data: InputData,
+               test_data: InputData, metric: SampleMetric) -> Iterable:
+        for index, pipeline in enumerate(pipelines):
+            if self.is_time_over:
+                return
+            yield delayed(_evaluate_sample)(index, pipeline, cores, train_data, test_data, metric, self._deadline)
+
+
+def unfit_downstream(pipeline: Pipeline, changed_nodes: Iterable[Node]):
+    """Unfits the changed nodes of the pipeline and all the nodes using their output,
+    the other nodes keep their fitted operations to be reused by the next fit.
+    The nodes downstream of the not fitted nodes (e.g. recreated by the modification of the pipeline) are unfitted too
+
+    Args:
+        pipeline: pipeline with the changed nodes
+        changed_nodes: nodes with the changed operation, parameters or inputs
+    """
+    stale_nodes = set(map(id, changed_nodes))
+
+    def is_stale(node: Node) -> bool:
+        if id(node) not in stale_nodes and any(is_stale(parent) or parent.fitted_operation is None
+                                               for parent in node.nodes_from or []):
+            stale_nodes.add(id(node))
+        return id(node) in stale_nodes
+
+    for node in pipeline.nodes:
+        if is_stale(node):
+            node.unfit()
+
+
+def _evaluate_sample(index: int, pipeline: Pipeline, cores: CoresShare, train_data: InputData, test_data: InputData,
+                     metric: SampleMetric, deadline: Optional[float]):
+    if deadline is not None and time.time() >= deadline:
+        return index, None
+    with cores.acquire() as threads:
+        pipeline.fit(train_data, n_jobs=threads)
+        prediction = pipeline.predict(test_data)
+    return index, metric(test_data, prediction)
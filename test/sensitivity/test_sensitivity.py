@@ -1,3 +1,4 @@
+import datetime
 import os
 from unittest.mock import patch
 
@@ -16,6 +17,7 @@ from fedot.sensitivity.operations_hp_sensitivity.one_operation_sensitivity impor
 from fedot.sensitivity.pipeline_sensitivity import PipelineAnalysis
 from fedot.sensitivity.pipeline_sensitivity_facade import PipelineSensitivityAnalysis
 from fedot.sensitivity.sa_requirements import SensitivityAnalysisRequirements
+from fedot.sensitivity.sample_evaluation import SampleEvaluator, unfit_downstream
 from test.unit.utilities.test_pipeline_import_export import create_func_delete_files
 
 
@@ -369,3 +371,36 @@ def test_multi_times_analyze_analyze(analyze_method):
     # then
     assert type(analyze_result) is float
     assert analyze_method.called
+
+
+# ------------------------------------------------------------------------------
+# Samples evaluation
+
+def test_unfit_downstream_keeps_upstream_fitted():
+    # given
+    pipeline, train_data, _, _, _ = given_data()
+    pipeline.fit(train_data)
+    knn_node, qda_node, rf_node = pipeline.root_node.nodes_from
+
+    # when
+    unfit_downstream(pipeline, [knn_node])
+
+    # then
+    assert knn_node.fitted_operation is None
+    assert pipeline.root_node.fitted_operation is None
+    assert qda_node.fitted_operation is not None
+    assert rf_node.fitted_operation is not None
+
+
+def test_sample_evaluator_time_budget():
+    # given
+    pipeline, train_data, test_data, _, _ = given_data()
+    evaluator = SampleEvaluator(timeout=datetime.timedelta(seconds=0))
+
+    # when
+    values = evaluator.evaluate([pipeline], train_data, test_data, lambda reference, predicted: 1.0)
+
+    # then
+    assert evaluator.is_time_over
+    assert values == [None]
+    assert not pipeline.is_fitted
@@ -1,11 +1,18 @@
+import datetime
 import logging
 import random
+import time
 from copy import deepcopy
 
+import pytest
+
 from examples.simple.classification.classification_pipelines import classification_pipeline_without_balancing
 from fedot.api.api_utils.api_composer import ApiComposer
 from fedot.api.api_utils.assumptions.assumptions_builder import AssumptionsBuilder
 from fedot.api.main import Fedot
+from fedot.api.time import ApiTime
+from fedot.core.constants import COMPOSING_TUNING_PROPORTION, DEFAULT_TUNING_ITERATIONS_NUMBER, \
+    TUNER_EVALUATIONS_OUT_OF_TIMEOUT
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
@@ -15,14 +22,17 @@ from test.unit.api.test_main_api import get_dataset
 from test.unit.tasks.test_classification import get_binary_classification_data
 
 
-def test_compose_fedot_model_without_tuning():
+def test_compose_fedot_model_with_tuning_in_remaining_time():
     task_type = 'classification'
     train_input, _, _ = get_dataset(task_type=task_type)
 
     model = Fedot(problem=task_type, timeout=0.1, preset='fast_train', with_tuning=True)
     model.fit(train_input)
 
-    assert not model.api_composer.was_tuned
+    # The iterations of tuning are reduced to the time remaining after composing instead of skipping the tuning
+    timer = model.api_composer.timer
+    assert timer.determine_iterations_for_tuning(model.current_pipeline) < DEFAULT_TUNING_ITERATIONS_NUMBER
+    assert timer.composing_spend_time + timer.tuning_spend_time < timer.timedelta_automl
 
 
 def test_output_binary_classification_correct():
@@ -115,3 +125,34 @@ def test_api_composer_available_operations():
                   )
     model.fit(train_data)
     assert model.params.api_params['available_operations'] == available_operations
+
+
+def test_api_time_reserves_time_for_final_fit_and_tuner_checks():
+    timer = ApiTime(time_for_automl=1, with_tuning=True)
+    assert timer.timeout_for_composing == pytest.approx(COMPOSING_TUNING_PROPORTION)
+
+    pipeline = Pipeline(PrimaryNode('logit'))
+    with timer.launch_assumption_fit():
+        time.sleep(0.5)
+    fit_seconds = timer.assumption_fit_spend_time.total_seconds()
+    # The final fit is expected to be as long as the initial assumption fit
+    assert timer.timeout_for_composing == pytest.approx((1 - fit_seconds / 60) * COMPOSING_TUNING_PROPORTION)
+    assert timer.determine_resources_for_tuning() == pytest.approx(60 - 2 * fit_seconds)
+
+    # The evaluation time learned during composing is reserved for the evaluations of the tuner beyond its timeout
+    timer.time_estimator.observe(pipeline, seconds=5)
+    assert timer.expected_evaluation_time(pipeline).total_seconds() == pytest.approx(5)
+    assert timer.determine_resources_for_tuning(pipeline) == \
+           pytest.approx(60 - 2 * fit_seconds - 5 * TUNER_EVALUATIONS_OUT_OF_TIMEOUT)
+    assert timer.determine_iterations_for_tuning() == DEFAULT_TUNING_ITERATIONS_NUMBER
+    # The search is stopped by the first iteration exceeding the timeout
+    assert timer.determine_iterations_for_tuning(pipeline) == 9
+
+    # The iterations of tuning are reduced to the remaining time instead of skipping the tuning
+    timer.time_estimator.observe(pipeline, seconds=5)
+    timer.composing_spend_time = datetime.timedelta(seconds=30)
+    assert timer.have_time_for_tuning(pipeline)
+    assert timer.determine_iterations_for_tuning(pipeline) == 3
+    timer.composing_spend_time = datetime.timedelta(seconds=45)
+    assert not timer.have_time_for_tuning(pipeline)
+    assert timer.determine_iterations_for_tuning(pipeline) == 0
@@ -326,3 +326,22 @@ def test_postproc_opt_nodes():
                          new_node=new_node)
     opt_node = pipeline.nodes[3]
     assert (isinstance(opt_node, OptNode))
+
+
+def test_copy_structure():
+    graph = PipelineAdapter().adapt(get_pipeline())
+    graph_copy = graph.copy_structure()
+
+    assert graph_copy == graph
+    assert not set(map(id, graph_copy.nodes)).intersection(map(id, graph.nodes))
+    for node, node_copy in zip(graph.nodes, graph_copy.nodes):
+        assert node_copy.content is not node.content
+        # Values of the content are shared until they are replaced
+        assert node_copy.content['params'] is node.content['params']
+        assert all(parent in graph_copy.nodes for parent in node_copy.nodes_from)
+
+    descriptive_id = graph.descriptive_id
+    graph_copy.delete_node(graph_copy.nodes[-1])
+    graph_copy.root_node.content['name'] = 'rf'
+    assert graph.descriptive_id == descriptive_id
+    assert graph_copy.descriptive_id != descriptive_id
@@ -0,0 +1,77 @@
+import random
+from itertools import combinations
+
+import numpy as np
+from scipy.stats import spearmanr
+
+from fedot.core.dag.graph_operator import get_distance_between
+from fedot.core.dag.structural_distance import get_approximate_distance_between, pairwise_approximate_distances, \
+    structural_diversity
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+
+
+def get_random_pipelines(pipelines_num: int = 15, max_nodes: int = 4):
+    rng = random.Random(42)
+    pipelines = []
+    for _ in range(pipelines_num):
+        nodes = []
+        for _ in range(rng.randint(1, max_nodes)):
+            operation = rng.choice(['scaling', 'knn', 'logit', 'rf'])
+            if nodes and rng.random() < 0.8:
+                parents = rng.sample(nodes, rng.randint(1, min(2, len(nodes))))
+                nodes.append(SecondaryNode(operation, nodes_from=parents))
+            else:
+                nodes.append(PrimaryNode(operation))
+        pipelines.append(Pipeline(nodes[-1]))
+    return pipelines
+
+
+def test_approximate_distance_matches_known_distances():
+    pipeline_scaling = PipelineBuilder().add_node('scaling').to_pipeline()
+    pipeline_xgboost = PipelineBuilder().add_node('xgboost').to_pipeline()
+    pipeline_knn = PipelineBuilder().add_node('scaling').add_node('knn').to_pipeline()
+    pipeline_linear = PipelineBuilder().add_node('scaling').add_node('linear').to_pipeline()
+    pipeline_knn_alternate_params = PipelineBuilder().add_node('scaling'). \
+        add_node('knn', params={'metric': 'euclidean'}).to_pipeline()
+
+    for pipeline in [pipeline_knn, pipeline_scaling, pipeline_linear, pipeline_knn_alternate_params,
+                     pipeline_xgboost]:
+        assert get_approximate_distance_between(pipeline_knn, pipeline) == get_distance_between(pipeline_knn,
+                                                                                                pipeline)
+
+    adapter = PipelineAdapter()
+    assert get_approximate_distance_between(pipeline_knn, adapter.restore(adapter.adapt(pipeline_knn))) == 0
+
+
+def test_approximate_distance_agrees_with_exact():
+    pipelines = get_random_pipelines()
+    pairs = list(combinations(pipelines, 2))
+
+    exact = np.array([get_distance_between(*pair) for pair in pairs])
+    approximate = np.array([get_approximate_distance_between(*pair) for pair in pairs])
+
+    assert np.all(approximate <= exact)
+    assert spearmanr(exact, approximate).correlation > 0.9
+
+
+def test_pairwise_approximate_distances_correct():
+    pipelines = get_random_pipelines()
+
+    distances = pairwise_approximate_distances(pipelines)
+
+    assert distances.shape == (len(pipelines), len(pipelines))
+    for (i, first), (j, second) in combinations(enumerate(pipelines), 2):
+        assert distances[i, j] == distances[j, i] == get_approximate_distance_between(first, second)
+    assert np.all(np.diag(distances) == 0)
+
+
+def test_structural_diversity_bounds():
+    pipelines = get_random_pipelines()
+    same_pipelines = [PipelineBuilder().add_node('scaling').add_node('knn').to_pipeline() for _ in range(5)]
+
+    assert structural_diversity(same_pipelines) == 0
+    assert structural_diversity(pipelines[:1]) == 0
+    assert 0 < structural_diversity(pipelines) <= 1
@@ -106,6 +106,27 @@ def test_data_from_image():
     assert type(dataset_to_validate.target) == np.ndarray
 
 
+def test_lazy_data_from_image_files(tmp_path):
+    cv2 = pytest.importorskip('cv2')
+    images_num = 10
+    for image_id in range(images_num):
+        image = np.random.randint(0, 255, size=(40 + image_id, 30, 3), dtype=np.uint8)
+        cv2.imwrite(str(tmp_path / f'{image_id}.jpeg'), image)
+    labels = np.random.randint(0, 2, images_num)
+    images_pattern = str(tmp_path / '*.jpeg')
+
+    data = InputData.from_image(images_pattern, labels, target_size=(16, 16))
+    lazy_data = InputData.from_image(images_pattern, labels, target_size=(16, 16),
+                                     lazy=True, cache_dir=str(tmp_path / 'cache'))
+
+    assert lazy_data.features.shape == data.features.shape == (images_num, 16, 16, 3)
+    assert np.array_equal(np.asarray(lazy_data.features), data.features)
+    assert len(os.listdir(tmp_path / 'cache')) == images_num
+    # Images are read from the cache
+    assert np.array_equal(np.vstack(list(lazy_data.features.iter_batches(batch_size=3))), data.features)
+    assert np.array_equal(np.asarray(lazy_data.features[[1, 5]]), data.features[[1, 5]])
+
+
 def test_data_from_json():
     # several features
     files_path = os.path.join('test', 'data', 'multi_modal')
@@ -145,6 +166,49 @@ def test_target_data_from_csv_correct():
     assert seven_columns_data.target.shape == (197, 7)
 
 
+def test_data_from_parquet_and_arrow_keeps_numerical_dtype(tmp_path):
+    feather = pytest.importorskip('pyarrow.feather')
+    test_file_path = str(os.path.dirname(__file__))
+    file = '../../data/simple_classification.csv'
+    csv_data = InputData.from_csv(os.path.join(test_file_path, file))
+    data_frame = pd.read_csv(os.path.join(test_file_path, file))
+    data_frame.to_parquet(tmp_path / 'data.parquet', index=False)
+    feather.write_feather(data_frame, tmp_path / 'data.arrow', compression='uncompressed')
+
+    for data in (InputData.from_parquet(str(tmp_path / 'data.parquet'), index_col=data_frame.columns[0]),
+                 InputData.from_arrow(str(tmp_path / 'data.arrow'), index_col=data_frame.columns[0])):
+        assert data.features.dtype != object
+        assert data.features.flags['C_CONTIGUOUS']
+        assert np.array_equal(data.idx, csv_data.idx)
+        assert np.allclose(data.features, csv_data.features.astype(float))
+        assert np.array_equal(data.target, csv_data.target)
+
+
+def test_data_from_npy_is_memory_mapped(tmp_path, data_setup):
+    np.save(tmp_path / 'features.npy', data_setup.features)
+    np.save(tmp_path / 'target.npy', data_setup.target)
+
+    data = InputData.from_npy(str(tmp_path / 'features.npy'), str(tmp_path / 'target.npy'))
+
+    assert isinstance(data.features, np.memmap)
+    assert np.array_equal(data.features, data_setup.features)
+    assert data.target.shape == (len(data_setup.target), 1)
+    assert np.array_equal(data.idx, np.arange(len(data_setup.features)))
+
+
+def test_data_iter_from_file_by_chunks(tmp_path, data_setup):
+    chunk_size = 30
+    np.save(tmp_path / 'features.npy', data_setup.features)
+    data_setup.to_csv(tmp_path / 'data.csv')
+
+    for file_name in ('features.npy', 'data.csv'):
+        chunks = list(InputData.iter_from_file(str(tmp_path / file_name), chunk_size=chunk_size))
+
+        assert [len(chunk.idx) for chunk in chunks] == [30, 30, 30, 10]
+        assert np.array_equal(np.concatenate([chunk.idx for chunk in chunks]), data_setup.idx)
+        assert np.allclose(np.vstack([chunk.features for chunk in chunks]), data_setup.features)
+
+
 def test_table_data_shuffle():
     test_file_path = str(os.path.dirname(__file__))
     file = '../../data/simple_classification.csv'
@@ -4,7 +4,7 @@ import pytest
 from typing import Callable
 
 from fedot.core.data.data import InputData
-from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.data_split import representative_sample_idx, representative_subsample, train_test_data_setup
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.optimisers.objective import DataSourceSplitter, Objective, PipelineObjectiveEvaluate
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -125,3 +125,27 @@ def test_multivariate_time_series_splitting_correct():
     for series_id, test_series_data in test_data.items():
         assert len(test_series_data.features) == 10
         assert np.allclose(test_series_data.target, np.array([6, 7, 8, 9]))
+
+
+def test_representative_sample_keeps_target_distribution():
+    # Sorted target is a worst case for the cut of the first rows
+    classes = np.repeat(np.array(['a', 'b', 'c']), [700, 280, 20])
+    classification_data = InputData(idx=np.arange(len(classes)), features=np.random.rand(len(classes), 3),
+                                    target=classes.reshape((-1, 1)), task=Task(TaskTypesEnum.classification),
+                                    data_type=DataTypesEnum.table)
+    regression_target = np.linspace(0, 1, 1000)
+    regression_data = InputData(idx=np.arange(1000), features=regression_target.reshape((-1, 1)),
+                                target=regression_target, task=Task(TaskTypesEnum.regression),
+                                data_type=DataTypesEnum.table)
+
+    sample_idx = representative_sample_idx(classification_data, 100)
+    _, class_counts = np.unique(classification_data.target[sample_idx], return_counts=True)
+    assert len(sample_idx) == len(np.unique(sample_idx)) == 100
+    assert list(class_counts) == [70, 28, 2]
+
+    subsample = representative_subsample(regression_data, 100)
+    assert len(subsample.idx) == 100
+    assert np.all(np.diff(subsample.idx) > 0)
+    assert np.allclose(np.quantile(subsample.target, [0.1, 0.5, 0.9]), [0.1, 0.5, 0.9], atol=0.01)
+
+    assert np.array_equal(representative_sample_idx(regression_data, 5000), np.arange(1000))
@@ -2,6 +2,7 @@ import os
 
 import numpy as np
 import pytest
+from sklearn.preprocessing import OneHotEncoder
 
 from examples.simple.classification.classification_with_tuning import get_classification_dataset
 from examples.simple.regression.regression_with_tuning import get_regression_dataset
@@ -9,12 +10,15 @@ from examples.simple.time_series_forecasting.gapfilling import generate_syntheti
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.operations.evaluation.operation_implementations.data_operations.categorical_encoders import \
+    OneHotEncodingImplementation
 from fedot.core.operations.evaluation.operation_implementations.data_operations.sklearn_imbalanced_class import \
     ResampleImplementation
 from fedot.core.operations.evaluation.operation_implementations.data_operations. \
     sklearn_transformations import ImputationImplementation
 from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
-    CutImplementation, LaggedTransformationImplementation
+    CutImplementation, LaggedTransformationImplementation, NumericalDerivativeFilterImplementation, \
+    TsSmoothingImplementation
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
@@ -348,6 +352,31 @@ def test_ts_forecasting_smoothing_data_operation():
         assert len(predicted) == len(np.ravel(y_test))
 
 
+def test_smoothing_and_derivative_filters_for_multi_ts_correct():
+    """ Filters are applied to all the series of multi_ts data at once, so the result
+    must be the same as for each series separately. Derivative of the polynomial series
+    must be exact in the center of the series
+    """
+    x = np.arange(100)
+    several_ts = np.column_stack([0.01 * x ** 3 - x, 5 - 0.5 * x ** 2, np.sin(x / 10)])
+    polynomial_derivative = 0.03 * x ** 2 - 1
+    task = Task(TaskTypesEnum.ts_forecasting, TsForecastingParams(forecast_length=2))
+    multi_ts = InputData(idx=x, features=several_ts, target=several_ts, task=task,
+                         data_type=DataTypesEnum.multi_ts)
+
+    filters = [TsSmoothingImplementation(OperationParameters(window_size=5)),
+               NumericalDerivativeFilterImplementation(OperationParameters(window_size=5, poly_degree=3, order=1))]
+    for ts_filter in filters:
+        filtered_multi_ts = ts_filter.transform(multi_ts).predict
+        for ts_id in range(several_ts.shape[1]):
+            ts = InputData(idx=x, features=several_ts[:, ts_id], target=several_ts[:, ts_id], task=task,
+                           data_type=DataTypesEnum.ts)
+            assert np.allclose(filtered_multi_ts[:, ts_id], ts_filter.transform(ts).predict)
+
+    derivative = filters[1].transform(multi_ts).predict[:, 0]
+    assert np.allclose(derivative[5:-5], polynomial_derivative[5:-5])
+
+
 def test_inf_and_nan_absence_after_imputation_implementation_fit_transform():
     input_data = get_nan_inf_data()
     output_data = ImputationImplementation().fit_transform(input_data)
@@ -426,6 +455,65 @@ def test_one_hot_encoding_new_category_in_test():
     assert predicted is not None
 
 
+def test_one_hot_encoding_unknown_categories_and_gaps_correct():
+    """ Check if One Hot Encoding places the categories in the sorted order and
+    encodes unknown categories and gaps with zeros
+    """
+    task = Task(TaskTypesEnum.classification)
+    train_features = np.array([['b', 1.5], ['a', 2.5], ['c', 3.5], ['a', 4.5]], dtype=object)
+    test_features = np.array([['c', 1.0], ['d', 2.0], [np.nan, 3.0]], dtype=object)
+    train = InputData(idx=np.arange(4), features=train_features, target=np.array([0, 1, 0, 1]),
+                      task=task, data_type=DataTypesEnum.table)
+    test = InputData(idx=np.arange(3), features=test_features, target=None,
+                     task=task, data_type=DataTypesEnum.table)
+    for data in (train, test):
+        data.supplementary_data.column_types = {'features': [NAME_CLASS_STR, NAME_CLASS_FLOAT]}
+
+    encoding_node = PrimaryNode('one_hot_encoding')
+    encoding_node.fit(train)
+    predicted_train = encoding_node.predict(train).predict
+    predicted_test = encoding_node.predict(test).predict
+
+    # Non-categorical columns are placed before the encoded ones
+    assert np.array_equal(predicted_train[:, 1:], [[0, 1, 0], [1, 0, 0], [0, 0, 1], [1, 0, 0]])
+    assert np.array_equal(predicted_test, [[1.0, 0, 0, 1], [2.0, 0, 0, 0], [3.0, 0, 0, 0]])
+
+
+@pytest.mark.parametrize('params', [{'drop': 'first'}, {'drop': 'if_binary'},
+                                    {'max_categories': 2}, {'min_frequency': 2, 'drop': 'first'}])
+def test_one_hot_encoding_params_correct(params):
+    """ Check if One Hot Encoding applies the parameters in the same way as sklearn OneHotEncoder """
+    task = Task(TaskTypesEnum.classification)
+    features = np.array([['b', 'x'], ['a', 'y'], ['c', 'x'], ['a', 'y'], ['a', 'x']], dtype=object)
+    data = InputData(idx=np.arange(5), features=features, target=np.array([0, 1, 0, 1, 0]),
+                     task=task, data_type=DataTypesEnum.table)
+    data.supplementary_data.column_types = {'features': [NAME_CLASS_STR, NAME_CLASS_STR]}
+
+    encoding_node = PrimaryNode('one_hot_encoding')
+    encoding_node.parameters = params
+    encoding_node.fit(data)
+
+    expected = OneHotEncoder(handle_unknown='infrequent_if_exist', **params).fit(features).transform(features)
+    assert np.array_equal(encoding_node.predict(data).predict, expected.toarray())
+
+
+def test_one_hot_encoding_handle_unknown_error():
+    task = Task(TaskTypesEnum.classification)
+    train = InputData(idx=np.arange(2), features=np.array([['a'], ['b']], dtype=object), target=np.array([0, 1]),
+                      task=task, data_type=DataTypesEnum.table)
+    test = InputData(idx=np.arange(1), features=np.array([['c']], dtype=object), target=None,
+                     task=task, data_type=DataTypesEnum.table)
+    for data in (train, test):
+        data.supplementary_data.column_types = {'features': [NAME_CLASS_STR]}
+
+    encoder = OneHotEncodingImplementation(OperationParameters(handle_unknown='error'))
+    encoder.fit(train)
+    with pytest.raises(ValueError):
+        encoder.transform(test)
+    with pytest.raises(ValueError):
+        OneHotEncodingImplementation(OperationParameters(sparse=True))
+
+
 def test_knn_with_float_neighbors():
     """
     Check pipeline with k-nn fit and predict correctly if n_neighbors value
@@ -497,6 +585,34 @@ def test_label_encoding_correct():
     assert predicted_test.predict[0, 0] == 2
 
 
+def test_label_encoding_unknown_categories_and_gaps_correct():
+    """ Check if LabelEncoder encodes all categorical columns with the codes of their own categories,
+    appends unknown categories to the categories of their columns and keeps gaps
+    """
+    task = Task(TaskTypesEnum.classification)
+    train_features = np.array([['b', 'y', 1.5], ['a', np.nan, 2.5], ['b', 'x', 3.5]], dtype=object)
+    test_features = np.array([['d', 'x', 1.0], ['c', 'z', 2.0], [np.nan, 'y', 3.0]], dtype=object)
+    train = InputData(idx=np.arange(3), features=train_features, target=np.array([0, 1, 0]),
+                      task=task, data_type=DataTypesEnum.table)
+    test = InputData(idx=np.arange(3), features=test_features, target=None,
+                     task=task, data_type=DataTypesEnum.table)
+    for data in (train, test):
+        data.supplementary_data.column_types = {'features': [NAME_CLASS_STR, NAME_CLASS_STR, NAME_CLASS_FLOAT]}
+
+    encoding_node = PrimaryNode('label_encoding')
+    encoding_node.fit(train)
+    predicted_train = encoding_node.predict(train)
+    predicted_test = encoding_node.predict(test).predict
+
+    assert np.array_equal(predicted_train.predict[:, 0], [1, 0, 1])
+    assert predicted_train.predict[0, 1] == 1 and np.isnan(predicted_train.predict[1, 1])
+    assert predicted_train.supplementary_data.column_types['features'] == \
+           [NAME_CLASS_INT, NAME_CLASS_INT, NAME_CLASS_FLOAT]
+    # Unknown categories 'c' and 'd' of the first column are appended in the sorted order
+    assert np.array_equal(predicted_test[:2, :2], [[3, 0], [2, 2]])
+    assert np.isnan(predicted_test[2, 0]) and predicted_test[2, 1] == 1
+
+
 def test_lagged_with_multivariate_time_series():
     """
     Checking the correct processing of multivariate time series in the lagged operation
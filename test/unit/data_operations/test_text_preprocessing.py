@@ -1,6 +1,9 @@
 import numpy as np
+import pytest
 
 from fedot.core.data.data import InputData
+from fedot.core.operations.evaluation.operation_implementations.data_operations.text_pretrained import \
+    PretrainedEmbeddingsImplementation
 from fedot.core.pipelines.node import PrimaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -28,3 +31,18 @@ def test_clean_text_preprocessing():
     cleaned_text = predicted_output.predict
 
     assert len(test_text) == len(cleaned_text)
+
+
+def test_pretrained_embeddings_batch_vectorization():
+    keyed_vectors = pytest.importorskip('gensim.models').KeyedVectors
+    embeddings = keyed_vectors(vector_size=4)
+    embeddings.add_vectors(['first', 'second', 'document'],
+                           np.random.rand(3, 4).astype('float32'))
+    test_text = ['first document', 'second second document unknown', 'unknown words only', '']
+
+    batch_vectors = PretrainedEmbeddingsImplementation.vectorize_avg_batch(test_text, embeddings)
+    single_vectors = np.stack([PretrainedEmbeddingsImplementation.vectorize_avg(text, embeddings)
+                               for text in test_text])
+
+    assert batch_vectors.shape == (len(test_text), 4)
+    assert np.allclose(batch_vectors, single_vectors)
@@ -358,3 +358,24 @@ def test_locf_forecast_correctly():
     assert np.array_equal(fit_forecast.idx, np.array([3, 4, 5, 6, 7, 8, 9, 10]))
     # Repeated pattern (3 elements to repeat and 4 forecast horizon)
     assert np.array_equal(predict_forecast.predict, np.array([[110, 120, 130, 110]]))
+
+
+@pytest.mark.parametrize('data_fixture', ['classification_dataset'])
+def test_model_predict_reuses_fitted_strategy(data_fixture, request):
+    data = request.getfixturevalue(data_fixture)
+    train_data, test_data = train_test_data_setup(data=data)
+
+    model = Model(operation_type='logit')
+    params = OperationParameters.from_operation_type('logit')
+    fitted_operation, _ = model.fit(params=params, data=train_data)
+    fitted_strategy = model._eval_strategy
+
+    probs = model.predict(fitted_operation, data=test_data, params=params)
+    labels = model.predict(fitted_operation, data=test_data, params=params, output_mode='labels')
+    assert model._eval_strategy is fitted_strategy
+    assert probs.predict.shape == labels.predict.shape
+    assert set(np.unique(labels.predict)) <= {0, 1}
+
+    # Strategy must be re-initialized if parameters were changed
+    model.predict(fitted_operation, data=test_data, params={'C': 0.5})
+    assert model._eval_strategy is not fitted_strategy
@@ -119,3 +119,20 @@ def test_pipeline_operation_repo_divide_operations():
 
     assert primary == available_operations
     assert secondary == available_operations
+
+
+def test_repository_index_lookups_correct():
+    repository = OperationTypesRepository('all')
+
+    for operation in repository.operations:
+        assert repository.operation_info_by_id(operation.id) is operation
+        assert repository.operation_info_by_id(f'{operation.id}/postfix') is operation
+    assert repository.operation_info_by_id('non_real_operation') is None
+
+    # Index is built once and shared by repositories of the same type
+    assert OperationTypesRepository('all')._index is repository._index
+
+    task_type = TaskTypesEnum.classification
+    expected_operations = [operation.id for operation in repository.operations
+                           if task_type in operation.task_type and 'linear' in operation.tags]
+    assert repository.suitable_operation(task_type=task_type, tags=['linear']) == expected_operations
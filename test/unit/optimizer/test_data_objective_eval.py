@@ -1,4 +1,5 @@
 import datetime
+import time
 
 import pytest
 from copy import deepcopy
@@ -9,8 +10,12 @@ import numpy as np
 from fedot.core.composer.metrics import MSE
 from fedot.core.data.data import InputData
 from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.operations.evaluation.operation_implementations.models.ts_implementations.arima import \
+    ARIMAImplementation
 from fedot.core.optimisers.fitness import SingleObjFitness
-from fedot.core.optimisers.objective import Objective, PipelineObjectiveEvaluate, DataSourceSplitter
+from fedot.core.optimisers.objective import Objective, PipelineObjectiveEvaluate, DataSourceSplitter, \
+    ProgressiveObjectiveEvaluate
+from fedot.core.pipelines.node import PrimaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -48,6 +53,10 @@ def throwing_exception_metric(*args, **kwargs):
     raise Exception
 
 
+def hanging_model_fit(*args):
+    time.sleep(600)
+
+
 def actual_fitness(data_split, pipeline, metric):
     metric_values = []
     for (train_data, test_data) in data_split():
@@ -137,6 +146,38 @@ def test_pipeline_objective_evaluate_with_time_constraint(classification_dataset
     assert fitness.value is not None
 
 
+def test_pipeline_objective_evaluate_with_isolated_fit(classification_dataset):
+    hanging_node = PrimaryNode('custom')
+    hanging_node.parameters = {'model_fit': hanging_model_fit, 'model_predict': None}
+    hanging_pipeline = Pipeline(hanging_node)
+    pipeline = sample_pipeline()
+    data_split = partial(OneFoldInputDataSplit().input_split, input_data=classification_dataset)
+    time_constraint = datetime.timedelta(seconds=1)
+    objective_eval = PipelineObjectiveEvaluate(Objective(ClassificationMetricsEnum.ROCAUC_penalty), data_split,
+                                               time_constraint=time_constraint, isolated_fit=True)
+
+    start_time = time.perf_counter()
+    fitness = objective_eval(hanging_pipeline)
+    assert not fitness.valid
+    assert time.perf_counter() - start_time < time_constraint.total_seconds() + 1
+
+    fitness = objective_eval(pipeline)
+    assert fitness.valid
+
+
+def test_pipeline_objective_evaluate_with_node_profile(classification_dataset):
+    pipeline = sample_pipeline()
+    data_split = partial(OneFoldInputDataSplit().input_split, input_data=classification_dataset)
+    objective_eval = PipelineObjectiveEvaluate(Objective(ClassificationMetricsEnum.ROCAUC_penalty), data_split,
+                                               profile_nodes=True)
+
+    fitness = objective_eval(pipeline)
+    assert fitness.valid
+    table = pipeline.profile.to_table()
+    assert set(table['stage']) == {'fit', 'predict'}
+    assert set(table['node_uid']) == {node.uid for node in pipeline.nodes}
+
+
 @pytest.mark.parametrize(
     'metrics',
     [[],
@@ -161,3 +202,55 @@ def test_pipeline_objective_evaluate_for_timeseries_cv(folds, actual_value):
     objective_evaluate = PipelineObjectiveEvaluate(objective, data_producer, validation_blocks=validation_blocks)
     metric_value = objective_evaluate.evaluate(simple_pipeline).value
     assert np.isclose(metric_value, actual_value)
+
+
+def test_pipeline_objective_evaluate_updates_ts_models_on_folds(monkeypatch):
+    updated_lengths = []
+    update = ARIMAImplementation.update
+
+    def counting_update(self, input_data):
+        updated_lengths.append(len(input_data.features))
+        return update(self, input_data)
+
+    monkeypatch.setattr(ARIMAImplementation, 'update', counting_update)
+    _, validation_blocks, time_series = configure_experiment()
+    data_producer = DataSourceSplitter(3, validation_blocks).build(time_series)
+    pipeline = PipelineBuilder().add_node('arima', params={'p': 2, 'd': 0, 'q': 2}).to_pipeline()
+    objective_evaluate = PipelineObjectiveEvaluate(Objective(MSE.get_value), data_producer,
+                                                   validation_blocks=validation_blocks)
+
+    assert objective_evaluate.evaluate(pipeline).valid
+    # The model is fitted from scratch on the first fold only and updated on the next ones
+    assert len(updated_lengths) == 2
+    assert updated_lengths[0] < updated_lengths[1]
+    assert pipeline.root_node.fitted_operation is None
+    assert pipeline.root_node._operation_to_update is None
+
+
+def test_progressive_objective_evaluate_promotes_best(classification_dataset):
+    evaluated_sizes = []
+
+    def root_operation_metric(pipeline: Pipeline, reference_data: InputData, **kwargs):
+        evaluated_sizes.append(len(reference_data.idx))
+        return {'logit': 0.1, 'rf': 0.5}[str(pipeline.root_node)]
+
+    objective = Objective(root_operation_metric)
+    data_split = partial(OneFoldInputDataSplit().input_split, input_data=classification_dataset)
+    subsample = classification_dataset.subset_range(0, 49)
+    subsample_split = partial(OneFoldInputDataSplit().input_split, input_data=subsample)
+    objective_eval = ProgressiveObjectiveEvaluate([PipelineObjectiveEvaluate(objective, subsample_split),
+                                                  PipelineObjectiveEvaluate(objective, data_split)])
+
+    good_pipeline = PipelineBuilder().add_node('logit').to_pipeline()
+    poor_pipeline = PipelineBuilder().add_node('rf').to_pipeline()
+
+    assert objective_eval(good_pipeline).value == 0.1
+    assert good_pipeline.subsample_stage is None
+    # Poor pipeline keeps the fitness obtained on the subsample and is marked as not promoted
+    assert objective_eval(poor_pipeline).value == 0.5
+    assert poor_pipeline.subsample_stage == 0
+    assert objective_eval(good_pipeline).value == 0.1
+    # Poor pipeline is scored on the subsample only
+    subsample_size, full_size = evaluated_sizes[0], evaluated_sizes[1]
+    assert subsample_size < full_size
+    assert evaluated_sizes == [subsample_size, full_size, subsample_size, subsample_size, full_size]
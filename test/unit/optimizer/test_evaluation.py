@@ -1,15 +1,22 @@
 import datetime
+from contextlib import ExitStack
+from copy import deepcopy
 
 import pytest
+from threadpoolctl import threadpool_info
 
+from fedot.core.log import Log
 from fedot.core.optimisers.adapters import PipelineAdapter
-from fedot.core.optimisers.fitness import Fitness, null_fitness
+from fedot.core.optimisers.fitness import Fitness, SingleObjFitness, null_fitness
 from fedot.core.optimisers.gp_comp.evaluation import MultiprocessingDispatcher, SimpleDispatcher
 from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.objective import Objective
+from fedot.core.optimisers.opt_history import OptHistory
+from fedot.core.optimisers.time_estimator import EvaluationTimeEstimator
 from fedot.core.optimisers.timer import OptimisationTimer
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.quality_metrics_repository import ClassificationMetricsEnum
+from fedot.core.utilities.cpu_budget import CPUBudget
 from test.unit.pipelines.test_node_cache import pipeline_first, pipeline_second, pipeline_third, pipeline_fourth
 from test.unit.validation.test_table_cv import get_classification_data
 
@@ -30,6 +37,11 @@ def prepared_objective(pipeline: Pipeline) -> Fitness:
     return objective(pipeline, reference_data=train_data)
 
 
+def profiled_objective(pipeline: Pipeline) -> Fitness:
+    pipeline.enable_profiling()
+    return prepared_objective(pipeline)
+
+
 def invalid_objective(pipeline: Pipeline) -> Fitness:
     return null_fitness()
 
@@ -49,6 +61,8 @@ def test_dispatchers_with_and_without_multiprocessing(dispatcher):
     fitness = [x.fitness for x in evaluated_population]
     assert all(x.valid for x in fitness), "At least one fitness value is invalid"
     assert len(population) == len(evaluated_population), "Not all pipelines was evaluated"
+    if isinstance(dispatcher, MultiprocessingDispatcher):
+        assert all(ind.metadata['peak_memory_in_mb'] >= 0 for ind in evaluated_population)
 
 
 @pytest.mark.parametrize(
@@ -105,3 +119,183 @@ def test_simple_dispatcher_with_timeout():
     fitness = [x.fitness for x in evaluated_population]
     assert all(x.valid for x in fitness), "At least one fitness value is invalid"
     assert len(population) == len(evaluated_population), "Not all pipelines was evaluated"
+
+
+def test_multiprocessing_dispatcher_reuses_evaluation_history():
+    adapter, population = set_up_tests()
+    evaluated_graphs = []
+
+    def counted_objective(pipeline: Pipeline) -> Fitness:
+        evaluated_graphs.append(pipeline)
+        return prepared_objective(pipeline)
+
+    dispatcher = MultiprocessingDispatcher(adapter)
+    evaluator = dispatcher.dispatch(counted_objective)
+    first_population = evaluator(population)
+
+    _, repeated_population = set_up_tests()
+    second_population = evaluator(repeated_population)
+
+    assert len(evaluated_graphs) == len(population)
+    assert len(second_population) == len(population)
+    first_fitness = {ind.graph.descriptive_id: ind.fitness for ind in first_population}
+    assert all(first_fitness[ind.graph.descriptive_id] == ind.fitness for ind in second_population)
+    assert dispatcher.fitness_index.hits_num == len(population)
+    assert dispatcher.fitness_index.hit_rate == 0.5
+
+    dispatcher.dispatch(counted_objective)
+    assert len(dispatcher.fitness_index) == 0
+
+
+def test_cpu_budget_shares_cores_between_running_tasks(monkeypatch):
+    monkeypatch.setattr('fedot.core.utilities.cpu_budget.cpu_count', lambda: 8)
+    budget = CPUBudget(n_jobs=-1)
+
+    assert budget.n_jobs == 8
+    assert budget.workers_num(3) == 3
+    assert budget.workers_num(10) == 8
+    with budget.share(3) as cores, ExitStack() as running:
+        assert [running.enter_context(cores.acquire()) for _ in range(3)] == [2, 3, 3]
+
+    with budget.share(10) as cores:
+        first_wave = [cores.acquire() for _ in range(8)]
+        assert [task.__enter__() for task in first_wave] == [1] * 8
+        # The tasks started after the first ones are finished get only the cores free from the running tasks
+        first_wave.pop().__exit__(None, None, None)
+        with cores.acquire() as threads:
+            assert threads == 1
+            for task in first_wave:
+                task.__exit__(None, None, None)
+            with cores.acquire() as last_threads:
+                assert last_threads == 7
+
+    with CPUBudget(n_jobs=8, nested=False).share(3) as cores, ExitStack() as running:
+        assert [running.enter_context(cores.acquire()) for _ in range(3)] == [1, 1, 1]
+
+
+def test_multiprocessing_dispatcher_assigns_threads_to_evaluation(monkeypatch):
+    monkeypatch.setattr('fedot.core.utilities.cpu_budget.cpu_count', lambda: 8)
+    adapter, population = set_up_tests()
+    assigned_threads = []
+
+    def threads_objective(pipeline: Pipeline) -> Fitness:
+        native_threads = max((info['num_threads'] for info in threadpool_info()), default=1)
+        assigned_threads.append((CPUBudget.assigned_threads(), native_threads))
+        return prepared_objective(pipeline)
+
+    dispatcher = MultiprocessingDispatcher(adapter)
+    dispatcher.dispatch(threads_objective)
+    with CPUBudget(n_jobs=2).share(1) as cores:
+        dispatcher.evaluate_single(population[0], cores=cores)
+
+    assert assigned_threads[0][0] == 2
+    assert assigned_threads[0][1] <= 2
+    assert CPUBudget.assigned_threads() == 1
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_multiprocessing_dispatcher_saves_node_profile(n_jobs):
+    _, population = set_up_tests()
+
+    evaluated_population = MultiprocessingDispatcher(PipelineAdapter(), n_jobs=n_jobs) \
+        .dispatch(profiled_objective)(population)
+    history = OptHistory()
+    # The individuals kept in the next generation are not counted twice
+    history.add_to_history(evaluated_population)
+    history.add_to_history(evaluated_population[:1])
+
+    table = history.node_profile_table()
+    assert set(table['individual_uid']) == {ind.uid for ind in evaluated_population}
+    assert (table['generation'] == 0).all()
+    assert len(table) == sum(len(ind.metadata['node_profile']) for ind in evaluated_population)
+    summary = history.operations_profile()
+    assert summary['calls'].sum() == len(table)
+    assert summary['wall_time_in_seconds'].is_monotonic_decreasing
+
+
+def test_multiprocessing_dispatcher_trains_time_estimator():
+    adapter, population = set_up_tests()
+    estimator = EvaluationTimeEstimator()
+
+    evaluated_population = MultiprocessingDispatcher(adapter, time_estimator=estimator) \
+        .dispatch(prepared_objective)(population)
+
+    assert estimator.observations_num == len(evaluated_population)
+    assert estimator.predict(population[0].graph) > 0
+
+
+def test_multiprocessing_dispatcher_observes_evaluated_individuals_only():
+    adapter, population = set_up_tests()
+    # The individual with the preset fitness has no evaluation metadata
+    known_individual = Individual(population[0].graph, fitness=SingleObjFitness(0.5))
+    estimator = EvaluationTimeEstimator()
+
+    dispatcher = MultiprocessingDispatcher(adapter, time_estimator=estimator)
+    dispatcher.dispatch(prepared_objective)
+    first_population = dispatcher.evaluate_population([known_individual] + population[1:])
+    assert len(first_population) == len(population)
+    assert estimator.observations_num == len(population) - 1
+
+    # The individuals evaluated before are kept in the next generation without the evaluation
+    dispatcher.evaluate_population(first_population)
+    assert estimator.observations_num == len(population) - 1
+
+
+def test_multiprocessing_dispatcher_skips_individuals_expected_late():
+    adapter, population = set_up_tests()
+    estimator = EvaluationTimeEstimator()
+    for ind in population:
+        estimator.observe(ind.graph, seconds=40)
+
+    with OptimisationTimer(timeout=datetime.timedelta(minutes=1)) as timer:
+        dispatcher = MultiprocessingDispatcher(adapter, timer=timer, time_estimator=estimator)
+        evaluated_population = dispatcher.dispatch(prepared_objective)(population)
+
+    # Only one of the individuals is expected to be evaluated in time
+    assert len(evaluated_population) == 1
+
+
+def test_multiprocessing_dispatcher_marks_individuals_scored_on_subsample():
+    adapter, population = set_up_tests()
+
+    def subsample_objective(pipeline: Pipeline) -> Fitness:
+        fitness = prepared_objective(pipeline)
+        pipeline.subsample_stage = 0 if pipeline.depth > 2 else None
+        return fitness
+
+    estimator = EvaluationTimeEstimator()
+    dispatcher = MultiprocessingDispatcher(adapter, time_estimator=estimator)
+    evaluated_population = dispatcher.dispatch(subsample_objective)(population)
+
+    assert len(evaluated_population) == len(population)
+    assert all(ind.fitness.valid for ind in evaluated_population)
+    marked_population = [ind for ind in evaluated_population if 'subsample_stage' in ind.metadata]
+    assert marked_population
+    assert len(marked_population) == 3
+    # The fitness obtained on the subsample is not reused for the full evaluation
+    assert len(dispatcher.fitness_index) == len(population) - len(marked_population)
+    # The evaluation time on the subsample is not observed as the one on the full data
+    assert estimator.observations_num == len(population) - len(marked_population)
+
+
+def test_multiprocessing_dispatcher_listens_logs_once_per_run(monkeypatch):
+    started_listeners = []
+    queue_listener = Log.queue_listener
+
+    def counted_queue_listener(*args, **kwargs):
+        started_listeners.append(1)
+        return queue_listener(*args, **kwargs)
+
+    monkeypatch.setattr(Log, 'queue_listener', counted_queue_listener)
+    monkeypatch.setattr('fedot.core.utilities.cpu_budget.cpu_count', lambda: 2)
+    adapter, population = set_up_tests()
+    dispatcher = MultiprocessingDispatcher(adapter, n_jobs=2)
+    with dispatcher:
+        evaluator = dispatcher.dispatch(prepared_objective)
+        for _ in range(2):
+            evaluated_population = dispatcher.evaluate_population(deepcopy(population))
+            assert len(evaluated_population) == len(population)
+        assert len(started_listeners) == 1
+        evaluator(population)
+    assert len(started_listeners) == 1
+    assert dispatcher._log_queue is None
@@ -1,7 +1,7 @@
 from typing import Sequence
 
 from fedot.core.optimisers.archive import GenerationKeeper
-from fedot.core.optimisers.fitness import Fitness, MultiObjFitness, null_fitness
+from fedot.core.optimisers.fitness import Fitness, MultiObjFitness, SingleObjFitness, null_fitness
 from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.gp_comp.operators.operator import PopulationT
 from fedot.core.optimisers.graph import OptGraph, OptNode
@@ -72,3 +72,14 @@ def test_archive_multiobj_one_improvement():
     assert len(archive.best_individuals) == previous_size + 1
     assert archive.is_complexity_improved
     assert not archive.is_quality_improved
+
+
+def test_archive_keeps_only_fully_evaluated_individuals():
+    archive = generation_keeper(create_population([SingleObjFitness(2, 1)]), multi_objective=False)
+    subsample_scored = create_individual(SingleObjFitness(0, 1))
+    subsample_scored.metadata['subsample_stage'] = 0
+
+    archive.append([subsample_scored, create_individual(SingleObjFitness(1, 1))])
+
+    assert [ind.fitness.value for ind in archive.best_individuals] == [1]
+    assert archive.is_quality_improved
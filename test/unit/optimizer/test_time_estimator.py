@@ -0,0 +1,57 @@
+import pytest
+
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.time_estimator import EvaluationTimeEstimator
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+
+OPERATION_SECONDS = {'scaling': 0.1, 'logit': 0.5, 'knn': 2., 'rf': 10.}
+
+
+def get_graph(*operations: str):
+    return PipelineAdapter().adapt(PipelineBuilder().add_sequence(*operations).to_pipeline())
+
+
+def observed_estimator() -> EvaluationTimeEstimator:
+    estimator = EvaluationTimeEstimator(data_shape=(1000, 10), regularization=0.01)
+    for operations in [('logit',), ('rf',), ('knn',), ('scaling', 'logit'), ('scaling', 'rf'), ('scaling', 'knn'),
+                       ('knn', 'logit'), ('rf', 'logit'), ('scaling', 'knn', 'logit')]:
+        seconds = sum(OPERATION_SECONDS[operation] for operation in operations)
+        estimator.observe(get_graph(*operations), seconds)
+    return estimator
+
+
+def test_time_estimator_without_observations():
+    estimator = EvaluationTimeEstimator()
+
+    assert estimator.predict(get_graph('logit')) is None
+    assert estimator.predict_mean([get_graph('logit')]) is None
+
+
+def test_time_estimator_learns_operations_cost():
+    estimator = observed_estimator()
+
+    assert estimator.observations_num == 9
+    light_time = estimator.predict(get_graph('scaling', 'logit'))
+    heavy_time = estimator.predict(get_graph('scaling', 'rf'))
+    assert light_time == pytest.approx(0.6, rel=0.5)
+    assert heavy_time == pytest.approx(10.1, rel=0.5)
+    # The graph which is not observed is predicted by the costs of its operations
+    assert estimator.predict(get_graph('scaling', 'rf', 'logit')) > estimator.predict(get_graph('knn', 'logit'))
+    assert estimator.predict_mean([get_graph('scaling', 'logit'), get_graph('scaling', 'rf')]) == \
+           pytest.approx((light_time + heavy_time) / 2)
+
+
+def test_time_estimator_with_unknown_operation():
+    estimator = observed_estimator()
+
+    # The graph with the operation not observed yet is expected to be as long as the longest observed one
+    assert estimator.predict(get_graph('scaling', 'dt')) >= 10.
+
+
+def test_time_estimator_keeps_latest_observations():
+    estimator = EvaluationTimeEstimator(max_observations=2)
+    for seconds in [100., 1., 1.]:
+        estimator.observe(get_graph('logit'), seconds)
+
+    assert estimator.observations_num == 2
+    assert estimator.predict(get_graph('logit')) == pytest.approx(1., rel=0.1)
@@ -34,3 +34,9 @@ def test_tuner_timer():
 
     spent_time = (datetime.datetime.now() - start).seconds
     assert reached and spent_time == 1
+
+
+def test_composition_timer_with_iteration_time():
+    with OptimisationTimer(timeout=datetime.timedelta(minutes=1)) as timer:
+        assert not timer.is_time_limit_reached(iteration_num=0, iteration_time=datetime.timedelta(seconds=30))
+        assert timer.is_time_limit_reached(iteration_num=0, iteration_time=datetime.timedelta(seconds=70))
@@ -14,8 +14,11 @@ from sklearn.datasets import load_iris
 
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.multi_modal import MultiModalData
+from fedot.core.pipelines.frozen_pipeline import FrozenPipeline
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
 from fedot.core.utils import probs_to_labels
@@ -23,7 +26,7 @@ from fedot.preprocessing.preprocessing import DataPreprocessor
 from test.unit.dag.test_graph_operator import get_pipeline
 from test.unit.models.test_model import classification_dataset_with_redundant_features
 from test.unit.pipelines.test_pipeline_comparison import pipeline_first
-from test.unit.tasks.test_forecasting import get_ts_data
+from test.unit.tasks.test_forecasting import get_ts_data, get_ts_data_with_dt_idx
 
 seed(1)
 np.random.seed(1)
@@ -409,6 +412,78 @@ def test_pipeline_fit_time_constraint():
     assert predicted_second is not None
 
 
+def hanging_model_fit(idx, features, target, params):
+    """ Custom model fit which hangs in the native code after saving id of its process """
+    with open(params.get('pid_file'), 'w') as pid_file:
+        pid_file.write(str(os.getpid()))
+    time.sleep(600)
+
+
+def test_pipeline_isolated_fit_stops_hanging_operation(data_setup, tmp_path):
+    pid_file = str(tmp_path / 'pid')
+    hanging_node = PrimaryNode('custom')
+    hanging_node.parameters = {'model_fit': hanging_model_fit, 'model_predict': None, 'pid_file': pid_file}
+    time_constraint = datetime.timedelta(seconds=2)
+
+    start_time = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        Pipeline(hanging_node).fit(data_setup, time_constraint=time_constraint, isolated=True)
+    fit_duration = time.perf_counter() - start_time
+
+    assert time_constraint.total_seconds() <= fit_duration < time_constraint.total_seconds() + 1
+    with open(pid_file) as file:
+        hanging_pid = int(file.read())
+    # The process of the hanging operation is killed
+    with pytest.raises(ProcessLookupError):
+        os.kill(hanging_pid, 0)
+
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')]))
+    isolated_predicted = pipeline.fit(data_setup, time_constraint=datetime.timedelta(minutes=1), isolated=True)
+    assert pipeline.is_fitted
+    assert pipeline.computation_time is not None
+    assert np.array_equal(pipeline.predict(data_setup).predict, isolated_predicted.predict)
+
+
+def test_pipeline_fit_with_n_jobs_sets_threads_of_models(data_setup):
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('rf'), PrimaryNode('xgboost')]))
+
+    pipeline.fit(data_setup, n_jobs=2)
+
+    rf_node, xgboost_node = pipeline.root_node.nodes_from
+    assert rf_node.parameters['n_jobs'] == 2
+    assert rf_node.fitted_operation.n_jobs == 2
+    # Boosting models use all the cores by default
+    assert xgboost_node.parameters['nthread'] == 2
+
+
+@pytest.mark.parametrize('isolated', [False, True])
+def test_pipeline_profiling_records_nodes(data_setup, isolated):
+    scaling_node = PrimaryNode('scaling')
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[SecondaryNode('rf', nodes_from=[scaling_node]),
+                                                           SecondaryNode('knn', nodes_from=[scaling_node])]))
+    pipeline.enable_profiling()
+
+    pipeline.fit(data_setup, time_constraint=datetime.timedelta(minutes=1), isolated=isolated)
+    pipeline.predict(data_setup)
+
+    table = pipeline.profile.to_table()
+    fit_table = table[table['stage'] == 'fit']
+    # The scaling is fitted for the first child node and reused for the second one
+    assert sorted(fit_table['operation']) == ['knn', 'logit', 'rf', 'scaling', 'scaling']
+    assert fit_table[fit_table['operation'] == 'scaling']['cache_hit'].tolist() == [False, True]
+    assert len(table[table['stage'] == 'predict']) == 5
+    assert (table['wall_time_in_seconds'] > 0).all()
+    assert (table['peak_memory_in_mb'] >= 0).all()
+    root_fit = fit_table[fit_table['operation'] == 'logit'].iloc[0]
+    assert root_fit['input_shape'] == (100, 6)
+    assert root_fit['output_shape'] == (100, 3)
+    assert pipeline.profile.summary().loc[('scaling', 'fit'), 'cache_hits'] == 1
+
+    pipeline.enable_profiling(False)
+    pipeline.predict(data_setup)
+    assert pipeline.profile is None
+
+
 @pytest.mark.parametrize('data_fixture', ['data_setup', 'file_data_setup'])
 def test_pipeline_unfit(data_fixture, request):
     data = request.getfixturevalue(data_fixture)
@@ -436,3 +511,252 @@ def test_ts_forecasting_pipeline_with_poly_features():
     pipeline.fit(train_data)
     prediction = pipeline.predict(test_data)
     assert prediction is not None
+
+
+def test_frozen_pipeline_predict_correct(classification_dataset):
+    """ Frozen pipeline must produce the same predictions as the source pipeline """
+    train_data, test_data = train_test_data_setup(classification_dataset)
+    scaling_node = PrimaryNode('scaling')
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[SecondaryNode('rf', nodes_from=[scaling_node]),
+                                                           SecondaryNode('knn', nodes_from=[scaling_node])]))
+    pipeline.fit(train_data)
+    frozen_pipeline = pipeline.freeze()
+    source_features = deepcopy(test_data.features)
+
+    assert len(frozen_pipeline.steps) == len(pipeline.nodes)
+    assert frozen_pipeline.root_step.operation_type == 'logit'
+    for output_mode in ['default', 'labels', 'full_probs']:
+        expected = pipeline.predict(test_data, output_mode=output_mode)
+        frozen_prediction = frozen_pipeline.predict(test_data, output_mode=output_mode)
+        assert np.array_equal(expected.predict, frozen_prediction.predict)
+        assert np.array_equal(expected.idx, frozen_prediction.idx)
+    assert np.array_equal(source_features, test_data.features)
+
+    train_data, test_data = get_ts_data_with_dt_idx(n_steps=100, forecast_length=5)
+    pipeline = Pipeline(SecondaryNode('ridge', nodes_from=[PrimaryNode('lagged')]))
+    pipeline.fit(train_data)
+    expected = pipeline.predict(test_data)
+    frozen_prediction = pipeline.freeze().predict(test_data)
+    assert np.allclose(expected.predict, frozen_prediction.predict)
+    assert np.array_equal(expected.idx, frozen_prediction.idx)
+
+    with pytest.raises(ValueError):
+        Pipeline(PrimaryNode('logit')).freeze()
+
+
+def test_frozen_pipeline_save_load_correct(classification_dataset, tmp_path):
+    train_data, test_data = train_test_data_setup(classification_dataset)
+    pipeline = Pipeline(SecondaryNode('rf', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(train_data)
+    frozen_pipeline = pipeline.freeze()
+
+    path = frozen_pipeline.save(str(tmp_path / 'frozen.zip'))
+    loaded_pipeline = FrozenPipeline.load(path)
+
+    assert [step.operation_type for step in loaded_pipeline.steps] == ['scaling', 'rf']
+    for output_mode in ['default', 'labels']:
+        assert np.array_equal(loaded_pipeline.predict(test_data, output_mode=output_mode).predict,
+                              frozen_pipeline.predict(test_data, output_mode=output_mode).predict)
+
+    pipeline.save_archive(str(tmp_path / 'pipeline.zip'))
+    with pytest.raises(ValueError):
+        FrozenPipeline.load(str(tmp_path / 'pipeline.zip'))
+
+
+def get_regression_rows(rows_num: int, shift: float = 0.) -> InputData:
+    features = np.random.normal(size=(rows_num, 4)) + shift
+    return InputData(idx=np.arange(rows_num), features=features, target=features @ np.arange(4),
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+
+
+def append_rows(data: InputData, new_data: InputData) -> InputData:
+    rows_num = len(data.idx) + len(new_data.idx)
+    return InputData(idx=np.arange(rows_num), features=np.vstack([data.features, new_data.features]),
+                     target=np.concatenate([data.target, new_data.target]),
+                     task=data.task, data_type=data.data_type)
+
+
+def get_mae(pipeline: Pipeline, test_data: InputData) -> float:
+    return float(np.mean(np.abs(pipeline.predict(test_data).predict - test_data.target)))
+
+
+def test_pipeline_update_partially_fits_incremental_operations():
+    scaling_node = PrimaryNode('scaling')
+    pipeline = Pipeline(SecondaryNode('sgdr', nodes_from=[scaling_node]))
+    pipeline.fit(get_regression_rows(200))
+    fitted_operations = [node.fitted_operation for node in pipeline.nodes]
+    coefficients = pipeline.root_node.fitted_operation.coef_.copy()
+
+    updated = pipeline.update(get_regression_rows(100))
+
+    assert updated.predict.shape == (100,)
+    assert [node.fitted_operation for node in pipeline.nodes] == fitted_operations
+    assert scaling_node.fitted_operation.operation.n_samples_seen_ == 300
+    assert scaling_node.input_statistics.rows_num == 300
+    assert not np.array_equal(pipeline.root_node.fitted_operation.coef_, coefficients)
+
+
+def test_pipeline_update_refits_only_drifted_operations():
+    history, test_data = get_regression_rows(1000), get_regression_rows(200, shift=3.)
+    scaling_node = PrimaryNode('scaling')
+    pipeline = Pipeline(SecondaryNode('rfr', nodes_from=[scaling_node]))
+    pipeline.fit(history)
+    fitted_scaling, fitted_model = scaling_node.fitted_operation, pipeline.root_node.fitted_operation
+
+    new_rows = get_regression_rows(200)
+    pipeline.update(new_rows)
+    history = append_rows(history, new_rows)
+    assert scaling_node.fitted_operation is fitted_scaling
+    assert pipeline.root_node.fitted_operation is fitted_model
+    assert not pipeline.root_node.is_drifted
+
+    # The drifted model is kept fitted on the history until the data to refit it is passed
+    shifted_rows = get_regression_rows(200, shift=3.)
+    pipeline.update(shifted_rows)
+    assert pipeline.root_node.fitted_operation is fitted_model
+    assert pipeline.root_node.is_drifted
+
+    history = append_rows(history, shifted_rows)
+    refitted = pipeline.update(shifted_rows, refit_data=history)
+    assert refitted.predict.shape == (len(history.idx),)
+    assert scaling_node.fitted_operation is fitted_scaling
+    assert pipeline.root_node.fitted_operation is not fitted_model
+    assert not pipeline.root_node.is_drifted
+
+    # The model refitted on the history with the new rows is as good as the pipeline fitted from scratch
+    fitted_from_scratch = Pipeline(SecondaryNode('rfr', nodes_from=[PrimaryNode('scaling')]))
+    fitted_from_scratch.fit(history)
+    assert get_mae(pipeline, test_data) < 1.1 * get_mae(fitted_from_scratch, test_data)
+
+    with pytest.raises(ValueError):
+        Pipeline(PrimaryNode('rfr')).update(get_regression_rows(10))
+
+
+def test_pipeline_update_after_isolated_fit():
+    pipeline = Pipeline(SecondaryNode('rfr', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(get_regression_rows(500), time_constraint=datetime.timedelta(minutes=1), isolated=True)
+    assert all(node.input_statistics is not None for node in pipeline.nodes)
+    fitted_operations = [node.fitted_operation for node in pipeline.nodes]
+
+    pipeline.update(get_regression_rows(100))
+    assert [node.fitted_operation for node in pipeline.nodes] == fitted_operations
+    assert not any(node.is_drifted for node in pipeline.nodes)
+
+
+def get_classification_rows(labels: np.ndarray) -> InputData:
+    features = np.random.normal(size=(len(labels), 3)) + labels.reshape((-1, 1)) * 2
+    return InputData(idx=np.arange(len(labels)), features=features, target=labels,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def test_pipeline_update_refits_classifier_on_new_classes():
+    history = get_classification_rows(np.arange(300) % 2)
+    new_rows = get_classification_rows(np.full(60, 2))
+    pipeline = Pipeline(SecondaryNode('mlp', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(history)
+
+    # The partial fit of the classifier fails on the unknown class, so it is refitted on the history
+    pipeline.update(new_rows, refit_data=append_rows(history, new_rows))
+
+    assert not any(node.is_drifted for node in pipeline.nodes)
+    test_data = get_classification_rows(np.array([0, 1, 2] * 20))
+    predicted_labels = pipeline.predict(test_data, output_mode='labels').predict.ravel()
+    assert set(predicted_labels) == {0, 1, 2}
+
+
+@pytest.mark.parametrize('model', ['lgbm', 'xgboost'])
+def test_pipeline_update_refits_boosting_on_missing_classes(model):
+    history = get_classification_rows(np.arange(300) % 3)
+    new_rows = get_classification_rows(np.arange(60) % 2)
+    pipeline = PipelineBuilder().add_node(model).to_pipeline()
+    pipeline.fit(history)
+    fitted_model = pipeline.root_node.fitted_operation
+
+    # The boosting can not be continued without one of the fitted classes
+    pipeline.update(new_rows)
+    assert pipeline.root_node.is_drifted
+    assert pipeline.root_node.fitted_operation is fitted_model
+
+    pipeline.update(new_rows, refit_data=append_rows(history, new_rows))
+    assert not pipeline.root_node.is_drifted
+    assert list(pipeline.root_node.fitted_operation.classes_) == [0, 1, 2]
+    probs = pipeline.predict(get_classification_rows(np.arange(30) % 3), output_mode='full_probs').predict
+    assert probs.shape == (30, 3)
+
+
+def test_pipeline_update_with_multimodal_data():
+    def get_multimodal_rows(rows_num: int, shift: float = 0.) -> MultiModalData:
+        data = get_regression_rows(rows_num, shift)
+        sources = {}
+        for name, columns in (('first', [0, 1]), ('second', [2, 3])):
+            sources[f'data_source_table/{name}'] = InputData(idx=data.idx, features=data.features[:, columns],
+                                                             target=data.target, task=data.task,
+                                                             data_type=data.data_type)
+        return MultiModalData(sources)
+
+    def get_pipeline():
+        sources = [SecondaryNode('scaling', nodes_from=[PrimaryNode(f'data_source_table/{name}')])
+                   for name in ('first', 'second')]
+        return Pipeline(SecondaryNode('dtreg', nodes_from=sources))
+
+    history, shifted_rows = get_multimodal_rows(500), get_multimodal_rows(100, shift=3.)
+    full_data = MultiModalData({name: append_rows(data, shifted_rows[name]) for name, data in history.items()})
+    pipeline = get_pipeline()
+    pipeline.fit(history)
+    fitted_model = pipeline.root_node.fitted_operation
+
+    updated = pipeline.update(shifted_rows)
+    assert updated.predict.shape == (100,)
+    data_sources = [node for node in pipeline.nodes if isinstance(node, PrimaryNode)]
+    assert all(node.direct_set and len(node.node_data.idx) == 100 for node in data_sources)
+    assert pipeline.root_node.is_drifted
+
+    pipeline.update(shifted_rows, refit_data=full_data)
+    assert pipeline.root_node.fitted_operation is not fitted_model
+    assert all(len(node.node_data.idx) == 600 for node in data_sources)
+    fitted_from_scratch = get_pipeline()
+    fitted_from_scratch.fit(full_data)
+    test_data = get_multimodal_rows(100, shift=3.)
+    assert np.allclose(pipeline.predict(test_data).predict, fitted_from_scratch.predict(test_data).predict)
+
+
+def test_pipeline_update_adds_fraction_of_boosting_trees():
+    history, new_rows, test_rows = get_regression_rows(1000), get_regression_rows(200), get_regression_rows(200)
+    pipeline = PipelineBuilder().add_node('lgbmreg', params={'n_estimators': 50}).to_pipeline()
+    pipeline.fit(history)
+
+    pipeline.update(new_rows)
+    pipeline.update(new_rows)
+
+    updated_model = pipeline.root_node.fitted_operation
+    assert updated_model.n_estimators == 50
+    assert updated_model.booster_.num_trees() == 60
+    # The updated model is as good as the model of the same size fitted from scratch
+    same_size = PipelineBuilder().add_node('lgbmreg', params={'n_estimators': 60}).to_pipeline()
+    same_size.fit(append_rows(append_rows(history, new_rows), new_rows))
+    assert get_mae(pipeline, test_rows) < 1.2 * get_mae(same_size, test_rows)
+
+
+def test_pipeline_update_for_time_series():
+    def get_series(start: int, end: int) -> InputData:
+        time_series = np.sin(np.arange(start, end) / 5) * 10 + 20
+        return InputData(idx=np.arange(start, end), features=time_series, target=time_series,
+                         task=Task(TaskTypesEnum.ts_forecasting, TsForecastingParams(forecast_length=5)),
+                         data_type=DataTypesEnum.ts)
+
+    pipeline = Pipeline(PrimaryNode('arima'))
+    pipeline.fit(get_series(0, 100))
+    fitted_model = pipeline.root_node.fitted_operation
+
+    # The whole series is passed to update the time series models, unlike the new rows only of the tables
+    pipeline.update(get_series(0, 120))
+    assert pipeline.root_node.fitted_operation is fitted_model
+    assert len(fitted_model.fitted_ts) == 120
+    fitted_from_scratch = Pipeline(PrimaryNode('arima'))
+    fitted_from_scratch.fit(get_series(0, 120))
+    forecast_data = get_series(0, 120)
+    assert np.allclose(pipeline.predict(forecast_data).predict, fitted_from_scratch.predict(forecast_data).predict,
+                       atol=0.5)
+
+    with pytest.raises(ValueError):
+        pipeline.update(get_series(120, 140))
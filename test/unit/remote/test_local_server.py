@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.utils import fedot_project_root
+from fedot.remote.infrastructure.clients.http_client import HttpClient
+from fedot.remote.infrastructure.local_server import LocalEvaluationServer
+from fedot.remote.remote_evaluator import RemoteEvaluator, RemoteTaskParams
+
+
+@pytest.fixture(autouse=True)
+def run_around_tests():
+    yield
+    # return evaluator to local mode
+    evaluator = RemoteEvaluator()
+    evaluator.init(None, RemoteTaskParams(mode='local'))
+
+
+def test_remote_evaluation_with_local_server(tmp_path):
+    exec_params = {
+        'container_input_path': os.path.join(fedot_project_root(), 'test', 'data'),
+        'container_output_path': str(tmp_path),
+    }
+    remote_task_params = RemoteTaskParams(mode='remote', dataset_name='advanced_classification',
+                                          task_type='Task(TaskTypesEnum.classification)',
+                                          max_parallel=2, poll_interval=0.1)
+    pipelines = [PipelineBuilder().add_node('scaling').add_node(model).to_pipeline()
+                 for model in ['logit', 'dt', 'knn']]
+
+    with LocalEvaluationServer(n_workers=2) as server:
+        client = HttpClient({'url': server.url}, exec_params, output_path=str(tmp_path))
+        assert client.supports_streaming
+        RemoteEvaluator().init(client, remote_task_params)
+        fitted_pipelines = RemoteEvaluator().compute_graphs(pipelines)
+
+    assert [pipeline.root_node.operation.operation_type for pipeline in fitted_pipelines] == ['logit', 'dt', 'knn']
+    assert all(pipeline.is_fitted for pipeline in fitted_pipelines)
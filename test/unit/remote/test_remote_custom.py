@@ -5,7 +5,7 @@ from typing import Tuple, Union, Optional, Sequence
 import pytest
 
 from fedot.core.utilities.serializable import Serializable
-from fedot.remote.infrastructure.clients.client import Client
+from fedot.remote.infrastructure.clients.client import Client, FAILED_STATUS, SUCCEEDED_STATUS
 from fedot.remote.remote_evaluator import RemoteEvaluator, RemoteTaskParams
 
 
@@ -89,3 +89,39 @@ def test_remote_composer_custom_graph(num_of_graphs):
 
     assert len(graphs) == len(evaluated_graphs)
     assert all(graph.evaluated for graph in evaluated_graphs)
+
+
+class TestStreamingLocalClient(TestLocalClient):
+    """ Client reporting the status of each task, the first tasks are failed """
+
+    def __init__(self, failed_tasks_num: int = 0):
+        super().__init__()
+        self.failed_tasks_num = failed_tasks_num
+        self.running_task_ids = set()
+        self.max_running_num = 0
+
+    def create_task(self, config):
+        task_id = super().create_task(config)
+        self.running_task_ids.add(task_id)
+        self.max_running_num = max(self.max_running_num, len(self.running_task_ids))
+        return task_id
+
+    def get_task_status(self, task_id) -> str:
+        self.running_task_ids.discard(task_id)
+        return FAILED_STATUS if int(task_id) < self.failed_tasks_num else SUCCEEDED_STATUS
+
+
+@pytest.mark.parametrize('failed_tasks_num, max_retries, evaluated_num',
+                         [(0, 0, 10), (3, 1, 10), (3, 0, 7)])
+def test_remote_custom_graph_streaming(failed_tasks_num, max_retries, evaluated_num):
+    client = TestStreamingLocalClient(failed_tasks_num)
+    RemoteEvaluator().init(client, RemoteTaskParams(mode='remote', max_parallel=4, max_retries=max_retries,
+                                                    poll_interval=0), mock_config)
+    graphs = get_many_graphs(10)
+
+    evaluated_graphs = RemoteEvaluator().compute_graphs(graphs)
+
+    assert client.supports_streaming
+    assert len(evaluated_graphs) == len(graphs)
+    assert sum(graph.evaluated for graph in evaluated_graphs) == evaluated_num
+    assert client.max_running_num <= 4
@@ -1,6 +1,8 @@
 import os
+from glob import glob
 
 import numpy as np
+import pytest
 
 from fedot.utilities.requirements_notificator import warn_requirement
 
@@ -15,6 +17,7 @@ from sklearn.metrics import roc_auc_score as roc_auc
 from examples.simple.classification.image_classification_problem import run_image_classification_problem
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.image_dataset import ImageDataset
 from fedot.core.data.supplementary_data import SupplementaryData
 from fedot.core.operations.evaluation.operation_implementations.models.keras import (
     FedotCNNImplementation,
@@ -31,6 +34,30 @@ from test.unit.common_tests import is_predict_ignores_target
 from test.unit.models.test_model import classification_dataset_with_redundant_features
 
 
+class BatchesRecordingModel:
+    """ Model with the interface of keras model which records the batches passed to it """
+
+    def __init__(self, num_classes: int):
+        self.output_classes = num_classes
+        self.train_batches = []
+        self.validation_batches = []
+
+    def compile(self, **kwargs):
+        pass
+
+    def fit(self, batches, steps_per_epoch: int, epochs: int, verbose: int,
+            validation_data=None, validation_steps: int = 0):
+        for _ in range(epochs):
+            self.train_batches.extend(next(batches) for _ in range(steps_per_epoch))
+            self.validation_batches.extend(next(validation_data) for _ in range(validation_steps))
+
+    def predict(self, batches, steps: int):
+        images = np.vstack([next(batches) for _ in range(steps)])
+        assert next(batches, None) is None
+        probs = images.mean(axis=(1, 2, 3))
+        return np.stack([1 - probs, probs] + [np.zeros_like(probs)] * (self.output_classes - 2), axis=1)
+
+
 def check_predict_cnn_correct(model, dataset_to_validate):
     return is_predict_ignores_target(
         predict_func=predict_cnn,
@@ -227,3 +254,33 @@ def test_cnn_methods():
     assert cnn_model.output_shape[1] == num_classes
     assert type(prediction) == np.ndarray
     assert check_predict_cnn_correct(model, dataset_to_validate)
+
+
+def test_cnn_methods_with_lazy_images(tmp_path):
+    cv2 = pytest.importorskip('cv2')
+    images_num, batch_size, epochs = 20, 8, 2
+    for image_id in range(images_num):
+        image = np.random.randint(0, 255, size=(30, 30, 3), dtype=np.uint8)
+        cv2.imwrite(str(tmp_path / f'{image_id:02d}.png'), image)
+    images = ImageDataset(sorted(glob(str(tmp_path / '*.png'))), target_size=(16, 16))
+    target = np.arange(images_num) % 2
+    data = InputData(idx=np.arange(images_num), features=images, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.image)
+
+    model = fit_cnn(train_data=data, model=BatchesRecordingModel(num_classes=2),
+                    epochs=epochs, batch_size=batch_size)
+    prediction = predict_cnn(trained_model=model, predict_data=data, output_mode='probs')
+
+    train_size = images_num - int(0.1 * images_num)
+    train_images = np.vstack([batch_images for batch_images, _ in model.train_batches])
+    train_target = np.vstack([batch_target for _, batch_target in model.train_batches])
+    # Each epoch passes over all the train images in the shuffled order, the last images are for validation
+    assert len(train_images) == epochs * train_size
+    assert train_images.dtype == np.float32 and train_images.max() <= 1
+    assert train_target.shape == (epochs * train_size, 2)
+    validation_images = np.vstack([batch_images for batch_images, _ in model.validation_batches])
+    assert np.allclose(validation_images[:images_num - train_size],
+                       np.asarray(images[train_size:]).astype('float32') / 255)
+    # Predictions are made for all the images in the order of the dataset
+    assert prediction.shape == (images_num,)
+    assert np.allclose(prediction, np.asarray(images).mean(axis=(1, 2, 3)) / 255, atol=1e-5)
@@ -16,6 +16,7 @@ from fedot.core.operations.evaluation.operation_implementations.models.ts_implem
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from fedot.core.pipelines.ts_wrappers import in_sample_ts_forecast, out_of_sample_ts_forecast
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
@@ -342,3 +343,42 @@ def test_ts_forecasting_with_multiple_series_in_lagged():
     predict_output = pipeline.predict(test_data)
 
     assert len(np.ravel(predict_output.predict)) == horizon
+
+
+@pytest.mark.parametrize('operation, params', [('arima', {'p': 2, 'd': 0, 'q': 2}),
+                                               ('ets', {'error': 'add', 'trend': 'add'})])
+def test_statsmodels_update_with_continued_series(operation, params):
+    """ Tests the models fitted on the beginning of the series are updated, not fitted from scratch,
+    on the continued series and forecast it close to the models fitted from scratch """
+    horizon = 5
+    train_data, _ = get_ts_data(n_steps=300, forecast_length=horizon)
+    first_fold, _ = get_ts_data(n_steps=250 + horizon, forecast_length=horizon)
+
+    pipeline = PipelineBuilder().add_node(operation, params=params).to_pipeline()
+    pipeline.fit(first_fold)
+    first_fold_model = pipeline.root_node.fitted_operation
+    pipeline.unfit(keep_state=True)
+    updated_forecast = pipeline.fit(train_data).predict
+    updated_model = pipeline.root_node.fitted_operation
+
+    pipeline.unfit()
+    refitted_forecast = pipeline.fit(train_data).predict
+
+    assert updated_model is first_fold_model
+    assert len(updated_model.fitted_ts) == len(train_data.features)
+    assert pipeline.root_node.fitted_operation is not first_fold_model
+    assert np.allclose(updated_forecast, refitted_forecast, atol=np.std(train_data.target) / 2)
+
+
+def test_arima_update_with_other_series_fits_from_scratch():
+    train_data, test_data = get_ts_data(n_steps=300, forecast_length=5)
+    arima = ARIMAImplementation(OperationParameters(p=2, d=0, q=2))
+    arima.fit(train_data)
+
+    other_data = deepcopy(train_data)
+    other_data.features = other_data.features[::-1].copy()
+    arima.update(other_data)
+
+    assert np.array_equal(arima.fitted_ts, other_data.features)
+    assert np.allclose(arima.arima.model.endog.ravel(),
+                       ARIMAImplementation(OperationParameters(p=2, d=0, q=2)).fit(other_data).model.endog.ravel())
@@ -4,8 +4,13 @@ import numpy as np
 
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
+    LaggedTransformationImplementation
+from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.ts_wrappers import multi_series_forecast
+from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
 from fedot.core.utils import fedot_project_root
 
@@ -57,3 +62,39 @@ def test_multi_ts_forecasting():
     pipeline.fit(train_data)
     prediction = np.ravel(pipeline.predict(test_data).predict)
     assert np.allclose(np.ravel(prediction), np.ravel(test_data.target))
+
+
+def test_multi_ts_lagged_table_stacks_tables_of_series():
+    train_data, _ = get_multi_ts_data()
+    forecast_length = train_data.task.task_params.forecast_length
+    lagged = LaggedTransformationImplementation(OperationParameters(window_size=10))
+    multi_ts_table = lagged.transform_for_fit(train_data)
+
+    tables, targets = [], []
+    for ts_id in range(train_data.features.shape[1]):
+        ts = InputData(idx=train_data.idx, features=train_data.features[:, ts_id],
+                       target=train_data.target[:, ts_id], task=train_data.task, data_type=DataTypesEnum.ts)
+        ts_table = lagged.transform_for_fit(ts)
+        tables.append(ts_table.predict)
+        targets.append(ts_table.target)
+
+    assert np.allclose(multi_ts_table.predict, np.vstack(tables))
+    assert np.allclose(multi_ts_table.target, np.vstack(targets))
+    assert multi_ts_table.target.shape[1] == forecast_length
+
+
+def test_multi_series_forecast_for_each_series():
+    train_data, test_data = get_multi_ts_data()
+    horizon = 12
+    pipeline = get_simple_pipeline()
+    pipeline.fit(train_data)
+
+    forecast = multi_series_forecast(pipeline, test_data)
+    long_forecast = multi_series_forecast(pipeline, test_data, horizon=horizon)
+
+    series_num = test_data.features.shape[1]
+    assert forecast.shape == (series_num, test_data.task.task_params.forecast_length)
+    assert long_forecast.shape == (series_num, horizon)
+    assert np.allclose(long_forecast[:, :forecast.shape[1]], forecast)
+    # The first series is forecasted by the usual predict of multi_ts data
+    assert np.allclose(forecast[0], np.ravel(pipeline.predict(test_data).predict))
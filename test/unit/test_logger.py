@@ -1,13 +1,15 @@
 import logging
 import os
+import queue
 from importlib import reload
 from pathlib import Path
 
 import pytest
+from joblib import Parallel, delayed
 
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
-from fedot.core.log import DEFAULT_LOG_PATH, Log, default_log
+from fedot.core.log import DEFAULT_LOG_PATH, Log, LogQueue, default_log
 from fedot.core.operations.model import Model
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.utilities.singleton_meta import SingletonMeta
@@ -120,3 +122,59 @@ def test_multiple_adapters_with_one_prefix():
 
     assert f'prefix_1 - {info_1}' in content
     assert f'prefix_1 - {info_2}' in content
+
+
+class RecordsCollector(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def log_in_worker(logs_initializer, task_id: int):
+    Log.setup_in_mp(*logs_initializer, task_id=task_id)
+    log = default_log(prefix='worker')
+    log.debug(f'Debug of task {task_id}')
+    log.info(f'Info of task {task_id}')
+    Log.flush_in_mp()
+
+
+def test_queue_listener_writes_records_of_workers():
+    collector = RecordsCollector()
+    log = Log()
+    log.logger.addHandler(collector)
+
+    with Log.queue_listener() as log_queue:
+        Parallel(n_jobs=2)(delayed(log_in_worker)((logging.INFO, log_queue), task_id) for task_id in range(4))
+
+    messages = {record.getMessage(): record for record in collector.records}
+    for task_id in range(4):
+        record = messages[f'worker - Info of task {task_id}']
+        assert record.task_id == task_id
+        assert record.processName != 'MainProcess'
+        assert f'worker - Debug of task {task_id}' not in messages
+
+
+def test_worker_queue_handler_drops_records_of_full_queue(monkeypatch):
+    monkeypatch.setattr('fedot.core.log.LOG_QUEUE_PUT_TIMEOUT', 0.01)
+    records_queue = queue.Queue(maxsize=1)
+    # the queue is used as if it is listened in other process
+    Log.setup_in_mp(logging.INFO, LogQueue(records_queue, listener_pid=-1, queue_id='test'))
+    log = default_log(prefix='worker')
+    try:
+        log.warning('first')
+        log.warning('second')
+        first_batch = records_queue.get_nowait()
+        log.warning('third')
+        last_batch = records_queue.get_nowait()
+    finally:
+        # the next tests use the default logging
+        for handler in list(Log().handlers):
+            Log().logger.removeHandler(handler)
+        clear_singleton_class(Log)
+
+    assert [record.getMessage() for record in first_batch] == ['worker - first']
+    assert [record.getMessage() for record in last_batch] == [
+        '1 log records were dropped because the log queue was full', 'worker - third']
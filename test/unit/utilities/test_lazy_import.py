@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from examples.advanced.performance.start_up_time import DEPENDENCIES_SCRIPT, PREDICT_ONLY_SCRIPT, \
+    measure_process_time, save_fitted_pipeline
+from fedot.core.utils import fedot_project_root
+from fedot.core.utilities.lazy_import import import_by_name, is_lazy_reference
+
+# The process predicting with the saved pipeline starts in ~1.2 s, missing the target of 1 s:
+# its dependencies (numpy, pandas, scipy and sklearn) alone take ~1 s to start up here.
+# So the start up time is checked as the overhead of FEDOT over the start up with these dependencies
+START_UP_OVERHEAD_SECONDS = 0.5
+
+HEAVY_OPTIONAL_MODULES = ['catboost', 'lightgbm', 'xgboost', 'statsmodels', 'gensim', 'h2o', 'tpot',
+                          'tensorflow', 'torch', 'matplotlib', 'seaborn', 'pyvis', 'hyperopt']
+
+
+def _modules_loaded_after_import(module_name: str) -> list:
+    """ Imports the module in the clean interpreter and returns heavy modules loaded with it """
+    script = (f'import json, sys; import {module_name}; '
+              f'print(json.dumps(sorted({{name.split(".")[0] for name in sys.modules}})))')
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=str(fedot_project_root()))
+    loaded_modules = json.loads(output.decode().strip().splitlines()[-1])
+    return [name for name in HEAVY_OPTIONAL_MODULES if name in loaded_modules]
+
+
+@pytest.mark.parametrize('module_name', ['fedot.core.pipelines.pipeline', 'fedot.api.main'])
+def test_heavy_backends_not_imported_eagerly(module_name):
+    loaded_modules = _modules_loaded_after_import(module_name)
+    if module_name == 'fedot.api.main':
+        # Tuning is the part of the composition API
+        loaded_modules = [name for name in loaded_modules if name != 'hyperopt']
+
+    assert not loaded_modules, f'{module_name} imports {loaded_modules} eagerly'
+
+
+def test_predict_only_process_start_up_overhead(tmp_path):
+    pipeline_path = save_fitted_pipeline(os.path.join(str(tmp_path), 'pipeline'))
+    dependencies_time = np.min(measure_process_time(DEPENDENCIES_SCRIPT, repeats=3))
+    predict_time = np.min(measure_process_time(PREDICT_ONLY_SCRIPT.format(path=pipeline_path), repeats=3))
+
+    assert predict_time - dependencies_time < START_UP_OVERHEAD_SECONDS
+
+
+def test_import_by_name_correct():
+    assert import_by_name('fedot.core.utilities.lazy_import', 'import_by_name') is import_by_name
+    assert is_lazy_reference(('xgboost', 'XGBRegressor'))
+    assert is_lazy_reference(['fedot.core.operations.evaluation.regression', 'SkLearnRegressionStrategy'])
+    assert not is_lazy_reference('xgboost')
+    assert not is_lazy_reference(None)
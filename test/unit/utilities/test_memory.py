@@ -0,0 +1,36 @@
+import numpy as np
+
+from fedot.core.utilities.memory import AdaptiveGarbageCollector, MemoryUsageTracker
+
+
+def test_memory_usage_tracker_counts_freed_allocations():
+    with MemoryUsageTracker() as memory:
+        array = np.ones(50 * 1024 ** 2 // 8)
+        del array
+
+    assert memory.peak_in_mb >= 40
+    assert memory.growth_in_mb < memory.peak_in_mb
+
+
+def test_adaptive_garbage_collector_collects_after_memory_growth():
+    collector = AdaptiveGarbageCollector(threshold_in_mb=30)
+    collector.collect_if_needed()
+    assert not collector.collect_if_needed()
+
+    array = np.ones(50 * 1024 ** 2 // 8)
+    assert collector.collect_if_needed()
+    assert not collector.collect_if_needed()
+    del array
+
+    assert AdaptiveGarbageCollector(threshold_in_mb=0).collect_if_needed()
+
+
+def test_memory_usage_tracker_keeps_peak_of_outer_block():
+    with MemoryUsageTracker() as outer_memory:
+        array = np.ones(50 * 1024 ** 2 // 8)
+        del array
+        with MemoryUsageTracker() as inner_memory:
+            pass
+
+    assert inner_memory.peak_in_mb < 40
+    assert outer_memory.peak_in_mb >= 40
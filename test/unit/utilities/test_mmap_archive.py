@@ -0,0 +1,71 @@
+import os
+import zipfile
+
+import numpy as np
+import pytest
+
+from fedot.core.utilities.mmap_archive import ARRAY_ALIGNMENT, is_archive, load_archive, save_archive
+
+
+@pytest.mark.parametrize('mmap_mode', ['c', 'r', None])
+def test_archive_restores_arrays(tmp_path, mmap_mode):
+    large = np.random.rand(300, 100)
+    objects = {
+        'first': {'large': large, 'same_large': large, 'small': np.arange(5),
+                  'fortran': np.asfortranarray(np.random.rand(100, 200)),
+                  'structured': np.zeros(10000, dtype=[('x', 'f8'), ('y', 'i4')]),
+                  'objects': np.array([1, 'a'], dtype=object)},
+        'second': [large]
+    }
+    path = save_archive(os.path.join(tmp_path, 'archive'), {'name': 'test'}, objects)
+
+    manifest, loaded = load_archive(path, mmap_mode)
+
+    assert is_archive(path)
+    assert manifest['name'] == 'test'
+    assert len(manifest['arrays']) == 3
+    for key, array in objects['first'].items():
+        assert np.array_equal(loaded['first'][key], array)
+        assert loaded['first'][key].dtype == array.dtype
+    # shared arrays are stored once and stay shared
+    assert loaded['first']['large'] is loaded['first']['same_large'] is loaded['second'][0]
+    assert loaded['first']['fortran'].flags.f_contiguous
+    assert isinstance(loaded['first']['large'], np.memmap) == (mmap_mode is not None)
+    if mmap_mode is not None:
+        assert loaded['first']['large'].ctypes.data % ARRAY_ALIGNMENT == 0
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+
+
+def test_is_archive_for_other_files(tmp_path):
+    other_zip = os.path.join(tmp_path, 'other.zip')
+    with zipfile.ZipFile(other_zip, 'w') as archive:
+        archive.writestr('file.txt', 'content')
+
+    assert not is_archive(other_zip)
+    assert not is_archive(os.path.join(tmp_path, 'missing.zip'))
+
+
+class ReducedToArray:
+    """ Object pickled as the new array each time, like the trees of scikit-learn """
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def __reduce__(self):
+        return ReducedToArray.restore, (np.full(self.size, self.size, dtype=float),)
+
+    @staticmethod
+    def restore(array: np.ndarray):
+        return array
+
+
+def test_archive_stores_temporary_arrays_separately(tmp_path):
+    sizes = [10000 + i for i in range(10)]
+    objects = {str(size): ReducedToArray(size) for size in sizes}
+    path = save_archive(os.path.join(tmp_path, 'archive'), {}, objects)
+
+    _, loaded = load_archive(path)
+
+    assert [len(loaded[str(size)]) for size in sizes] == sizes
+    assert all(np.all(loaded[str(size)] == size) for size in sizes)
@@ -4,12 +4,15 @@ import shutil
 
 import numpy as np
 import pytest
+from sklearn.datasets import make_classification
 from sklearn.metrics import mean_absolute_error
 
 from fedot.api.main import Fedot
+from fedot.core.data.data import InputData
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.template import PipelineTemplate, extract_subtree_root
+from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
 from fedot.core.utils import fedot_project_root
 from test.unit.api.test_main_api import get_dataset
@@ -485,3 +488,36 @@ def test_load_though_api_perform_correctly():
     loaded_predictions = loaded_model.predict(input_data)
 
     assert np.array_equal(predictions, loaded_predictions)
+
+
+@pytest.mark.parametrize('mmap_mode', ['c', None])
+def test_pipeline_archive_serialized_correctly(tmp_path, mmap_mode):
+    """ Pipeline with preprocessing saved to the single archive must predict the same after loading """
+    mixed_input = get_mixed_data(task=Task(TaskTypesEnum.regression), extended=True)
+    pipeline = Pipeline(SecondaryNode('ridge', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(mixed_input)
+    before_output = pipeline.predict(mixed_input)
+
+    archive_path = pipeline.save_archive(os.path.join(tmp_path, 'pipeline.fedot'))
+    pipeline_after = Pipeline()
+    pipeline_after.load_archive(archive_path, mmap_mode=mmap_mode)
+    after_output = pipeline_after.predict(mixed_input)
+
+    assert os.listdir(tmp_path) == ['pipeline.fedot']
+    assert pipeline_after.descriptive_id == pipeline.descriptive_id
+    assert np.allclose(before_output.predict, after_output.predict)
+
+
+def test_pipeline_archive_memory_maps_large_arrays(tmp_path):
+    features, target = make_classification(n_samples=2000, n_features=20, random_state=1)
+    train_data = InputData(idx=np.arange(len(target)), features=features, target=target,
+                           task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+    pipeline = Pipeline(PrimaryNode('knn'))
+    pipeline.fit(train_data)
+    archive_path = pipeline.save_archive(os.path.join(tmp_path, 'pipeline.fedot'))
+
+    pipeline_after = Pipeline.from_serialized(archive_path)
+    fitted_model = pipeline_after.root_node.fitted_operation
+
+    assert isinstance(fitted_model.model._fit_X, np.memmap)
+    assert np.array_equal(pipeline.predict(train_data).predict, pipeline_after.predict(train_data).predict)